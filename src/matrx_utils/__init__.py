@@ -127,13 +127,16 @@ from .react_analysis import (
     get_default_configs_with_overrides,
 )
 from .code_context import (
+    AnalysisPipeline,
     ASTAnalyzer,
+    BuildCache,
     ClassInfo,
     CodeContextBuilder,
     CodeContextConfig,
     CodeContextResult,
     CodeExtractor,
     DirectoryTree,
+    FileAnalysis,
     FileDiscovery,
     FileNode,
     FunctionCallAnalyzer,
@@ -144,6 +147,8 @@ from .code_context import (
     OutputMode,
     SignatureBlock,
     SignatureExtractor,
+    SymbolIndex,
+    SymbolRecord,
 )
 from .package_analysis import (
     CLI_PACKAGES,
@@ -282,13 +287,16 @@ __all__ = [
     "create_combined_structure",
     "get_default_configs_with_overrides",
     # code_context
+    "AnalysisPipeline",
     "ASTAnalyzer",
+    "BuildCache",
     "ClassInfo",
     "CodeContextBuilder",
     "CodeContextConfig",
     "CodeContextResult",
     "CodeExtractor",
     "DirectoryTree",
+    "FileAnalysis",
     "FileDiscovery",
     "FileNode",
     "FunctionCallAnalyzer",
@@ -299,6 +307,8 @@ __all__ = [
     "OutputMode",
     "SignatureBlock",
     "SignatureExtractor",
+    "SymbolIndex",
+    "SymbolRecord",
     # package_analysis
     "CLI_PACKAGES",
     "PACKAGE_COMPANIONS",
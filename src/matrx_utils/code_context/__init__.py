@@ -8,13 +8,16 @@ Primary entry point:
 """
 
 from .code_context import (
+    AnalysisPipeline,
     ASTAnalyzer,
+    BuildCache,
     ClassInfo,
     CodeContextBuilder,
     CodeContextConfig,
     CodeContextResult,
     CodeExtractor,
     DirectoryTree,
+    FileAnalysis,
     FileDiscovery,
     FileNode,
     FunctionCallAnalyzer,
@@ -25,19 +28,24 @@ from .code_context import (
     OutputMode,
     SignatureBlock,
     SignatureExtractor,
+    SymbolIndex,
+    SymbolRecord,
 )
 
 from .generate_module_readme import readme_orchestrator
 
 
 __all__ = [
+    "AnalysisPipeline",
     "ASTAnalyzer",
+    "BuildCache",
     "ClassInfo",
     "CodeContextBuilder",
     "CodeContextConfig",
     "CodeContextResult",
     "CodeExtractor",
     "DirectoryTree",
+    "FileAnalysis",
     "FileDiscovery",
     "FileNode",
     "FunctionCallAnalyzer",
@@ -48,5 +56,7 @@ __all__ = [
     "OutputMode",
     "SignatureBlock",
     "SignatureExtractor",
+    "SymbolIndex",
+    "SymbolRecord",
     "readme_orchestrator",
 ]
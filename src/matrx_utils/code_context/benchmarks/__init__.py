@@ -0,0 +1 @@
+"""Performance benchmarks for code_context. Run each module with ``python -m``."""
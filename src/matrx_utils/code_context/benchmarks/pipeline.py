@@ -0,0 +1,517 @@
+"""
+Benchmark: the CodeContextBuilder pipeline, stage by stage, on synthetic
+repositories.
+
+Each case (repo size x output mode) runs in a fresh worker process so peak
+RSS is attributable to that case alone. A case first times the public path,
+an uncached build() followed by save(). That is ``total_seconds`` and
+``peak_rss_mb``, and what --compare's "total" row tracks. It then re-runs
+the build stage by stage through the builder's internals, as a breakdown
+(skip it with --no-stages). The stages mirror build():
+
+    discovery   FileDiscovery + directory tree
+    load        parallel file reads
+    strip       comment stripping            (clean, budget)
+    signatures  signature extraction         (signatures, budget)
+    call_graph  Python call graphs           (unless --no-call-graph)
+    assemble    budget planning + combined text + file nodes
+    save        combined .txt and structure JSON
+
+Signatures and call graphs share one parse inside build(). The breakdown
+times them separately, so each of them pays for its own parse, and the
+stages run on a warm OS file cache. Their sum is ``stages_seconds``, which
+is not the build's cost; read it for where time goes, not how much.
+
+Repositories are generated deterministically from ``--seed``. Each one has
+a mixed language set, nested package directories and excluded noise
+(node_modules, __pycache__, .gitignore'd build output). They are reused
+from ``--workdir`` across runs.
+
+Results are written as JSON (``--output``). Pass an earlier result with
+``--compare`` to print per-stage ratios against it.
+
+Usage:
+    python -m matrx_utils.code_context.benchmarks.pipeline
+    python -m matrx_utils.code_context.benchmarks.pipeline --sizes 1000 10000 100000 --output run.json
+    python -m matrx_utils.code_context.benchmarks.pipeline --compare baseline.json --output run.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from matrx_utils.code_context.code_context import AnalysisPipeline, CodeContextBuilder
+
+_REPORT_VERSION = 2
+_GENERATOR_VERSION = 1
+_MANIFEST = ".bench_manifest.json"
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+DEFAULT_MODES = ("tree_only", "signatures", "clean", "original", "budget")
+STAGES = ("discovery", "load", "strip", "signatures", "call_graph", "assemble", "save")
+
+# Extension → relative weight, roughly a full-stack monorepo.
+_LANGUAGE_MIX = {
+    ".py": 40, ".ts": 16, ".tsx": 8, ".js": 6, ".go": 5, ".rs": 4,
+    ".java": 4, ".md": 7, ".json": 4, ".yaml": 3, ".css": 3,
+}
+_FILES_PER_DIR = 10
+_DIR_FANOUT = 5
+_DIR_WORDS = ("core", "api", "models", "services", "utils")
+_NAME_WORDS = (
+    "user", "order", "invoice", "session", "cache", "report", "queue", "token",
+    "account", "payment", "search", "config", "event", "stream", "parser", "store",
+)
+
+
+# ---------------------------------------------------------------------------
+# Synthetic repository
+# ---------------------------------------------------------------------------
+
+def _ident(rng: random.Random, parts: int = 2) -> str:
+    return "_".join(rng.choice(_NAME_WORDS) for _ in range(parts))
+
+
+def _camel(name: str) -> str:
+    return "".join(p.capitalize() for p in name.split("_"))
+
+
+def _python_file(rng: random.Random, module_names: list[str]) -> str:
+    lines = [f'"""{_camel(_ident(rng))} helpers."""', "", "import os", "from typing import Any"]
+    for mod in rng.sample(module_names, min(len(module_names), rng.randint(0, 3))):
+        lines.append(f"from .{mod} import {mod}_entry")
+    lines.append("")
+    funcs = [_ident(rng) for _ in range(rng.randint(2, 6))]
+    for i, fn in enumerate(funcs):
+        callee = funcs[i - 1] if i else "os.getcwd"
+        lines += [
+            "",
+            f"def {fn}_{i}(value: Any, limit: int = {rng.randint(1, 99)}) -> Any:",
+            f'    """Process {fn.replace("_", " ")}."""',
+            "    # Clamp before delegating",
+            "    if limit <= 0:",
+            "        return None",
+            f"    result = {callee}{'_' + str(i - 1) if i else ''}(value{', limit - 1' if i else ''})",
+            "    return result",
+        ]
+    for _ in range(rng.randint(0, 2)):
+        cls = _camel(_ident(rng))
+        lines += ["", "", f"class {cls}:", f'    """{cls} model."""', "", "    def __init__(self, name: str) -> None:",
+                  "        self.name = name  # display name", "        self._validate()", "",
+                  "    def _validate(self) -> None:", "        if not self.name:",
+                  '            raise ValueError("name required")']
+        for m in range(rng.randint(1, 4)):
+            lines += ["", f"    def {_ident(rng, 1)}_{m}(self, *args, **kwargs) -> dict:",
+                      "        return {'name': self.name, 'args': args, **kwargs}"]
+    return "\n".join(lines) + "\n"
+
+
+def _ts_file(rng: random.Random, jsx: bool) -> str:
+    name = _camel(_ident(rng))
+    lines = ["// Generated fixture", "import { useState } from 'react';", "",
+             f"export interface {name}Props {{", "  id: string;", "  count?: number;", "}", ""]
+    for i in range(rng.randint(2, 5)):
+        fn = _ident(rng)
+        lines += [f"/** Compute {fn.replace('_', ' ')}. */",
+                  f"export function {fn}{i}(input: {name}Props, factor: number = {i}): number {{",
+                  "  // scale the count", "  return (input.count ?? 0) * factor;", "}", ""]
+    if jsx:
+        lines += [f"export const {name} = (props: {name}Props) => {{",
+                  "  const [open, setOpen] = useState(false);",
+                  "  return <div onClick={() => setOpen(!open)}>{props.id}</div>;", "};"]
+    return "\n".join(lines) + "\n"
+
+
+def _js_file(rng: random.Random) -> str:
+    fn = _ident(rng)
+    return (f"/* {fn} module */\n'use strict';\n\nfunction {fn}(items) {{\n"
+            "  // filter falsy\n  return items.filter(Boolean);\n}\n\n"
+            f"module.exports = {{ {fn} }};\n")
+
+
+def _go_file(rng: random.Random) -> str:
+    name = _camel(_ident(rng))
+    return (f"package {rng.choice(_DIR_WORDS)}\n\n// {name} holds state.\ntype {name} struct {{\n\tID string\n}}\n\n"
+            f"// Get returns the id.\nfunc (s *{name}) Get() string {{\n\treturn s.ID\n}}\n\n"
+            f"func New{name}(id string) *{name} {{\n\treturn &{name}{{ID: id}}\n}}\n")
+
+
+def _rust_file(rng: random.Random) -> str:
+    name = _camel(_ident(rng))
+    return (f"/// {name} record.\npub struct {name} {{\n    pub id: u64,\n}}\n\n"
+            f"impl {name} {{\n    // constructor\n    pub fn new(id: u64) -> Self {{\n        Self {{ id }}\n    }}\n}}\n")
+
+
+def _java_file(rng: random.Random) -> str:
+    name = _camel(_ident(rng))
+    return (f"package com.example;\n\n/** {name} service. */\npublic class {name} {{\n"
+            "    // cached value\n    private int value;\n\n"
+            "    public int getValue() {\n        return value;\n    }\n}\n")
+
+
+def _text_file(rng: random.Random, suffix: str) -> str:
+    key = _ident(rng)
+    if suffix == ".md":
+        return f"# {_camel(key)}\n\n" + "\n".join(f"- {_ident(rng, 3).replace('_', ' ')}" for _ in range(rng.randint(3, 12))) + "\n"
+    if suffix == ".json":
+        return json.dumps({_ident(rng): rng.randint(0, 1000) for _ in range(rng.randint(3, 10))}, indent=2) + "\n"
+    if suffix == ".yaml":
+        return "".join(f"{_ident(rng)}: {rng.randint(0, 100)}  # tuning\n" for _ in range(rng.randint(3, 10)))
+    return f"/* {key} */\n.{key} {{\n  display: flex;\n  margin: {rng.randint(0, 16)}px;\n}}\n"
+
+
+def _file_content(rng: random.Random, suffix: str, module_names: list[str]) -> str:
+    if suffix == ".py":
+        return _python_file(rng, module_names)
+    if suffix in (".ts", ".tsx"):
+        return _ts_file(rng, jsx=suffix == ".tsx")
+    if suffix == ".js":
+        return _js_file(rng)
+    if suffix == ".go":
+        return _go_file(rng)
+    if suffix == ".rs":
+        return _rust_file(rng)
+    if suffix == ".java":
+        return _java_file(rng)
+    return _text_file(rng, suffix)
+
+
+def _dir_for(index: int) -> Path:
+    """Directory for the ``index``-th batch of files: base-5 digits → nested package names."""
+    parts = ["src"]
+    level = 0
+    while index:
+        index, digit = divmod(index, _DIR_FANOUT)
+        parts.append(f"{_DIR_WORDS[digit]}{level}")
+        level += 1
+    return Path(*parts)
+
+
+def generate_repo(root: Path, n_files: int, seed: int = 0) -> Path:
+    """
+    Write a deterministic synthetic repository of ``n_files`` source files under
+    ``root`` (plus excluded noise) and return it. A repo already generated with
+    the same parameters is reused.
+    """
+    manifest = {"files": n_files, "seed": seed, "generator": _GENERATOR_VERSION}
+    marker = root / _MANIFEST
+    if marker.exists():
+        try:
+            if json.loads(marker.read_text(encoding="utf-8")) == manifest:
+                return root
+        except (OSError, ValueError):
+            pass
+    if root.exists():
+        shutil.rmtree(root)
+    root.mkdir(parents=True)
+
+    rng = random.Random(seed)
+    suffixes = list(_LANGUAGE_MIX)
+    weights = list(_LANGUAGE_MIX.values())
+    for batch in range((n_files + _FILES_PER_DIR - 1) // _FILES_PER_DIR):
+        directory = root / _dir_for(batch)
+        directory.mkdir(parents=True, exist_ok=True)
+        count = min(_FILES_PER_DIR, n_files - batch * _FILES_PER_DIR)
+        chosen = rng.choices(suffixes, weights=weights, k=count)
+        stems = [f"{_ident(rng)}_{i}" for i in range(count)]
+        py_stems = [s for s, suffix in zip(stems, chosen) if suffix == ".py"]
+        for stem, suffix in zip(stems, chosen):
+            (directory / f"{stem}{suffix}").write_text(_file_content(rng, suffix, py_stems), encoding="utf-8")
+
+    # Noise discovery has to skip: excluded directories, gitignored output, bytecode.
+    for noise in ("node_modules/left-pad", "build/generated", "src/__pycache__"):
+        (root / noise).mkdir(parents=True, exist_ok=True)
+    for i in range(max(1, n_files // 100)):
+        (root / "node_modules" / "left-pad" / f"index{i}.js").write_text(_js_file(rng), encoding="utf-8")
+        (root / "build" / "generated" / f"bundle{i}.js").write_text(_js_file(rng), encoding="utf-8")
+        (root / "src" / "__pycache__" / f"mod{i}.cpython-313.pyc").write_bytes(bytes(rng.randrange(256) for _ in range(64)))
+    (root / ".gitignore").write_text("build/\n*.log\n", encoding="utf-8")
+
+    marker.write_text(json.dumps(manifest), encoding="utf-8")
+    return root
+
+
+# ---------------------------------------------------------------------------
+# Measurement
+# ---------------------------------------------------------------------------
+
+def _peak_rss_mb() -> float | None:
+    """Process high-water RSS in MiB (ru_maxrss is KiB on Linux, bytes on macOS)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+class _StageTimer:
+    """Collects seconds, high-water RSS and (optionally) Python heap peak per stage."""
+
+    def __init__(self, trace_memory: bool) -> None:
+        self.trace_memory = trace_memory
+        self.stages: dict[str, dict] = {}
+
+    def run(self, name: str, fn, *args, **kwargs):
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        value = fn(*args, **kwargs)
+        record = {"seconds": time.perf_counter() - start, "rss_peak_mb": _peak_rss_mb()}
+        if self.trace_memory:
+            record["py_heap_peak_mb"] = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+        self.stages[name] = record
+        return value
+
+
+def _strip(extractors) -> None:
+    for ex in extractors.values():
+        ex.strip_comments()
+
+
+def _builder(
+    root: Path, mode: str, call_graph: bool, token_budget: int, analysis_workers: int, out: str
+) -> CodeContextBuilder:
+    return CodeContextBuilder(
+        project_root=root,
+        output_mode="budget" if mode == "budget" else mode,
+        token_budget=token_budget if mode == "budget" else None,
+        call_graph=call_graph,
+        analysis_workers=analysis_workers,
+        export_directory=out,
+    )
+
+
+def _save_quietly(builder: CodeContextBuilder, result) -> None:
+    with contextlib.redirect_stdout(io.StringIO()):  # save() announces each path
+        builder.save(result)
+
+
+def _run_stages(
+    builder: CodeContextBuilder, root: Path, mode: str, call_graph: bool, analysis_workers: int, timer: _StageTimer
+) -> None:
+    """Re-run an uncached build() one internal stage at a time, recording each in ``timer``."""
+    files, stats, tree = timer.run("discovery", builder._discover)
+
+    extractors = {}
+    if mode != "tree_only":
+        extractors = timer.run("load", builder._load_files_parallel, files)
+    if mode in ("clean", "budget"):
+        timer.run("strip", _strip, extractors)
+    sources = {f: ex.original for f, ex in extractors.items()}
+
+    signature_blocks = []
+    if mode in ("signatures", "budget"):
+        pipeline = AnalysisPipeline(signatures=True, project_root=root, workers=analysis_workers)
+        signature_blocks = [a.signature_block for a in timer.run("signatures", pipeline.run, files, sources)]
+
+    call_graphs = []
+    if call_graph:
+        pipeline = AnalysisPipeline(
+            signatures=False,
+            call_graph=builder._call_graph_analyzer(),
+            project_root=root,
+            workers=analysis_workers,
+        )
+        analyses = timer.run("call_graph", pipeline.run, files, sources)
+        call_graphs = [a.call_graph for a in analyses if a.call_graph is not None]
+
+    result = timer.run(
+        "assemble", builder._finish, files, stats, tree, extractors, signature_blocks, call_graphs
+    )
+    timer.run("save", _save_quietly, builder, result)
+
+
+def run_case(
+    root: Path,
+    mode: str,
+    call_graph: bool = True,
+    token_budget: int = 100_000,
+    analysis_workers: int = 1,
+    trace_memory: bool = False,
+    stages: bool = True,
+) -> dict:
+    """
+    Time one uncached build() + save() of ``root`` in ``mode``, in this
+    process, then (with ``stages``) the same build stage by stage. Returns
+    the measurements.
+    """
+    if trace_memory:
+        tracemalloc.start()
+    public = _StageTimer(trace_memory)
+    breakdown = _StageTimer(trace_memory)
+    with tempfile.TemporaryDirectory(prefix="ccbench_out_") as out:
+        builder = _builder(root, mode, call_graph, token_budget, analysis_workers, out)
+        result = public.run("build", builder.build)
+        public.run("save", _save_quietly, builder, result)
+        peak_rss = _peak_rss_mb()
+        if stages:
+            builder = _builder(root, mode, call_graph, token_budget, analysis_workers, out)
+            _run_stages(builder, root, mode, call_graph, analysis_workers, breakdown)
+
+    if trace_memory:
+        tracemalloc.stop()
+    return {
+        "mode": mode,
+        "files": len(result.files),
+        "input_chars": sum(fn.original_chars for fn in result.file_nodes.values()),
+        "output_chars": len(result.combined_text),
+        "build": public.stages,
+        "total_seconds": sum(s["seconds"] for s in public.stages.values()),
+        "stages": breakdown.stages,
+        "stages_seconds": sum(s["seconds"] for s in breakdown.stages.values()),
+        "peak_rss_mb": peak_rss,
+    }
+
+
+def run(
+    sizes: list[int],
+    modes: list[str],
+    workdir: Path,
+    seed: int = 0,
+    call_graph: bool = True,
+    token_budget: int = 100_000,
+    analysis_workers: int = 1,
+    trace_memory: bool = False,
+    stages: bool = True,
+) -> dict:
+    results = []
+    for size in sizes:
+        repo = generate_repo(workdir / f"repo_{size}_s{seed}", size, seed)
+        for mode in modes:
+            # One process per case: ru_maxrss never goes down, so a shared process would blur peaks.
+            with ProcessPoolExecutor(max_workers=1, max_tasks_per_child=1) as executor:
+                case = executor.submit(
+                    run_case, repo, mode, call_graph, token_budget, analysis_workers, trace_memory, stages
+                ).result()
+            case["repo_files"] = size
+            results.append(case)
+            print(f"  {size:>7} files  {mode:<10} {case['total_seconds']:8.2f}s", file=sys.stderr)
+    return {
+        "report_version": _REPORT_VERSION,
+        "benchmark": "code_context.pipeline",
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "params": {
+            "sizes": sizes,
+            "modes": modes,
+            "seed": seed,
+            "call_graph": call_graph,
+            "token_budget": token_budget,
+            "analysis_workers": analysis_workers,
+            "trace_memory": trace_memory,
+            "stages": stages,
+        },
+        "results": results,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Reporting
+# ---------------------------------------------------------------------------
+
+def compare(baseline: dict, current: dict) -> list[dict]:
+    """Per (size, mode, stage) seconds in both reports and current/baseline ratio."""
+    before = {(r["repo_files"], r["mode"]): r for r in baseline.get("results", [])}
+    rows = []
+    for r in current.get("results", []):
+        old = before.get((r["repo_files"], r["mode"]))
+        if old is None:
+            continue
+        for stage in (*STAGES, "total"):
+            new_s = r["total_seconds"] if stage == "total" else r["stages"].get(stage, {}).get("seconds")
+            old_s = old["total_seconds"] if stage == "total" else old["stages"].get(stage, {}).get("seconds")
+            if new_s is None or old_s is None:
+                continue
+            rows.append({
+                "repo_files": r["repo_files"],
+                "mode": r["mode"],
+                "stage": stage,
+                "baseline_s": old_s,
+                "current_s": new_s,
+                "ratio": new_s / old_s if old_s else float("inf"),
+            })
+    return rows
+
+
+def _print_report(report: dict) -> None:
+    header = f"{'files':>7}  {'mode':<11}" + "".join(f"{s:>11}" for s in STAGES) + f"{'total':>9}{'rss MB':>9}"
+    print(header)
+    print("-" * len(header))
+    for r in report["results"]:
+        cells = "".join(
+            f"{r['stages'][s]['seconds'] * 1000:>9.0f}ms" if s in r["stages"] else f"{'-':>11}"
+            for s in STAGES
+        )
+        rss = f"{r['peak_rss_mb']:>9.0f}" if r["peak_rss_mb"] is not None else f"{'-':>9}"
+        print(f"{r['repo_files']:>7}  {r['mode']:<11}{cells}{r['total_seconds']:>8.2f}s{rss}")
+
+
+def _print_comparison(rows: list[dict]) -> None:
+    header = f"{'files':>7}  {'mode':<11}{'stage':<12}{'baseline':>10}{'current':>10}{'ratio':>8}"
+    print(header)
+    print("-" * len(header))
+    for r in rows:
+        print(
+            f"{r['repo_files']:>7}  {r['mode']:<11}{r['stage']:<12}"
+            f"{r['baseline_s']:>9.3f}s{r['current_s']:>9.3f}s{r['ratio']:>7.2f}x"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(DEFAULT_SIZES), help="Repository sizes in files")
+    parser.add_argument("--modes", nargs="+", choices=DEFAULT_MODES, default=list(DEFAULT_MODES))
+    parser.add_argument("--seed", type=int, default=0, help="Generator seed")
+    parser.add_argument("--workdir", type=Path, default=Path(tempfile.gettempdir()) / "code_context_bench",
+                        help="Where synthetic repositories are generated and reused")
+    parser.add_argument("--no-call-graph", action="store_true", help="Skip the call_graph stage")
+    parser.add_argument("--token-budget", type=int, default=100_000, help="Budget for the budget mode")
+    parser.add_argument("--analysis-workers", type=int, default=1, help="Processes for signatures / call graphs")
+    parser.add_argument("--tracemalloc", action="store_true",
+                        help="Also record per-stage Python heap peaks (slows every stage; timings are not comparable)")
+    parser.add_argument("--no-stages", action="store_true",
+                        help="Time only the public build(); skip the per-stage breakdown")
+    parser.add_argument("--output", type=Path, help="Write the JSON report here")
+    parser.add_argument("--compare", type=Path, help="Earlier JSON report to compare against")
+    args = parser.parse_args()
+
+    report = run(
+        args.sizes,
+        args.modes,
+        args.workdir,
+        seed=args.seed,
+        call_graph=not args.no_call_graph,
+        token_budget=args.token_budget,
+        analysis_workers=max(1, args.analysis_workers),
+        trace_memory=args.tracemalloc,
+        stages=not args.no_stages,
+    )
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"Saved: {args.output}")
+    _print_report(report)
+    if args.compare:
+        print()
+        _print_comparison(compare(json.loads(args.compare.read_text(encoding="utf-8")), report))
+
+
+if __name__ == "__main__":
+    main()
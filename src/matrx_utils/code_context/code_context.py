@@ -20,6 +20,10 @@ Output Modes
 "original"    Tree + raw file content, nothing modified.
               100% of token cost. Best for: debugging, when comments matter.
 
+"budget"      Per-file mix of the above, chosen to fit ``token_budget``. Files are ranked
+              by ``budget_priority`` (recency / size / path) with ``budget_pins`` first;
+              every file gets signatures before any file gets full content.
+
 Usage (programmatic)
 --------------------
     builder = CodeContextBuilder(
@@ -38,11 +42,19 @@ Usage (programmatic)
         prune_empty_directories=True,
         prompt_prefix="Please review this code...",
         prompt_suffix="What do you think?",
+        cache_dir="~/.cache/code_context",  # optional: incremental rebuilds
     )
     result = builder.build()
     builder.save(result)
     print(result.combined_text)
 
+    # Large trees: write straight to disk without materializing combined_text.
+    builder.save_stream()            # or builder.save_stream(sink=sys.stdout)
+
+    # Live mode: a fresh result after every save, re-processing only changed files.
+    for result in builder.watch():
+        builder.save(result)
+
 Config defaults live in config.yaml next to this file.
 Named presets in config.yaml let you store reusable exclusion profiles.
 Runtime kwargs override config.yaml values.
@@ -51,17 +63,28 @@ Runtime kwargs override config.yaml values.
 from __future__ import annotations
 
 import ast
+import ctypes
+import ctypes.util
+import fnmatch
+import hashlib
+import json
 import logging
 import os
 import re
+import select
+import sqlite3
+import struct
 import sys
+import threading
+import time
 import warnings
-from collections import defaultdict
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass, field
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Literal
+from typing import Callable, Iterable, Iterator, Literal, TextIO
 
 try:
     import yaml
@@ -73,15 +96,30 @@ logger = logging.getLogger(__name__)
 
 _CONFIG_PATH = Path(__file__).parent / "config.yaml"
 
-OutputMode = Literal["tree_only", "signatures", "clean", "original"]
+OutputMode = Literal["tree_only", "signatures", "clean", "original", "budget"]
 
 _OUTPUT_MODE_LABELS: dict[str, str] = {
     "tree_only":  "tree only  — directory structure, no file content",
     "signatures": "signatures — code skeleton (functions/classes/methods, no bodies)",
     "clean":      "clean      — full content with comments stripped",
     "original":   "original   — full content, unmodified",
+    "budget":     "budget     — per-file detail chosen to fit a token budget",
 }
 
+# Budget mode upgrades files through these levels, cheapest first.
+_BUDGET_LEVELS: tuple[str, ...] = ("tree_only", "signatures", "clean", "original")
+
+BudgetPriority = Literal["recency", "size", "path"]
+
+# Rough chars-per-token ratio for code with common BPE tokenizers. Pass
+# token_counter= to CodeContextBuilder for exact counts.
+_CHARS_PER_TOKEN = 4
+
+
+def _estimate_tokens(text: str) -> int:
+    """Fast token estimate from character length — no tokenizer needed."""
+    return -(-len(text) // _CHARS_PER_TOKEN)
+
 # ---------------------------------------------------------------------------
 # Call graph — default noise filter (tier-1 builtins + stdlib)
 # Callers can add project-specific noise via call_graph_ignore or config.yaml
@@ -151,6 +189,14 @@ class CodeContextConfig:
     prune_empty_directories: bool = False
     include_text_output: bool = True
     project_root_display: bool = True
+    cache_directory: str | None = None
+    symbol_index: str | None = None
+    dedupe_identical_files: bool = True
+
+    # Discovery limits
+    respect_gitignore: bool = True
+    max_file_size_kb: int | None = 1024
+    skip_binary_files: bool = True
 
     # Call graph settings
     call_graph_project_noise: list[str] = field(default_factory=list)
@@ -179,6 +225,7 @@ class CodeContextConfig:
         excl_dirs = raw.get("exclude_directories", {})
         excl_files = raw.get("exclude_files", {})
         out = raw.get("output", {})
+        disc = raw.get("discovery", {})
 
         cfg = cls(
             exclude_directories=list(excl_dirs.get("exact", [])),
@@ -197,6 +244,12 @@ class CodeContextConfig:
             prune_empty_directories=bool(out.get("prune_empty_directories", False)),
             include_text_output=bool(out.get("include_text_output", True)),
             project_root_display=bool(out.get("project_root_display", True)),
+            cache_directory=out.get("cache_directory") or None,
+            symbol_index=out.get("symbol_index") or None,
+            dedupe_identical_files=bool(out.get("dedupe_identical_files", True)),
+            respect_gitignore=bool(disc.get("respect_gitignore", True)),
+            max_file_size_kb=disc.get("max_file_size_kb", 1024),
+            skip_binary_files=bool(disc.get("skip_binary_files", True)),
             call_graph_project_noise=list(raw.get("call_graph_project_noise", [])),
             extensions_for_analysis=list(raw.get("extensions_for_analysis", [".js", ".jsx", ".ts", ".tsx", ".mjs"])),
             remove_comments_for_extensions=list(raw.get("remove_comments_for_extensions", [".js", ".jsx", ".ts", ".tsx"])),
@@ -227,6 +280,8 @@ class CodeContextConfig:
                   exact: [...]
                   containing: [...]
                 include_extensions: [...]
+                discovery:
+                  max_file_size_kb: 4096
                 output:
                   output_mode: "signatures"
         """
@@ -271,10 +326,16 @@ class CodeContextConfig:
         preset_out: dict = preset_data.get("output", {})
         for key in ("output_mode", "show_all_tree_directories", "prune_empty_directories",
                     "save_combined", "save_individual", "export_directory",
-                    "include_text_output", "project_root_display"):
+                    "include_text_output", "project_root_display", "cache_directory",
+                    "symbol_index", "dedupe_identical_files"):
             if key in preset_out:
                 setattr(self, key, preset_out[key])
 
+        preset_disc: dict = preset_data.get("discovery", {})
+        for key in ("respect_gitignore", "max_file_size_kb", "skip_binary_files"):
+            if key in preset_disc:
+                setattr(self, key, preset_disc[key])
+
     def _apply_overrides(self, overrides: dict) -> None:
         list_fields = {
             "exclude_directories":            "exclude_directories",
@@ -302,7 +363,8 @@ class CodeContextConfig:
         scalar_fields = (
             "output_mode", "show_all_tree_directories", "prune_empty_directories",
             "save_combined", "save_individual", "export_directory",
-            "include_text_output", "project_root_display",
+            "include_text_output", "project_root_display", "cache_directory",
+            "symbol_index", "dedupe_identical_files", "respect_gitignore", "max_file_size_kb", "skip_binary_files",
         )
         for key in scalar_fields:
             if key in overrides:
@@ -313,8 +375,110 @@ class CodeContextConfig:
 # File Discovery
 # ---------------------------------------------------------------------------
 
-def _word_boundary_pattern(word: str) -> re.Pattern:
-    return re.compile(r"(^|[_\- .])" + re.escape(word) + r"([_\- .]|$)", re.IGNORECASE)
+def _word_boundary_pattern(words: list[str]) -> re.Pattern | None:
+    """One alternation for all words, so each name is scanned once regardless of list length."""
+    if not words:
+        return None
+    alternation = "|".join(re.escape(w) for w in words)
+    return re.compile(r"(^|[_\- .])(?:" + alternation + r")([_\- .]|$)", re.IGNORECASE)
+
+
+# Bytes read from files of unknown type to decide whether they are binary.
+_BINARY_SNIFF_BYTES = 8192
+
+# (base, pattern, negate, dir_only) — base is the posix path of the directory
+# holding the .gitignore, relative to the project root, with a trailing "/".
+_GitIgnoreRule = tuple[str, re.Pattern, bool, bool]
+
+
+def _looks_binary(path: str) -> bool:
+    """True if the first block contains a NUL byte — the same heuristic git uses."""
+    try:
+        with open(path, "rb") as fh:
+            return b"\0" in fh.read(_BINARY_SNIFF_BYTES)
+    except OSError:
+        return False
+
+
+def _gitignore_pattern(line: str) -> tuple[re.Pattern, bool, bool] | None:
+    """Translate one .gitignore line to (regex, negate, dir_only), or None for blanks/comments."""
+    line = line.rstrip()
+    if not line or line.startswith("#"):
+        return None
+    negate = line.startswith("!")
+    if negate:
+        line = line[1:]
+    elif line.startswith("\\"):
+        line = line[1:]  # "\#" / "\!" escapes
+    dir_only = line.endswith("/")
+    line = line.rstrip("/")
+    if not line:
+        return None
+    # A slash anywhere but the end anchors the pattern to the .gitignore's directory.
+    anchored = "/" in line
+    line = line.lstrip("/")
+
+    out: list[str] = []
+    i = 0
+    while i < len(line):
+        c = line[i]
+        if line.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+            continue
+        if line.startswith("**", i):
+            out.append(".*")
+            i += 2
+            continue
+        if c == "*":
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[" and "]" in line[i + 2:]:
+            j = line.index("]", i + 2)
+            body = line[i + 1:j]
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            elif body.startswith("^"):
+                body = "\\" + body
+            out.append(f"[{body}]")
+            i = j + 1
+            continue
+        elif c == "\\" and i + 1 < len(line):
+            out.append(re.escape(line[i + 1]))
+            i += 2
+            continue
+        else:
+            out.append(re.escape(c))
+        i += 1
+
+    prefix = "" if anchored else "(?:.*/)?"
+    return re.compile(prefix + "".join(out)), negate, dir_only
+
+
+def _read_gitignore(directory: str, base: str) -> list[_GitIgnoreRule]:
+    try:
+        with open(os.path.join(directory, ".gitignore"), encoding="utf-8", errors="replace") as fh:
+            lines = fh.read().splitlines()
+    except OSError:
+        return []
+    rules: list[_GitIgnoreRule] = []
+    for line in lines:
+        parsed = _gitignore_pattern(line)
+        if parsed is not None:
+            rules.append((base, *parsed))
+    return rules
+
+
+def _gitignored(rules: list[_GitIgnoreRule], rel: str, is_dir: bool) -> bool:
+    """Last matching rule wins, deeper .gitignore files being later in ``rules``."""
+    ignored = False
+    for base, pattern, negate, dir_only in rules:
+        if negate != ignored or (dir_only and not is_dir):
+            continue  # this rule cannot change the outcome
+        if pattern.fullmatch(rel[len(base):]):
+            ignored = not negate
+    return ignored
 
 
 class FileDiscovery:
@@ -329,26 +493,34 @@ class FileDiscovery:
       5. Word-boundary substring match on filenames
       6. Allowlist: if include_files is set, only those filenames are kept
       7. Extension: blacklist (exclude_extensions) OR whitelist (include_extensions)
+      8. .gitignore rules from the project root down (respect_gitignore)
+      9. Size cap (max_file_size_kb) and a NUL-byte sniff for files of unknown type
+         (skip_binary_files), so nothing large or binary reaches CodeExtractor
+
+    The walk uses os.scandir, so file/directory type comes from the directory
+    listing; a stat is only issued for files that survive the name filters.
+    Counts for layers 8-9 are exposed as ``last_skipped_counts``.
     """
 
     def __init__(self, cfg: CodeContextConfig) -> None:
         self._cfg = cfg
         self._dir_exact: set[str] = {d.lower() for d in cfg.exclude_directories}
-        self._dir_patterns: list[re.Pattern] = [_word_boundary_pattern(w) for w in cfg.exclude_directories_containing]
+        self._dir_pattern: re.Pattern | None = _word_boundary_pattern(cfg.exclude_directories_containing)
         self._dir_allowlist: set[str] = {d.lower() for d in cfg.include_directories}
         self._file_exact: set[str] = {f.lower() for f in cfg.exclude_files}
-        self._file_patterns: list[re.Pattern] = [_word_boundary_pattern(w) for w in cfg.exclude_files_containing]
+        self._file_pattern: re.Pattern | None = _word_boundary_pattern(cfg.exclude_files_containing)
         self._file_allowlist: set[str] = {f.lower() for f in cfg.include_files}
         self._excl_ext: set[str] = {e.lower() for e in cfg.exclude_extensions}
         self._incl_ext: set[str] = {e.lower() for e in cfg.include_extensions}
+        self._max_bytes: int | None = cfg.max_file_size_kb * 1024 if cfg.max_file_size_kb else None
+        self.last_skipped_counts: dict[str, int] = {}
 
     def should_exclude_directory(self, dirname: str) -> bool:
         low = dirname.lower()
         if low in self._dir_exact:
             return True
-        for pat in self._dir_patterns:
-            if pat.search(low):
-                return True
+        if self._dir_pattern is not None and self._dir_pattern.search(low):
+            return True
         # Allowlist: if set, exclude anything not in it
         if self._dir_allowlist and low not in self._dir_allowlist:
             return True
@@ -358,9 +530,8 @@ class FileDiscovery:
         low = filename.lower()
         if low in self._file_exact:
             return True
-        for pat in self._file_patterns:
-            if pat.search(low):
-                return True
+        if self._file_pattern is not None and self._file_pattern.search(low):
+            return True
         # Allowlist: if set, exclude anything not in it
         if self._file_allowlist and low not in self._file_allowlist:
             return True
@@ -380,6 +551,7 @@ class FileDiscovery:
             normalized = Path(os.path.normpath(subdirectory.lstrip("/\\")))
             target = root / normalized
         else:
+            normalized = None
             target = root
 
         if not target.exists():
@@ -388,25 +560,90 @@ class FileDiscovery:
 
         found: list[Path] = []
         excluded_ext_counts: dict[str, int] = defaultdict(int)
+        skipped: dict[str, int] = {"gitignored": 0, "too_large": 0, "binary": 0}
+        use_gitignore = self._cfg.respect_gitignore
+
+        # Paths are matched against .gitignore rules relative to the project root,
+        # so a scoped scan still honours the root's (and intermediate) ignore files.
+        rules: list[_GitIgnoreRule] = []
+        prefix = ""
+        if normalized is not None:
+            for part in normalized.parts:
+                if use_gitignore:
+                    rules = rules + _read_gitignore(str(root / prefix), prefix)
+                prefix += part + "/"
+
+        # Depth-first, files of a directory before its subdirectories — the same
+        # order os.walk(topdown=True) produces.
+        stack: list[tuple[str, str, list[_GitIgnoreRule]]] = [(str(target), prefix, rules)]
+        while stack:
+            dirpath, rel_dir, rules = stack.pop()
+            if use_gitignore:
+                rules = rules + _read_gitignore(dirpath, rel_dir)
+            try:
+                with os.scandir(dirpath) as it:
+                    entries = list(it)
+            except OSError as exc:
+                logger.debug("Cannot list %s: %s", dirpath, exc)
+                continue
 
-        for dirpath, dirnames, filenames in os.walk(target):
-            dirnames[:] = [d for d in dirnames if not self.should_exclude_directory(d)]
-            for fname in filenames:
-                fp = Path(dirpath) / fname
-                if not fp.is_file():
+            subdirs: list[tuple[str, str, list[_GitIgnoreRule]]] = []
+            for entry in entries:
+                name = entry.name
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    continue
+                if is_dir:
+                    # Like os.walk(followlinks=False): symlinked dirs are not entered.
+                    if entry.is_symlink() or self.should_exclude_directory(name):
+                        continue
+                    rel = rel_dir + name
+                    if rules and _gitignored(rules, rel, True):
+                        skipped["gitignored"] += 1
+                        continue
+                    subdirs.append((entry.path, rel + "/", rules))
+                    continue
+
+                try:
+                    if not entry.is_file():
+                        continue
+                except OSError:
                     continue
-                if self.should_exclude_file(fname):
+                if self.should_exclude_file(name):
                     # Count by extension so the tree can show an excluded-files summary.
                     # Only count files that pass directory filters (i.e. "normal" files
                     # that were intentionally excluded by extension/name rules, not system
                     # noise from excluded directories).
-                    ext = fp.suffix.lower() or "(no ext)"
+                    ext = os.path.splitext(name)[1].lower() or "(no ext)"
                     excluded_ext_counts[ext] += 1
-                else:
-                    found.append(fp)
+                    continue
+                if rules and _gitignored(rules, rel_dir + name, False):
+                    skipped["gitignored"] += 1
+                    continue
+                if self._max_bytes is not None:
+                    try:
+                        size = entry.stat().st_size
+                    except OSError:
+                        continue
+                    if size > self._max_bytes:
+                        skipped["too_large"] += 1
+                        continue
+                # Known source/text extensions skip the sniff; the size cap covers them.
+                if (
+                    self._cfg.skip_binary_files
+                    and os.path.splitext(name)[1].lower() not in _LANG_MAP
+                    and _looks_binary(entry.path)
+                ):
+                    skipped["binary"] += 1
+                    continue
+                found.append(Path(entry.path))
+
+            stack.extend(reversed(subdirs))
 
         # Expose excluded counts so callers (e.g. tree builder) can report them.
         self._last_excluded_counts: dict[str, int] = dict(excluded_ext_counts)
+        self.last_skipped_counts = skipped
 
         if additional_files:
             seen = set(found)
@@ -552,79 +789,358 @@ class DirectoryTree:
 # Code Extractor
 # ---------------------------------------------------------------------------
 
+# ---------------------------------------------------------------------------
+# Comment stripping — one linear scan per file, chosen by language
+# ---------------------------------------------------------------------------
+#
+# Each language family compiles to a single regex of the form
+#     ([<lead chars>](?:(?<=lead1)body1|(?<=lead2)body2|...))
+# matched left to right in one pass. String literals are matched whole, so a
+# "#" or "//" inside a string is consumed with the string and never mistaken
+# for a comment. Starting the pattern with a character class lets the regex
+# engine skip straight to candidate positions instead of trying every
+# alternative at every character. What happens to a match is decided by its
+# lead character: kept (strings), dropped (comments) or, for Python strings,
+# dropped only when the literal stands alone on its line (docstrings).
+
+# String bodies, written as unrolled loops ([^q\\]*(?:\\.[^q\\]*)*) — far fewer
+# backtracking steps than (?:\\.|[^q\\])*.
+_DQ_BODY = r'[^"\\\n]*(?:\\.[^"\\\n]*)*"'
+_SQ_BODY = r"[^'\\\n]*(?:\\.[^'\\\n]*)*'"
+_BACKTICK_BODY = r"[^`\\]*(?:\\.[^`\\]*)*`"
+_TRIPLE_DQ_BODY = r'""[^"\\]*(?:(?:\\.|"(?!""))[^"\\]*)*"""'
+_TRIPLE_SQ_BODY = r"''[^'\\]*(?:(?:\\.|'(?!''))[^'\\]*)*'''"
+
+_SLASH_COMMENTS = r"(?:/[^\n]*|\*[\s\S]*?\*/)"
+
+# A JS "/" is a comment, a regex literal or division. It starts a regex only
+# where an operand is expected: after one of =(,:[!&|?{}; or "return", with at
+# most one whitespace character between. The remaining body must then parse as
+# a regex; classes ([...]) may hold an unescaped "/".
+_JS_REGEX_AFTER = r"[=(,:\[!&|?{};]"
+_JS_SLASH_BODY = (
+    r"(?:/[^\n]*|\*[\s\S]*?\*/"
+    rf"|(?:(?<={_JS_REGEX_AFTER}/)|(?<={_JS_REGEX_AFTER}\s/)|(?<=\breturn\s/))(?![/*])"
+    r"[^/\\\[\n]*(?:(?:\\.|\[[^\]\\\n]*(?:\\.[^\]\\\n]*)*\])[^/\\\[\n]*)*/[a-z]*)"
+)
+
+# (lead char, body regex following the lead char, action) — one action per lead.
+_CommentRule = tuple[str, str, str]
+
+_COMMENT_RULES: dict[str, list[_CommentRule]] = {
+    "python": [
+        ('"', r"(?:" + _TRIPLE_DQ_BODY + "|" + _DQ_BODY + ")", "py_string"),
+        ("'", r"(?:" + _TRIPLE_SQ_BODY + "|" + _SQ_BODY + ")", "py_string"),
+        ("#", r"[^\n]*", "drop"),
+    ],
+    "c_family": [
+        ('"', r"(?:" + _TRIPLE_DQ_BODY + "|" + _DQ_BODY + ")", "keep"),  # Kotlin/Java/Swift text blocks
+        ("'", _SQ_BODY, "keep"),
+        ("`", _BACKTICK_BODY, "keep"),
+        ("/", _SLASH_COMMENTS, "drop"),
+    ],
+    "js": [
+        ('"', _DQ_BODY, "keep"),
+        ("'", _SQ_BODY, "keep"),
+        ("`", _BACKTICK_BODY, "keep"),
+        ("/", _JS_SLASH_BODY, "drop_comment"),  # keeps regex literals
+    ],
+    "rust": [
+        ('"', _DQ_BODY, "keep"),
+        ("'", r"(?:\\.|[^'\\\n])'", "keep"),  # char literals only — lifetimes ('a) stay code
+        ("/", _SLASH_COMMENTS, "drop"),
+    ],
+    "php": [
+        ('"', _DQ_BODY, "keep"),
+        ("'", _SQ_BODY, "keep"),
+        ("/", _SLASH_COMMENTS, "drop"),
+        ("#", r"(?!\[)[^\n]*", "drop"),  # but not PHP 8 #[Attributes]
+    ],
+    "css": [
+        ('"', _DQ_BODY, "keep"),
+        ("'", _SQ_BODY, "keep"),
+        ("/", r"\*[\s\S]*?\*/", "drop"),  # no // in CSS: url(http://…) must survive
+    ],
+    "scss": [
+        ('"', _DQ_BODY, "keep"),
+        ("'", _SQ_BODY, "keep"),
+        ("/", _SLASH_COMMENTS, "drop"),
+    ],
+    "hash": [
+        ('"', _DQ_BODY, "keep"),
+        ("'", _SQ_BODY, "keep"),
+        ("#", r"[^\n]*", "drop"),
+    ],
+    "lua": [
+        ('"', _DQ_BODY, "keep"),
+        ("'", _SQ_BODY, "keep"),
+        ("[", r"\[[\s\S]*?\]\]", "keep"),  # [[long strings]]
+        ("-", r"-(?:\[\[[\s\S]*?\]\]|[^\n]*)", "drop"),
+    ],
+    "sql": [
+        ("'", _SQ_BODY, "keep"),
+        ('"', _DQ_BODY, "keep"),
+        ("-", r"-[^\n]*", "drop"),
+        ("/", r"\*[\s\S]*?\*/", "drop"),
+    ],
+    "haskell": [
+        ('"', _DQ_BODY, "keep"),
+        ("-", r"-[^\n]*", "drop"),
+        ("{", r"-[\s\S]*?-\}", "drop"),
+    ],
+    "markup": [
+        ("<", r"!--[\s\S]*?-->", "drop"),
+    ],
+}
+
+_COMMENT_FAMILY: dict[str, str] = {
+    **dict.fromkeys((".py", ".pyi", ".pyw"), "python"),
+    **dict.fromkeys(
+        (".java", ".c", ".h", ".cpp", ".cc", ".cxx", ".hpp", ".cs", ".go", ".kt", ".kts",
+         ".swift", ".scala", ".dart"),
+        "c_family",
+    ),
+    **dict.fromkeys((".js", ".jsx", ".ts", ".tsx", ".mjs", ".cjs"), "js"),
+    ".rs": "rust",
+    ".php": "php",
+    ".css": "css",
+    ".scss": "scss",
+    ".sass": "scss",
+    ".less": "scss",
+    **dict.fromkeys(
+        (".rb", ".sh", ".bash", ".zsh", ".r", ".ex", ".exs", ".pl", ".yaml", ".yml", ".toml"),
+        "hash",
+    ),
+    ".lua": "lua",
+    ".sql": "sql",
+    ".hs": "haskell",
+    **dict.fromkeys((".html", ".htm", ".xml", ".vue", ".svelte"), "markup"),
+}
+
+_BLANK_RUN = re.compile(r"\n[ \t]*\n[ \t]*\n+")
+
+_COMPILED_COMMENT_RULES: dict[str, tuple[re.Pattern, dict[str, str]]] = {}
+
+
+def _comment_scanner(family: str) -> tuple[re.Pattern, dict[str, str]]:
+    compiled = _COMPILED_COMMENT_RULES.get(family)
+    if compiled is None:
+        rules = _COMMENT_RULES[family]
+        leads = "".join(dict.fromkeys(re.escape(lead) for lead, _, _ in rules))
+        bodies = "|".join(f"(?<={re.escape(lead)}){body}" for lead, body, _ in rules)
+        actions = {lead: action for lead, _, action in rules}
+        compiled = _COMPILED_COMMENT_RULES[family] = (re.compile(f"([{leads}](?:{bodies}))"), actions)
+    return compiled
+
+
+def _strip_with_rules(text: str, family: str) -> str:
+    pattern, actions = _comment_scanner(family)
+    # split() with one capture group alternates [code, match, code, match, ..., code].
+    parts = pattern.split(text)
+    for i in range(1, len(parts), 2):
+        token = parts[i]
+        action = actions[token[0]]
+        if action == "drop" or (action == "drop_comment" and token[1] in "/*"):
+            parts[i] = ""
+        elif action == "py_string" and token[:3] in ('"""', "'''") and _is_docstring(parts, i):
+            parts[i] = ""
+            parts[i - 1] = parts[i - 1].rstrip("rRuU")  # the string prefix, if any
+    return "".join(parts)
+
+
+def _is_docstring(parts: list[str], i: int) -> bool:
+    """
+    True if the string token parts[i] is a docstring: alone on its line, and
+    the first statement of the module or of a def/class body. A string that is
+    an argument or a later expression statement is kept.
+    """
+    return _alone_on_line(parts, i) and _starts_body(parts, i)
+
+
+def _alone_on_line(parts: list[str], i: int) -> bool:
+    """True if the string token parts[i] is alone on its line (an expression statement)."""
+    before = parts[i - 1]
+    nl = before.rfind("\n")
+    if nl < 0 and i > 1:
+        return False  # an earlier token shares this line
+    if before[nl + 1:].strip(" \t") not in ("", "r", "R", "u", "U"):
+        return False
+    after = parts[i + 1]
+    nl = after.find("\n")
+    if nl >= 0:
+        return not after[:nl].strip(" \t")
+    if after.strip(" \t"):
+        return False
+    # Only whitespace up to the next token: it must be a trailing comment, or end of file.
+    return i + 2 >= len(parts) or parts[i + 2][0] == "#"
+
+
+_DOCSTRING_OWNER = re.compile(r"(?:async\s+)?(?:def|class)\b")
+
+
+def _starts_body(parts: list[str], i: int) -> bool:
+    """
+    True if nothing but whitespace and (already dropped) comments precedes
+    parts[i] in the file, or in the body whose def/class header ends just
+    before it. Earlier code parts are walked backwards; string tokens are
+    skipped as opaque, and brackets are balanced to find a multi-line header.
+    """
+    before = parts[i - 1]
+    j, code = i - 1, before[: before.rfind("\n") + 1]
+    while not code.strip():
+        j -= 1
+        if j < 0:
+            return True  # first statement of the module
+        if j % 2:
+            if parts[j]:
+                return False  # preceded by a string statement
+            continue
+        code = parts[j]
+    code = code.rstrip()
+    if not code.endswith(":"):
+        return False
+
+    # Collect the header's logical line: back to a newline outside brackets.
+    line: list[str] = []
+    depth = 0
+    while True:
+        for k in range(len(code) - 1, -1, -1):
+            ch = code[k]
+            if ch in ")]}":
+                depth += 1
+            elif ch in "([{":
+                depth -= 1
+            elif ch == "\n" and depth <= 0 and code[k - 1 : k] != "\\":
+                line.append(code[k + 1:])
+                return bool(_DOCSTRING_OWNER.match("".join(reversed(line)).lstrip()))
+        line.append(code)
+        j -= 2  # skip the string token between two code parts
+        if j < 0:
+            return bool(_DOCSTRING_OWNER.match("".join(reversed(line)).lstrip()))
+        code = parts[j]
+
+
+def _strip_comments_legacy(text: str) -> str:
+    """
+    Language-agnostic fallback for unrecognised extensions: one pass per comment
+    syntax, unaware of string literals. Also the baseline for
+    benchmarks/strip_comments.py.
+    """
+    # Python triple-quoted strings (docstrings) — must come before # removal
+    text = re.sub(r"'''[\s\S]*?'''", "", text)
+    text = re.sub(r'"""[\s\S]*?"""', "", text)
+    # Python / Ruby / Shell single-line comments
+    text = re.sub(r"#[^\n]*", "", text)
+
+    # Block comments: JS/TS/CSS/Go/C/C++/Java/Rust/Swift/Kotlin/C#/PHP
+    text = re.sub(r"/\*[\s\S]*?\*/", "", text)
+    # Line comments: JS/TS/Go/C/C++/Java/Rust/Swift/Kotlin/C#/PHP
+    text = re.sub(r"//[^\n]*", "", text)
+
+    # Lua block comments
+    text = re.sub(r"--\[\[[\s\S]*?\]\]", "", text)
+    # Lua single-line comments
+    text = re.sub(r"--[^\n]*", "", text)
+
+    # HTML/XML comments
+    text = re.sub(r"<!--[\s\S]*?-->", "", text)
+    return text
+
+
+def _strip_comments_text(text: str, suffix: str) -> str:
+    """
+    Strip comments from ``text`` according to the language implied by ``suffix``
+    (e.g. ".py", ".ts"), then collapse runs of 3+ blank lines to one blank line.
+    String literals are left intact.
+    """
+    family = _COMMENT_FAMILY.get(suffix.lower())
+    if family:
+        text = _strip_with_rules(text, family)
+    else:
+        text = _strip_comments_legacy(text)
+    return _BLANK_RUN.sub("\n\n", text)
+
+
 class CodeExtractor:
     """
     Reads a single file, strips comments/docstrings, and optionally holds
     modified content for programmatic injection.
 
-    Comment stripping covers:
-    - Python:      # line comments, triple-quoted strings (docstrings)
-    - JS/TS/CSS/Go/C/C++/Java/Rust/Swift/Kotlin/C#/PHP: // and /* */
-    - Lua:         -- single-line and --[[ block ]]
-    - HTML/XML:    <!-- -->
-    - Ruby/Shell:  # (already covered by Python rule)
+    Comment stripping is chosen by file extension and never touches string
+    literals (see _strip_comments_text):
+    - Python:      # comments and docstrings (first statement of a module, class
+                   or def body), via the same regex scanner as the rest
+    - JS/TS/Go/C/C++/Java/Rust/Swift/Kotlin/C#/Scala/Dart: // and /* */
+    - PHP:         // /* */ and #;  CSS: /* */;  SCSS/LESS: // and /* */
+    - Ruby/Shell/R/Elixir/YAML/TOML: #
+    - Lua:         -- and --[[ block ]];  SQL: -- and /* */;  Haskell: -- and {- -}
+    - HTML/XML/Vue/Svelte: <!-- -->
+    - Anything else: every syntax above, string-unaware (legacy behaviour)
     """
 
-    def __init__(self, file_path: str | Path) -> None:
+    def __init__(self, file_path: str | Path, data: bytes | None = None) -> None:
+        """``data`` is the file's bytes when the caller already read them; the file is then not read again."""
         self.path = Path(file_path)
         self.original: str | None = None
         self.clean: str | None = None
         self._original_chars: int = 0
         self._clean_chars: int = 0
-        self._load()
+        self._deferred: bool = False
+        self._load(data)
 
-    def _load(self) -> None:
+    @classmethod
+    def from_cache(cls, file_path: str | Path, clean: str | None, original_chars: int) -> "CodeExtractor":
+        """
+        Build an extractor from BuildCache artifacts without reading the file.
+        ``original`` stays None until get_content() needs it, then loads from disk.
+        """
+        ex = cls.__new__(cls)
+        ex.path = Path(file_path)
+        ex.original = None
+        ex.clean = clean
+        ex._original_chars = original_chars
+        ex._clean_chars = len(clean) if clean is not None else 0
+        ex._deferred = True
+        return ex
+
+    def _load(self, data: bytes | None = None) -> None:
         try:
-            self.original = self.path.read_text(encoding="utf-8")
-        except UnicodeDecodeError:
+            if data is None:
+                data = self.path.read_bytes()
             try:
-                self.original = self.path.read_text(encoding="latin-1")
-            except Exception as exc:
-                logger.error("Cannot read %s: %s", self.path, exc)
-                self.original = None
+                text = data.decode("utf-8")
+            except UnicodeDecodeError:
+                text = data.decode("latin-1")
+            # Universal newlines, as read_text() would give.
+            self.original = text.replace("\r\n", "\n").replace("\r", "\n")
         except Exception as exc:
             logger.error("Cannot read %s: %s", self.path, exc)
             self.original = None
         self._original_chars = len(self.original) if self.original else 0
 
+    def _ensure_loaded(self) -> None:
+        if self._deferred:
+            self._deferred = False
+            self._load()
+
     def strip_comments(self) -> str | None:
+        self._ensure_loaded()
         if self.original is None:
             return None
-        text = self.original
-
-        # Python triple-quoted strings (docstrings) — must come before # removal
-        text = re.sub(r"'''[\s\S]*?'''", "", text)
-        text = re.sub(r'"""[\s\S]*?"""', "", text)
-        # Python / Ruby / Shell single-line comments
-        text = re.sub(r"#[^\n]*", "", text)
-
-        # Block comments: JS/TS/CSS/Go/C/C++/Java/Rust/Swift/Kotlin/C#/PHP
-        text = re.sub(r"/\*[\s\S]*?\*/", "", text)
-        # Line comments: JS/TS/Go/C/C++/Java/Rust/Swift/Kotlin/C#/PHP
-        text = re.sub(r"//[^\n]*", "", text)
-
-        # Lua block comments
-        text = re.sub(r"--\[\[[\s\S]*?\]\]", "", text)
-        # Lua single-line comments
-        text = re.sub(r"--[^\n]*", "", text)
-
-        # HTML/XML comments
-        text = re.sub(r"<!--[\s\S]*?-->", "", text)
-
-        # Collapse 3+ blank lines to 2
-        text = re.sub(r"\n[ \t]*\n[ \t]*\n+", "\n\n", text)
-
+        text = _strip_comments_text(self.original, self.path.suffix)
         self.clean = text
         self._clean_chars = len(text)
         return text
 
     def get_content(self, mode: OutputMode) -> str | None:
-        if mode == "clean":
-            return self.clean if self.clean is not None else self.original
+        if mode == "clean" and self.clean is not None:
+            return self.clean
+        self._ensure_loaded()
         return self.original
 
     def update_contents(self, new_contents: str) -> None:
         """Replace original content in-memory (does not write to disk)."""
+        self._deferred = False
         self.original = new_contents
         self._original_chars = len(new_contents)
         self.clean = None
@@ -632,6 +1148,7 @@ class CodeExtractor:
 
     def refresh_contents(self) -> None:
         """Re-read content from disk, discarding any in-memory edits."""
+        self._deferred = False
         self.clean = None
         self._clean_chars = 0
         self._load()
@@ -746,6 +1263,12 @@ _SIG_PATTERNS: dict[str, list[re.Pattern]] = {
         re.compile(r"^type\s+\w[\w\d]*\s+(?:struct|interface)[^{]*", re.MULTILINE),
     ],
 
+    "js": [
+        ('"', _DQ_BODY, "keep"),
+        ("'", _SQ_BODY, "keep"),
+        ("`", _BACKTICK_BODY, "keep"),
+        ("/", _JS_SLASH_BODY, "drop_comment"),  # keeps regex literals
+    ],
     "rust": [
         re.compile(r"^(?:pub(?:\([^)]+\))?\s+)?(?:async\s+)?fn\s+\w[\w\d]*[^{]*", re.MULTILINE),
         re.compile(r"^(?:pub\s+)?(?:struct|enum|trait|impl(?:\s+\w[\w\d]*)?)\s+\w[\w\d]*[^{]*", re.MULTILINE),
@@ -805,6 +1328,13 @@ _SIG_PATTERNS: dict[str, list[re.Pattern]] = {
 }
 
 
+def _parse_python(source: str, path: Path) -> ast.Module:
+    """ast.parse with SyntaxWarnings (invalid escapes etc. in scanned code) silenced."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return ast.parse(source, filename=str(path))
+
+
 class SignatureExtractor:
     """
     Extracts code signatures (function/class/method declarations) from source files.
@@ -813,9 +1343,11 @@ class SignatureExtractor:
             return types, async/positional-only/keyword-only args.
     Other supported languages: curated regex patterns per language.
     Unsupported types: noted in output but not silently dropped.
+
+    Pass ``tree`` to reuse an already-parsed Python module (see AnalysisPipeline).
     """
 
-    def extract(self, path: Path, source: str | None = None) -> SignatureBlock:
+    def extract(self, path: Path, source: str | None = None, tree: ast.Module | None = None) -> SignatureBlock:
         lang = _LANG_MAP.get(path.suffix.lower(), "unknown")
 
         if source is None:
@@ -830,7 +1362,7 @@ class SignatureExtractor:
                 return SignatureBlock(file_path=path, language=lang, note=f"read error: {exc}")
 
         if lang == "python":
-            return self._extract_python(path, source)
+            return self._extract_python(path, source, tree)
         if lang in _SUPPORTED_LANGS:
             return self._extract_regex(path, lang, source)
 
@@ -840,13 +1372,12 @@ class SignatureExtractor:
             note="signature extraction not supported for this language",
         )
 
-    def _extract_python(self, path: Path, source: str) -> SignatureBlock:
-        try:
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore")
-                tree = ast.parse(source, filename=str(path))
-        except SyntaxError as exc:
-            return SignatureBlock(file_path=path, language="python", note=f"SyntaxError: {exc}")
+    def _extract_python(self, path: Path, source: str, tree: ast.Module | None = None) -> SignatureBlock:
+        if tree is None:
+            try:
+                tree = _parse_python(source, path)
+            except SyntaxError as exc:
+                return SignatureBlock(file_path=path, language="python", note=f"SyntaxError: {exc}")
 
         sigs: list[str] = []
         method_names: set[str] = set()
@@ -1101,22 +1632,27 @@ class FunctionCallAnalyzer:
         self._include_method_calls = include_method_calls
         self._include_private_methods = include_private_methods
 
-    def analyze_file(self, path: Path, project_root: Path | None = None) -> FunctionCallGraph:
+    def analyze_file(
+        self,
+        path: Path,
+        project_root: Path | None = None,
+        source: str | None = None,
+        tree: ast.Module | None = None,
+    ) -> FunctionCallGraph:
         if path.suffix.lower() != ".py":
             return FunctionCallGraph(file_path=path, module_name=str(path), error="not a Python file")
 
         module_name = self._module_name(path, project_root)
-        try:
-            source = path.read_text(encoding="utf-8")
-        except Exception as exc:
-            return FunctionCallGraph(file_path=path, module_name=module_name, error=str(exc))
-
-        try:
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore")
-                tree = ast.parse(source, filename=str(path))
-        except SyntaxError as exc:
-            return FunctionCallGraph(file_path=path, module_name=module_name, error=f"SyntaxError: {exc}")
+        if tree is None:
+            if source is None:
+                try:
+                    source = path.read_text(encoding="utf-8")
+                except Exception as exc:
+                    return FunctionCallGraph(file_path=path, module_name=module_name, error=str(exc))
+            try:
+                tree = _parse_python(source, path)
+            except SyntaxError as exc:
+                return FunctionCallGraph(file_path=path, module_name=module_name, error=f"SyntaxError: {exc}")
 
         visitor = _CallVisitor(
             module_name,
@@ -1132,12 +1668,52 @@ class FunctionCallAnalyzer:
         files: list[Path],
         project_root: Path | None = None,
         scope: list[str] | None = None,
+        cache: BuildCache | None = None,
     ) -> list[FunctionCallGraph]:
-        candidates = [f for f in files if f.suffix.lower() == ".py"]
-        if scope:
-            scope_set = set(scope)
-            candidates = [f for f in candidates if f.stem in scope_set]
-        return [self.analyze_file(f, project_root) for f in candidates]
+        return list(self.iter_files(files, project_root, scope=scope, cache=cache))
+
+    def iter_files(
+        self,
+        files: list[Path],
+        project_root: Path | None = None,
+        scope: list[str] | None = None,
+        cache: BuildCache | None = None,
+    ) -> Iterator[FunctionCallGraph]:
+        """Lazy analyze_files(): one graph at a time, for streaming output."""
+        for f in self.candidates(files, scope):
+            if cache is None:
+                yield self.analyze_file(f, project_root)
+            else:
+                yield self._analyze_file_cached(f, project_root, cache)
+
+    @staticmethod
+    def candidates(files: list[Path], scope: list[str] | None = None) -> list[Path]:
+        """The subset of ``files`` analyze_files() covers: Python files, optionally by stem."""
+        scope_set = set(scope or ())
+        return [
+            f for f in files
+            if f.suffix.lower() == ".py" and (not scope_set or f.stem in scope_set)
+        ]
+
+    def _analyze_file_cached(self, path: Path, project_root: Path | None, cache: BuildCache) -> FunctionCallGraph:
+        # The graph depends on the module name and analyzer options, not just the content.
+        module_name = self._module_name(path, project_root)
+        options = json.dumps([
+            module_name, sorted(self._ignore), self._include_method_calls, self._include_private_methods,
+        ])
+        key = "call_graph:" + hashlib.sha1(options.encode("utf-8")).hexdigest()[:16]
+        digest = cache.digest(path)
+        hit = cache.get(digest, key)
+        if hit is not None:
+            return _call_graph_from_cache(path, hit)
+        digest, data = cache.read(path)
+        try:
+            source = data.decode("utf-8") if data is not None else None
+        except UnicodeDecodeError:
+            source = None  # analyze_file() reports it
+        cg = self.analyze_file(path, project_root, source=source)
+        cache.put(digest, key, _call_graph_to_cache(cg))
+        return cg
 
     def _module_name(self, path: Path, project_root: Path | None) -> str:
         if project_root:
@@ -1271,20 +1847,19 @@ class ASTAnalyzer:
     """Python-only structural analysis: extracts class/method/function names and args."""
 
     @staticmethod
-    def analyze_file(path: Path, source: str | None = None) -> ModuleAST:
+    def analyze_file(path: Path, source: str | None = None, tree: ast.Module | None = None) -> ModuleAST:
         if path.suffix.lower() != ".py":
             return ModuleAST(file_path=path, error="not a Python file")
-        if source is None:
+        if tree is None:
+            if source is None:
+                try:
+                    source = path.read_text(encoding="utf-8")
+                except Exception as exc:
+                    return ModuleAST(file_path=path, error=str(exc))
             try:
-                source = path.read_text(encoding="utf-8")
-            except Exception as exc:
-                return ModuleAST(file_path=path, error=str(exc))
-        try:
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore")
-                tree = ast.parse(source, filename=str(path))
-        except SyntaxError as exc:
-            return ModuleAST(file_path=path, error=f"SyntaxError: {exc}")
+                tree = _parse_python(source, path)
+            except SyntaxError as exc:
+                return ModuleAST(file_path=path, error=f"SyntaxError: {exc}")
 
         classes: list[ClassInfo] = []
         method_names: set[str] = set()
@@ -1321,124 +1896,1063 @@ class ASTAnalyzer:
 
 
 # ---------------------------------------------------------------------------
-# Builder result
+# Analysis pipeline — parse each Python file once, run every analyzer on it
 # ---------------------------------------------------------------------------
 
 @dataclass
-class FileNode:
-    """
-    Per-file metadata populated by the builder.
-    Downstream consumers (e.g. React analysis) may attach exports/imports.
-    """
-    path: Path
-    language: str | None
-    original_chars: int
-    clean_chars: int
-    signatures: list[str] = field(default_factory=list)
-    exports: dict | None = None    # attached by react_analysis consumers
-    imports: dict | None = None    # attached by react_analysis consumers
+class FileAnalysis:
+    """Per-file output of AnalysisPipeline. Plain dataclasses only, so it pickles across processes."""
+    file_path: Path
+    signature_block: SignatureBlock | None = None
+    call_graph: FunctionCallGraph | None = None
+    ast_module: ModuleAST | None = None
 
 
-@dataclass
-class CodeContextResult:
-    combined_text: str
-    files: list[Path]
-    output_mode: OutputMode
-    stats: dict
-    extractors: dict[Path, CodeExtractor] = field(default_factory=dict)
-    file_nodes: dict[Path, FileNode] = field(default_factory=dict)
-    signature_blocks: list[SignatureBlock] = field(default_factory=list)
-    ast_modules: list[ModuleAST] = field(default_factory=list)
-    call_graphs: list[FunctionCallGraph] = field(default_factory=list)
-    export_path: Path | None = None
+class AnalysisPipeline:
+    """
+    Runs SignatureExtractor, FunctionCallAnalyzer and ASTAnalyzer over a file
+    list with a single read and a single ast.parse per Python file.
 
-    def to_files_json(self, root: Path | None = None) -> dict:
-        """
-        Canonical _files-keyed JSON — the single source of truth for downstream consumers.
+    Parsing is CPU-bound and holds the GIL, so threads do not help; with
+    ``workers`` > 1 files are fanned out to a ProcessPoolExecutor in chunks and
+    only the picklable FileAnalysis results travel back. If a process pool
+    cannot be started (restricted sandboxes), analysis runs in-process.
 
-        Shape:
-            {
-                "dir": {
-                    "_files":      ["a.py", "b.py"],
-                    "full_paths":  ["/abs/dir/a.py", "/abs/dir/b.py"],
-                    "subdir": {
-                        "_files":     ["c.py"],
-                        "full_paths": ["/abs/dir/subdir/c.py"],
-                    }
-                }
-            }
+    Args:
+        signatures:       Extract a SignatureBlock for every file (any language).
+        call_graph:       Analyzer used for call graphs; None = skip.
+        call_graph_scope: Restrict call graphs to files whose stem is listed.
+        ast_analysis:     Produce a ModuleAST for every Python file.
+        project_root:     Used for call-graph module names.
+        workers:          Number of processes. 1 (default) = in-process.
+    """
 
-        Each directory node carries:
-        - "_files"      — list of bare filenames in that directory
-        - "full_paths"  — parallel list of absolute paths (as strings)
+    def __init__(
+        self,
+        signatures: bool = True,
+        call_graph: FunctionCallAnalyzer | None = None,
+        call_graph_scope: list[str] | None = None,
+        ast_analysis: bool = False,
+        project_root: Path | None = None,
+        workers: int = 1,
+    ) -> None:
+        self.signatures = signatures
+        self.call_graph = call_graph
+        self.call_graph_scope = call_graph_scope
+        self.ast_analysis = ast_analysis
+        self.project_root = project_root
+        self.workers = max(1, workers)
+        self._sig_extractor = SignatureExtractor()
+        self._graph_scope = set(call_graph_scope or ())
 
-        If a FileNode has exports/imports attached, they are embedded per file:
-            "a.py": {"exports": {...}, "imports": {...}}
+    def run(self, files: list[Path], sources: dict[Path, str] | None = None) -> list[FileAnalysis]:
         """
-        structure: dict = {}
+        Analyze ``files`` in order. ``sources`` supplies already-loaded text
+        (e.g. CodeExtractor.original) so files are not read twice. Files with
+        nothing to do are skipped, so a call-graph-only run returns
+        FunctionCallAnalyzer.candidates() entries.
+        """
+        if not self.signatures and not self.ast_analysis:
+            files = FunctionCallAnalyzer.candidates(files, self.call_graph_scope) if self.call_graph else []
+        elif not self.signatures:
+            files = [f for f in files if f.suffix.lower() == ".py"]
+        texts = [sources.get(f) if sources else None for f in files]
+
+        if self.workers > 1 and len(files) > 1:
+            # Several chunks per worker keeps the pool balanced while
+            # amortizing per-task pickling.
+            chunksize = max(1, len(files) // (self.workers * 4))
+            try:
+                with ProcessPoolExecutor(max_workers=min(self.workers, len(files))) as pool:
+                    return list(pool.map(self.analyze_file, files, texts, chunksize=chunksize))
+            except (OSError, BrokenProcessPool) as exc:
+                logger.warning("Process pool unavailable (%s); analyzing in-process", exc)
+
+        return [self.analyze_file(f, text) for f, text in zip(files, texts)]
+
+    def analyze_file(self, path: Path, source: str | None = None) -> FileAnalysis:
+        is_python = path.suffix.lower() == ".py"
+        want_graph = (
+            self.call_graph is not None
+            and is_python
+            and (not self._graph_scope or path.stem in self._graph_scope)
+        )
+        want_ast = self.ast_analysis and is_python
 
-        for f in self.files:
-            # Determine path relative to root for tree placement
-            if root:
+        tree: ast.Module | None = None
+        if is_python and (self.signatures or want_graph or want_ast):
+            if source is None:
                 try:
-                    rel = f.relative_to(root)
-                except ValueError:
-                    rel = Path(f.name)
-            else:
-                rel = Path(f.name)
+                    source = path.read_text(encoding="utf-8")
+                except Exception:
+                    source = None  # each analyzer reports read errors its own way
+            if source is not None:
+                try:
+                    tree = _parse_python(source, path)
+                except SyntaxError:
+                    tree = None  # analyzers re-parse and report the error themselves
 
-            parts = rel.parts
-            node = structure
-            for part in parts[:-1]:
-                node = node.setdefault(part, {})
+        result = FileAnalysis(file_path=path)
+        if self.signatures:
+            result.signature_block = self._sig_extractor.extract(path, source=source, tree=tree)
+        if want_graph:
+            result.call_graph = self.call_graph.analyze_file(path, self.project_root, source=source, tree=tree)
+        if want_ast:
+            result.ast_module = ASTAnalyzer.analyze_file(path, source=source, tree=tree)
+        return result
 
-            filename = parts[-1]
-            node.setdefault("_files", []).append(filename)
-            node.setdefault("full_paths", []).append(str(f))
 
-            # Embed per-file analysis data if available
-            fn = self.file_nodes.get(f)
-            if fn and (fn.exports is not None or fn.imports is not None):
-                entry: dict = {}
-                if fn.exports is not None:
-                    entry["exports"] = fn.exports
-                if fn.imports is not None:
-                    entry["imports"] = fn.imports
-                node[filename] = entry
+# ---------------------------------------------------------------------------
+# Build cache — persistent per-file artifacts for incremental rebuilds
+# ---------------------------------------------------------------------------
 
-        return structure
+# Bump whenever strip_comments / signature / call-graph output changes shape,
+# so stale artifacts from an older version are never served.
+_CACHE_VERSION = 2
 
-    def to_simple_json(self) -> dict:
-        """
-        Flat file→None mapping for lightweight use (tree shape, no _files convention).
-        """
-        structure: dict = {}
-        for f in self.files:
-            parts = f.parts
-            node = structure
-            for part in parts[:-1]:
-                node = node.setdefault(part, {})
-            node[parts[-1]] = None
-        return structure
+# Files modified this recently are hashed on the next build even when size and
+# mtime match — guards against edits landing within one mtime tick.
+_RACY_WINDOW_NS = 2_000_000_000
 
 
-# ---------------------------------------------------------------------------
-# Code Context Builder (orchestrator)
-# ---------------------------------------------------------------------------
+class BuildCache:
+    """
+    On-disk cache of derived per-file artifacts: clean text, signature blocks
+    and call graphs.
 
-class CodeContextBuilder:
+    Freshness is decided by (size, mtime_ns) from a single stat; when those
+    changed (touch, git checkout) the file is re-hashed and the entry is kept
+    if the content did not. Artifacts are stored content-addressed, so
+    byte-identical files share one entry.
+
+    Layout:
+        <cache_dir>/index.json               {"version": N, "files": {path: [size, mtime_ns, digest]}}
+        <cache_dir>/objects/ab/<digest>.json {artifact_key: artifact}
+
+    Thread-safe; call save() once after a build to flush to disk.
     """
-    Main entry point. Orchestrates:
-      discovery → extraction (parallel) → tree → signatures/content → assembly → save
 
-    Args:
-        project_root:                Root directory to scan.
-        subdirectory:                Optional subdirectory within project_root to restrict scan.
-        output_mode:                 "tree_only" | "signatures" | "clean" | "original".
-        preset:                      Named preset from config.yaml presets section.
-        config_path:                 Path to config.yaml. Defaults to the one next to this file.
-        overrides:                   Runtime exclusion/inclusion tweaks.
-        additional_files:            Extra file paths always included regardless of filters.
+    def __init__(self, cache_dir: str | Path) -> None:
+        self.cache_dir = Path(cache_dir).expanduser()
+        self._lock = threading.Lock()
+        self._index: dict[str, list] = {}
+        self._objects: dict[str, dict] = {}
+        self._dirty_objects: set[str] = set()
+        self._index_dirty = False
+        self.hits = 0
+        self.misses = 0
+        self._read_index()
+
+    # -- index ---------------------------------------------------------------
+
+    def _read_index(self) -> None:
+        index_path = self.cache_dir / "index.json"
+        if not index_path.exists():
+            return
+        try:
+            raw = json.loads(index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable build cache index %s: %s", index_path, exc)
+            return
+        if raw.get("version") != _CACHE_VERSION:
+            logger.info("Build cache version changed; starting fresh at %s", self.cache_dir)
+            return
+        self._index = raw.get("files", {})
+
+    def digest(self, path: Path) -> str | None:
+        """
+        Content digest for ``path``. Served from the index when size and mtime
+        are unchanged; otherwise the file is hashed and the index updated.
+        Returns None if the file cannot be read.
+        """
+        key = str(path)
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        with self._lock:
+            entry = self._index.get(key)
+        if entry and entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+            return entry[2]
+
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        return self._record(key, st, data)
+
+    def read(self, path: Path) -> tuple[str | None, bytes | None]:
+        """
+        Read ``path`` and return (digest, bytes), the digest taken from exactly
+        those bytes. Artifacts built from the returned bytes can be stored
+        under the digest even if the file changes meanwhile. Returns
+        (None, None) if the file cannot be read.
+        """
+        try:
+            st = path.stat()
+            data = path.read_bytes()
+        except OSError:
+            return None, None
+        return self._record(str(path), st, data), data
+
+    def _record(self, key: str, st: os.stat_result, data: bytes) -> str:
+        """Hash ``data`` and index it under the stat taken before it was read."""
+        digest = hashlib.sha1(data).hexdigest()
+        # Recently-modified files get a sentinel mtime so the next build re-hashes them.
+        mtime = st.st_mtime_ns if time.time_ns() - st.st_mtime_ns > _RACY_WINDOW_NS else -1
+        with self._lock:
+            self._index[key] = [st.st_size, mtime, digest]
+            self._index_dirty = True
+        return digest
+
+    # -- artifacts -----------------------------------------------------------
+
+    def _object_path(self, digest: str) -> Path:
+        return self.cache_dir / "objects" / digest[:2] / f"{digest}.json"
+
+    def _object(self, digest: str) -> dict:
+        with self._lock:
+            obj = self._objects.get(digest)
+        if obj is not None:
+            return obj
+        obj = {}
+        path = self._object_path(digest)
+        if path.exists():
+            try:
+                obj = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                obj = {}
+        with self._lock:
+            return self._objects.setdefault(digest, obj)
+
+    def get(self, digest: str | None, key: str) -> dict | None:
+        if digest is None:
+            return None
+        value = self._object(digest).get(key)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def put(self, digest: str | None, key: str, value: dict) -> None:
+        if digest is None:
+            return
+        obj = self._object(digest)
+        with self._lock:
+            obj[key] = value
+            self._dirty_objects.add(digest)
+
+    # -- persistence ---------------------------------------------------------
+
+    def save(self) -> None:
+        """Write the index and any new artifacts. Writes are atomic (tmp + rename)."""
+        with self._lock:
+            dirty = {d: self._objects[d] for d in self._dirty_objects}
+            self._dirty_objects.clear()
+            index = dict(self._index) if self._index_dirty else None
+            self._index_dirty = False
+
+        for digest, obj in dirty.items():
+            _atomic_write_text(self._object_path(digest), json.dumps(obj))
+        if index is not None:
+            _atomic_write_text(
+                self.cache_dir / "index.json",
+                json.dumps({"version": _CACHE_VERSION, "files": index}),
+            )
+
+    def prune(self) -> int:
+        """
+        Drop index entries for files that no longer exist and delete artifacts
+        no longer referenced by any entry. Returns the number of artifacts removed.
+        """
+        with self._lock:
+            live = {p: e for p, e in self._index.items() if os.path.exists(p)}
+            if len(live) != len(self._index):
+                self._index = live
+                self._index_dirty = True
+            referenced = {e[2] for e in live.values()}
+        self.save()
+
+        removed = 0
+        objects_dir = self.cache_dir / "objects"
+        if objects_dir.is_dir():
+            for obj_path in objects_dir.glob("*/*.json"):
+                if obj_path.stem not in referenced:
+                    obj_path.unlink(missing_ok=True)
+                    removed += 1
+        return removed
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._index)}
+
+
+def _atomic_write_text(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _call_graph_to_cache(cg: FunctionCallGraph) -> dict:
+    return {"module_name": cg.module_name, "calls": [asdict(c) for c in cg.calls], "error": cg.error}
+
+
+def _call_graph_from_cache(path: Path, data: dict) -> FunctionCallGraph:
+    return FunctionCallGraph(
+        file_path=path,
+        module_name=data["module_name"],
+        calls=[FunctionCallInfo(**c) for c in data["calls"]],
+        error=data["error"],
+    )
+
+
+# ---------------------------------------------------------------------------
+# Symbol index — persistent cross-file definitions, references, imports, calls
+# ---------------------------------------------------------------------------
+
+# Bump whenever the schema or what gets extracted changes.
+_SYMBOL_INDEX_VERSION = 1
+
+_SYMBOL_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS files (
+    id          INTEGER PRIMARY KEY,
+    path        TEXT NOT NULL UNIQUE,
+    size        INTEGER NOT NULL,
+    mtime_ns    INTEGER NOT NULL,
+    digest      TEXT NOT NULL,
+    module      TEXT NOT NULL,
+    language    TEXT NOT NULL,
+    signatures  TEXT NOT NULL,
+    note        TEXT,
+    error       TEXT
+);
+CREATE INDEX IF NOT EXISTS files_module ON files(module);
+CREATE TABLE IF NOT EXISTS definitions (
+    file_id     INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    name        TEXT NOT NULL,
+    qualname    TEXT NOT NULL,
+    kind        TEXT NOT NULL,
+    line        INTEGER NOT NULL,
+    exported    INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS definitions_name ON definitions(name);
+CREATE INDEX IF NOT EXISTS definitions_file ON definitions(file_id);
+CREATE TABLE IF NOT EXISTS refs (
+    file_id     INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    name        TEXT NOT NULL,
+    line        INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS refs_name ON refs(name);
+CREATE INDEX IF NOT EXISTS refs_file ON refs(file_id);
+CREATE TABLE IF NOT EXISTS imports (
+    file_id     INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    module      TEXT NOT NULL,
+    name        TEXT,
+    alias       TEXT,
+    line        INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS imports_module ON imports(module);
+CREATE INDEX IF NOT EXISTS imports_file ON imports(file_id);
+CREATE TABLE IF NOT EXISTS calls (
+    file_id     INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    seq         INTEGER NOT NULL,
+    caller      TEXT,
+    callee      TEXT NOT NULL,
+    callee_name TEXT NOT NULL,
+    kind        TEXT NOT NULL,
+    arguments   TEXT NOT NULL,
+    line        INTEGER NOT NULL,
+    is_async    INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS calls_callee_name ON calls(callee_name);
+CREATE INDEX IF NOT EXISTS calls_file ON calls(file_id, seq);
+"""
+
+
+@dataclass
+class SymbolRecord:
+    """One SymbolIndex query hit. ``detail`` is the qualname, caller or import alias, by query."""
+    name: str
+    kind: str
+    file_path: Path
+    line: int
+    detail: str | None = None
+
+
+class _IndexCallVisitor(_CallVisitor):
+    """_CallVisitor that also records whether each call was a plain name or an attribute call."""
+
+    def __init__(self, module_name: str) -> None:
+        super().__init__(module_name, set(), include_method_calls=True, include_private_methods=True)
+        self.kinds: dict[int, str] = {}
+
+    def visit_Call(self, node: ast.Call) -> None:
+        n = len(self.calls)
+        kind = "name" if isinstance(node.func, ast.Name) else "attr"
+        super().visit_Call(node)
+        # The call for ``node`` itself is appended before its children are visited.
+        if len(self.calls) > n:
+            self.kinds[n] = kind
+
+
+def _index_python_tree(tree: ast.Module) -> tuple[list[tuple], list[tuple], list[tuple]]:
+    """(definitions, references, imports) rows for one parsed module, without file_id."""
+    definitions: list[tuple] = []
+    exported_names: set[str] | None = None
+
+    for stmt in tree.body:
+        if isinstance(stmt, ast.Assign) and any(
+            isinstance(t, ast.Name) and t.id == "__all__" for t in stmt.targets
+        ) and isinstance(stmt.value, (ast.List, ast.Tuple)):
+            exported_names = {
+                e.value for e in stmt.value.elts
+                if isinstance(e, ast.Constant) and isinstance(e.value, str)
+            }
+
+    def _exported(name: str) -> int:
+        if exported_names is not None:
+            return int(name in exported_names)
+        return int(not name.startswith("_"))
+
+    def _walk(body: list[ast.stmt], prefix: str, in_class: bool, top: bool) -> None:
+        for stmt in body:
+            if isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                kind = "method" if in_class else "function"
+                if isinstance(stmt, ast.AsyncFunctionDef):
+                    kind = "async " + kind
+                qualname = prefix + stmt.name
+                definitions.append((stmt.name, qualname, kind, stmt.lineno, _exported(stmt.name) if top else 0))
+                _walk(stmt.body, qualname + ".", False, False)
+            elif isinstance(stmt, ast.ClassDef):
+                qualname = prefix + stmt.name
+                definitions.append((stmt.name, qualname, "class", stmt.lineno, _exported(stmt.name) if top else 0))
+                _walk(stmt.body, qualname + ".", True, False)
+            elif top and isinstance(stmt, (ast.Assign, ast.AnnAssign)):
+                targets = stmt.targets if isinstance(stmt, ast.Assign) else [stmt.target]
+                for target in targets:
+                    if isinstance(target, ast.Name) and target.id != "__all__":
+                        definitions.append((target.id, target.id, "variable", stmt.lineno, _exported(target.id)))
+
+    _walk(tree.body, "", False, True)
+
+    references: set[tuple] = set()
+    imports: list[tuple] = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load):
+            references.add((node.id, node.lineno))
+        elif isinstance(node, ast.Attribute) and isinstance(node.ctx, ast.Load):
+            references.add((node.attr, node.lineno))
+        elif isinstance(node, ast.Import):
+            for alias in node.names:
+                imports.append((alias.name, None, alias.asname, node.lineno))
+        elif isinstance(node, ast.ImportFrom):
+            module = "." * node.level + (node.module or "")
+            for alias in node.names:
+                imports.append((module, alias.name, alias.asname, node.lineno))
+
+    return definitions, sorted(references), imports
+
+
+class SymbolIndex:
+    """
+    Project-wide symbol index in a local SQLite file: definitions, references,
+    imports and call edges for Python files, plus signature blocks for every
+    file. Lookups by name or module go through B-tree indexes, so they are
+    O(log n) in the size of the project.
+
+    update() re-indexes only files whose content changed — freshness is
+    (size, mtime_ns) from one stat, with a re-hash when those moved — and
+    each file is parsed once for everything stored. Call edges are stored
+    unfiltered; call_graph() applies a FunctionCallAnalyzer's options at read
+    time, so differently configured builds share one index.
+
+        index = SymbolIndex("~/.cache/code_context/symbols.db", project_root)
+        index.update(files)
+        index.definitions("CodeExtractor")   # where is it defined?
+        index.callers("strip_comments")      # who calls it?
+        index.exports("pkg.module")          # what does the module export?
+
+    Not thread-safe; use one instance per thread.
+    """
+
+    def __init__(self, db_path: str | Path, project_root: str | Path | None = None) -> None:
+        self.db_path = Path(db_path).expanduser()
+        self.project_root = Path(project_root) if project_root else None
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._analyzer = FunctionCallAnalyzer()
+        self._sig_extractor = SignatureExtractor()
+        self.reindexed = 0
+        self._init_schema()
+
+    def _init_schema(self) -> None:
+        with self._conn:
+            self._conn.executescript(_SYMBOL_SCHEMA)
+            meta = dict(self._conn.execute("SELECT key, value FROM meta"))
+            root = str(self.project_root) if self.project_root else ""
+            if meta and (meta.get("version") != str(_SYMBOL_INDEX_VERSION) or meta.get("project_root") != root):
+                # Module names depend on the root, so a different root invalidates everything.
+                logger.info("Symbol index version or root changed; rebuilding %s", self.db_path)
+                self._conn.execute("DELETE FROM files")
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                [("version", str(_SYMBOL_INDEX_VERSION)), ("project_root", root)],
+            )
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> SymbolIndex:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # -- updating ------------------------------------------------------------
+
+    def update(self, files: list[Path], sources: dict[Path, str] | None = None) -> int:
+        """
+        Bring ``files`` up to date. ``sources`` supplies already-loaded text
+        so changed files are not read twice. Returns the number of files
+        (re)indexed.
+        """
+        known = {
+            row[0]: row[1:]
+            for row in self._conn.execute("SELECT path, size, mtime_ns, digest, id FROM files")
+        }
+        reindexed = 0
+        with self._conn:
+            for f in files:
+                try:
+                    st = f.stat()
+                except OSError:
+                    continue
+                entry = known.get(str(f))
+                if entry and entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+                    continue
+
+                source = sources.get(f) if sources else None
+                if source is None:
+                    try:
+                        source = f.read_bytes().decode("utf-8", errors="replace")
+                    except OSError:
+                        continue
+                digest = hashlib.sha1(source.encode("utf-8", errors="replace")).hexdigest()
+                # Recently-modified files keep a sentinel mtime so the next update re-checks them.
+                mtime = st.st_mtime_ns if time.time_ns() - st.st_mtime_ns > _RACY_WINDOW_NS else -1
+
+                if entry and entry[2] == digest:
+                    self._conn.execute(
+                        "UPDATE files SET size = ?, mtime_ns = ? WHERE id = ?", (st.st_size, mtime, entry[3])
+                    )
+                    continue
+                self._index_file(f, source, digest, st.st_size, mtime)
+                reindexed += 1
+        self.reindexed += reindexed
+        return reindexed
+
+    def _index_file(self, path: Path, source: str, digest: str, size: int, mtime_ns: int) -> None:
+        module = self._analyzer._module_name(path, self.project_root)
+        tree: ast.Module | None = None
+        error: str | None = None
+        if path.suffix.lower() == ".py":
+            try:
+                tree = _parse_python(source, path)
+            except SyntaxError as exc:
+                error = f"SyntaxError: {exc}"
+        sb = self._sig_extractor.extract(path, source=source, tree=tree)
+
+        self._conn.execute("DELETE FROM files WHERE path = ?", (str(path),))
+        file_id = self._conn.execute(
+            "INSERT INTO files (path, size, mtime_ns, digest, module, language, signatures, note, error)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (str(path), size, mtime_ns, digest, module, sb.language, json.dumps(sb.signatures), sb.note, error),
+        ).lastrowid
+        if tree is None:
+            return
+
+        definitions, references, imports = _index_python_tree(tree)
+        visitor = _IndexCallVisitor(module)
+        visitor.visit(tree)
+        self._conn.executemany(
+            "INSERT INTO definitions VALUES (?, ?, ?, ?, ?, ?)", [(file_id, *row) for row in definitions]
+        )
+        self._conn.executemany("INSERT INTO refs VALUES (?, ?, ?)", [(file_id, *row) for row in references])
+        self._conn.executemany("INSERT INTO imports VALUES (?, ?, ?, ?, ?)", [(file_id, *row) for row in imports])
+        self._conn.executemany(
+            "INSERT INTO calls VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    file_id, seq, c.caller, c.callee, c.callee.split(".")[-1],
+                    visitor.kinds.get(seq, "attr"), json.dumps(c.arguments), c.line, int(c.is_async),
+                )
+                for seq, c in enumerate(visitor.calls)
+            ],
+        )
+
+    def prune(self) -> int:
+        """Drop files that no longer exist on disk. Returns the number removed."""
+        gone = [(p,) for (p,) in self._conn.execute("SELECT path FROM files") if not os.path.exists(p)]
+        with self._conn:
+            self._conn.executemany("DELETE FROM files WHERE path = ?", gone)
+        return len(gone)
+
+    # -- per-file reads (used by CodeContextBuilder) -------------------------
+
+    def signature_block(self, path: Path) -> SignatureBlock | None:
+        row = self._conn.execute(
+            "SELECT language, signatures, note FROM files WHERE path = ?", (str(path),)
+        ).fetchone()
+        if row is None:
+            return None
+        return SignatureBlock(file_path=path, language=row[0], signatures=json.loads(row[1]), note=row[2])
+
+    def call_graph(self, path: Path, analyzer: FunctionCallAnalyzer | None = None) -> FunctionCallGraph | None:
+        """The graph ``analyzer.analyze_file(path, project_root)`` would return, read from the index."""
+        analyzer = analyzer or self._analyzer
+        row = self._conn.execute("SELECT id, module, error FROM files WHERE path = ?", (str(path),)).fetchone()
+        if row is None:
+            return None
+        file_id, module, error = row
+        if error:
+            return FunctionCallGraph(file_path=path, module_name=module, error=error)
+
+        calls: list[FunctionCallInfo] = []
+        for caller, callee, name, kind, arguments, line, is_async in self._conn.execute(
+            "SELECT caller, callee, callee_name, kind, arguments, line, is_async"
+            " FROM calls WHERE file_id = ? ORDER BY seq",
+            (file_id,),
+        ):
+            if name in analyzer._ignore:
+                continue
+            if kind == "attr" and (
+                not analyzer._include_method_calls
+                or (not analyzer._include_private_methods and name.startswith("_"))
+            ):
+                continue
+            calls.append(FunctionCallInfo(
+                caller=caller, callee=callee, arguments=json.loads(arguments), line=line, is_async=bool(is_async),
+            ))
+        return FunctionCallGraph(file_path=path, module_name=module, calls=calls)
+
+    # -- cross-file queries --------------------------------------------------
+
+    def definitions(self, name: str) -> list[SymbolRecord]:
+        """Where is ``name`` defined? Matches the bare name or the dotted qualname."""
+        rows = self._conn.execute(
+            "SELECT d.name, d.kind, f.path, d.line, d.qualname FROM definitions d JOIN files f ON f.id = d.file_id"
+            " WHERE d.name = ? ORDER BY f.path, d.line",
+            (name.rsplit(".", 1)[-1],),
+        )
+        return [
+            SymbolRecord(n, kind, Path(p), line, qual)
+            for n, kind, p, line, qual in rows
+            if "." not in name or qual == name or qual.endswith("." + name)
+        ]
+
+    def references(self, name: str) -> list[SymbolRecord]:
+        """Every load of ``name`` (bare or as an attribute)."""
+        rows = self._conn.execute(
+            "SELECT r.name, f.path, r.line FROM refs r JOIN files f ON f.id = r.file_id"
+            " WHERE r.name = ? ORDER BY f.path, r.line",
+            (name,),
+        )
+        return [SymbolRecord(n, "reference", Path(p), line) for n, p, line in rows]
+
+    def callers(self, name: str) -> list[SymbolRecord]:
+        """Who calls ``name``? ``detail`` is the calling function (None = module level)."""
+        rows = self._conn.execute(
+            "SELECT c.callee, f.path, c.line, c.caller FROM calls c JOIN files f ON f.id = c.file_id"
+            " WHERE c.callee_name = ? ORDER BY f.path, c.seq",
+            (name.rsplit(".", 1)[-1],),
+        )
+        return [SymbolRecord(callee, "call", Path(p), line, caller) for callee, p, line, caller in rows]
+
+    def importers(self, module: str) -> list[SymbolRecord]:
+        """Files importing ``module`` (absolute name as written in the import)."""
+        rows = self._conn.execute(
+            "SELECT i.name, f.path, i.line, i.alias FROM imports i JOIN files f ON f.id = i.file_id"
+            " WHERE i.module = ? ORDER BY f.path, i.line",
+            (module,),
+        )
+        return [SymbolRecord(n or module, "import", Path(p), line, alias) for n, p, line, alias in rows]
+
+    def exports(self, module: str) -> list[SymbolRecord]:
+        """Public top-level names of ``module``: ``__all__`` if defined, else non-underscore names."""
+        rows = self._conn.execute(
+            "SELECT d.name, d.kind, f.path, d.line, d.qualname FROM files f JOIN definitions d ON d.file_id = f.id"
+            " WHERE f.module = ? AND d.exported = 1 ORDER BY d.line",
+            (module,),
+        )
+        return [SymbolRecord(n, kind, Path(p), line, qual) for n, kind, p, line, qual in rows]
+
+    @property
+    def stats(self) -> dict[str, int]:
+        counts = {"reindexed": self.reindexed}
+        for table in ("files", "definitions", "refs", "imports", "calls"):
+            counts[table] = self._conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        return counts
+
+
+# ---------------------------------------------------------------------------
+# Watch mode — filesystem change sources for CodeContextBuilder.watch()
+# ---------------------------------------------------------------------------
+
+WatchBackend = Literal["auto", "inotify", "poll"]
+
+# <sys/inotify.h>
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = 0o2000000
+_INOTIFY_EVENT = struct.Struct("iIII")  # wd, mask, cookie, len — followed by the name
+
+
+class _InotifyWatcher:
+    """
+    Linux inotify via ctypes, so no third-party dependency is needed. Watches
+    every non-excluded directory under ``root`` and follows new ones as they
+    appear. A kernel queue overflow is reported as a change to ``root`` itself,
+    which makes the caller rescan everything.
+    """
+
+    _MASK = (
+        _IN_MODIFY | _IN_CLOSE_WRITE | _IN_CREATE | _IN_DELETE
+        | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_ONLYDIR
+    )
+
+    def __init__(self, root: Path, discovery: FileDiscovery) -> None:
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is only available on Linux")
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        try:
+            self._add_watch_fn = libc.inotify_add_watch
+            init = libc.inotify_init1
+        except AttributeError as exc:
+            raise OSError(f"libc has no inotify: {exc}") from exc
+        self._add_watch_fn.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+
+        fd = init(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, f"inotify_init1: {os.strerror(err)}")
+        self._fd = fd
+        self._root = root
+        self._discovery = discovery
+        self._dirs: dict[int, str] = {}
+        try:
+            self._add_tree(str(root), strict=True)
+        except OSError:
+            self.close()
+            raise
+
+    def _add_tree(self, top: str, strict: bool = False) -> None:
+        stack = [top]
+        while stack:
+            path = stack.pop()
+            wd = self._add_watch_fn(self._fd, os.fsencode(path), self._MASK)
+            if wd < 0:
+                err = ctypes.get_errno()
+                # ENOSPC here means fs.inotify.max_user_watches is exhausted.
+                if strict:
+                    raise OSError(err, f"inotify_add_watch {path}: {os.strerror(err)}")
+                logger.warning("Cannot watch %s: %s", path, os.strerror(err))
+                continue
+            self._dirs[wd] = path
+            try:
+                with os.scandir(path) as it:
+                    for entry in it:
+                        if (
+                            entry.is_dir(follow_symlinks=False)
+                            and not self._discovery.should_exclude_directory(entry.name)
+                        ):
+                            stack.append(entry.path)
+            except OSError:
+                continue
+
+    def wait(self, timeout: float) -> set[Path]:
+        """Block up to ``timeout`` seconds; return the paths that changed (possibly none)."""
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+
+        changed: set[Path] = set()
+        offset = 0
+        while offset + _INOTIFY_EVENT.size <= len(data):
+            wd, mask, _, name_len = _INOTIFY_EVENT.unpack_from(data, offset)
+            offset += _INOTIFY_EVENT.size
+            name = data[offset:offset + name_len].rstrip(b"\0")
+            offset += name_len
+
+            if mask & _IN_Q_OVERFLOW:
+                changed.add(self._root)
+                continue
+            if mask & _IN_IGNORED:
+                self._dirs.pop(wd, None)
+                continue
+            parent = self._dirs.get(wd)
+            if parent is None:
+                continue
+            path = os.path.join(parent, os.fsdecode(name)) if name else parent
+            if (
+                mask & _IN_ISDIR
+                and mask & (_IN_CREATE | _IN_MOVED_TO)
+                and not self._discovery.should_exclude_directory(os.path.basename(path))
+            ):
+                self._add_tree(path)
+            changed.add(Path(path))
+        return changed
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+class _PollingWatcher:
+    """Portable fallback: re-stat the tree every ``interval`` seconds and diff (size, mtime_ns) snapshots."""
+
+    def __init__(self, root: Path, discovery: FileDiscovery, interval: float) -> None:
+        self._root = root
+        self._discovery = discovery
+        self._interval = interval
+        self._snapshot = self._scan()
+        self._next_scan = time.monotonic() + interval
+
+    def _scan(self) -> dict[str, tuple[int, int]]:
+        snapshot: dict[str, tuple[int, int]] = {}
+        stack = [str(self._root)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not self._discovery.should_exclude_directory(entry.name):
+                            stack.append(entry.path)
+                    elif not self._discovery.should_exclude_file(entry.name):
+                        st = entry.stat()
+                        snapshot[entry.path] = (st.st_size, st.st_mtime_ns)
+                except OSError:
+                    continue
+        return snapshot
+
+    def wait(self, timeout: float) -> set[Path]:
+        delay = self._next_scan - time.monotonic()
+        if delay > timeout:
+            time.sleep(timeout)
+            return set()
+        if delay > 0:
+            time.sleep(delay)
+        self._next_scan = time.monotonic() + self._interval
+
+        previous, self._snapshot = self._snapshot, self._scan()
+        changed = {p for p, sig in self._snapshot.items() if previous.get(p) != sig}
+        changed.update(p for p in previous if p not in self._snapshot)
+        return {Path(p) for p in changed}
+
+    def close(self) -> None:
+        pass
+
+
+def _ancestor_dirs(files: list[Path], root: Path) -> set[Path]:
+    """Every directory between ``root`` and the given files — events on these always matter."""
+    dirs: set[Path] = set()
+    for f in files:
+        for parent in f.parents:
+            if parent in dirs or parent == root:
+                break
+            dirs.add(parent)
+    return dirs
+
+
+def _watch_relevant(path: Path, root: Path, discovery: FileDiscovery) -> bool:
+    """Whether a change to an unknown path could affect the discovered file set."""
+    try:
+        *parents, name = path.relative_to(root).parts
+    except ValueError:
+        return False  # outside root, or root itself (handled by the caller)
+    if any(discovery.should_exclude_directory(d) for d in parents):
+        return False
+    if path.is_dir():
+        return not discovery.should_exclude_directory(name)
+    return not discovery.should_exclude_file(name)
+
+
+# ---------------------------------------------------------------------------
+# Builder result
+# ---------------------------------------------------------------------------
+
+@dataclass
+class _DedupState:
+    """Content digests emitted so far in one output, for identical-file deduplication."""
+    seen: dict[bytes, Path] = field(default_factory=dict)
+    duplicates: dict[Path, Path] = field(default_factory=dict)
+    saved_chars: int = 0
+
+    def first_seen(self, f: Path, key: bytes) -> Path | None:
+        """Record ``f``; return the earlier file with the same ``key``, if any."""
+        first = self.seen.setdefault(key, f)
+        return None if first == f else first
+
+    def add_duplicate(self, f: Path, first: Path, saved_chars: int) -> None:
+        """Record that ``f`` was emitted as a reference to ``first``."""
+        self.duplicates[f] = first
+        self.saved_chars += saved_chars
+
+
+@dataclass
+class FileNode:
+    """
+    Per-file metadata populated by the builder.
+    Downstream consumers (e.g. React analysis) may attach exports/imports.
+    """
+    path: Path
+    language: str | None
+    original_chars: int
+    clean_chars: int
+    signatures: list[str] = field(default_factory=list)
+    output_mode: OutputMode | None = None  # per-file mode; differs from the result's in "budget" mode
+    duplicate_of: Path | None = None       # first file with identical output; this one was emitted as a reference
+    exports: dict | None = None    # attached by react_analysis consumers
+    imports: dict | None = None    # attached by react_analysis consumers
+
+
+@dataclass
+class CodeContextResult:
+    combined_text: str
+    files: list[Path]
+    output_mode: OutputMode
+    stats: dict
+    extractors: dict[Path, CodeExtractor] = field(default_factory=dict)
+    file_nodes: dict[Path, FileNode] = field(default_factory=dict)
+    signature_blocks: list[SignatureBlock] = field(default_factory=list)
+    ast_modules: list[ModuleAST] = field(default_factory=list)
+    call_graphs: list[FunctionCallGraph] = field(default_factory=list)
+    export_path: Path | None = None
+
+    def to_files_json(self, root: Path | None = None) -> dict:
+        """
+        Canonical _files-keyed JSON — the single source of truth for downstream consumers.
+
+        Shape:
+            {
+                "dir": {
+                    "_files":      ["a.py", "b.py"],
+                    "full_paths":  ["/abs/dir/a.py", "/abs/dir/b.py"],
+                    "subdir": {
+                        "_files":     ["c.py"],
+                        "full_paths": ["/abs/dir/subdir/c.py"],
+                    }
+                }
+            }
+
+        Each directory node carries:
+        - "_files"      — list of bare filenames in that directory
+        - "full_paths"  — parallel list of absolute paths (as strings)
+
+        If a FileNode has exports/imports attached, they are embedded per file:
+            "a.py": {"exports": {...}, "imports": {...}}
+
+        Files emitted as references to an identical earlier file carry
+        "duplicate_of" (that file's path relative to ``root``), and the
+        top level gets a "_dedup" entry with the savings from stats["dedup"].
+        """
+        structure: dict = {}
+
+        for f in self.files:
+            # Determine path relative to root for tree placement
+            if root:
+                try:
+                    rel = f.relative_to(root)
+                except ValueError:
+                    rel = Path(f.name)
+            else:
+                rel = Path(f.name)
+
+            parts = rel.parts
+            node = structure
+            for part in parts[:-1]:
+                node = node.setdefault(part, {})
+
+            filename = parts[-1]
+            node.setdefault("_files", []).append(filename)
+            node.setdefault("full_paths", []).append(str(f))
+
+            # Embed per-file analysis data if available
+            fn = self.file_nodes.get(f)
+            if fn and (fn.exports is not None or fn.imports is not None or fn.duplicate_of is not None):
+                entry: dict = {}
+                if fn.exports is not None:
+                    entry["exports"] = fn.exports
+                if fn.imports is not None:
+                    entry["imports"] = fn.imports
+                if fn.duplicate_of is not None:
+                    try:
+                        entry["duplicate_of"] = fn.duplicate_of.relative_to(root).as_posix() if root else fn.duplicate_of.name
+                    except ValueError:
+                        entry["duplicate_of"] = str(fn.duplicate_of)
+                node[filename] = entry
+
+        dedup = self.stats.get("dedup")
+        if dedup and dedup.get("duplicate_files"):
+            structure["_dedup"] = dict(dedup)
+
+        return structure
+
+    def to_simple_json(self) -> dict:
+        """
+        Flat file→None mapping for lightweight use (tree shape, no _files convention).
+        """
+        structure: dict = {}
+        for f in self.files:
+            parts = f.parts
+            node = structure
+            for part in parts[:-1]:
+                node = node.setdefault(part, {})
+            node[parts[-1]] = None
+        return structure
+
+
+# ---------------------------------------------------------------------------
+# Code Context Builder (orchestrator)
+# ---------------------------------------------------------------------------
+
+class CodeContextBuilder:
+    """
+    Main entry point. Orchestrates:
+      discovery → extraction (parallel) → tree → signatures/content → assembly → save
+
+    Args:
+        project_root:                Root directory to scan.
+        subdirectory:                Optional subdirectory within project_root to restrict scan.
+        output_mode:                 "tree_only" | "signatures" | "clean" | "original".
+        preset:                      Named preset from config.yaml presets section.
+        config_path:                 Path to config.yaml. Defaults to the one next to this file.
+        overrides:                   Runtime exclusion/inclusion tweaks.
+        additional_files:            Extra file paths always included regardless of filters.
         custom_root:                 Override the tree root label.
         show_all_tree_directories:   Show all dirs in tree, not just those with included files.
         prune_empty_directories:     Remove empty directory entries from the tree.
@@ -1446,12 +2960,27 @@ class CodeContextBuilder:
         prompt_prefix:               Text prepended to the combined output.
         prompt_suffix:               Text appended to the combined output.
         parallel_workers:            Number of threads for parallel file reading. Default: 8.
+        analysis_workers:            Number of processes for signature / call-graph analysis, which is
+                                     CPU-bound and does not scale with threads. Default: 1 (in-process).
         call_graph:                  If True, build function-call graphs for Python files.
         call_graph_ignore:           Additional function names to skip (merged with defaults).
         call_graph_highlight:        Function names to mark in call graph output.
         call_graph_scope:            If set, only analyze files whose stem is in this list.
         call_graph_include_methods:  If True (default), include method calls (ast.Attribute).
         call_graph_include_private:  If True, include private (_prefixed) method calls.
+        token_budget:                Target token count. Switches output_mode to "budget": each file
+                                     gets the most detailed mode that still fits.
+        budget_priority:             File ranking for budget mode: "recency" (newest first),
+                                     "size" (smallest first) or "path". Default: "recency".
+        budget_pins:                 Paths (relative to project_root) or glob patterns ranked ahead
+                                     of everything else in budget mode.
+        token_counter:               Callable returning the token count of a string. Defaults to a
+                                     chars/4 estimate; pass e.g. a tiktoken encoder for exact counts.
+        cache_dir:                   Directory for the persistent BuildCache. Unchanged files are
+                                     served from it on rebuilds. Overrides config.yaml; None = off.
+        symbol_index:                SQLite file for the persistent SymbolIndex. Signatures and call
+                                     graphs are read from it; only changed files are re-parsed.
+                                     Overrides config.yaml; None = off.
     """
 
     def __init__(
@@ -1470,12 +2999,19 @@ class CodeContextBuilder:
         prompt_prefix: str | None = None,
         prompt_suffix: str | None = None,
         parallel_workers: int = 8,
+        analysis_workers: int = 1,
         call_graph: bool = False,
         call_graph_ignore: list[str] | None = None,
         call_graph_highlight: list[str] | None = None,
         call_graph_scope: list[str] | None = None,
         call_graph_include_methods: bool = True,
         call_graph_include_private: bool = False,
+        token_budget: int | None = None,
+        budget_priority: BudgetPriority = "recency",
+        budget_pins: list[str] | None = None,
+        token_counter: Callable[[str], int] | None = None,
+        cache_dir: str | Path | None = None,
+        symbol_index: str | Path | None = None,
     ) -> None:
         self.project_root = Path(project_root)
         self.subdirectory = subdirectory
@@ -1484,12 +3020,17 @@ class CodeContextBuilder:
         self.prompt_prefix = prompt_prefix
         self.prompt_suffix = prompt_suffix
         self.parallel_workers = max(1, parallel_workers)
+        self.analysis_workers = max(1, analysis_workers)
         self.call_graph_enabled = call_graph
         self.call_graph_ignore = call_graph_ignore
         self.call_graph_highlight = call_graph_highlight
         self.call_graph_scope = call_graph_scope
         self.call_graph_include_methods = call_graph_include_methods
         self.call_graph_include_private = call_graph_include_private
+        self.token_budget = token_budget
+        self.budget_priority = budget_priority
+        self.budget_pins = budget_pins or []
+        self.count_tokens: Callable[[str], int] = token_counter or _estimate_tokens
 
         self.cfg = CodeContextConfig.from_yaml(config_path, preset=preset, overrides=overrides)
 
@@ -1501,61 +3042,140 @@ class CodeContextBuilder:
             self.cfg.prune_empty_directories = prune_empty_directories
         if export_directory is not None:
             self.cfg.export_directory = export_directory
+        if cache_dir is not None:
+            self.cfg.cache_directory = str(cache_dir)
+        if symbol_index is not None:
+            self.cfg.symbol_index = str(symbol_index)
+        if token_budget is not None:
+            self.cfg.output_mode = "budget"
 
     def build(self) -> CodeContextResult:
-        discovery = FileDiscovery(self.cfg)
-        files = discovery.discover(
-            self.project_root,
-            subdirectory=self.subdirectory,
-            additional_files=self.additional_files,
-        )
-        stats = discovery.analyze(files)
-        # Attach excluded file counts so tree builder can show a summary footer.
-        stats["excluded_by_extension"] = getattr(discovery, "_last_excluded_counts", {})
+        mode = self.cfg.output_mode
+        if mode == "budget" and self.token_budget is None:
+            raise ValueError('output_mode "budget" requires token_budget')
+        files, stats, tree = self._discover()
 
-        scan_root = self.project_root
-        if self.subdirectory:
-            normalized = Path(os.path.normpath(self.subdirectory.lstrip("/\\")))
-            scan_root = self.project_root / normalized
+        cache = BuildCache(self.cfg.cache_directory) if self.cfg.cache_directory else None
+        index = SymbolIndex(self.cfg.symbol_index, self.project_root) if self.cfg.symbol_index else None
+        try:
+            extractors, signature_blocks, call_graphs = self._produce(files, cache, index)
+            if index is not None:
+                index.prune()
+                stats["symbol_index"] = index.stats
+        finally:
+            if index is not None:
+                index.close()
 
-        tree = DirectoryTree(files, self.cfg, self.custom_root, scan_root=scan_root).generate(
-            project_root=self.project_root
-        )
-        mode = self.cfg.output_mode
+        if cache is not None:
+            cache.save()
+            stats["cache"] = cache.stats
 
+        return self._finish(files, stats, tree, extractors, signature_blocks, call_graphs)
+
+    def _produce(
+        self,
+        files: list[Path],
+        cache: BuildCache | None,
+        index: SymbolIndex | None = None,
+    ) -> tuple[dict[Path, CodeExtractor], list[SignatureBlock], list[FunctionCallGraph]]:
+        """
+        Load and analyze ``files`` as the output mode requires: (extractors,
+        signature blocks, call graphs). With a SymbolIndex, signatures and call
+        graphs are read from it after re-indexing only the files that changed.
+        """
+        mode = self.cfg.output_mode
         extractors: dict[Path, CodeExtractor] = {}
         signature_blocks: list[SignatureBlock] = []
-        ast_modules: list[ModuleAST] = []
         call_graphs: list[FunctionCallGraph] = []
 
-        if mode in ("clean", "original", "signatures"):
-            extractors = self._load_files_parallel(files)
+        if cache is not None and mode in ("clean", "signatures"):
+            extractors, signature_blocks = self._load_files_cached(files, cache, mode)
 
-        if mode == "clean":
-            for ex in extractors.values():
-                ex.strip_comments()
-
-        elif mode == "signatures":
-            sig_extractor = SignatureExtractor()
-            signature_blocks = sig_extractor.extract_files(files, extractors)
+        elif mode in ("clean", "original", "signatures", "budget"):
+            extractors = self._load_files_parallel(files)
 
-        if self.call_graph_enabled:
-            # Merge: defaults + project noise from config + caller-supplied ignore
-            merged_ignore = list(_DEFAULT_CALL_GRAPH_IGNORE)
-            merged_ignore.extend(self.cfg.call_graph_project_noise)
-            if self.call_graph_ignore:
-                merged_ignore.extend(self.call_graph_ignore)
-            analyzer = FunctionCallAnalyzer(
-                ignore=merged_ignore,
-                highlight=self.call_graph_highlight,
-                include_method_calls=self.call_graph_include_methods,
-                include_private_methods=self.call_graph_include_private,
+            # Budget planning needs every level's cost, so it produces all of them up front.
+            if mode in ("clean", "budget"):
+                for ex in extractors.values():
+                    ex.strip_comments()
+
+        want_signatures = mode == "budget" or (mode == "signatures" and cache is None)
+        want_call_graphs = self.call_graph_enabled and (cache is None or index is not None)
+        # Cached extractors load their original text lazily; don't force that just to index.
+        sources = {f: ex.original for f, ex in extractors.items()} if cache is None else None
+
+        if index is not None and (want_signatures or want_call_graphs):
+            index.update(files, sources)
+            if want_signatures:
+                signature_blocks = [sb for sb in map(index.signature_block, files) if sb is not None]
+            if want_call_graphs:
+                analyzer = self._call_graph_analyzer()
+                candidates = FunctionCallAnalyzer.candidates(files, self.call_graph_scope)
+                call_graphs = [cg for cg in (index.call_graph(f, analyzer) for f in candidates) if cg is not None]
+
+        # Signatures and call graphs share one parse per Python file.
+        elif want_signatures or want_call_graphs:
+            pipeline = AnalysisPipeline(
+                signatures=want_signatures,
+                call_graph=self._call_graph_analyzer() if want_call_graphs else None,
+                call_graph_scope=self.call_graph_scope,
+                project_root=self.project_root,
+                workers=self.analysis_workers,
             )
-            call_graphs = analyzer.analyze_files(
-                files, self.project_root, scope=self.call_graph_scope
+            analyses = pipeline.run(files, sources)
+            if want_signatures:
+                signature_blocks = [a.signature_block for a in analyses]
+            call_graphs = [a.call_graph for a in analyses if a.call_graph is not None]
+
+        if self.call_graph_enabled and cache is not None and index is None:
+            call_graphs = self._call_graph_analyzer().analyze_files(
+                files, self.project_root, scope=self.call_graph_scope, cache=cache
             )
 
-        combined = self._assemble(files, extractors, tree, signature_blocks, call_graphs, mode)
+        return extractors, signature_blocks, call_graphs
+
+    def _finish(
+        self,
+        files: list[Path],
+        stats: dict,
+        tree: str,
+        extractors: dict[Path, CodeExtractor],
+        signature_blocks: list[SignatureBlock],
+        call_graphs: list[FunctionCallGraph],
+        sections: dict[Path, list[str]] | None = None,
+    ) -> CodeContextResult:
+        """
+        Plan (budget mode), assemble and package already-produced per-file
+        artifacts. ``sections`` holds pre-rendered per-file body parts (see
+        watch()); files missing from it are rendered here.
+        """
+        mode = self.cfg.output_mode
+        file_modes: dict[Path, OutputMode] | None = None
+        if mode == "budget":
+            file_modes = self._plan_budget(files, extractors, signature_blocks, tree, call_graphs)
+
+        dedup = _DedupState() if self.cfg.dedupe_identical_files else None
+        combined = self._assemble(
+            files, extractors, tree, signature_blocks, call_graphs, mode, file_modes,
+            sections=sections if file_modes is None else None,
+            dedup=dedup,
+        )
+        if dedup is not None:
+            stats["dedup"] = {
+                "duplicate_files": len(dedup.duplicates),
+                "saved_chars": dedup.saved_chars,
+            }
+
+        if file_modes is not None:
+            by_mode = {level: 0 for level in _BUDGET_LEVELS}
+            for file_mode in file_modes.values():
+                by_mode[file_mode] += 1
+            stats["budget"] = {
+                "target_tokens": self.token_budget,
+                "estimated_tokens": self.count_tokens(combined),
+                "priority": self.budget_priority,
+                "files_by_mode": by_mode,
+            }
 
         # Build file_nodes from extractors
         sig_map = {sb.file_path: sb for sb in signature_blocks}
@@ -1565,8 +3185,9 @@ class CodeContextBuilder:
             lang = _LANG_MAP.get(f.suffix.lower())
             original_chars = ex.char_counts.get("original", 0) if ex else 0
             clean_chars = ex.char_counts.get("clean", 0) if ex else 0
+            file_mode = file_modes[f] if file_modes is not None else mode
             sigs: list[str] = []
-            if mode == "signatures":
+            if file_mode == "signatures":
                 sb = sig_map.get(f)
                 if sb:
                     sigs = list(sb.signatures)
@@ -1576,6 +3197,8 @@ class CodeContextBuilder:
                 original_chars=original_chars,
                 clean_chars=clean_chars,
                 signatures=sigs,
+                output_mode=file_mode,
+                duplicate_of=dedup.duplicates.get(f) if dedup is not None else None,
             )
 
         return CodeContextResult(
@@ -1586,10 +3209,290 @@ class CodeContextBuilder:
             extractors=extractors,
             file_nodes=file_nodes,
             signature_blocks=signature_blocks,
-            ast_modules=ast_modules,
+            ast_modules=[],
             call_graphs=call_graphs,
         )
 
+    def watch(
+        self,
+        interval: float = 0.5,
+        debounce: float = 0.05,
+        backend: WatchBackend = "auto",
+        stop_event: threading.Event | None = None,
+    ) -> Iterator[CodeContextResult]:
+        """
+        Yield a full build() result, then a fresh CodeContextResult after every
+        batch of filesystem changes, until ``stop_event`` is set or the
+        generator is closed.
+
+        The discovered file set, extractors, signature blocks, call graphs and
+        rendered per-file sections stay in memory between results. An edit
+        re-processes only the edited files; adding, removing or renaming files
+        re-runs discovery and the tree, but still re-processes only the new
+        files. stats["refresh"] reports what each refresh touched.
+
+            for result in builder.watch():
+                builder.save(result)
+
+        Args:
+            interval:   Poll period in seconds (polling backend), and how often
+                        ``stop_event`` is checked.
+            debounce:   Quiet period that closes a batch of changes, so an
+                        editor's write + rename is one refresh, not two.
+            backend:    "inotify" (Linux), "poll" (mtime/size polling, portable)
+                        or "auto" — inotify when available, else polling.
+            stop_event: Set from another thread to end the loop.
+        """
+        mode = self.cfg.output_mode
+        if mode == "budget" and self.token_budget is None:
+            raise ValueError('output_mode "budget" requires token_budget')
+
+        files, base_stats, tree = self._discover()
+        cache = BuildCache(self.cfg.cache_directory) if self.cfg.cache_directory else None
+        index = SymbolIndex(self.cfg.symbol_index, self.project_root) if self.cfg.symbol_index else None
+        extractors, signature_blocks, call_graphs = self._produce(files, cache, index)
+        if cache is not None:
+            cache.save()
+        sig_map = {sb.file_path: sb for sb in signature_blocks}
+        graph_map = {cg.file_path: cg for cg in call_graphs}
+        # Budget mode re-plans globally on every change, so there is nothing to keep per file.
+        sections: dict[Path, list[str]] | None = None
+        if mode != "budget":
+            sections = {f: self._file_sections(f, extractors, sig_map, mode) for f in files}
+
+        scan_root = self._scan_root()
+        discovery = FileDiscovery(self.cfg)
+        file_set = set(files)
+        dir_set = _ancestor_dirs(files, scan_root)
+        # Start watching before the first yield so edits made while the caller
+        # handles a result are picked up by the next one.
+        watcher = self._make_watcher(scan_root, discovery, backend, interval)
+        try:
+            yield self._finish(files, dict(base_stats), tree, extractors, signature_blocks, call_graphs, sections)
+
+            while stop_event is None or not stop_event.is_set():
+                changed = watcher.wait(interval)
+                if not changed:
+                    continue
+                while more := watcher.wait(debounce):
+                    changed |= more
+                started = time.perf_counter()
+
+                relevant = {
+                    p for p in changed
+                    if p in file_set or p in dir_set or _watch_relevant(p, scan_root, discovery)
+                }
+                if not relevant:
+                    continue
+
+                # scan_root itself is reported when change events were lost.
+                rescan_all = scan_root in relevant
+                if rescan_all or any(p not in file_set or not p.is_file() for p in relevant):
+                    new_files, base_stats, new_tree = self._discover()
+                    dirty = [f for f in new_files if rescan_all or f in relevant or f not in file_set]
+                    if not dirty and new_files == files and new_tree == tree:
+                        continue
+                    files, tree = new_files, new_tree
+                    file_set = set(files)
+                    dir_set = _ancestor_dirs(files, scan_root)
+                    for mapping in (extractors, sig_map, graph_map, sections or {}):
+                        for gone in [f for f in mapping if f not in file_set]:
+                            del mapping[gone]
+                else:
+                    dirty = [f for f in files if f in relevant]
+
+                new_extractors, new_blocks, new_graphs = self._produce(dirty, cache, index)
+                extractors.update(new_extractors)
+                for f in dirty:
+                    graph_map.pop(f, None)
+                sig_map.update((sb.file_path, sb) for sb in new_blocks)
+                graph_map.update((cg.file_path, cg) for cg in new_graphs)
+                if sections is not None:
+                    for f in dirty:
+                        sections[f] = self._file_sections(f, extractors, sig_map, mode)
+                if cache is not None:
+                    cache.save()
+
+                stats = dict(base_stats)
+                stats["refresh"] = {
+                    "changed_files": len(dirty),
+                    "seconds": round(time.perf_counter() - started, 4),
+                }
+                yield self._finish(
+                    files,
+                    stats,
+                    tree,
+                    extractors,
+                    [sig_map[f] for f in files if f in sig_map],
+                    [graph_map[f] for f in files if f in graph_map],
+                    sections,
+                )
+        finally:
+            watcher.close()
+            if index is not None:
+                index.close()
+
+    def build_stream(self) -> Iterator[str]:
+        """
+        Streaming counterpart of build(): yields the combined text in chunks —
+        header, tree, then one file at a time in discovery order — without ever
+        holding the whole output or every file in memory.
+
+        "".join(builder.build_stream()) == builder.build().combined_text
+        """
+        files, _, tree = self._discover()
+        yield from self._stream_chunks(files, tree, self.cfg.output_mode)
+
+    def save_stream(
+        self,
+        sink: TextIO | None = None,
+        export_directory: str | None = None,
+    ) -> Path | None:
+        """
+        Write build_stream() output straight to ``sink`` (any object with .write),
+        or to a timestamped file in the export directory alongside its structure
+        JSON. Returns the written path, or None when writing to a sink.
+        """
+        files, stats, tree = self._discover()
+        mode = self.cfg.output_mode
+        chunks = self._stream_chunks(files, tree, mode)
+
+        if sink is not None:
+            for chunk in chunks:
+                sink.write(chunk)
+            return None
+
+        export_dir = Path(export_directory or self.cfg.export_directory)
+        export_dir.mkdir(parents=True, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+        out_path = export_dir / f"{mode}_{timestamp}.txt"
+        with open(out_path, "w", encoding="utf-8") as fh:
+            for chunk in chunks:
+                fh.write(chunk)
+        logger.info("Saved: %s", out_path)
+        print(f"Saved: {out_path}")
+
+        json_path = export_dir / f"{mode}_{timestamp}_structure.json"
+        skeleton = CodeContextResult(combined_text="", files=files, output_mode=mode, stats=stats)
+        json_path.write_text(
+            json.dumps(skeleton.to_files_json(root=self.project_root), indent=2),
+            encoding="utf-8",
+        )
+        logger.info("Saved structure JSON: %s", json_path)
+        return out_path
+
+    def _discover(self) -> tuple[list[Path], dict, str]:
+        """Run discovery and render the tree. Returns (files, stats, tree)."""
+        discovery = FileDiscovery(self.cfg)
+        files = discovery.discover(
+            self.project_root,
+            subdirectory=self.subdirectory,
+            additional_files=self.additional_files,
+        )
+        stats = discovery.analyze(files)
+        # Attach excluded file counts so tree builder can show a summary footer.
+        stats["excluded_by_extension"] = getattr(discovery, "_last_excluded_counts", {})
+        stats["skipped_files"] = discovery.last_skipped_counts
+
+        tree = DirectoryTree(files, self.cfg, self.custom_root, scan_root=self._scan_root()).generate(
+            project_root=self.project_root
+        )
+        return files, stats, tree
+
+    def _scan_root(self) -> Path:
+        if self.subdirectory:
+            normalized = Path(os.path.normpath(self.subdirectory.lstrip("/\\")))
+            return self.project_root / normalized
+        return self.project_root
+
+    def _make_watcher(
+        self,
+        root: Path,
+        discovery: FileDiscovery,
+        backend: WatchBackend,
+        interval: float,
+    ) -> _InotifyWatcher | _PollingWatcher:
+        if backend in ("auto", "inotify"):
+            try:
+                return _InotifyWatcher(root, discovery)
+            except OSError as exc:
+                if backend == "inotify":
+                    raise
+                logger.info("inotify unavailable (%s); polling every %.2fs", exc, interval)
+        return _PollingWatcher(root, discovery, interval)
+
+    def _call_graph_analyzer(self) -> FunctionCallAnalyzer:
+        # Merge: defaults + project noise from config + caller-supplied ignore
+        merged_ignore = list(_DEFAULT_CALL_GRAPH_IGNORE)
+        merged_ignore.extend(self.cfg.call_graph_project_noise)
+        if self.call_graph_ignore:
+            merged_ignore.extend(self.call_graph_ignore)
+        return FunctionCallAnalyzer(
+            ignore=merged_ignore,
+            highlight=self.call_graph_highlight,
+            include_method_calls=self.call_graph_include_methods,
+            include_private_methods=self.call_graph_include_private,
+        )
+
+    def _stream_chunks(self, files: list[Path], tree: str, mode: OutputMode) -> Iterator[str]:
+        """
+        Lazily load, process and emit each file. A bounded window of
+        ``parallel_workers`` files is read ahead, so peak memory tracks the
+        largest few files rather than the project.
+        """
+        if mode == "budget":
+            # Planning needs every file's costs up front, so there is nothing to stream.
+            yield self.build().combined_text
+            return
+
+        cache = BuildCache(self.cfg.cache_directory) if self.cfg.cache_directory else None
+        sig_extractor = SignatureExtractor()
+
+        def _load(path: Path) -> tuple[CodeExtractor, SignatureBlock | None]:
+            if cache is not None and mode in ("clean", "signatures"):
+                _, ex, sb = self._load_one_cached(path, cache, mode, sig_extractor)
+                return ex, sb
+            ex = CodeExtractor(path)
+            if mode == "clean":
+                ex.strip_comments()
+            sb = sig_extractor.extract(path, source=ex.original) if mode == "signatures" else None
+            return ex, sb
+
+        dedup = _DedupState() if self.cfg.dedupe_identical_files else None
+
+        def _body_parts() -> Iterator[str]:
+            if mode == "tree_only":
+                return
+            with ThreadPoolExecutor(max_workers=self.parallel_workers) as executor:
+                window: deque = deque()
+                pending = iter(files)
+                for f in pending:
+                    window.append((f, executor.submit(_load, f)))
+                    if len(window) >= self.parallel_workers:
+                        break
+                while window:
+                    f, future = window.popleft()
+                    nxt = next(pending, None)
+                    if nxt is not None:
+                        window.append((nxt, executor.submit(_load, nxt)))
+                    ex, sb = future.result()
+                    yield from self._iter_body_parts([f], {f: ex}, [sb] if sb else [], mode, dedup=dedup)
+
+        call_graphs: Iterable[FunctionCallGraph] = ()
+        if self.call_graph_enabled:
+            call_graphs = self._call_graph_analyzer().iter_files(
+                files, self.project_root, scope=self.call_graph_scope, cache=cache
+            )
+
+        first = True
+        for part in self._iter_parts(files, tree, mode, _body_parts(), call_graphs):
+            yield part if first else "\n" + part
+            first = False
+
+        if cache is not None:
+            cache.save()
+
     def _load_files_parallel(self, files: list[Path]) -> dict[Path, CodeExtractor]:
         """Load all files in parallel using a thread pool."""
         extractors: dict[Path, CodeExtractor] = {}
@@ -1607,6 +3510,74 @@ class CodeContextBuilder:
 
         return extractors
 
+    def _load_files_cached(
+        self,
+        files: list[Path],
+        cache: BuildCache,
+        mode: OutputMode,
+    ) -> tuple[dict[Path, CodeExtractor], list[SignatureBlock]]:
+        """
+        Cache-aware counterpart of _load_files_parallel for "clean" and "signatures".
+        Hits are served without reading the file; misses are loaded, processed and
+        written back. Signature blocks are returned in ``files`` order.
+        """
+        extractors: dict[Path, CodeExtractor] = {}
+        sig_map: dict[Path, SignatureBlock] = {}
+        if not files:
+            return extractors, []
+        sig_extractor = SignatureExtractor()
+
+        with ThreadPoolExecutor(max_workers=self.parallel_workers) as executor:
+            futures = {
+                executor.submit(self._load_one_cached, f, cache, mode, sig_extractor): f for f in files
+            }
+            for future in as_completed(futures):
+                path, ex, sb = future.result()
+                extractors[path] = ex
+                if sb is not None:
+                    sig_map[path] = sb
+
+        return extractors, [sig_map[f] for f in files if f in sig_map]
+
+    @staticmethod
+    def _load_one_cached(
+        path: Path,
+        cache: BuildCache,
+        mode: OutputMode,
+        sig_extractor: SignatureExtractor,
+    ) -> tuple[Path, CodeExtractor, SignatureBlock | None]:
+        digest = cache.digest(path)
+        if mode == "clean":
+            hit = cache.get(digest, "clean")
+            if hit is not None:
+                return path, CodeExtractor.from_cache(path, hit["text"], hit["original_chars"]), None
+            digest, data = cache.read(path)
+            ex = CodeExtractor(path, data)
+            ex.strip_comments()
+            if ex.original is not None:
+                cache.put(digest, "clean", {"text": ex.clean, "original_chars": ex.char_counts["original"]})
+            return path, ex, None
+
+        # Language comes from the suffix, so identical content under another extension is a separate entry.
+        key = f"signatures:{path.suffix.lower()}"
+        hit = cache.get(digest, key)
+        if hit is not None:
+            sb = SignatureBlock(
+                file_path=path, language=hit["language"], signatures=hit["signatures"], note=hit["note"],
+            )
+            return path, CodeExtractor.from_cache(path, None, hit["original_chars"]), sb
+        digest, data = cache.read(path)
+        ex = CodeExtractor(path, data)
+        sb = sig_extractor.extract(path, source=ex.original)
+        if ex.original is not None:
+            cache.put(digest, key, {
+                "language": sb.language,
+                "signatures": sb.signatures,
+                "note": sb.note,
+                "original_chars": ex.char_counts["original"],
+            })
+        return path, ex, sb
+
     def _assemble(
         self,
         files: list[Path],
@@ -1615,60 +3586,278 @@ class CodeContextBuilder:
         signature_blocks: list[SignatureBlock],
         call_graphs: list[FunctionCallGraph],
         mode: OutputMode,
+        file_modes: dict[Path, OutputMode] | None = None,
+        sections: dict[Path, list[str]] | None = None,
+        dedup: _DedupState | None = None,
     ) -> str:
-        parts: list[str] = []
+        body = self._iter_body_parts(files, extractors, signature_blocks, mode, file_modes, sections, dedup)
+        return "\n".join(self._iter_parts(files, tree, mode, body, call_graphs))
+
+    def _file_sections(
+        self,
+        f: Path,
+        extractors: dict[Path, CodeExtractor],
+        sig_map: dict[Path, SignatureBlock],
+        mode: OutputMode,
+    ) -> list[str]:
+        """One file's body parts in ``mode`` — [] when it contributes nothing."""
+        if mode == "tree_only":
+            return []
+        if mode == "signatures":
+            sb = sig_map.get(f)
+            return [sb.to_text(self.project_root)] if sb else []
+
+        # "clean" or "original"
+        ex = extractors.get(f)
+        if not ex:
+            return []
+        content = ex.get_content(mode)
+        if not content:
+            return []
+        lang = _LANG_MAP.get(f.suffix.lower())
+        return [ex.file_header(self.project_root, language=lang), content]
+
+    def _iter_body_parts(
+        self,
+        files: list[Path],
+        extractors: dict[Path, CodeExtractor],
+        signature_blocks: list[SignatureBlock],
+        mode: OutputMode,
+        file_modes: dict[Path, OutputMode] | None = None,
+        sections: dict[Path, list[str]] | None = None,
+        dedup: _DedupState | None = None,
+    ) -> Iterator[str]:
+        """
+        Per-file sections. ``file_modes`` (budget mode) overrides ``mode`` per
+        file; ``sections`` supplies already-rendered parts. With ``dedup``, a
+        file whose emitted content repeats an earlier file's is replaced by a
+        one-line reference to that file, unless the reference is no shorter
+        than the content itself.
+        """
+        if mode == "tree_only":
+            return
+
+        sig_map = {sb.file_path: sb for sb in signature_blocks}
+        for f in files:
+            file_mode = file_modes.get(f, "tree_only") if file_modes is not None else mode
+            if sections is not None and f in sections:
+                parts = sections[f]
+            else:
+                parts = self._file_sections(f, extractors, sig_map, file_mode)
+            if not parts:
+                continue
+            if dedup is not None:
+                first = dedup.first_seen(f, self._content_key(f, extractors, sig_map, file_mode))
+                if first is not None:
+                    reference = self._duplicate_sections(f, first, extractors, sig_map, file_mode)
+                    saved = sum(map(len, parts)) - sum(map(len, reference))
+                    if saved > 0:
+                        dedup.add_duplicate(f, first, saved)
+                        yield from reference
+                        continue
+            yield from parts
 
+    @staticmethod
+    def _content_key(
+        f: Path,
+        extractors: dict[Path, CodeExtractor],
+        sig_map: dict[Path, SignatureBlock],
+        mode: OutputMode,
+    ) -> bytes:
+        """Digest of what ``f`` emits in ``mode``, independent of its path."""
+        if mode == "signatures":
+            sb = sig_map[f]
+            payload = json.dumps([sb.language, sb.signatures, sb.note])
+        else:
+            payload = extractors[f].get_content(mode)
+        return hashlib.sha1(f"{mode}\0{payload}".encode("utf-8", errors="surrogatepass")).digest()
+
+    def _duplicate_sections(
+        self,
+        f: Path,
+        first: Path,
+        extractors: dict[Path, CodeExtractor],
+        sig_map: dict[Path, SignatureBlock],
+        mode: OutputMode,
+    ) -> list[str]:
+        """Stand-in for a duplicate file's section: its header plus a pointer to the first copy."""
+        try:
+            first_display = first.relative_to(self.project_root).as_posix()
+        except ValueError:
+            first_display = str(first)
+        if mode == "signatures":
+            sb = sig_map[f]
+            stub = SignatureBlock(file_path=f, language=sb.language, note=f"identical to {first_display}")
+            return [stub.to_text(self.project_root)]
+        lang = _LANG_MAP.get(f.suffix.lower())
+        return [extractors[f].file_header(self.project_root, language=lang), f"(identical to {first_display})"]
+
+    def _plan_budget(
+        self,
+        files: list[Path],
+        extractors: dict[Path, CodeExtractor],
+        signature_blocks: list[SignatureBlock],
+        tree: str,
+        call_graphs: list[FunctionCallGraph],
+    ) -> dict[Path, OutputMode]:
+        """
+        Choose a mode per file so the combined output fits ``token_budget``.
+
+        Pinned files are upgraded first, each to the most detailed level that fits.
+        The rest are upgraded breadth-first in priority order — every file is tried
+        at "signatures" before any is tried at "clean", then "original" — so the
+        budget buys coverage before depth.
+
+        With ``dedupe_identical_files``, files that would emit the same content at
+        a level are costed as a group: the first copy in output order pays in full,
+        the others only their one-line reference, as _iter_body_parts() emits them.
+        """
+        count = self.count_tokens
+        sig_map = {sb.file_path: sb for sb in signature_blocks}
+        dedupe = self.cfg.dedupe_identical_files
+
+        # Cost of each level per file, including its section header.
+        costs: dict[Path, dict[str, int]] = {}
+        for f in files:
+            level_costs = {"tree_only": 0}
+            sb = sig_map.get(f)
+            if sb:
+                level_costs["signatures"] = count(sb.to_text(self.project_root))
+            ex = extractors.get(f)
+            if ex:
+                header = count(ex.file_header(self.project_root, language=_LANG_MAP.get(f.suffix.lower())))
+                for level in ("clean", "original"):
+                    content = ex.get_content(level)
+                    if content:
+                        level_costs[level] = header + count(content)
+            costs[f] = level_costs
+
+        fixed = count("\n".join(self._iter_parts(files, tree, "budget", (), call_graphs)))
+        remaining = self.token_budget - fixed
+        if remaining < 0:
+            logger.warning(
+                "token_budget %d is below the tree/header cost (~%d tokens); emitting tree only.",
+                self.token_budget, fixed,
+            )
+
+        plan: dict[Path, OutputMode] = {f: "tree_only" for f in files}
+        order = {f: i for i, f in enumerate(files)}
+        groups: dict[tuple[str, bytes | Path], set[Path]] = {}
+        ref_costs: dict[tuple[Path, Path, str], int] = {}
+
+        keys: dict[tuple[Path, str], bytes | Path] = {}
+
+        def _group(f: Path, level: str) -> tuple[str, bytes | Path]:
+            if (f, level) not in keys:
+                keys[f, level] = self._content_key(f, extractors, sig_map, level) if dedupe else f
+            return level, keys[f, level]
+
+        def _group_cost(level: str, members: set[Path]) -> int:
+            if not members:
+                return 0
+            first = min(members, key=order.__getitem__)
+            total = costs[first][level]
+            for m in members - {first}:
+                if (m, first, level) not in ref_costs:
+                    reference = self._duplicate_sections(m, first, extractors, sig_map, level)
+                    ref_costs[m, first, level] = sum(map(count, reference))
+                total += min(costs[m][level], ref_costs[m, first, level])
+            return total
+
+        def _try(f: Path, level: str) -> bool:
+            nonlocal remaining
+            if level not in costs[f]:
+                return False
+            new = _group(f, level)
+            members = groups.get(new, set())
+            extra = _group_cost(level, members | {f}) - _group_cost(level, members)
+            old = _group(f, plan[f]) if plan[f] != "tree_only" else None
+            if old is not None:
+                extra += _group_cost(plan[f], groups[old] - {f}) - _group_cost(plan[f], groups[old])
+            if extra > remaining:
+                return False
+            if old is not None:
+                groups[old].discard(f)
+            groups.setdefault(new, set()).add(f)
+            plan[f] = level
+            remaining -= extra
+            return True
+
+        pinned, ranked = self._budget_order(files)
+        for f in pinned:
+            for level in reversed(_BUDGET_LEVELS[1:]):
+                if _try(f, level):
+                    break
+        for level in _BUDGET_LEVELS[1:]:
+            for f in ranked:
+                if _BUDGET_LEVELS.index(level) > _BUDGET_LEVELS.index(plan[f]):
+                    _try(f, level)
+        return plan
+
+    def _budget_order(self, files: list[Path]) -> tuple[list[Path], list[Path]]:
+        """Split ``files`` into (pinned, rest), each ranked by ``budget_priority``."""
+        def _stat_key(f: Path) -> float:
+            try:
+                st = f.stat()
+            except OSError:
+                return 0.0
+            return -st.st_mtime if self.budget_priority == "recency" else float(st.st_size)
+
+        if self.budget_priority == "path":
+            ranked = sorted(files)
+        else:
+            ranked = sorted(files, key=_stat_key)
+
+        def _is_pinned(f: Path) -> bool:
+            try:
+                rel = f.relative_to(self.project_root).as_posix()
+            except ValueError:
+                rel = f.as_posix()
+            return any(rel == pin or fnmatch.fnmatch(rel, pin) for pin in self.budget_pins)
+
+        pinned = [f for f in ranked if _is_pinned(f)]
+        pinned_set = set(pinned)
+        return pinned, [f for f in ranked if f not in pinned_set]
+
+    def _iter_parts(
+        self,
+        files: list[Path],
+        tree: str,
+        mode: OutputMode,
+        body_parts: Iterable[str],
+        call_graphs: Iterable[FunctionCallGraph],
+    ) -> Iterator[str]:
+        """Yield the output sections in order; callers join them with newlines."""
         scanned = self.subdirectory or str(self.project_root)
         dirs = len({f.parent for f in files})
         stats_line = f"Files: {len(files)}  |  Directories: {dirs}" if files else ""
-        parts.append(
+        yield (
             f"Code Context  [mode: {mode}  —  {_OUTPUT_MODE_LABELS[mode]}]\n"
             f"Scanned: {scanned}\n"
             + (f"{stats_line}\n" if stats_line else "")
         )
 
         if self.prompt_prefix:
-            parts.append(self.prompt_prefix.strip())
-            parts.append("")
-
-        parts.append(tree)
-        parts.append("")
+            yield self.prompt_prefix.strip()
+            yield ""
 
-        if mode == "tree_only":
-            pass
-
-        elif mode == "signatures":
-            sig_map = {sb.file_path: sb for sb in signature_blocks}
-            for f in files:
-                sb = sig_map.get(f)
-                if sb:
-                    lang = _LANG_MAP.get(f.suffix.lower())
-                    parts.append(sb.to_text(self.project_root))
+        yield tree
+        yield ""
 
-        else:  # "clean" or "original"
-            for f in files:
-                ex = extractors.get(f)
-                if not ex:
-                    continue
-                content = ex.get_content(mode)
-                if not content:
-                    continue
-                lang = _LANG_MAP.get(f.suffix.lower())
-                parts.append(ex.file_header(self.project_root, language=lang))
-                parts.append(content)
+        yield from body_parts
 
-        if call_graphs:
-            parts.append("\n\n---\nFunction Call Graphs\n")
-            highlight = set(self.call_graph_highlight) if self.call_graph_highlight else None
-            for cg in call_graphs:
-                if cg.calls or cg.error:
-                    parts.append(cg.to_text(highlight=highlight, concise=False))
+        highlight = set(self.call_graph_highlight) if self.call_graph_highlight else None
+        heading_emitted = False
+        for cg in call_graphs:
+            if not heading_emitted:
+                yield "\n\n---\nFunction Call Graphs\n"
+                heading_emitted = True
+            if cg.calls or cg.error:
+                yield cg.to_text(highlight=highlight, concise=False)
 
         if self.prompt_suffix:
-            parts.append("")
-            parts.append(self.prompt_suffix.strip())
-
-        return "\n".join(parts)
+            yield ""
+            yield self.prompt_suffix.strip()
 
     def save(self, result: CodeContextResult, export_directory: str | None = None) -> Path | None:
         export_dir = Path(export_directory or self.cfg.export_directory)
@@ -1722,6 +3911,9 @@ class CodeContextBuilder:
         print(f"Files:         {stats['total_files']}")
         print(f"Directories:   {stats['total_directories']}")
         print(f"File types:    {stats['file_types']}")
+        skipped = {k: v for k, v in stats.get("skipped_files", {}).items() if v}
+        if skipped:
+            print(f"Skipped:       {skipped}")
         total_original = sum(fn.original_chars for fn in result.file_nodes.values())
         total_clean = sum(fn.clean_chars for fn in result.file_nodes.values())
         if total_original:
@@ -1729,6 +3921,13 @@ class CodeContextBuilder:
         if total_clean:
             print(f"Chars (clean): {total_clean:,}")
         print(f"Output chars:  {len(result.combined_text):,}")
+        dedup = stats.get("dedup")
+        if dedup and dedup["duplicate_files"]:
+            print(f"Deduplicated:  {dedup['duplicate_files']} files ({dedup['saved_chars']:,} chars saved)")
+        budget = stats.get("budget")
+        if budget:
+            print(f"Tokens (est):  {budget['estimated_tokens']:,} / {budget['target_tokens']:,}")
+            print(f"Files by mode: {budget['files_by_mode']}")
         if result.export_path:
             print(f"Saved to:      {result.export_path}")
         print(f"{sep}\n")
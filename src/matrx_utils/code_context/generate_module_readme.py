@@ -9,6 +9,17 @@ Architecture section for human authoring.
 On subsequent runs: replaces only the AUTO-tagged sections; all human-authored
 content outside those blocks is left completely untouched.
 
+Staleness
+---------
+The meta block records an "Inputs hash": a Merkle hash of every file under the
+module plus its generation config. A README whose stored hash still matches is
+not regenerated, and a child README is only auto-refreshed when its hash has
+changed. Checkouts, rebases and fresh clones therefore don't trigger rebuilds.
+A change anywhere in a subtree changes the hash of every enclosing module. A
+regenerated README that comes out byte-identical is not rewritten. Upstream
+callers live outside the module and are not part of the hash; use
+--force-refresh-children to pick up new callers.
+
 AUTO section convention
 -----------------------
 Each auto-managed section is wrapped with sentinel comments:
@@ -58,14 +69,27 @@ Options
 from __future__ import annotations
 
 import argparse
+import ast
+import contextlib
+import hashlib
+import io
 import json
 import logging
+import os
 import re
+import shutil
+import sys
+import tempfile
+import time
+import warnings
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
 
 from matrx_utils.code_context import CodeContextBuilder
-from matrx_utils.code_context.code_context import OutputMode
+from matrx_utils.code_context.code_context import OutputMode, SymbolIndex
 from matrx_utils import vcprint
 
 
@@ -170,6 +194,213 @@ def _find_child_readmes(subdirectory: str, project_root: Path) -> list[Path]:
     return sorted(found)
 
 
+# ---------------------------------------------------------------------------
+# Project index — one walk and one parse per file, shared by a whole run
+# ---------------------------------------------------------------------------
+
+_INDEX_SKIP_DIRS = frozenset({".venv", "venv", "__pycache__", ".git", "node_modules"})
+
+
+@dataclass(frozen=True)
+class ImportRecord:
+    """One imported name. ``name`` is None for plain ``import module`` statements."""
+
+    module: str
+    name: str | None
+    asname: str | None
+    level: int = 0
+
+
+@dataclass
+class PyFileFacts:
+    """Everything the section builders read from one Python file."""
+
+    path: Path
+    imports: list[ImportRecord] = field(default_factory=list)
+    callables: list[str] = field(default_factory=list)  # top-level def / class names
+    name_calls: set[str] = field(default_factory=set)  # f()
+    attr_calls: set[tuple[str | None, str]] = field(default_factory=set)  # (receiver name | None, attr) for x.f()
+
+
+class ProjectIndex:
+    """
+    The project's Python files, listed by a single directory walk and each
+    parsed at most once (on first use) into PyFileFacts.
+
+    One index is shared by every section of a README and by every level of a
+    cascade. Previously the dependencies, callers and entry-point helpers each
+    re-walked and re-parsed the tree for every module.
+
+    It also owns a scratch SymbolIndex database, ``symbol_db``. The
+    CodeContextBuilder passes for signatures and call graphs all use it, so
+    those are extracted once per file as well. The database is removed by
+    close(), unless ``scratch_dir`` was given. In that case the database is
+    a per-process file in that directory and the caller cleans it up; this is
+    how parallel cascade workers share one run directory.
+    """
+
+    def __init__(self, project_root: Path, scratch_dir: Path | None = None) -> None:
+        self.project_root = project_root
+        self._facts: dict[Path, PyFileFacts | None] = {}
+        self._tree_hashes: dict[Path, str] = {}
+        self._file_hashes: dict[Path, str | None] = {}
+        self._scratch: Path | None = None
+        self._scratch_dir = scratch_dir
+
+    def __enter__(self) -> "ProjectIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._scratch is not None:
+            shutil.rmtree(self._scratch, ignore_errors=True)
+            self._scratch = None
+
+    def worker_copy(self, scratch_dir: Path) -> "ProjectIndex":
+        """
+        A copy for a cascade worker process. It carries this index's walk and
+        every file's parsed facts, so the worker parses nothing again. Its
+        symbol database lives in ``scratch_dir``.
+        """
+        for path in self.files:
+            self.facts(path)
+        copy = ProjectIndex(self.project_root, scratch_dir=scratch_dir)
+        copy.__dict__["files"] = self.files
+        copy.__dict__["top_level_names"] = self.top_level_names
+        copy._facts = dict(self._facts)
+        copy._tree_hashes = dict(self._tree_hashes)
+        copy._file_hashes = dict(self._file_hashes)
+        return copy
+
+    @property
+    def parsed(self) -> int:
+        """Number of files parsed so far."""
+        return len(self._facts)
+
+    @cached_property
+    def files(self) -> list[Path]:
+        """Every .py file under the project root, skipping virtualenvs, caches and VCS dirs."""
+        found: list[Path] = []
+        for dirpath, dirnames, filenames in os.walk(self.project_root):
+            dirnames[:] = sorted(d for d in dirnames if d not in _INDEX_SKIP_DIRS)
+            found.extend(Path(dirpath, name) for name in sorted(filenames) if name.endswith(".py"))
+        return found
+
+    def py_files(self, directory: Path) -> list[Path]:
+        """Python files at any depth under ``directory``."""
+        if directory == self.project_root:
+            return list(self.files)
+        prefix = str(directory).rstrip(os.sep) + os.sep
+        return [f for f in self.files if str(f).startswith(prefix)]
+
+    def py_files_outside(self, directory: Path) -> list[Path]:
+        """Python files that are not under ``directory``."""
+        inside = set(self.py_files(directory))
+        return [f for f in self.files if f not in inside]
+
+    @cached_property
+    def top_level_names(self) -> set[str]:
+        """
+        Top-level package roots of the project: every non-hidden directory
+        (with or without __init__.py) and every bare .py file at the root.
+        """
+        names: set[str] = set()
+        for item in self.project_root.iterdir():
+            if item.is_dir() and item.name not in _INDEX_SKIP_DIRS | {".cursor"} and not item.name.startswith("."):
+                names.add(item.name)
+            elif item.is_file() and item.suffix == ".py":
+                names.add(item.stem)
+        return names
+
+    @property
+    def symbol_db(self) -> Path:
+        """Scratch SymbolIndex database shared by the run's CodeContextBuilder passes."""
+        if self._scratch_dir is not None:
+            return self._scratch_dir / f"symbols-{os.getpid()}.db"
+        if self._scratch is None:
+            self._scratch = Path(tempfile.mkdtemp(prefix="module_readme_"))
+        return self._scratch / "symbols.db"
+
+    def tree_hash(self, directory: Path) -> str:
+        """
+        Merkle hash of everything under ``directory``. Files are hashed by
+        content. Each subdirectory contributes its own tree_hash, plus whether
+        it has a MODULE_README.md. The directory's own README is left out, so
+        writing it never changes the hash. Hidden and skipped directories are
+        ignored. Memoized, so a parent reuses the hashes of its children.
+        """
+        if directory in self._tree_hashes:
+            return self._tree_hashes[directory]
+        try:
+            entries = sorted(os.scandir(directory), key=lambda e: e.name)
+        except OSError:
+            entries = []
+        lines: list[str] = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name in _INDEX_SKIP_DIRS or entry.name.startswith("."):
+                    continue
+                sub = Path(entry.path)
+                has_readme = (sub / "MODULE_README.md").exists()
+                lines.append(f"d {entry.name} {self.tree_hash(sub)} {int(has_readme)}")
+            elif entry.is_file() and entry.name != "MODULE_README.md":
+                digest = self.file_hash(Path(entry.path))
+                if digest is None:
+                    continue
+                lines.append(f"f {entry.name} {digest}")
+        self._tree_hashes[directory] = hashlib.sha1("\n".join(lines).encode("utf-8")).hexdigest()
+        return self._tree_hashes[directory]
+
+    def file_hash(self, path: Path) -> str | None:
+        """Content hash of ``path``; None when it cannot be read. Memoized."""
+        if path not in self._file_hashes:
+            try:
+                self._file_hashes[path] = hashlib.sha1(path.read_bytes()).hexdigest()
+            except OSError:
+                self._file_hashes[path] = None
+        return self._file_hashes[path]
+
+    def facts(self, path: Path) -> PyFileFacts | None:
+        """Parsed facts for ``path``; None when it cannot be read or parsed."""
+        if path not in self._facts:
+            self._facts[path] = self._parse(path)
+        return self._facts[path]
+
+    @staticmethod
+    def _parse(path: Path) -> PyFileFacts | None:
+        try:
+            source = path.read_text(encoding="utf-8", errors="ignore")
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                tree = ast.parse(source, filename=str(path))
+        except (OSError, SyntaxError, ValueError):
+            return None
+
+        facts = PyFileFacts(path=path)
+        facts.callables = [
+            node.name
+            for node in tree.body
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef))
+        ]
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                facts.imports.extend(ImportRecord(alias.name, None, alias.asname) for alias in node.names)
+            elif isinstance(node, ast.ImportFrom):
+                facts.imports.extend(
+                    ImportRecord(node.module or "", alias.name, alias.asname, node.level or 0)
+                    for alias in node.names
+                )
+            elif isinstance(node, ast.Call):
+                if isinstance(node.func, ast.Name):
+                    facts.name_calls.add(node.func.id)
+                elif isinstance(node.func, ast.Attribute):
+                    receiver = node.func.value.id if isinstance(node.func.value, ast.Name) else None
+                    facts.attr_calls.add((receiver, node.func.attr))
+        return facts
+
+
 # ---------------------------------------------------------------------------
 # Section generators
 # ---------------------------------------------------------------------------
@@ -182,8 +413,10 @@ def _build_meta(
     scope: list[str] | None,
     project_root: Path,
     child_readmes: list[Path] | None = None,
+    inputs_hash: str | None = None,
+    generated: str | None = None,
 ) -> str:
-    ts = datetime.now().strftime("%Y-%m-%d %H:%M")
+    ts = generated or datetime.now().strftime("%Y-%m-%d %H:%M")
     scope_arg = f" \\\n        --call-graph-scope {','.join(scope)}" if scope else ""
     cmd = (
         f"python utils/code_context/generate_module_readme.py {subdirectory}"
@@ -211,6 +444,7 @@ def _build_meta(
         )
 
     child_section = child_readme_rows if child_readme_rows else ""
+    hash_row = f"| Inputs hash | `{inputs_hash}` |\n" if inputs_hash else ""
     return f"""\
 ## About This Document
 
@@ -223,7 +457,7 @@ are overwritten each time the generator runs. Everything else is yours to edit f
 | Last generated | {ts} |
 | Output file | `{rel_output}` |
 | Signature mode | `{mode}` |
-{child_section}
+{hash_row}{child_section}
 **To refresh auto-sections:**
 ```bash
 {cmd}
@@ -245,6 +479,57 @@ def _read_child_timestamp(readme_path: Path) -> str | None:
     return None
 
 
+def _read_inputs_hash(readme_path: Path) -> str | None:
+    """Extract the 'Inputs hash' recorded in an existing MODULE_README.md's meta block."""
+    try:
+        text = readme_path.read_text(encoding="utf-8", errors="ignore")
+        m = re.search(r"\|\s*Inputs hash\s*\|\s*`([0-9a-f]+)`\s*\|", text)
+        if m:
+            return m.group(1)
+    except Exception:
+        pass
+    return None
+
+
+def _generation_config(
+    subdirectory: str,
+    mode: OutputMode,
+    scope: list[str] | None,
+    project_noise: list[str] | None,
+    include_call_graph: bool,
+    entry_points: list[str] | None,
+    call_graph_exclude: list[str] | None = None,
+    signatures_exclude: list[str] | None = None,
+) -> dict:
+    return {
+        "subdirectory": subdirectory,
+        "mode": mode,
+        "scope": scope,
+        "project_noise": project_noise,
+        "include_call_graph": include_call_graph,
+        "entry_points": entry_points,
+        "call_graph_exclude": call_graph_exclude,
+        "signatures_exclude": signatures_exclude,
+    }
+
+
+def _inputs_hash(cfg: dict, project_root: Path, index: ProjectIndex) -> str:
+    """
+    Merkle hash of a README's inputs: the module's file tree, its generation
+    config, and what the sections read from outside the module — the files
+    that import it (AUTO:callers) and the project's top-level names
+    (AUTO:dependencies).
+    """
+    subdirectory = cfg.get("subdirectory", "")
+    digest = hashlib.sha1(index.tree_hash(project_root / subdirectory).encode("utf-8"))
+    digest.update(json.dumps(cfg, sort_keys=True).encode("utf-8"))
+    digest.update(json.dumps(sorted(index.top_level_names)).encode("utf-8"))
+    if cfg.get("entry_points") != []:
+        for py_file, _names, _modules in _scan_external_imports(subdirectory, project_root, index):
+            digest.update(f"{py_file.relative_to(project_root).as_posix()} {index.file_hash(py_file)}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
 def _build_config_block(
     subdirectory: str,
     mode: OutputMode,
@@ -263,16 +548,16 @@ def _build_config_block(
     The block is auto-managed (overwritten on every run) and intentionally placed
     last so it stays out of the way of human-authored content.
     """
-    cfg = {
-        "subdirectory": subdirectory,
-        "mode": mode,
-        "scope": scope,
-        "project_noise": project_noise,
-        "include_call_graph": include_call_graph,
-        "entry_points": entry_points,
-        "call_graph_exclude": call_graph_exclude,
-        "signatures_exclude": signatures_exclude,
-    }
+    cfg = _generation_config(
+        subdirectory,
+        mode,
+        scope,
+        project_noise,
+        include_call_graph,
+        entry_points,
+        call_graph_exclude,
+        signatures_exclude,
+    )
     payload = json.dumps(cfg, indent=2)
     return f"""\
 ## Generation Config
@@ -313,20 +598,40 @@ def _read_child_config(readme_path: Path) -> dict | None:
 
 
 def _check_child_staleness(
-    child_readmes: list[Path], project_root: Path
+    child_readmes: list[Path], project_root: Path, index: ProjectIndex | None = None
 ) -> list[tuple[Path, str]]:
     """
-    For each child README, find the newest .py file modification time in that
-    submodule and compare it against the README's embedded 'Last generated'
-    timestamp.
+    Decide which child READMEs are out of date.
 
-    Returns a list of (readme_path, warning_message) tuples for any submodule
-    whose source has been modified since the README was generated.
-    Also checks the subdir's own mtime to catch file additions/deletions.
+    A child whose README records an inputs hash and a generation config is
+    stale exactly when the hash of its current inputs differs (see
+    _inputs_hash), so touching files without changing them — git checkout,
+    rebase, a fresh clone — never marks it stale.
+
+    READMEs written before the hash existed fall back to timestamps: the
+    newest .py modification time in that submodule (and the subdir's own
+    mtime, to catch file additions/deletions) is compared against the
+    README's embedded 'Last generated' timestamp.
+
+    Returns a list of (readme_path, warning_message) tuples for stale children.
     """
+    if index is None:
+        index = ProjectIndex(project_root)
     stale: list[tuple[Path, str]] = []
     for readme in child_readmes:
         subdir = readme.parent
+        try:
+            rel_readme = readme.relative_to(project_root)
+        except ValueError:
+            rel_readme = readme
+
+        stored_hash = _read_inputs_hash(readme)
+        child_cfg = _read_child_config(readme)
+        if stored_hash and child_cfg is not None:
+            if _inputs_hash(child_cfg, project_root, index) != stored_hash:
+                stale.append((readme, f"  ⚠  {rel_readme} is STALE — sources or config changed since last generation"))
+            continue
+
         ts_str = _read_child_timestamp(readme)
         if not ts_str:
             continue
@@ -352,22 +657,20 @@ def _check_child_staleness(
         )
         if newest_dt > readme_dt:
             try:
-                rel_readme = readme.relative_to(project_root)
                 rel_file = newest_file.relative_to(project_root)
             except ValueError:
-                rel_readme = readme
                 rel_file = newest_file
-                delta_minutes = int((newest_dt - readme_dt).total_seconds() / 60)
-                age = (
-                    f"{delta_minutes}m"
-                    if delta_minutes < 120
-                    else f"{delta_minutes // 60}h"
-                )
-                msg = (
-                    f"  ⚠  {rel_readme} is STALE — "
-                    f"{rel_file} modified {age} after last generation"
-                )
-                stale.append((readme, msg))
+            delta_minutes = int((newest_dt - readme_dt).total_seconds() / 60)
+            age = (
+                f"{delta_minutes}m"
+                if delta_minutes < 120
+                else f"{delta_minutes // 60}h"
+            )
+            msg = (
+                f"  ⚠  {rel_readme} is STALE — "
+                f"{rel_file} modified {age} after last generation"
+            )
+            stale.append((readme, msg))
 
     return stale
 
@@ -443,6 +746,7 @@ def _build_signatures(
     project_root: Path,
     child_readmes: list[Path] | None = None,
     signatures_exclude: list[str] | None = None,
+    index: ProjectIndex | None = None,
 ) -> str:
     # Translate signatures_exclude entries into CodeContextBuilder overrides.
     # Convention (mirrors call_graph_exclude):
@@ -471,6 +775,7 @@ def _build_signatures(
         output_mode=mode,
         export_directory="/tmp/module_readme_gen",
         overrides=overrides,
+        symbol_index=index.symbol_db if index is not None else None,
     )
     result = builder.build()
     # Strip the header block — extract just the per-file content
@@ -670,6 +975,7 @@ def _build_call_graph(
     project_root: Path,
     child_readmes: list[Path] | None = None,
     call_graph_exclude: list[str] | None = None,
+    index: ProjectIndex | None = None,
 ) -> str:
     """
     Build the call graph section.
@@ -712,6 +1018,7 @@ def _build_call_graph(
         call_graph_include_methods=True,
         call_graph_include_private=False,
         export_directory="/tmp/module_readme_gen",
+        symbol_index=index.symbol_db if index is not None else None,
     )
     result = builder.build()
     text = result.combined_text
@@ -816,7 +1123,9 @@ def _build_call_graph(
 """
 
 
-def _build_dependencies(subdirectory: str, project_root: Path) -> str:
+def _build_dependencies(
+    subdirectory: str, project_root: Path, index: ProjectIndex | None = None
+) -> str:
     """
     Scan all Python files in the target module for import statements and produce
     two lists:
@@ -827,9 +1136,7 @@ def _build_dependencies(subdirectory: str, project_root: Path) -> str:
     Stdlib modules are filtered out using sys.stdlib_module_names (Python 3.10+)
     with a hardcoded fallback for older versions.
     """
-    import ast as _ast
     import sys as _sys
-    import warnings as _warnings
 
     # Python 3.10+ has sys.stdlib_module_names
     _STDLIB: frozenset[str] = getattr(
@@ -1042,22 +1349,10 @@ def _build_dependencies(subdirectory: str, project_root: Path) -> str:
         ),
     )
 
-    target_dir = project_root / subdirectory
-    # Derive the top-level package roots of this project from the project root
-    # so we can distinguish "internal project" from "external package".
-    # Include all non-hidden directories (with or without __init__.py) and
-    # bare .py files at root so packages like seo/ and user_data/ are captured.
-    _IGNORE_DIRS = {".git", ".venv", "venv", "node_modules", "__pycache__", ".cursor"}
-    project_top_dirs: set[str] = set()
-    for item in project_root.iterdir():
-        if (
-            item.is_dir()
-            and item.name not in _IGNORE_DIRS
-            and not item.name.startswith(".")
-        ):
-            project_top_dirs.add(item.name)
-        elif item.is_file() and item.suffix == ".py":
-            project_top_dirs.add(item.stem)
+    index = index or ProjectIndex(project_root)
+    # Top-level package roots of this project distinguish "internal project"
+    # from "external package".
+    project_top_dirs = index.top_level_names
 
     # module prefix for the target directory itself (to exclude intra-module imports)
     target_module_prefix = subdirectory.replace("/", ".").replace("\\", ".")
@@ -1065,45 +1360,37 @@ def _build_dependencies(subdirectory: str, project_root: Path) -> str:
     external: set[str] = set()
     internal: set[str] = set()
 
-    for py_file in target_dir.rglob("*.py"):
-        try:
-            source = py_file.read_text(encoding="utf-8", errors="ignore")
-            with _warnings.catch_warnings():
-                _warnings.simplefilter("ignore")
-                tree = _ast.parse(source, filename=str(py_file))
-        except Exception:
+    for py_file in index.py_files(project_root / subdirectory):
+        facts = index.facts(py_file)
+        if facts is None:
             continue
 
-        for node in _ast.walk(tree):
-            names: list[str] = []
-
-            if isinstance(node, _ast.Import):
-                names = [alias.name for alias in node.names]
-            elif isinstance(node, _ast.ImportFrom):
-                # Skip relative imports (from . import X, from .models import X)
-                # They are always intra-module by definition.
-                if node.level and node.level > 0:
-                    continue
-                if node.module:
-                    names = [node.module]
+        for rec in facts.imports:
+            if rec.name is None:
+                name = rec.module
+            # Skip relative imports (from . import X, from .models import X)
+            # They are always intra-module by definition.
+            elif rec.level == 0 and rec.module:
+                name = rec.module
+            else:
+                continue
 
-            for name in names:
-                root = name.split(".")[0]
-                if root in _STDLIB or not root:
-                    continue
-                # Check if it's an intra-module import (within target directory)
-                if name == target_module_prefix or name.startswith(
-                    target_module_prefix + "."
-                ):
-                    continue
-                # Check if it's another project-internal module
-                if root in project_top_dirs:
-                    # Collapse to two-segment path for readability (e.g. ai.execution_context)
-                    parts = name.split(".")
-                    label = ".".join(parts[:2]) if len(parts) > 1 else parts[0]
-                    internal.add(label)
-                else:
-                    external.add(root)
+            root = name.split(".")[0]
+            if root in _STDLIB or not root:
+                continue
+            # Check if it's an intra-module import (within target directory)
+            if name == target_module_prefix or name.startswith(
+                target_module_prefix + "."
+            ):
+                continue
+            # Check if it's another project-internal module
+            if root in project_top_dirs:
+                # Collapse to two-segment path for readability (e.g. ai.execution_context)
+                parts = name.split(".")
+                label = ".".join(parts[:2]) if len(parts) > 1 else parts[0]
+                internal.add(label)
+            else:
+                external.add(root)
 
     if not external and not internal:
         return ""
@@ -1137,7 +1424,7 @@ def _build_dependencies(subdirectory: str, project_root: Path) -> str:
 
 
 def _scan_external_imports(
-    subdirectory: str, project_root: Path
+    subdirectory: str, project_root: Path, index: ProjectIndex | None = None
 ) -> list[tuple[Path, set[str], set[str]]]:
     """
     Walk every .py file outside `subdirectory` and collect those that import
@@ -1150,58 +1437,26 @@ def _scan_external_imports(
     This is the shared scanning core used by both auto-discovery and
     the manual entry-points path.
     """
-    import ast as _ast
-    import warnings as _warnings
-
+    index = index or ProjectIndex(project_root)
     module_path = subdirectory.replace("/", ".").replace("\\", ".")
-    target_dir = project_root / subdirectory
-
-    # All .py files outside the target directory
-    candidates: list[Path] = []
-    for py_file in project_root.rglob("*.py"):
-        try:
-            py_file.relative_to(target_dir)
-            continue  # inside target module — skip
-        except ValueError:
-            pass
-        parts = py_file.parts
-        if any(
-            p in parts for p in (".venv", "venv", "__pycache__", ".git", "node_modules")
-        ):
-            continue
-        candidates.append(py_file)
 
     results: list[tuple[Path, set[str], set[str]]] = []
 
-    for py_file in candidates:
-        try:
-            source = py_file.read_text(encoding="utf-8", errors="ignore")
-        except Exception:
-            continue
-        # Quick pre-filter before full parse
-        if module_path not in source and subdirectory.replace("/", ".") not in source:
-            continue
-        try:
-            with _warnings.catch_warnings():
-                _warnings.simplefilter("ignore")
-                tree = _ast.parse(source, filename=str(py_file))
-        except SyntaxError:
+    for py_file in index.py_files_outside(project_root / subdirectory):
+        facts = index.facts(py_file)
+        if facts is None:
             continue
 
         imported_names: set[str] = set()  # from module import X  → X
         module_imports: set[str] = set()  # import module.sub as Y → Y
 
-        for node in _ast.walk(tree):
-            if isinstance(node, _ast.ImportFrom):
-                mod = node.module or ""
-                if mod == module_path or mod.startswith(module_path + "."):
-                    for alias in node.names:
-                        imported_names.add(alias.asname or alias.name)
-            elif isinstance(node, _ast.Import):
-                for alias in node.names:
-                    n = alias.name
-                    if n == module_path or n.startswith(module_path + "."):
-                        module_imports.add(alias.asname or n.split(".")[-1])
+        for rec in facts.imports:
+            if not (rec.module == module_path or rec.module.startswith(module_path + ".")):
+                continue
+            if rec.name is not None:
+                imported_names.add(rec.asname or rec.name)
+            else:
+                module_imports.add(rec.asname or rec.module.split(".")[-1])
 
         if imported_names or module_imports:
             results.append((py_file, imported_names, module_imports))
@@ -1210,7 +1465,7 @@ def _scan_external_imports(
 
 
 def _discover_entry_points(
-    subdirectory: str, project_root: Path
+    subdirectory: str, project_root: Path, index: ProjectIndex | None = None
 ) -> dict[str, list[str]]:
     """
     Auto-discover the public entry points of a module by inverting the import graph.
@@ -1225,15 +1480,14 @@ def _discover_entry_points(
     Returns: dict mapping caller_path_str → [fn_name, ...] sorted.
     Only callers that reference at least one callable name are included.
     """
-    import ast as _ast
-
-    scan_results = _scan_external_imports(subdirectory, project_root)
+    index = index or ProjectIndex(project_root)
+    scan_results = _scan_external_imports(subdirectory, project_root, index)
     if not scan_results:
         return {}
 
     # Build the target module's own public callable names for cross-referencing.
     # This filters out submodule-name imports (e.g. `from ai import tools`).
-    target_callables: set[str] = _get_module_callables(subdirectory, project_root)
+    target_callables: set[str] = _get_module_callables(subdirectory, project_root, index)
 
     callers: dict[str, list[str]] = {}
 
@@ -1252,26 +1506,14 @@ def _discover_entry_points(
                 if not n.startswith("_") and (len(n) > 3 or n[0].isupper())
             }
 
-        # For module-alias imports, scan the AST for attribute calls: alias.X()
+        # For module-alias imports, look for attribute calls: alias.X()
         attr_hits: set[str] = set()
-        if module_imports:
-            try:
-                source = py_file.read_text(encoding="utf-8", errors="ignore")
-                tree = _ast.parse(source)
-            except Exception:
-                tree = None
-            if tree:
-                for node in _ast.walk(tree):
-                    if (
-                        isinstance(node, _ast.Call)
-                        and isinstance(node.func, _ast.Attribute)
-                        and isinstance(node.func.value, _ast.Name)
-                        and node.func.value.id in module_imports
-                    ):
-                        attr_name = node.func.attr
-                        if not attr_name.startswith("_"):
-                            if not target_callables or attr_name in target_callables:
-                                attr_hits.add(attr_name)
+        facts = index.facts(py_file)
+        if module_imports and facts is not None:
+            for receiver, attr_name in facts.attr_calls:
+                if receiver in module_imports and not attr_name.startswith("_"):
+                    if not target_callables or attr_name in target_callables:
+                        attr_hits.add(attr_name)
 
         all_hits = direct_hits | attr_hits
         if all_hits:
@@ -1284,29 +1526,21 @@ def _discover_entry_points(
     return callers
 
 
-def _get_module_callables(subdirectory: str, project_root: Path) -> set[str]:
+def _get_module_callables(
+    subdirectory: str, project_root: Path, index: ProjectIndex | None = None
+) -> set[str]:
     """
     Return the set of public function and class names defined in `subdirectory`.
     Used to filter discovered imports down to actual callables, excluding
     submodule names and data variables.
     """
-    import ast as _ast
-
+    index = index or ProjectIndex(project_root)
     callables: set[str] = set()
-    target_dir = project_root / subdirectory
 
-    for py_file in target_dir.rglob("*.py"):
-        try:
-            source = py_file.read_text(encoding="utf-8", errors="ignore")
-            tree = _ast.parse(source)
-        except Exception:
-            continue
-        for node in tree.body:
-            if isinstance(
-                node, (_ast.FunctionDef, _ast.AsyncFunctionDef, _ast.ClassDef)
-            ):
-                if not node.name.startswith("_"):
-                    callables.add(node.name)
+    for py_file in index.py_files(project_root / subdirectory):
+        facts = index.facts(py_file)
+        if facts is not None:
+            callables.update(name for name in facts.callables if not name.startswith("_"))
 
     return callables
 
@@ -1315,6 +1549,7 @@ def _build_callers(
     subdirectory: str,
     entry_points: list[str] | None,
     project_root: Path,
+    index: ProjectIndex | None = None,
 ) -> str:
     """
     Build the Upstream Callers table section.
@@ -1327,13 +1562,12 @@ def _build_callers(
 
     Returns empty string if no callers are found.
     """
-    import ast as _ast
-
+    index = index or ProjectIndex(project_root)
     auto_mode = entry_points is None
 
     if auto_mode:
         # Auto-discovery path: invert the import graph
-        callers_map = _discover_entry_points(subdirectory, project_root)
+        callers_map = _discover_entry_points(subdirectory, project_root, index)
         if not callers_map:
             return ""
         rows: list[tuple[str, str]] = []
@@ -1347,46 +1581,18 @@ def _build_callers(
     else:
         # Manual path: original behaviour — scan for named entry points
         entry_set = set(entry_points)
-        scan_results = _scan_external_imports(subdirectory, project_root)
+        scan_results = _scan_external_imports(subdirectory, project_root, index)
         rows = []
         for py_file, imported_names, module_imports in scan_results:
             called: set[str] = set()
             # Direct imports of named entry points
             called |= imported_names & entry_set
-            # Attribute calls on module aliases
-            if module_imports:
-                try:
-                    source = py_file.read_text(encoding="utf-8", errors="ignore")
-                    tree = _ast.parse(source)
-                    for node in _ast.walk(tree):
-                        if (
-                            isinstance(node, _ast.Call)
-                            and isinstance(node.func, _ast.Attribute)
-                            and isinstance(node.func.value, _ast.Name)
-                            and node.func.value.id in module_imports
-                            and node.func.attr in entry_set
-                        ):
-                            called.add(node.func.attr)
-                except Exception:
-                    pass
-            # Direct calls in the file body
-            try:
-                source = py_file.read_text(encoding="utf-8", errors="ignore")
-                tree = _ast.parse(source)
-                for node in _ast.walk(tree):
-                    if isinstance(node, _ast.Call):
-                        if (
-                            isinstance(node.func, _ast.Name)
-                            and node.func.id in entry_set
-                        ):
-                            called.add(node.func.id)
-                        elif (
-                            isinstance(node.func, _ast.Attribute)
-                            and node.func.attr in entry_set
-                        ):
-                            called.add(node.func.attr)
-            except Exception:
-                pass
+            facts = index.facts(py_file)
+            if facts is not None:
+                # Calls in the file body: f() and any receiver.f() — the latter
+                # also covers attribute calls on module aliases.
+                called |= facts.name_calls & entry_set
+                called |= {attr for _, attr in facts.attr_calls if attr in entry_set}
             if called:
                 try:
                     rel = py_file.relative_to(project_root)
@@ -1469,6 +1675,8 @@ def _build_initial_file(
     entry_points: list[str] | None = None,
     call_graph_exclude: list[str] | None = None,
     signatures_exclude: list[str] | None = None,
+    index: ProjectIndex | None = None,
+    inputs_hash: str | None = None,
 ) -> str:
     """Build the full file content for first-time creation."""
     module_name = subdirectory.replace("/", ".").replace("\\", ".")
@@ -1494,6 +1702,7 @@ def _build_initial_file(
                 scope,
                 project_root,
                 child_readmes or None,
+                inputs_hash,
             ),
         )
     )
@@ -1520,6 +1729,7 @@ def _build_initial_file(
                 project_root,
                 child_readmes or None,
                 signatures_exclude,
+                index,
             ),
         )
     )
@@ -1534,6 +1744,7 @@ def _build_initial_file(
             project_root,
             child_readmes or None,
             call_graph_exclude,
+            index,
         )
         if cg:
             parts.append(_wrap_auto("call_graph", cg))
@@ -1541,13 +1752,13 @@ def _build_initial_file(
 
     # callers — None means auto-discover, [] means explicitly disabled
     if entry_points != []:
-        callers = _build_callers(subdirectory, entry_points, project_root)
+        callers = _build_callers(subdirectory, entry_points, project_root, index)
         if callers:
             parts.append(_wrap_auto("callers", callers))
             parts.append("")
 
     # dependencies (always on — two compact lines, high signal)
-    deps = _build_dependencies(subdirectory, project_root)
+    deps = _build_dependencies(subdirectory, project_root, index)
     if deps:
         parts.append(_wrap_auto("dependencies", deps))
         parts.append("")
@@ -1586,7 +1797,25 @@ def run(
     call_graph_exclude: list[str] | None = None,
     signatures_exclude: list[str] | None = None,
     force_refresh_children: bool = False,
+    index: ProjectIndex | None = None,
 ) -> None:
+    if index is None:
+        with ProjectIndex(project_root) as index:
+            return run(
+                subdirectory,
+                output_path,
+                mode,
+                scope,
+                project_noise,
+                include_call_graph,
+                project_root,
+                entry_points,
+                call_graph_exclude,
+                signatures_exclude,
+                force_refresh_children,
+                index=index,
+            )
+
     is_new = not output_path.exists()
 
     if not is_new:
@@ -1601,6 +1830,29 @@ def run(
             )
             is_new = True
 
+    rel = (
+        output_path.relative_to(project_root)
+        if output_path.is_relative_to(project_root)
+        else output_path
+    )
+    inputs_hash = _inputs_hash(
+        _generation_config(
+            subdirectory,
+            mode,
+            scope,
+            project_noise,
+            include_call_graph,
+            entry_points,
+            call_graph_exclude,
+            signatures_exclude,
+        ),
+        project_root,
+        index,
+    )
+    if not is_new and not force_refresh_children and _read_inputs_hash(output_path) == inputs_hash:
+        vcprint(f" --> Up to date: {rel} (inputs unchanged)", color="blue")
+        return
+
     # Detect child READMEs once — used in meta, tree, signatures, and staleness check
     child_readmes = _find_child_readmes(subdirectory, project_root)
 
@@ -1612,7 +1864,7 @@ def run(
         if force_refresh_children:
             children_to_refresh = [(p, "") for p in child_readmes]
         else:
-            children_to_refresh = _check_child_staleness(child_readmes, project_root)
+            children_to_refresh = _check_child_staleness(child_readmes, project_root, index)
         for child_path, _warning in children_to_refresh:
             child_cfg = _read_child_config(child_path)
             if child_cfg is None:
@@ -1649,6 +1901,7 @@ def run(
                 call_graph_exclude=child_cg_exclude,
                 signatures_exclude=child_sig_exclude,
                 force_refresh_children=force_refresh_children,
+                index=index,
             )
             try:
                 rel = child_path.relative_to(project_root)
@@ -1672,11 +1925,15 @@ def run(
             entry_points=entry_points,
             call_graph_exclude=call_graph_exclude,
             signatures_exclude=signatures_exclude,
+            index=index,
+            inputs_hash=inputs_hash,
         )
     else:
         vcprint(f"Updating existing README: {output_path}", color="yellow")
         existing = output_path.read_text(encoding="utf-8")
 
+        # Keep the previous timestamp at first so an unchanged README merges
+        # back byte-identical and is not rewritten.
         sections: dict[str, str] = {}
         sections["meta"] = _build_meta(
             subdirectory,
@@ -1685,6 +1942,8 @@ def run(
             scope,
             project_root,
             child_readmes or None,
+            inputs_hash,
+            _read_child_timestamp(output_path),
         )
         sections["tree"] = _build_tree(
             subdirectory, project_root, child_readmes or None
@@ -1695,6 +1954,7 @@ def run(
             project_root,
             child_readmes or None,
             signatures_exclude,
+            index,
         )
 
         if include_call_graph:
@@ -1705,17 +1965,18 @@ def run(
                 project_root,
                 child_readmes or None,
                 call_graph_exclude,
+                index,
             )
             if cg:
                 sections["call_graph"] = cg
 
         # callers — None means auto-discover, [] means explicitly disabled
         if entry_points != []:
-            callers = _build_callers(subdirectory, entry_points, project_root)
+            callers = _build_callers(subdirectory, entry_points, project_root, index)
             if callers:
                 sections["callers"] = callers
 
-        deps = _build_dependencies(subdirectory, project_root)
+        deps = _build_dependencies(subdirectory, project_root, index)
         if deps:
             sections["dependencies"] = deps
 
@@ -1732,16 +1993,24 @@ def run(
         )
 
         content = _merge_sections(existing, sections)
+        if content != existing:
+            sections["meta"] = _build_meta(
+                subdirectory,
+                output_path,
+                mode,
+                scope,
+                project_root,
+                child_readmes or None,
+                inputs_hash,
+            )
+            content = _merge_sections(existing, sections)
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(content, encoding="utf-8")
+    unchanged = not is_new and content == existing
+    if not unchanged:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(content, encoding="utf-8")
 
-    rel = (
-        output_path.relative_to(project_root)
-        if output_path.is_relative_to(project_root)
-        else output_path
-    )
-    action = "Created" if is_new else "Updated"
+    action = "Created" if is_new else "Unchanged" if unchanged else "Updated"
     extra_sections = []
     if include_call_graph:
         extra_sections.append("call_graph")
@@ -1773,7 +2042,7 @@ def run(
             )
             for r in no_config:
                 vcprint(f"    ⚠  {r}", color="yellow")
-        remaining_stale = _check_child_staleness(child_readmes, project_root)
+        remaining_stale = _check_child_staleness(child_readmes, project_root, index)
         if not auto_refreshed and not no_config:
             vcprint(
                 f"  Child READMEs: {len(child_readmes)} found, all up-to-date ✓",
@@ -1799,6 +2068,8 @@ def run_cascade(
     call_graph_exclude: list[str] | None = None,
     signatures_exclude: list[str] | None = None,
     force_refresh_children: bool = False,
+    index: ProjectIndex | None = None,
+    jobs: int = 1,
     _depth: int = 0,
     _all_new: list[Path] | None = None,
 ) -> None:
@@ -1828,7 +2099,51 @@ def run_cascade(
         entry_points:       Entry points for upstream callers section.
         call_graph_exclude: Subdirectory paths to exclude from call graph.
         force_refresh_children: Regenerate all children unconditionally.
+        index:              ProjectIndex shared by every level. Created (and closed)
+                            here when omitted, so the tree is parsed once per cascade.
+        jobs:               Worker processes. Above 1, independent subtrees are generated
+                            in parallel (see _run_cascade_parallel); the README files and
+                            the printed log are the same as for a serial run.
     """
+    if index is None:
+        with ProjectIndex(project_root) as index:
+            return run_cascade(
+                subdirectory,
+                project_root,
+                mode,
+                child_mode,
+                min_py_files,
+                scope,
+                project_noise,
+                include_call_graph,
+                entry_points,
+                call_graph_exclude,
+                signatures_exclude,
+                force_refresh_children,
+                index=index,
+                jobs=jobs,
+                _depth=_depth,
+                _all_new=_all_new,
+            )
+
+    if jobs > 1 and _depth == 0:
+        return _run_cascade_parallel(
+            subdirectory,
+            project_root,
+            mode,
+            child_mode,
+            min_py_files,
+            scope,
+            project_noise,
+            include_call_graph,
+            entry_points,
+            call_graph_exclude,
+            signatures_exclude,
+            force_refresh_children,
+            index,
+            jobs,
+        )
+
     if _all_new is None:
         _all_new = []
 
@@ -1843,7 +2158,7 @@ def run_cascade(
                 continue
             if child.name.startswith((".", "_")):
                 continue
-            py_count = sum(1 for _ in child.rglob("*.py"))
+            py_count = len(index.py_files(child))
             if py_count >= min_py_files:
                 candidates.append((child, py_count))
     except PermissionError:
@@ -1881,6 +2196,7 @@ def run_cascade(
             call_graph_exclude=call_graph_exclude,
             signatures_exclude=signatures_exclude,
             force_refresh_children=force_refresh_children,
+            index=index,
             _depth=_depth + 1,
             _all_new=_all_new,
         )
@@ -1900,6 +2216,7 @@ def run_cascade(
                 call_graph_exclude=call_graph_exclude,
                 signatures_exclude=signatures_exclude,
                 force_refresh_children=force_refresh_children,
+                index=index,
             )
             _all_new.append(child_readme)
         elif force_refresh_children:
@@ -1916,6 +2233,7 @@ def run_cascade(
                 call_graph_exclude=call_graph_exclude,
                 signatures_exclude=signatures_exclude,
                 force_refresh_children=force_refresh_children,
+                index=index,
             )
         else:
             print(f"{indent}  ✓ Already documented: {child_subdir}/")
@@ -1936,19 +2254,251 @@ def run_cascade(
         call_graph_exclude=call_graph_exclude,
         signatures_exclude=signatures_exclude,
         force_refresh_children=force_refresh_children,
+        index=index,
     )
 
     if _depth == 0:
-        total_new = len(_all_new)
+        _print_cascade_summary(len(_all_new))
+
+
+def _print_cascade_summary(total_new: int) -> None:
+    print(
+        f"\nCascade complete: {total_new} new child README{'s' if total_new != 1 else ''} created, root updated."
+    )
+    if total_new:
+        print("Next steps:")
+        print("  1. Review each child README's Architecture stub and fill it in.")
         print(
-            f"\nCascade complete: {total_new} new child README{'s' if total_new != 1 else ''} created, root updated."
+            "  2. Set INCLUDE_CALL_GRAPH=True for children that need call graphs, then re-run with FORCE_REFRESH_CHILDREN=True."
         )
-        if _all_new:
-            print("Next steps:")
-            print("  1. Review each child README's Architecture stub and fill it in.")
-            print(
-                "  2. Set INCLUDE_CALL_GRAPH=True for children that need call graphs, then re-run with FORCE_REFRESH_CHILDREN=True."
-            )
+
+
+# ---------------------------------------------------------------------------
+# Parallel cascade
+# ---------------------------------------------------------------------------
+
+
+@dataclass(eq=False)
+class _CascadeNode:
+    """A qualifying subdirectory, as visited by the serial run_cascade recursion."""
+
+    subdirectory: str
+    py_count: int
+    depth: int  # depth of this directory's own run_cascade level
+    already_has: bool
+    readable: bool = True
+    children: list["_CascadeNode"] = field(default_factory=list)
+
+
+def _plan_cascade(
+    subdirectory: str, project_root: Path, min_py_files: int, index: ProjectIndex, depth: int = 0
+) -> list[_CascadeNode]:
+    """
+    The qualifying subdirectories of ``subdirectory``, each with its own
+    qualifying subdirectories — the tree run_cascade walks, in the order it
+    walks it. Raises PermissionError when ``subdirectory`` itself is unreadable.
+    """
+    nodes: list[_CascadeNode] = []
+    for child in sorted((project_root / subdirectory).iterdir()):
+        if not child.is_dir() or child.name.startswith((".", "_")):
+            continue
+        py_count = len(index.py_files(child))
+        if py_count < min_py_files:
+            continue
+        node = _CascadeNode(
+            subdirectory=str(child.relative_to(project_root)),
+            py_count=py_count,
+            depth=depth + 1,
+            already_has=(child / "MODULE_README.md").exists(),
+        )
+        try:
+            node.children = _plan_cascade(node.subdirectory, project_root, min_py_files, index, depth + 1)
+        except PermissionError:
+            node.readable = False
+        nodes.append(node)
+    return nodes
+
+
+def _post_order(nodes: list[_CascadeNode]) -> list[_CascadeNode]:
+    ordered: list[_CascadeNode] = []
+    for node in nodes:
+        ordered.extend(_post_order(node.children))
+        ordered.append(node)
+    return ordered
+
+
+_worker_index: ProjectIndex | None = None
+
+
+def _init_cascade_worker(index: ProjectIndex, seed_db: Path) -> None:
+    global _worker_index
+    _worker_index = index
+    # Start from the parent's pre-built symbols so workers don't re-extract shared files.
+    shutil.copyfile(seed_db, index.symbol_db)
+
+
+@contextlib.contextmanager
+def _captured_output(buffer: io.StringIO):
+    """Route print() and root-logger output into ``buffer`` for ordered replay."""
+    root = logging.getLogger()
+    saved = root.handlers[:]
+    handler = logging.StreamHandler(buffer)
+    if saved and saved[0].formatter is not None:
+        handler.setFormatter(saved[0].formatter)
+    root.handlers = [handler]
+    try:
+        with contextlib.redirect_stdout(buffer):
+            yield
+    finally:
+        root.handlers = saved
+
+
+def _run_cascade_node(node: _CascadeNode, project_root: Path, run_kwargs: dict) -> str:
+    """
+    Worker: what the serial cascade does for one subdirectory once its
+    children are done — its own level's run(), then the parent loop's
+    generate / refresh / skip step. Returns the captured output.
+    """
+    child_readme = project_root / node.subdirectory / "MODULE_README.md"
+    indent = "  " * (node.depth - 1)
+    kwargs = dict(
+        subdirectory=node.subdirectory,
+        output_path=child_readme,
+        project_root=project_root,
+        index=_worker_index,
+        **run_kwargs,
+    )
+    buffer = io.StringIO()
+    with _captured_output(buffer):
+        if node.readable:
+            run(**kwargs)
+        else:
+            vcprint(f"Permission denied reading {project_root / node.subdirectory}", color="yellow")
+        if not node.already_has:
+            print(f"{indent}  → Generating: {node.subdirectory}/  [{node.py_count} .py files]")
+            run(**kwargs)
+        elif run_kwargs["force_refresh_children"]:
+            print(f"{indent}  ↻ Force-refreshing: {node.subdirectory}/")
+            run(**kwargs)
+        else:
+            print(f"{indent}  ✓ Already documented: {node.subdirectory}/")
+    return buffer.getvalue()
+
+
+def _run_cascade_parallel(
+    subdirectory: str,
+    project_root: Path,
+    mode: OutputMode,
+    child_mode: OutputMode,
+    min_py_files: int,
+    scope: list[str] | None,
+    project_noise: list[str] | None,
+    include_call_graph: bool,
+    entry_points: list[str] | None,
+    call_graph_exclude: list[str] | None,
+    signatures_exclude: list[str] | None,
+    force_refresh_children: bool,
+    index: ProjectIndex,
+    jobs: int,
+) -> None:
+    """
+    run_cascade() scheduled as a DAG: a subdirectory's README is generated
+    once all of its qualifying children are done, and independent subtrees
+    run concurrently on a pool of ``jobs`` processes.
+
+    Each worker's output is captured and replayed in serial order once
+    everything before it has finished. The printed log therefore matches a
+    serial run; a one-line progress counter goes to stderr. The root level
+    runs in this process last. Before the pool starts, the parent indexes the
+    subtree's Python files once into its own symbol database. It also parses
+    the whole tree once. Every worker starts from a copy of both
+    (ProjectIndex.worker_copy).
+    """
+    try:
+        plan = _plan_cascade(subdirectory, project_root, min_py_files, index)
+    except PermissionError:
+        vcprint(f"Permission denied reading {project_root / subdirectory}", color="yellow")
+        return
+
+    if not plan:
+        vcprint(
+            f"Cascade: no subdirectories with >= {min_py_files} Python files found in {subdirectory}."
+        )
+        vcprint("Generating parent README only.")
+    else:
+        vcprint(f"Cascade: starting depth-first generation from {subdirectory}/")
+        vcprint(f"  (min_py_files={min_py_files}, child_mode={child_mode})")
+
+    order = _post_order(plan)
+    position = {node: i for i, node in enumerate(order)}
+    parent_of = {child: node for node in order for child in node.children}
+    pending = {node: len(node.children) for node in order}
+    run_kwargs = dict(
+        mode=child_mode,
+        scope=None,
+        project_noise=project_noise,
+        include_call_graph=False,
+        entry_points=entry_points,
+        call_graph_exclude=call_graph_exclude,
+        signatures_exclude=signatures_exclude,
+        force_refresh_children=force_refresh_children,
+    )
+
+    with SymbolIndex(index.symbol_db, project_root) as symbols:
+        symbols.update(index.py_files(project_root / subdirectory))
+
+    outputs: dict[int, str] = {}
+    next_out = 0
+    started = time.perf_counter()
+    with tempfile.TemporaryDirectory(prefix="module_readme_") as scratch:
+        with ProcessPoolExecutor(
+            max_workers=min(jobs, max(1, len(order))),
+            initializer=_init_cascade_worker,
+            initargs=(index.worker_copy(Path(scratch)), index.symbol_db),
+        ) as pool:
+            futures = {
+                pool.submit(_run_cascade_node, node, project_root, run_kwargs): node
+                for node in order
+                if not node.children
+            }
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    node = futures.pop(future)
+                    outputs[position[node]] = future.result()
+                    print(
+                        f"  [{len(order) - len(pending) + 1}/{len(order)}] {node.subdirectory}/"
+                        f"  ({time.perf_counter() - started:.1f}s)",
+                        file=sys.stderr,
+                        flush=True,
+                    )
+                    del pending[node]
+                    parent = parent_of.get(node)
+                    if parent is not None:
+                        pending[parent] -= 1
+                        if pending[parent] == 0:
+                            futures[pool.submit(_run_cascade_node, parent, project_root, run_kwargs)] = parent
+                while next_out in outputs:
+                    sys.stdout.write(outputs.pop(next_out))
+                    sys.stdout.flush()
+                    next_out += 1
+
+    print(f"\nGenerating root: {subdirectory}/")
+    run(
+        subdirectory=subdirectory,
+        output_path=project_root / subdirectory / "MODULE_README.md",
+        mode=mode,
+        scope=scope,
+        project_noise=project_noise,
+        include_call_graph=include_call_graph,
+        project_root=project_root,
+        entry_points=entry_points,
+        call_graph_exclude=call_graph_exclude,
+        signatures_exclude=signatures_exclude,
+        force_refresh_children=force_refresh_children,
+        index=index,
+    )
+    _print_cascade_summary(sum(1 for node in order if not node.already_has))
 
 
 def readme_orchestrator(
@@ -1966,6 +2516,7 @@ def readme_orchestrator(
     call_graph_exclude: list[str] | None = None,
     signatures_exclude: list[str] | None = None,
     force_refresh_children: bool = False,
+    jobs: int = 1,
 ) -> None:
     """Generate or update MODULE_README.md files for one or more subdirectories.
 
@@ -2017,8 +2568,13 @@ def readme_orchestrator(
                                   that exact filename
 
                                 e.g. ``["tests", "migrations", "conftest.py"]``
-        force_refresh_children: When ``True``, regenerate all child READMEs
-                                unconditionally, even if their sources are unchanged.
+        force_refresh_children: When ``True``, regenerate the target and all child
+                                READMEs unconditionally, even if their inputs hash
+                                is unchanged.
+        jobs:                   Worker processes for cascade mode. Child READMEs are
+                                generated before their parents, and independent subtrees
+                                run in parallel. ``0`` means one per CPU. The default of
+                                ``1`` runs serially.
     """
     logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 
@@ -2050,50 +2606,56 @@ def readme_orchestrator(
         targets = [""]
 
     single_target = len(targets) == 1
+    jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
 
-    for subdirectory in targets:
-        subdirectory = subdirectory.strip("/\\")
+    # One index for every target: they share the same tree, so nothing is parsed twice.
+    with ProjectIndex(resolved_root) as index:
+        for subdirectory in targets:
+            subdirectory = subdirectory.strip("/\\")
 
-        if single_target and output:
-            output_path: Path | None = Path(output)
-            if not output_path.is_absolute():
-                output_path = resolved_root / output_path
-        else:
-            output_path = (
-                resolved_root / subdirectory / "MODULE_README.md"
-                if subdirectory
-                else resolved_root / "MODULE_README.md"
-            )
+            if single_target and output:
+                output_path: Path | None = Path(output)
+                if not output_path.is_absolute():
+                    output_path = resolved_root / output_path
+            else:
+                output_path = (
+                    resolved_root / subdirectory / "MODULE_README.md"
+                    if subdirectory
+                    else resolved_root / "MODULE_README.md"
+                )
 
-        if cascade:
-            run_cascade(
-                subdirectory=subdirectory,
-                project_root=resolved_root,
-                mode=mode,
-                child_mode=cascade_child_mode,
-                min_py_files=cascade_min_files,
-                scope=scope,
-                project_noise=project_noise_list,
-                include_call_graph=include_call_graph,
-                entry_points=entry_points,
-                call_graph_exclude=call_graph_exclude,
-                signatures_exclude=signatures_exclude,
-                force_refresh_children=force_refresh_children,
-            )
-        else:
-            run(
-                subdirectory=subdirectory,
-                output_path=output_path,
-                mode=mode,
-                scope=scope,
-                project_noise=project_noise_list,
-                include_call_graph=include_call_graph,
-                project_root=resolved_root,
-                entry_points=entry_points,
-                call_graph_exclude=call_graph_exclude,
-                signatures_exclude=signatures_exclude,
-                force_refresh_children=force_refresh_children,
-            )
+            if cascade:
+                run_cascade(
+                    subdirectory=subdirectory,
+                    project_root=resolved_root,
+                    mode=mode,
+                    child_mode=cascade_child_mode,
+                    min_py_files=cascade_min_files,
+                    scope=scope,
+                    project_noise=project_noise_list,
+                    include_call_graph=include_call_graph,
+                    entry_points=entry_points,
+                    call_graph_exclude=call_graph_exclude,
+                    signatures_exclude=signatures_exclude,
+                    force_refresh_children=force_refresh_children,
+                    index=index,
+                    jobs=jobs,
+                )
+            else:
+                run(
+                    subdirectory=subdirectory,
+                    output_path=output_path,
+                    mode=mode,
+                    scope=scope,
+                    project_noise=project_noise_list,
+                    include_call_graph=include_call_graph,
+                    project_root=resolved_root,
+                    entry_points=entry_points,
+                    call_graph_exclude=call_graph_exclude,
+                    signatures_exclude=signatures_exclude,
+                    force_refresh_children=force_refresh_children,
+                    index=index,
+                )
 
 
 def main() -> None:
@@ -2184,7 +2746,20 @@ def main() -> None:
     parser.add_argument(
         "--force-refresh-children",
         action="store_true",
-        help="Regenerate all child READMEs unconditionally, even if their sources are unchanged.",
+        help=(
+            "Regenerate this README and all child READMEs unconditionally, "
+            "even if their inputs hash is unchanged."
+        ),
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help=(
+            "Worker processes for --cascade: children are generated before parents, "
+            "independent subtrees in parallel. 0 = one per CPU (default: 1, serial)"
+        ),
     )
 
     args = parser.parse_args()
@@ -2206,6 +2781,7 @@ def main() -> None:
         call_graph_exclude=_parse_csv(args.call_graph_exclude),
         signatures_exclude=_parse_csv(args.signatures_exclude),
         force_refresh_children=args.force_refresh_children,
+        jobs=args.jobs,
     )
 
 
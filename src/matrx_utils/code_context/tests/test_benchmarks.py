@@ -0,0 +1,93 @@
+"""
+Smoke tests for the pipeline benchmark harness (benchmarks/pipeline.py).
+
+Covers:
+- generate_repo(): deterministic for a seed, reused when the manifest matches
+- run_case(): public build() timing, the stages each mode runs, JSON-serialisable output
+- compare(): per-stage ratios between two reports
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from matrx_utils.code_context.benchmarks.pipeline import compare, generate_repo, run_case
+
+
+def _snapshot(root: Path) -> dict[str, str]:
+    return {
+        p.relative_to(root).as_posix(): p.read_text(encoding="utf-8", errors="replace")
+        for p in sorted(root.rglob("*")) if p.is_file()
+    }
+
+
+class TestGenerateRepo:
+    def test_deterministic(self, tmp_path):
+        a = _snapshot(generate_repo(tmp_path / "a", 60, seed=3))
+        b = _snapshot(generate_repo(tmp_path / "b", 60, seed=3))
+        assert a == b
+        assert sum(1 for name in a if name.startswith("src/") and "__pycache__" not in name) == 60
+
+    def test_reused_when_unchanged(self, tmp_path):
+        root = generate_repo(tmp_path / "r", 20)
+        marker = root / "src" / "keep.txt"
+        marker.write_text("x", encoding="utf-8")
+        generate_repo(root, 20)
+        assert marker.exists()
+        generate_repo(root, 30)
+        assert not marker.exists()
+
+
+@pytest.fixture(scope="module")
+def repo(tmp_path_factory) -> Path:
+    return generate_repo(tmp_path_factory.mktemp("bench") / "repo", 40)
+
+
+class TestRunCase:
+    @pytest.mark.parametrize("mode, expected", [
+        ("tree_only", {"discovery", "call_graph", "assemble", "save"}),
+        ("signatures", {"discovery", "load", "signatures", "call_graph", "assemble", "save"}),
+        ("clean", {"discovery", "load", "strip", "call_graph", "assemble", "save"}),
+        ("budget", {"discovery", "load", "strip", "signatures", "call_graph", "assemble", "save"}),
+    ])
+    def test_stages(self, repo, mode, expected):
+        case = run_case(repo, mode)
+        assert set(case["stages"]) == expected
+        assert case["files"] > 0 and case["output_chars"] > 0
+        json.dumps(case)
+
+    def test_total_times_public_build(self, repo):
+        case = run_case(repo, "clean", call_graph=False, stages=False)
+        assert set(case["build"]) == {"build", "save"}
+        assert case["total_seconds"] == pytest.approx(sum(s["seconds"] for s in case["build"].values()))
+        assert case["stages"] == {} and case["stages_seconds"] == 0
+
+    def test_breakdown_recorded_alongside_total(self, repo):
+        case = run_case(repo, "signatures", call_graph=False)
+        assert case["total_seconds"] > 0 and case["stages_seconds"] > 0
+        assert case["files"] > 0 and case["output_chars"] > 0
+
+    def test_excluded_noise_not_discovered(self, repo):
+        case = run_case(repo, "tree_only", call_graph=False)
+        assert case["files"] <= 40
+        assert "call_graph" not in case["stages"]
+
+    def test_trace_memory(self, repo):
+        case = run_case(repo, "clean", call_graph=False, trace_memory=True)
+        assert all("py_heap_peak_mb" in s for s in case["stages"].values())
+
+
+class TestCompare:
+    def test_ratios(self):
+        def report(load: float) -> dict:
+            return {"results": [{
+                "repo_files": 10, "mode": "clean", "total_seconds": load + 1.0,
+                "stages": {"load": {"seconds": load}, "assemble": {"seconds": 1.0}},
+            }]}
+
+        rows = {r["stage"]: r["ratio"] for r in compare(report(2.0), report(1.0))}
+        assert rows == {"load": 0.5, "assemble": 1.0, "total": pytest.approx(2 / 3)}
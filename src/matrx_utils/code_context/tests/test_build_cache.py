@@ -0,0 +1,220 @@
+"""
+Tests for BuildCache and cache-aware CodeContextBuilder builds.
+
+Covers:
+- Digest reuse when size/mtime are unchanged
+- Re-hash on stat change, entry kept when content is identical
+- Warm rebuilds serve clean/signatures/call-graph artifacts from cache
+- Changed files are reprocessed; output matches an uncached build
+- Version mismatch discards the index
+- prune() removes entries for deleted files
+- An edit landing between the digest and the read never poisons the cache
+"""
+
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from matrx_utils.code_context.code_context import BuildCache, CodeContextBuilder, CodeExtractor
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+@pytest.fixture()
+def project(tmp_path) -> Path:
+    root = tmp_path / "proj"
+    root.mkdir()
+    (root / "alpha.py").write_text(
+        "# leading comment\ndef alpha(x):\n    return beta(x)\n\ndef beta(y):\n    return y\n",
+        encoding="utf-8",
+    )
+    (root / "gamma.ts").write_text(
+        "// note\nexport function gamma(a: number): number { return a; }\n",
+        encoding="utf-8",
+    )
+    return root
+
+
+def _age(path: Path, seconds: int = 60) -> None:
+    """Push mtime into the past so it falls outside the racy-timestamp window."""
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - seconds * 1_000_000_000))
+
+
+def _builder(root: Path, cache_dir: Path | None, mode: str, **kwargs) -> CodeContextBuilder:
+    return CodeContextBuilder(
+        project_root=root,
+        output_mode=mode,
+        cache_dir=cache_dir,
+        export_directory=str(root.parent / "out"),
+        **kwargs,
+    )
+
+
+# ---------------------------------------------------------------------------
+# BuildCache
+# ---------------------------------------------------------------------------
+
+class TestBuildCacheDigest:
+    def test_digest_stable_for_unchanged_file(self, tmp_path):
+        f = tmp_path / "a.py"
+        f.write_text("x = 1\n", encoding="utf-8")
+        _age(f)
+        cache = BuildCache(tmp_path / "cache")
+        assert cache.digest(f) == cache.digest(f)
+
+    def test_digest_changes_with_content(self, tmp_path):
+        f = tmp_path / "a.py"
+        f.write_text("x = 1\n", encoding="utf-8")
+        cache = BuildCache(tmp_path / "cache")
+        before = cache.digest(f)
+        f.write_text("x = 22\n", encoding="utf-8")
+        assert cache.digest(f) != before
+
+    def test_touch_keeps_digest(self, tmp_path):
+        f = tmp_path / "a.py"
+        f.write_text("x = 1\n", encoding="utf-8")
+        cache = BuildCache(tmp_path / "cache")
+        before = cache.digest(f)
+        os.utime(f, None)
+        assert cache.digest(f) == before
+
+    def test_missing_file_returns_none(self, tmp_path):
+        cache = BuildCache(tmp_path / "cache")
+        assert cache.digest(tmp_path / "nope.py") is None
+
+    def test_artifacts_persist_across_instances(self, tmp_path):
+        f = tmp_path / "a.py"
+        f.write_text("x = 1\n", encoding="utf-8")
+        _age(f)
+        cache = BuildCache(tmp_path / "cache")
+        cache.put(cache.digest(f), "clean", {"text": "x = 1\n", "original_chars": 6})
+        cache.save()
+
+        reopened = BuildCache(tmp_path / "cache")
+        assert reopened.get(reopened.digest(f), "clean") == {"text": "x = 1\n", "original_chars": 6}
+
+    def test_version_mismatch_discards_index(self, tmp_path):
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        (cache_dir / "index.json").write_text(
+            json.dumps({"version": -1, "files": {"/x.py": [1, 1, "abc"]}}), encoding="utf-8"
+        )
+        assert BuildCache(cache_dir).stats["entries"] == 0
+
+    def test_prune_drops_deleted_files(self, tmp_path):
+        f = tmp_path / "a.py"
+        f.write_text("x = 1\n", encoding="utf-8")
+        cache = BuildCache(tmp_path / "cache")
+        cache.put(cache.digest(f), "clean", {"text": "", "original_chars": 0})
+        cache.save()
+        f.unlink()
+        assert cache.prune() == 1
+        assert cache.stats["entries"] == 0
+
+
+# ---------------------------------------------------------------------------
+# Builder integration
+# ---------------------------------------------------------------------------
+
+class TestCachedBuild:
+    @pytest.mark.parametrize("mode", ["clean", "signatures"])
+    def test_warm_build_matches_uncached(self, project, tmp_path, mode):
+        for f in project.iterdir():
+            _age(f)
+        cache_dir = tmp_path / "cache"
+        uncached = _builder(project, None, mode, call_graph=True).build()
+        cold = _builder(project, cache_dir, mode, call_graph=True).build()
+        warm = _builder(project, cache_dir, mode, call_graph=True).build()
+
+        assert cold.combined_text == uncached.combined_text
+        assert warm.combined_text == uncached.combined_text
+        assert cold.stats["cache"]["hits"] == 0
+        assert warm.stats["cache"]["misses"] == 0
+        assert warm.stats["cache"]["hits"] > 0
+
+    def test_warm_clean_build_does_not_read_files(self, project, tmp_path):
+        for f in project.iterdir():
+            _age(f)
+        cache_dir = tmp_path / "cache"
+        _builder(project, cache_dir, "clean").build()
+        warm = _builder(project, cache_dir, "clean").build()
+        ex = warm.extractors[project / "alpha.py"]
+        assert ex.original is None
+        assert ex.char_counts["original"] > 0
+        assert "def alpha" in ex.get_content("clean")
+
+    def test_deferred_extractor_loads_original_on_demand(self, project):
+        f = project / "alpha.py"
+        ex = CodeExtractor.from_cache(f, "cleaned", original_chars=5)
+        assert ex.get_content("clean") == "cleaned"
+        assert ex.get_content("original") == f.read_text(encoding="utf-8")
+
+    def test_changed_file_is_reprocessed(self, project, tmp_path):
+        for f in project.iterdir():
+            _age(f)
+        cache_dir = tmp_path / "cache"
+        _builder(project, cache_dir, "clean").build()
+        (project / "alpha.py").write_text("def changed():\n    pass\n", encoding="utf-8")
+
+        result = _builder(project, cache_dir, "clean").build()
+        assert "def changed" in result.combined_text
+        assert "def alpha" not in result.combined_text
+        assert result.stats["cache"]["misses"] == 1
+
+    def test_call_graph_options_are_part_of_key(self, project, tmp_path):
+        cache_dir = tmp_path / "cache"
+        _builder(project, cache_dir, "tree_only", call_graph=True).build()
+        result = _builder(
+            project, cache_dir, "tree_only", call_graph=True, call_graph_ignore=["beta"]
+        ).build()
+        callees = {c.callee for cg in result.call_graphs for c in cg.calls}
+        assert not any(c.endswith(".beta") for c in callees)
+
+    @pytest.mark.parametrize("mode", ["clean", "signatures"])
+    def test_edit_after_digest_does_not_poison_cache(self, project, tmp_path, monkeypatch, mode):
+        f = project / "alpha.py"
+        _age(f)
+        old = f.read_bytes()
+        digest = BuildCache.digest
+
+        def digest_then_edit(self, path):
+            result = digest(self, path)
+            if path == f:
+                path.write_text("def edited():\n    pass\n", encoding="utf-8")
+            return result
+
+        monkeypatch.setattr(BuildCache, "digest", digest_then_edit)
+        cache_dir = tmp_path / "cache"
+        _builder(project, cache_dir, mode).build()
+        monkeypatch.undo()
+
+        f.write_bytes(old)
+        _age(f)
+        result = _builder(project, cache_dir, mode).build()
+        assert "def alpha" in result.combined_text
+        assert "edited" not in result.combined_text
+        cache = BuildCache(cache_dir)
+        assert cache.get(hashlib.sha1(old).hexdigest(), "clean" if mode == "clean" else "signatures:.py") is not None
+
+    def test_read_digests_the_bytes_it_returns(self, tmp_path):
+        f = tmp_path / "a.py"
+        f.write_text("x = 1\n", encoding="utf-8")
+        cache = BuildCache(tmp_path / "cache")
+        digest, data = cache.read(f)
+        assert data == b"x = 1\n"
+        assert digest == hashlib.sha1(data).hexdigest() == cache.digest(f)
+        assert cache.read(tmp_path / "missing.py") == (None, None)
+
+    def test_original_mode_unaffected(self, project, tmp_path):
+        plain = _builder(project, None, "original").build()
+        cached = _builder(project, tmp_path / "cache", "original").build()
+        assert cached.combined_text == plain.combined_text
@@ -3,8 +3,9 @@ Tests for CodeExtractor and ASTAnalyzer.
 
 CodeExtractor covers:
 - UTF-8 file reading
-- Python comment removal (# and triple-quoted)
+- Python comment removal (# and docstrings, not other triple-quoted strings)
 - JS/TS comment removal (// and /* */)
+- String literals survive stripping (URLs, "#" in strings) across languages
 - Blank line normalization
 - Character count tracking
 - Content type fallback (clean falls back to original if strip not called)
@@ -179,6 +180,113 @@ class TestJSCommentRemoval:
         assert "function add(x)" in result
 
 
+# ---------------------------------------------------------------------------
+# String-literal awareness and per-language rules
+# ---------------------------------------------------------------------------
+
+class TestStringAwareStripping:
+    def _strip(self, tmp_path, name: str, content: str) -> str:
+        p = tmp_path / name
+        p.write_text(content, encoding="utf-8")
+        return CodeExtractor(p).strip_comments()
+
+    def test_python_hash_inside_string_kept(self, tmp_path):
+        result = self._strip(tmp_path, "a.py", 'color = "#ff0000"  # red\n')
+        assert '"#ff0000"' in result
+        assert "red" not in result
+
+    def test_python_assigned_triple_string_kept(self, tmp_path):
+        result = self._strip(tmp_path, "a.py", 'SQL = """select 1"""\n')
+        assert "select 1" in result
+
+    def test_python_module_docstring_removed(self, tmp_path):
+        result = self._strip(tmp_path, "a.py", '"""Module docs."""\nimport os\n')
+        assert "Module docs" not in result
+        assert "import os" in result
+
+    def test_python_docstring_with_trailing_comment_removed(self, tmp_path):
+        result = self._strip(tmp_path, "a.py", 'def f():\n    """Doc."""  # note\n    return 1\n')
+        assert "Doc." not in result
+        assert "note" not in result
+
+    def test_python_triple_string_call_argument_kept(self, tmp_path):
+        result = self._strip(tmp_path, "a.py", 'cur.execute(\n    """\n    SELECT 1\n    """\n)\n')
+        assert "SELECT 1" in result
+
+    def test_python_only_first_body_statement_is_docstring(self, tmp_path):
+        src = (
+            '@dataclass\nclass A(\n    Base,\n):\n    r"""Class doc."""\n    x = 1\n    """Attribute note."""\n'
+            '\nif DEBUG:\n    """Branch string."""\n'
+            "\nasync def g(a='('):\n    # lead\n    '''Async doc.'''\n"
+        )
+        result = self._strip(tmp_path, "a.py", src)
+        assert "Class doc" not in result
+        assert 'r"""' not in result
+        assert "Attribute note" in result
+        assert "Branch string" in result
+        assert "Async doc" not in result
+
+    def test_python_unterminated_string_does_not_crash(self, tmp_path):
+        result = self._strip(tmp_path, "a.py", 'x = "oops\n# comment\ny = 1\n')
+        assert "y = 1" in result
+
+    def test_js_url_in_string_kept(self, tmp_path):
+        result = self._strip(tmp_path, "app.ts", 'const u = "https://example.com/a"; // link\n')
+        assert "https://example.com/a" in result
+        assert "link" not in result
+
+    def test_js_template_literal_kept(self, tmp_path):
+        result = self._strip(tmp_path, "app.js", "const t = `a /* not */ b`;\n")
+        assert "/* not */" in result
+
+    def test_js_division_untouched(self, tmp_path):
+        result = self._strip(tmp_path, "app.js", "const r = a / b / c;\n")
+        assert "a / b / c" in result
+
+    def test_js_regex_literal_kept(self, tmp_path):
+        result = self._strip(tmp_path, "app.js", "const r = /\\/\\//g; // c\nif (/[/*]/.test(s)) f(); /* d */\n")
+        assert "const r = /\\/\\//g;" in result
+        assert "if (/[/*]/.test(s)) f();" in result
+        assert "// c" not in result
+        assert "/* d */" not in result
+
+    def test_ts_regex_after_return_kept(self, tmp_path):
+        result = self._strip(tmp_path, "app.ts", "function f() {\n  return /\\/\\*/; // e\n}\n")
+        assert "return /\\/\\*/;" in result
+        assert "// e" not in result
+
+    def test_js_division_before_comment(self, tmp_path):
+        result = self._strip(tmp_path, "app.js", "const half = total / 2; // f /g\n")
+        assert "const half = total / 2;" in result
+        assert "f /g" not in result
+
+    def test_python_file_keeps_double_dash(self, tmp_path):
+        result = self._strip(tmp_path, "a.py", "x = y--z\nflag = '--verbose'\n")
+        assert "y--z" in result
+        assert "'--verbose'" in result
+
+    def test_css_url_survives(self, tmp_path):
+        result = self._strip(tmp_path, "s.css", "a { background: url(http://x/y.png); } /* c */\n")
+        assert "http://x/y.png" in result
+        assert "/* c */" not in result
+
+    def test_lua_comments(self, tmp_path):
+        result = self._strip(tmp_path, "m.lua", 'local s = "a--b" -- c\n--[[ block ]]\nreturn s\n')
+        assert '"a--b"' in result
+        assert "block" not in result
+        assert " c" not in result
+
+    def test_rust_lifetime_not_treated_as_string(self, tmp_path):
+        result = self._strip(tmp_path, "lib.rs", "fn f<'a>(x: &'a str) {} // gone\n")
+        assert "fn f<'a>(x: &'a str)" in result
+        assert "gone" not in result
+
+    def test_html_comment(self, tmp_path):
+        result = self._strip(tmp_path, "i.html", "<p>hi</p><!-- hidden -->\n")
+        assert "hidden" not in result
+        assert "<p>hi</p>" in result
+
+
 # ---------------------------------------------------------------------------
 # Blank line normalization
 # ---------------------------------------------------------------------------
@@ -6,6 +6,9 @@ Layer 2: word-boundary substring match on directory names
 Layer 3: exact filename match
 Layer 4: word-boundary substring match on filenames
 Layer 5: extension blacklist (or whitelist if include_extensions is set)
+
+Plus the content-level filters applied during the walk: .gitignore rules,
+the max_file_size_kb cap and the binary sniff.
 """
 
 import os
@@ -280,6 +283,121 @@ class TestDiscoverWithTempDir:
         assert stats["file_types"][".ts"] == 1
 
 
+class TestWalkOrder:
+    def test_matches_os_walk_order(self, tmp_path):
+        for rel in ["b.py", "a.py", "z/x.py", "z/y/deep.py", "c/c.py"]:
+            p = tmp_path / rel
+            p.parent.mkdir(parents=True, exist_ok=True)
+            p.write_text("pass")
+        expected = [
+            Path(dirpath) / name
+            for dirpath, _, filenames in os.walk(tmp_path)
+            for name in filenames
+        ]
+        found = FileDiscovery(make_cfg(exclude_extensions=[])).discover(tmp_path)
+        assert found == expected
+
+    def test_many_substring_words_share_one_pattern(self):
+        fd = FileDiscovery(make_cfg(exclude_files_containing=["backup", "generated", "old"]))
+        assert fd.should_exclude_file("db_backup.py")
+        assert fd.should_exclude_file("schema.generated.ts")
+        assert fd.should_exclude_file("old-utils.py")
+        assert not fd.should_exclude_file("golden.py")
+
+
+# ---------------------------------------------------------------------------
+# .gitignore support
+# ---------------------------------------------------------------------------
+
+class TestGitignore:
+    def _names(self, root, **cfg_kwargs) -> set[str]:
+        cfg = make_cfg(exclude_extensions=[], exclude_files=[], **cfg_kwargs)
+        found = FileDiscovery(cfg).discover(root)
+        return {f.relative_to(root).as_posix() for f in found}
+
+    def _tree(self, root, files: dict[str, str]) -> None:
+        for rel, content in files.items():
+            p = root / rel
+            p.parent.mkdir(parents=True, exist_ok=True)
+            p.write_text(content)
+
+    def test_patterns_files_and_directories(self, tmp_path):
+        self._tree(tmp_path, {
+            ".gitignore": "*.gen.py\nbuild/\n/top_only.py\n# comment\n",
+            "app.py": "", "schema.gen.py": "", "top_only.py": "",
+            "build/out.py": "", "pkg/top_only.py": "", "pkg/more.gen.py": "",
+        })
+        names = self._names(tmp_path)
+        assert names == {".gitignore", "app.py", "pkg/top_only.py"}
+
+    def test_negation_and_nested_gitignore(self, tmp_path):
+        self._tree(tmp_path, {
+            ".gitignore": "*.py\n!keep.py\n",
+            "keep.py": "", "drop.py": "",
+            "sub/.gitignore": "!local.py\n",
+            "sub/local.py": "", "sub/other.py": "",
+        })
+        names = self._names(tmp_path)
+        assert {"keep.py", "sub/local.py"} <= names
+        assert "drop.py" not in names and "sub/other.py" not in names
+
+    def test_double_star(self, tmp_path):
+        self._tree(tmp_path, {
+            ".gitignore": "docs/**/draft.py\n",
+            "docs/draft.py": "", "docs/a/b/draft.py": "", "docs/final.py": "",
+        })
+        names = self._names(tmp_path)
+        assert "docs/final.py" in names
+        assert "docs/draft.py" not in names and "docs/a/b/draft.py" not in names
+
+    def test_root_gitignore_applies_to_subdirectory_scan(self, tmp_path):
+        self._tree(tmp_path, {".gitignore": "src/generated/\n", "src/app.py": "", "src/generated/x.py": ""})
+        found = FileDiscovery(make_cfg(exclude_extensions=[])).discover(tmp_path, subdirectory="src")
+        assert [f.name for f in found] == ["app.py"]
+
+    def test_disabled(self, tmp_path):
+        self._tree(tmp_path, {".gitignore": "*.py\n", "app.py": ""})
+        assert "app.py" in self._names(tmp_path, respect_gitignore=False)
+
+    def test_skipped_counts(self, tmp_path):
+        self._tree(tmp_path, {".gitignore": "*.log.py\n", "a.log.py": "", "b.log.py": "", "c.py": ""})
+        fd = FileDiscovery(make_cfg(exclude_extensions=[]))
+        fd.discover(tmp_path)
+        assert fd.last_skipped_counts["gitignored"] == 2
+
+
+# ---------------------------------------------------------------------------
+# Size cap and binary sniff
+# ---------------------------------------------------------------------------
+
+class TestContentFilters:
+    def test_size_cap(self, tmp_path):
+        (tmp_path / "small.py").write_text("pass")
+        (tmp_path / "huge.py").write_text("x = 1\n" * 400)  # ~2.4 KB
+        fd = FileDiscovery(make_cfg(exclude_extensions=[], max_file_size_kb=1))
+        names = {f.name for f in fd.discover(tmp_path)}
+        assert names == {"small.py"}
+        assert fd.last_skipped_counts["too_large"] == 1
+
+    def test_no_size_cap(self, tmp_path):
+        (tmp_path / "huge.py").write_text("x = 1\n" * 400)
+        fd = FileDiscovery(make_cfg(exclude_extensions=[], max_file_size_kb=None))
+        assert [f.name for f in fd.discover(tmp_path)] == ["huge.py"]
+
+    def test_binary_sniff(self, tmp_path):
+        (tmp_path / "blob.dat").write_bytes(b"\x89PNG\r\n\x00\x00data")
+        (tmp_path / "notes.dat").write_text("plain text")
+        fd = FileDiscovery(make_cfg(exclude_extensions=[]))
+        names = {f.name for f in fd.discover(tmp_path)}
+        assert names == {"notes.dat"}
+        assert fd.last_skipped_counts["binary"] == 1
+
+    def test_binary_sniff_disabled(self, tmp_path):
+        (tmp_path / "blob.dat").write_bytes(b"\x00\x01\x02")
+        fd = FileDiscovery(make_cfg(exclude_extensions=[], skip_binary_files=False))
+        assert [f.name for f in fd.discover(tmp_path)] == ["blob.dat"]
+
+
 # ---------------------------------------------------------------------------
 # Dynamic exclusion override (add/remove)
 # ---------------------------------------------------------------------------
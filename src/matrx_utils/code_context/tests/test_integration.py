@@ -520,3 +520,50 @@ class TestDeepNesting:
         )
         result = builder.build()
         assert "a/b/c/deep.py" in result.combined_text
+
+
+# ---------------------------------------------------------------------------
+# Streaming output
+# ---------------------------------------------------------------------------
+
+class TestStreaming:
+    @pytest.mark.parametrize("mode", ["tree_only", "signatures", "clean", "original"])
+    def test_stream_matches_build(self, simple_project, mode):
+        builder = CodeContextBuilder(
+            project_root=simple_project,
+            output_mode=mode,
+            call_graph=True,
+            prompt_prefix="START",
+            prompt_suffix="END",
+        )
+        assert "".join(builder.build_stream()) == builder.build().combined_text
+
+    def test_stream_yields_multiple_chunks(self, simple_project):
+        builder = CodeContextBuilder(project_root=simple_project, output_mode="original")
+        assert len(list(builder.build_stream())) > 3
+
+    def test_save_stream_to_sink(self, simple_project):
+        import io
+
+        builder = CodeContextBuilder(project_root=simple_project, output_mode="clean")
+        sink = io.StringIO()
+        assert builder.save_stream(sink=sink) is None
+        assert sink.getvalue() == builder.build().combined_text
+
+    def test_save_stream_to_export_dir(self, simple_project, tmp_path):
+        out = tmp_path / "out"
+        builder = CodeContextBuilder(
+            project_root=simple_project, output_mode="original", export_directory=str(out)
+        )
+        path = builder.save_stream()
+        assert path is not None and path.exists()
+        assert path.read_text(encoding="utf-8") == builder.build().combined_text
+        assert list(out.glob("*_structure.json"))
+
+    def test_stream_uses_cache(self, simple_project, tmp_path):
+        builder = CodeContextBuilder(
+            project_root=simple_project, output_mode="clean", cache_dir=tmp_path / "cache"
+        )
+        first = "".join(builder.build_stream())
+        assert "".join(builder.build_stream()) == first
+        assert (tmp_path / "cache" / "index.json").exists()
@@ -0,0 +1,280 @@
+"""
+Tests for generate_module_readme — MODULE_README.md generation and cascades.
+
+Covers:
+- ProjectIndex: one walk, each file parsed at most once, skipped directories
+- Dependencies, upstream callers (auto and pinned entry points) from the index
+- run_cascade: one parse per file for the whole cascade
+- Parallel cascade (jobs > 1): same plan order, READMEs and log as serial
+- Inputs hash: content-based staleness, propagation to parents, no-op writes
+  skipped, external callers
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from matrx_utils.code_context import generate_module_readme as gmr
+from matrx_utils.code_context.generate_module_readme import ProjectIndex
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+@pytest.fixture()
+def project(tmp_path) -> Path:
+    root = tmp_path / "proj"
+    (root / "svc" / "core").mkdir(parents=True)
+    (root / "app").mkdir()
+    (root / ".venv" / "lib").mkdir(parents=True)
+    (root / "svc" / "__init__.py").write_text("from svc.api import handle\n", encoding="utf-8")
+    (root / "svc" / "api.py").write_text(
+        "import requests\n"
+        "from app.settings import LIMIT\n"
+        "from .core.engine import run\n\n"
+        "def handle(x):\n"
+        "    return run(x)\n\n"
+        "def _private():\n"
+        "    pass\n",
+        encoding="utf-8",
+    )
+    for name in ("engine", "models", "queue"):
+        (root / "svc" / "core" / f"{name}.py").write_text(
+            f"import json\n\ndef run(x):\n    return x\n\nclass {name.title()}:\n    pass\n",
+            encoding="utf-8",
+        )
+    (root / "app" / "settings.py").write_text("LIMIT = 3\n", encoding="utf-8")
+    (root / "app" / "main.py").write_text(
+        "import svc.api as api\n"
+        "from svc import handle\n\n"
+        "def main():\n"
+        "    handle(1)\n"
+        "    api.handle(2)\n"
+        "    api._private()\n",
+        encoding="utf-8",
+    )
+    (root / ".venv" / "lib" / "vendored.py").write_text("from svc import handle\n", encoding="utf-8")
+    return root
+
+
+@pytest.fixture()
+def index(project):
+    with ProjectIndex(project) as idx:
+        yield idx
+
+
+# ---------------------------------------------------------------------------
+# ProjectIndex
+# ---------------------------------------------------------------------------
+
+class TestProjectIndex:
+    def test_skips_virtualenv(self, index):
+        assert not any(".venv" in f.parts for f in index.files)
+
+    def test_py_files_scoped(self, index, project):
+        inside = {f.name for f in index.py_files(project / "svc")}
+        assert inside == {"__init__.py", "api.py", "engine.py", "models.py", "queue.py"}
+        outside = {f.name for f in index.py_files_outside(project / "svc")}
+        assert outside == {"settings.py", "main.py"}
+
+    def test_facts(self, index, project):
+        facts = index.facts(project / "app" / "main.py")
+        assert facts.callables == ["main"]
+        assert "handle" in facts.name_calls
+        assert ("api", "handle") in facts.attr_calls
+        assert {(r.module, r.name, r.asname) for r in facts.imports} == {
+            ("svc.api", None, "api"),
+            ("svc", "handle", None),
+        }
+
+    def test_parsed_once(self, index, project):
+        for _ in range(3):
+            gmr._build_dependencies("svc", project, index)
+            gmr._build_callers("svc", None, project, index)
+        assert index.parsed == len(index.files)
+
+    def test_syntax_error_is_none(self, project):
+        (project / "broken.py").write_text("def oops(:\n", encoding="utf-8")
+        with ProjectIndex(project) as idx:
+            assert idx.facts(project / "broken.py") is None
+
+    def test_close_removes_symbol_db(self, project):
+        idx = ProjectIndex(project)
+        scratch = idx.symbol_db.parent
+        assert scratch.exists()
+        idx.close()
+        assert not scratch.exists()
+
+
+# ---------------------------------------------------------------------------
+# Sections built from the index
+# ---------------------------------------------------------------------------
+
+class TestSections:
+    def test_dependencies(self, index, project):
+        deps = gmr._build_dependencies("svc", project, index)
+        assert "**External packages:** requests" in deps
+        assert "**Internal modules:** app.settings" in deps
+
+    def test_auto_callers(self, index, project):
+        callers = gmr._build_callers("svc", None, project, index)
+        assert "| `app/main.py` | `handle()` |" in callers
+        assert "_private" not in callers
+        assert "vendored" not in callers
+
+    def test_pinned_entry_points(self, index, project):
+        callers = gmr._build_callers("svc", ["handle"], project, index)
+        assert "| `app/main.py` | `handle()` |" in callers
+
+    def test_module_callables(self, index, project):
+        assert gmr._get_module_callables("svc", project, index) == {
+            "handle", "run", "Engine", "Models", "Queue",
+        }
+
+
+# ---------------------------------------------------------------------------
+# Cascade
+# ---------------------------------------------------------------------------
+
+class TestCascade:
+    def test_single_parse_for_whole_cascade(self, project, monkeypatch):
+        parsed: list[Path] = []
+        real_parse = ProjectIndex._parse
+
+        def counting_parse(path):
+            parsed.append(path)
+            return real_parse(path)
+
+        monkeypatch.setattr(ProjectIndex, "_parse", staticmethod(counting_parse))
+        gmr.run_cascade("svc", project, min_py_files=3)
+        assert (project / "svc" / "MODULE_README.md").exists()
+        assert (project / "svc" / "core" / "MODULE_README.md").exists()
+        assert parsed and len(parsed) == len(set(parsed))
+
+    def test_matches_without_shared_index(self, project, tmp_path):
+        shared = project / "svc" / "MODULE_README.md"
+        with ProjectIndex(project) as idx:
+            gmr.run("svc", shared, "signatures", None, None, True, project, index=idx)
+        with_index = shared.read_text(encoding="utf-8")
+        shared.unlink()
+        gmr.run("svc", shared, "signatures", None, None, True, project)
+        strip = lambda text: "\n".join(ln for ln in text.splitlines() if "Last generated" not in ln)
+        assert strip(shared.read_text(encoding="utf-8")) == strip(with_index)
+
+
+class TestParallelCascade:
+    @staticmethod
+    def _tree(root: Path) -> Path:
+        for sub in ("a/x", "a/y", "b", "c/z"):
+            d = root / "pkg" / sub
+            d.mkdir(parents=True)
+            for i in range(3):
+                (d / f"m{i}.py").write_text(
+                    f"from pkg import shared\n\ndef f{i}(v):\n    return shared.g(v)\n", encoding="utf-8"
+                )
+        (root / "pkg" / "shared.py").write_text("def g(v):\n    return v\n", encoding="utf-8")
+        (root / "pkg" / "a" / "top.py").write_text("def top():\n    pass\n", encoding="utf-8")
+        return root
+
+    @staticmethod
+    def _readmes(root: Path) -> dict[str, str]:
+        return {
+            p.relative_to(root).as_posix(): "\n".join(
+                ln for ln in p.read_text(encoding="utf-8").splitlines() if "Last generated" not in ln
+            )
+            for p in sorted(root.rglob("MODULE_README.md"))
+        }
+
+    def test_plan_matches_serial_walk(self, tmp_path):
+        root = self._tree(tmp_path / "p")
+        with ProjectIndex(root) as idx:
+            plan = gmr._plan_cascade("pkg", root, 3, idx)
+        order = [n.subdirectory for n in gmr._post_order(plan)]
+        assert order == ["pkg/a/x", "pkg/a/y", "pkg/a", "pkg/b", "pkg/c/z", "pkg/c"]
+
+    def test_parallel_matches_serial(self, tmp_path, capsys):
+        serial, parallel = self._tree(tmp_path / "s"), self._tree(tmp_path / "p")
+        gmr.run_cascade("pkg", serial, min_py_files=3)
+        serial_log = capsys.readouterr().out
+        gmr.run_cascade("pkg", parallel, min_py_files=3, jobs=3)
+        parallel_log = capsys.readouterr().out
+        assert self._readmes(parallel) == self._readmes(serial)
+        assert len(self._readmes(serial)) == 7
+        assert parallel_log.replace(str(parallel), "") == serial_log.replace(str(serial), "")
+
+
+# ---------------------------------------------------------------------------
+# Inputs hash (content-based staleness)
+# ---------------------------------------------------------------------------
+
+class TestInputsHash:
+    def _generate(self, project, **kwargs):
+        out = project / "svc" / "MODULE_README.md"
+        gmr.run("svc", out, "signatures", None, None, False, project, **kwargs)
+        return out
+
+    def test_hash_recorded(self, project):
+        out = self._generate(project)
+        assert gmr._read_inputs_hash(out)
+
+    def test_touch_does_not_change_hash(self, project):
+        with ProjectIndex(project) as idx:
+            before = idx.tree_hash(project / "svc")
+        api = project / "svc" / "api.py"
+        api.write_text(api.read_text(encoding="utf-8"), encoding="utf-8")
+        (project / "svc" / "MODULE_README.md").write_text("x", encoding="utf-8")
+        with ProjectIndex(project) as idx:
+            assert idx.tree_hash(project / "svc") == before
+
+    def test_nested_change_propagates(self, project):
+        with ProjectIndex(project) as idx:
+            before = (idx.tree_hash(project / "svc"), idx.tree_hash(project / "app"))
+        (project / "svc" / "core" / "engine.py").write_text("def run(x):\n    return 2\n", encoding="utf-8")
+        with ProjectIndex(project) as idx:
+            after = (idx.tree_hash(project / "svc"), idx.tree_hash(project / "app"))
+        assert after[0] != before[0] and after[1] == before[1]
+
+    def test_unchanged_inputs_skip_write(self, project):
+        out = self._generate(project)
+        mtime = out.stat().st_mtime_ns
+        self._generate(project)
+        assert out.stat().st_mtime_ns == mtime
+
+    def test_forced_identical_merge_not_rewritten(self, project):
+        # The first refresh lists the README itself in the tree; after that it is stable.
+        out = self._generate(project)
+        self._generate(project, force_refresh_children=True)
+        mtime = out.stat().st_mtime_ns
+        self._generate(project, force_refresh_children=True)
+        assert out.stat().st_mtime_ns == mtime
+
+    def test_source_change_regenerates(self, project):
+        out = self._generate(project)
+        (project / "svc" / "core" / "extra.py").write_text("def added():\n    pass\n", encoding="utf-8")
+        old_hash = gmr._read_inputs_hash(out)
+        self._generate(project)
+        assert gmr._read_inputs_hash(out) != old_hash
+        assert "added" in out.read_text(encoding="utf-8")
+
+    def test_child_staleness_by_hash(self, project):
+        child = project / "svc" / "core" / "MODULE_README.md"
+        gmr.run("svc/core", child, "signatures", None, None, False, project)
+        assert gmr._check_child_staleness([child], project) == []
+        engine = project / "svc" / "core" / "engine.py"
+        os.utime(engine, (engine.stat().st_atime, engine.stat().st_mtime + 3600))
+        assert gmr._check_child_staleness([child], project) == []
+        engine.write_text("def run(x):\n    return 2\n", encoding="utf-8")
+        assert [p for p, _ in gmr._check_child_staleness([child], project)] == [child]
+
+    def test_new_external_caller_regenerates(self, project):
+        out = self._generate(project)
+        (project / "app" / "worker.py").write_text(
+            "from svc.api import handle\n\ndef work():\n    handle(3)\n", encoding="utf-8"
+        )
+        self._generate(project)
+        assert "app/worker.py" in out.read_text(encoding="utf-8")
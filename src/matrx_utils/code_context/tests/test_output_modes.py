@@ -3,11 +3,14 @@ Tests for the four output modes and multi-language signature extraction.
 
 Covers:
 - OutputMode token-cost ordering (tree_only < signatures < clean < original)
+- Budget mode: per-file mode planning, pins, priority, stats reporting
 - SignatureExtractor: Python AST path
 - SignatureExtractor: TypeScript/JavaScript regex path
 - SignatureExtractor: Go, Rust, Java, Kotlin, Swift, C#, Ruby, PHP, Lua, Dart
 - SignatureExtractor: unsupported language graceful handling
 - SignatureBlock.to_text() formatting
+- AnalysisPipeline: single parse per file, parity with the standalone analyzers, process pool
+- Identical-file dedup: references, stats, to_files_json, streaming parity, opt-out
 - _format_py_args: annotations, defaults, *args, **kwargs, positional-only
 """
 
@@ -18,9 +21,13 @@ import pytest
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
+from matrx_utils.code_context import code_context
 from matrx_utils.code_context.code_context import (
+    AnalysisPipeline,
+    ASTAnalyzer,
     CodeContextBuilder,
     CodeContextConfig,
+    FunctionCallAnalyzer,
     SignatureBlock,
     SignatureExtractor,
 )
@@ -477,3 +484,247 @@ class TestExtractFilesMulti:
             files.append(p)
         results = make_extractor().extract_files(files)
         assert len(results) == 2
+
+
+# ---------------------------------------------------------------------------
+# Analysis pipeline — one parse shared by all analyzers
+# ---------------------------------------------------------------------------
+
+class TestAnalysisPipeline:
+    @pytest.fixture()
+    def files(self, tmp_path) -> list[Path]:
+        sources = {
+            "models.py": "class User:\n    def save(self, force: bool = False) -> None:\n        self.validate()\n",
+            "service.py": "def run(x):\n    return helper(x)\n\ndef helper(y):\n    return y\n",
+            "broken.py": "def oops(:\n",
+            "app.ts": "export function greet(name: string): string { return name; }\n",
+        }
+        paths = []
+        for name, content in sources.items():
+            p = tmp_path / name
+            p.write_text(content, encoding="utf-8")
+            paths.append(p)
+        return paths
+
+    def _pipeline(self, tmp_path, **kwargs) -> AnalysisPipeline:
+        return AnalysisPipeline(
+            call_graph=FunctionCallAnalyzer(),
+            ast_analysis=True,
+            project_root=tmp_path,
+            **kwargs,
+        )
+
+    def test_parses_each_python_file_once(self, tmp_path, files, monkeypatch):
+        calls = []
+        real_parse = code_context._parse_python
+        monkeypatch.setattr(code_context, "_parse_python", lambda src, path: calls.append(path) or real_parse(src, path))
+        self._pipeline(tmp_path).run([f for f in files if f.name != "broken.py"])
+        assert sorted(p.name for p in calls) == ["models.py", "service.py"]
+
+    def test_matches_standalone_analyzers(self, tmp_path, files):
+        results = self._pipeline(tmp_path).run(files)
+        assert [r.file_path for r in results] == files
+        for r in results:
+            assert r.signature_block == SignatureExtractor().extract(r.file_path)
+            if r.file_path.suffix == ".py":
+                assert r.call_graph == FunctionCallAnalyzer().analyze_file(r.file_path, tmp_path)
+                assert r.ast_module == ASTAnalyzer.analyze_file(r.file_path)
+            else:
+                assert r.call_graph is None and r.ast_module is None
+
+    def test_syntax_error_reported_by_each_analyzer(self, tmp_path, files):
+        broken = next(r for r in self._pipeline(tmp_path).run(files) if r.file_path.name == "broken.py")
+        assert "SyntaxError" in broken.signature_block.note
+        assert "SyntaxError" in broken.call_graph.error
+        assert "SyntaxError" in broken.ast_module.error
+
+    def test_call_graph_only_returns_candidates(self, tmp_path, files):
+        pipeline = AnalysisPipeline(signatures=False, call_graph=FunctionCallAnalyzer(), call_graph_scope=["service"])
+        results = pipeline.run(files)
+        assert [r.file_path.name for r in results] == ["service.py"]
+        assert results[0].signature_block is None
+
+    def test_process_pool_matches_in_process(self, tmp_path, files):
+        serial = self._pipeline(tmp_path).run(files)
+        parallel = self._pipeline(tmp_path, workers=2).run(files)
+        assert parallel == serial
+
+    def test_builder_analysis_workers(self, tmp_path, files):
+        outputs = []
+        for workers in (1, 2):
+            builder = CodeContextBuilder(
+                project_root=tmp_path,
+                output_mode="signatures",
+                call_graph=True,
+                analysis_workers=workers,
+                export_directory=str(tmp_path / "out"),
+            )
+            result = builder.build()
+            outputs.append(result.combined_text.split("\n", 3)[3])  # skip timestamped header
+            assert result.call_graphs
+        assert outputs[0] == outputs[1]
+
+
+# ---------------------------------------------------------------------------
+# Identical-file deduplication
+# ---------------------------------------------------------------------------
+
+class TestDedupIdenticalFiles:
+    BODY = "def shared(x):\n    # double it\n    return x * 2\n"
+
+    @pytest.fixture()
+    def dup_project(self, tmp_path) -> Path:
+        root = tmp_path / "proj"
+        (root / "a").mkdir(parents=True)
+        (root / "b").mkdir()
+        (root / "a" / "util.py").write_text(self.BODY, encoding="utf-8")
+        (root / "b" / "util.py").write_text(self.BODY, encoding="utf-8")
+        # Differs only in a comment: identical once cleaned, distinct in "original"
+        (root / "c.py").write_text(self.BODY.replace("double", "twice"), encoding="utf-8")
+        return root
+
+    def _build(self, root: Path, mode: str, **kwargs):
+        return CodeContextBuilder(project_root=root, output_mode=mode, **kwargs).build()
+
+    @staticmethod
+    def _first(result, candidates: list[Path]) -> Path:
+        return min(candidates, key=result.files.index)
+
+    def test_clean_emits_body_once(self, dup_project):
+        result = self._build(dup_project, "clean")
+        first = self._first(result, result.files)
+        assert result.combined_text.count("return x * 2") == 1
+        assert result.combined_text.count(f"(identical to {first.relative_to(dup_project).as_posix()})") == 2
+        assert result.stats["dedup"]["duplicate_files"] == 2
+        assert result.stats["dedup"]["saved_chars"] > 0
+
+    def test_original_keeps_comment_variant(self, dup_project):
+        result = self._build(dup_project, "original")
+        utils = [dup_project / "a" / "util.py", dup_project / "b" / "util.py"]
+        first = self._first(result, utils)
+        second = next(f for f in utils if f != first)
+        assert result.combined_text.count("return x * 2") == 2
+        assert result.file_nodes[second].duplicate_of == first
+        assert result.file_nodes[first].duplicate_of is None
+        assert result.file_nodes[dup_project / "c.py"].duplicate_of is None
+
+    def test_signatures_reference(self, dup_project):
+        skeleton = "".join(
+            f"def shared_{i}(value: int, factor: int = 2) -> int:\n    return value * factor\n\n" for i in range(4)
+        )
+        for f in (dup_project / "a" / "util.py", dup_project / "b" / "util.py", dup_project / "c.py"):
+            f.write_text(skeleton, encoding="utf-8")
+        result = self._build(dup_project, "signatures")
+        first = self._first(result, result.files)
+        assert result.combined_text.count("def shared_0(") == 1
+        assert result.combined_text.count(f"# identical to {first.relative_to(dup_project).as_posix()}") == 2
+
+    def test_files_json(self, dup_project):
+        result = self._build(dup_project, "original")
+        first = self._first(result, [dup_project / "a" / "util.py", dup_project / "b" / "util.py"])
+        second_dir = "b" if first.parent.name == "a" else "a"
+        data = result.to_files_json(root=dup_project)
+        assert data[second_dir]["util.py"] == {"duplicate_of": f"{first.parent.name}/util.py"}
+        assert "util.py" not in data[first.parent.name]
+        assert data["_dedup"]["duplicate_files"] == 1
+
+    def test_disabled(self, dup_project):
+        result = self._build(dup_project, "clean", overrides={"dedupe_identical_files": False})
+        assert result.combined_text.count("return x * 2") == 3
+        assert "dedup" not in result.stats
+
+    def test_tiny_duplicates_are_emitted_in_full(self, tmp_path):
+        root = tmp_path / "proj"
+        for pkg in ("a", "b", "c"):
+            (root / pkg).mkdir(parents=True)
+            (root / pkg / "__init__.py").write_text("x = 1\n", encoding="utf-8")
+        result = self._build(root, "original")
+        assert result.combined_text.count("x = 1") == 3
+        assert "identical to" not in result.combined_text
+        assert "dedup" in result.stats
+        assert result.stats["dedup"] == {"duplicate_files": 0, "saved_chars": 0}
+        assert all(node.duplicate_of is None for node in result.file_nodes.values())
+
+    @pytest.mark.parametrize("mode", ["clean", "signatures"])
+    def test_stream_matches_build(self, dup_project, mode):
+        builder = CodeContextBuilder(project_root=dup_project, output_mode=mode)
+        streamed = "".join(builder.build_stream())
+        built = builder.build().combined_text
+        assert streamed.split("\n", 3)[3] == built.split("\n", 3)[3]
+
+
+# ---------------------------------------------------------------------------
+# Budget mode
+# ---------------------------------------------------------------------------
+
+class TestBudgetMode:
+    @pytest.fixture()
+    def budget_project(self, tmp_path) -> Path:
+        root = tmp_path / "proj"
+        root.mkdir()
+        for name in ("one", "two", "three"):
+            body = "\n".join(f"    total += {i}  # step {i}" for i in range(40))
+            (root / f"{name}.py").write_text(
+                f"def {name}(total: int) -> int:\n{body}\n    return total\n",
+                encoding="utf-8",
+            )
+        return root
+
+    def _build(self, root: Path, budget: int, **kwargs):
+        return CodeContextBuilder(project_root=root, token_budget=budget, **kwargs).build()
+
+    def test_token_budget_switches_mode(self, budget_project):
+        result = self._build(budget_project, 10_000)
+        assert result.output_mode == "budget"
+        assert "[mode: budget" in result.combined_text
+
+    def test_large_budget_gives_original_everywhere(self, budget_project):
+        result = self._build(budget_project, 1_000_000)
+        assert result.stats["budget"]["files_by_mode"]["original"] == 3
+        assert "# step 0" in result.combined_text
+
+    def test_tiny_budget_is_tree_only(self, budget_project):
+        result = self._build(budget_project, 1)
+        assert result.stats["budget"]["files_by_mode"]["tree_only"] == 3
+        assert "def one" not in result.combined_text
+
+    def test_stays_within_budget(self, budget_project):
+        full = self._build(budget_project, 1_000_000).stats["budget"]["estimated_tokens"]
+        budget = full // 2
+        result = self._build(budget_project, budget)
+        assert result.stats["budget"]["estimated_tokens"] <= budget
+        assert result.stats["budget"]["target_tokens"] == budget
+
+    def test_signatures_before_full_content(self, budget_project):
+        sigs_only = CodeContextBuilder(project_root=budget_project, output_mode="signatures").build()
+        budget = len(sigs_only.combined_text) // 4 + 150
+        modes = self._build(budget_project, budget).stats["budget"]["files_by_mode"]
+        assert modes["signatures"] + modes["clean"] + modes["original"] == 3
+        assert modes["tree_only"] == 0
+
+    def test_pins_take_priority(self, budget_project):
+        sigs_only = CodeContextBuilder(project_root=budget_project, output_mode="signatures").build()
+        budget = len(sigs_only.combined_text) // 4 + 300
+        result = self._build(budget_project, budget, budget_pins=["two.py"])
+        assert result.file_nodes[budget_project / "two.py"].output_mode in ("clean", "original")
+
+    def test_duplicates_cost_only_their_reference(self, tmp_path):
+        root = tmp_path / "dups"
+        root.mkdir()
+        body = "def double(x):\n    return x * 2\n" * 3
+        for i in range(40):
+            (root / f"m{i:02d}.py").write_text(body, encoding="utf-8")
+        deduped = self._build(root, 1000)
+        plain = self._build(root, 1000, overrides={"dedupe_identical_files": False})
+        assert deduped.stats["budget"]["files_by_mode"]["original"] == 40
+        assert plain.stats["budget"]["files_by_mode"]["original"] < 40
+        assert deduped.stats["budget"]["estimated_tokens"] <= 1000
+        assert deduped.combined_text.count("return x * 2") == 3
+
+    def test_custom_token_counter(self, budget_project):
+        result = self._build(budget_project, 1_000_000, token_counter=lambda text: len(text.split()))
+        assert result.stats["budget"]["estimated_tokens"] == len(result.combined_text.split())
+
+    def test_budget_mode_requires_budget(self, budget_project):
+        with pytest.raises(ValueError):
+            CodeContextBuilder(project_root=budget_project, output_mode="budget").build()
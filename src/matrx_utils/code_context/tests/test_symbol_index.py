@@ -0,0 +1,197 @@
+"""
+Tests for SymbolIndex and index-backed CodeContextBuilder builds.
+
+Covers:
+- Definitions, references, callers, importers and exports queries
+- __all__ controls exports; private names are hidden otherwise
+- Incremental update: unchanged files are skipped, edited files re-indexed
+- prune() drops deleted files
+- call_graph() honours FunctionCallAnalyzer options and matches analyze_file()
+- Builder output with symbol_index matches a build without it
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from matrx_utils.code_context.code_context import (
+    CodeContextBuilder,
+    FunctionCallAnalyzer,
+    SignatureExtractor,
+    SymbolIndex,
+)
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+@pytest.fixture()
+def project(tmp_path) -> Path:
+    root = tmp_path / "proj"
+    (root / "pkg").mkdir(parents=True)
+    (root / "pkg" / "models.py").write_text(
+        '__all__ = ["User"]\n\n'
+        "class User:\n"
+        "    def save(self):\n"
+        "        self._validate()\n"
+        "        return helper(self)\n\n"
+        "    def _validate(self):\n"
+        "        pass\n\n"
+        "def helper(obj):\n"
+        "    return obj\n",
+        encoding="utf-8",
+    )
+    (root / "app.py").write_text(
+        "from pkg.models import User\n"
+        "import os\n\n"
+        "LIMIT = 10\n\n"
+        "async def main():\n"
+        "    user = User()\n"
+        "    user.save()\n"
+        "    return os.getcwd()\n\n"
+        "def _private():\n"
+        "    pass\n",
+        encoding="utf-8",
+    )
+    (root / "web.ts").write_text("export function render(x: number): string { return ''; }\n", encoding="utf-8")
+    return root
+
+
+def _files(root: Path) -> list[Path]:
+    return sorted(p for p in root.rglob("*") if p.is_file())
+
+
+def _age(path: Path, seconds: int = 60) -> None:
+    """Push mtime into the past so it falls outside the racy-timestamp window."""
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - seconds * 1_000_000_000))
+
+
+@pytest.fixture()
+def index(project, tmp_path):
+    for f in _files(project):
+        _age(f)
+    idx = SymbolIndex(tmp_path / "symbols.db", project)
+    idx.update(_files(project))
+    yield idx
+    idx.close()
+
+
+# ---------------------------------------------------------------------------
+# Queries
+# ---------------------------------------------------------------------------
+
+class TestQueries:
+    def test_definitions(self, index, project):
+        hits = index.definitions("save")
+        assert [(h.kind, h.file_path.name, h.detail) for h in hits] == [("method", "models.py", "User.save")]
+        assert index.definitions("User.save")[0].line == 4
+
+    def test_definition_kinds(self, index):
+        assert index.definitions("main")[0].kind == "async function"
+        assert index.definitions("User")[0].kind == "class"
+        assert index.definitions("LIMIT")[0].kind == "variable"
+
+    def test_callers(self, index):
+        callers = index.callers("helper")
+        assert [(c.file_path.name, c.detail) for c in callers] == [("models.py", "pkg.models.save")]
+        assert {c.detail for c in index.callers("save")} == {"app.main"}
+
+    def test_references(self, index):
+        assert {r.file_path.name for r in index.references("User")} == {"app.py"}
+
+    def test_importers(self, index):
+        hits = index.importers("pkg.models")
+        assert [(h.name, h.file_path.name) for h in hits] == [("User", "app.py")]
+        assert [h.file_path.name for h in index.importers("os")] == ["app.py"]
+
+    def test_exports_respect_all(self, index):
+        assert [e.name for e in index.exports("pkg.models")] == ["User"]
+
+    def test_exports_without_all_hide_private(self, index):
+        assert [e.name for e in index.exports("app")] == ["LIMIT", "main"]
+
+    def test_signature_block_matches_extractor(self, index, project):
+        for f in _files(project):
+            assert index.signature_block(f) == SignatureExtractor().extract(f)
+
+
+# ---------------------------------------------------------------------------
+# Incremental updates
+# ---------------------------------------------------------------------------
+
+class TestIncremental:
+    def test_unchanged_files_skipped(self, index, project):
+        assert index.update(_files(project)) == 0
+
+    def test_edit_reindexes_only_that_file(self, index, project):
+        app = project / "app.py"
+        app.write_text("def renamed():\n    helper(1)\n", encoding="utf-8")
+        _age(app, 30)
+        assert index.update(_files(project)) == 1
+        assert index.definitions("main") == []
+        assert [c.detail for c in index.callers("helper")] == ["app.renamed", "pkg.models.save"]
+
+    def test_touch_without_change_is_not_reindexed(self, index, project):
+        _age(project / "app.py", 10)
+        assert index.update(_files(project)) == 0
+
+    def test_prune(self, index, project):
+        (project / "app.py").unlink()
+        assert index.prune() == 1
+        assert index.definitions("main") == []
+
+    def test_reopen_persists(self, index, project, tmp_path):
+        index.close()
+        with SymbolIndex(tmp_path / "symbols.db", project) as reopened:
+            assert reopened.update(_files(project)) == 0
+            assert reopened.definitions("helper")
+
+    def test_root_change_invalidates(self, index, project, tmp_path):
+        index.close()
+        with SymbolIndex(tmp_path / "symbols.db", project / "pkg") as other:
+            assert other.stats["files"] == 0
+
+
+# ---------------------------------------------------------------------------
+# Call graphs and builder integration
+# ---------------------------------------------------------------------------
+
+class TestCallGraphFromIndex:
+    @pytest.mark.parametrize("options", [
+        {},
+        {"ignore": ["helper"]},
+        {"include_method_calls": False},
+        {"include_private_methods": True},
+    ])
+    def test_matches_analyzer(self, index, project, options):
+        analyzer = FunctionCallAnalyzer(**options)
+        for f in [project / "app.py", project / "pkg" / "models.py"]:
+            assert index.call_graph(f, analyzer) == analyzer.analyze_file(f, project)
+
+    def test_syntax_error_recorded(self, project, tmp_path):
+        bad = project / "bad.py"
+        bad.write_text("def oops(:\n", encoding="utf-8")
+        with SymbolIndex(tmp_path / "s.db", project) as idx:
+            idx.update([bad])
+            assert "SyntaxError" in idx.call_graph(bad).error
+            assert "SyntaxError" in idx.signature_block(bad).note
+
+
+class TestBuilderWithIndex:
+    @pytest.mark.parametrize("mode", ["signatures", "clean"])
+    def test_output_matches_plain_build(self, project, tmp_path, mode):
+        kwargs = dict(project_root=project, output_mode=mode, call_graph=True, export_directory=str(tmp_path / "out"))
+        plain = CodeContextBuilder(**kwargs).build()
+        indexed = CodeContextBuilder(symbol_index=tmp_path / "s.db", **kwargs).build()
+        assert indexed.combined_text == plain.combined_text
+        assert indexed.stats["symbol_index"]["reindexed"] > 0
+
+        again = CodeContextBuilder(symbol_index=tmp_path / "s.db", **kwargs).build()
+        assert again.combined_text == plain.combined_text
+        assert again.stats["symbol_index"]["reindexed"] == 0
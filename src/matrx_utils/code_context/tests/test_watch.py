@@ -0,0 +1,131 @@
+"""
+Tests for CodeContextBuilder.watch() — the live, incrementally refreshed index.
+
+Covers:
+- First result matches build()
+- Edits re-process only the edited file; output matches a fresh build()
+- Added / removed files update the file set and tree
+- Changes in excluded directories are ignored
+- Both backends: inotify (Linux) and mtime polling
+- stop_event ends the loop
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from matrx_utils.code_context.code_context import CodeContextBuilder
+
+BACKENDS = ["poll"] + (["inotify"] if sys.platform.startswith("linux") else [])
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+@pytest.fixture()
+def project(tmp_path) -> Path:
+    root = tmp_path / "proj"
+    (root / "pkg").mkdir(parents=True)
+    (root / "node_modules").mkdir()
+    (root / "alpha.py").write_text("def alpha(x):\n    return beta(x)\n", encoding="utf-8")
+    (root / "pkg" / "beta.py").write_text("def beta(y):\n    return y\n", encoding="utf-8")
+    return root
+
+
+def _builder(root: Path, mode: str = "signatures", **kwargs) -> CodeContextBuilder:
+    return CodeContextBuilder(
+        project_root=root,
+        output_mode=mode,
+        overrides={"exclude_directories": {"add": ["node_modules"]}},
+        export_directory=str(root.parent / "out"),
+        **kwargs,
+    )
+
+
+def _next(gen, timeout: float = 10.0):
+    """next(gen) with a timeout, so a missed event fails the test instead of hanging it."""
+    box: list = []
+    worker = threading.Thread(target=lambda: box.append(next(gen)), daemon=True)
+    worker.start()
+    worker.join(timeout)
+    assert box, "watch() produced no result in time"
+    return box[0]
+
+
+# ---------------------------------------------------------------------------
+# Refresh behaviour
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("backend", BACKENDS)
+class TestWatch:
+    def test_initial_result_matches_build(self, project, backend):
+        gen = _builder(project).watch(interval=0.05, backend=backend)
+        first = _next(gen)
+        gen.close()
+        assert first.combined_text == _builder(project).build().combined_text
+
+    def test_edit_refreshes_only_that_file(self, project, backend):
+        builder = _builder(project, call_graph=True)
+        gen = builder.watch(interval=0.05, backend=backend)
+        _next(gen)
+        (project / "alpha.py").write_text("def alpha(x, y):\n    return gamma(x)\n", encoding="utf-8")
+        result = _next(gen)
+        gen.close()
+        assert result.stats["refresh"]["changed_files"] == 1
+        assert "def alpha(x, y)" in result.combined_text
+        assert result.combined_text == _builder(project, call_graph=True).build().combined_text
+
+    def test_added_and_removed_files(self, project, backend):
+        gen = _builder(project, mode="clean").watch(interval=0.05, backend=backend)
+        _next(gen)
+        (project / "pkg" / "gamma.py").write_text("GAMMA = 3\n", encoding="utf-8")
+        added = _next(gen)
+        assert project / "pkg" / "gamma.py" in added.files
+        assert "gamma.py" in added.combined_text
+
+        (project / "alpha.py").unlink()
+        removed = _next(gen)
+        gen.close()
+        assert project / "alpha.py" not in removed.files
+        assert removed.combined_text == _builder(project, mode="clean").build().combined_text
+
+    def test_excluded_directory_ignored(self, project, backend):
+        gen = _builder(project).watch(interval=0.05, backend=backend)
+        _next(gen)
+        (project / "node_modules" / "noise.py").write_text("x = 1\n", encoding="utf-8")
+        (project / "alpha.py").write_text("def alpha():\n    pass\n", encoding="utf-8")
+        result = _next(gen)
+        gen.close()
+        assert result.stats["refresh"]["changed_files"] == 1
+        assert all("node_modules" not in str(f) for f in result.files)
+
+    def test_stop_event(self, project, backend):
+        stop = threading.Event()
+        gen = _builder(project).watch(interval=0.05, backend=backend, stop_event=stop)
+        _next(gen)
+        stop.set()
+        with pytest.raises(StopIteration):
+            _next_or_stop(gen)
+
+
+def _next_or_stop(gen, timeout: float = 10.0):
+    box: list = []
+
+    def _run() -> None:
+        try:
+            box.append(next(gen))
+        except StopIteration as exc:
+            box.append(exc)
+
+    worker = threading.Thread(target=_run, daemon=True)
+    worker.start()
+    worker.join(timeout)
+    assert box, "watch() did not stop in time"
+    if isinstance(box[0], StopIteration):
+        raise box[0]
+    return box[0]
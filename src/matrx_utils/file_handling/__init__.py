@@ -20,6 +20,9 @@ from .backends import (
     SupabaseBackend,
     ServerBackend,
     BackendRouter,
+    BatchResult,
+    FileEntry,
+    ReadCache,
     is_cloud_uri,
     parse_uri,
     parse_storage_url,
@@ -71,6 +74,9 @@ __all__ = [
     'SupabaseBackend',
     'ServerBackend',
     'BackendRouter',
+    'BatchResult',
+    'FileEntry',
+    'ReadCache',
     'is_cloud_uri',
     'parse_uri',
     # URL parsing utilities
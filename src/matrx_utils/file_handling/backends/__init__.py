@@ -1,7 +1,16 @@
 from .base_backend import StorageBackend
+from .batch import DEFAULT_BATCH_CONCURRENCY, BatchResult
+from .content_store import ContentStore
+from .executors import BoundedExecutor, ExecutorStats, configure_executors, cpu_executor, io_executor
+from .streaming import DEFAULT_BLOCK_SIZE, DEFAULT_CHUNK_SIZE, ChunkReader, RangeReader, iter_chunks, aiter_chunks
 from .s3_backend import S3Backend
 from .supabase_backend import SupabaseBackend
 from .server_backend import ServerBackend
+from .listing import FileEntry
+from .read_cache import CacheStats, ReadCache
+from .retry import CircuitOpenError, Retrier, RetryPolicy, StorageHTTPError, is_retryable
+from .segmented import SegmentedObject
+from .url_cache import SignedUrlCache
 from .router import BackendRouter, is_cloud_uri, parse_uri
 from .url_parser import parse_storage_url, is_storage_url, ParsedStorageUrl
 from .llm_helpers import (
@@ -15,10 +24,34 @@ from .llm_helpers import (
 
 __all__ = [
     "StorageBackend",
+    "DEFAULT_CHUNK_SIZE",
+    "DEFAULT_BLOCK_SIZE",
+    "ChunkReader",
+    "RangeReader",
+    "iter_chunks",
+    "aiter_chunks",
     "S3Backend",
     "SupabaseBackend",
     "ServerBackend",
     "BackendRouter",
+    "BatchResult",
+    "DEFAULT_BATCH_CONCURRENCY",
+    "BoundedExecutor",
+    "ExecutorStats",
+    "configure_executors",
+    "io_executor",
+    "cpu_executor",
+    "ReadCache",
+    "CacheStats",
+    "FileEntry",
+    "SegmentedObject",
+    "ContentStore",
+    "RetryPolicy",
+    "Retrier",
+    "CircuitOpenError",
+    "StorageHTTPError",
+    "is_retryable",
+    "SignedUrlCache",
     "is_cloud_uri",
     "parse_uri",
     "parse_storage_url",
@@ -1,4 +1,15 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Iterator
+
+from .listing import DEFAULT_PAGE_SIZE, FileEntry
+from .streaming import (
+    DEFAULT_CHUNK_SIZE,
+    AsyncByteSource,
+    ByteSource,
+    aiter_chunks,
+    check_range,
+    iter_chunks,
+)
 
 
 class StorageBackend(ABC):
@@ -10,12 +21,27 @@ class StorageBackend(ABC):
     other async context to avoid blocking the event loop.
 
     S3Backend async methods run the synchronous boto3 calls in a thread-pool
-    executor (run_in_executor) — genuinely non-blocking to the event loop,
-    the standard pattern for boto3 in async applications.
+    executor — genuinely non-blocking to the event loop, the standard
+    pattern for boto3 in async applications. The pool is the dedicated
+    storage I/O executor (executors.py), not the loop's default one.
 
     SupabaseBackend async methods use supabase-py's native AsyncClient.
 
     ServerBackend async methods use httpx.AsyncClient.
+
+    The streaming methods (read_stream / write_stream and their async
+    versions) move data in chunks instead of whole ``bytes`` objects. The
+    defaults below fall back to read()/write(). All built-in backends
+    override them to stream over the wire.
+
+    read_range() fetches a half-open byte range ``[start, end)`` (like a
+    slice). Backends implement the ``_read_range`` hook, which also returns
+    the total object size when the response reports it; RangeReader uses
+    that size for seeks relative to the end.
+
+    ``_read_if_changed`` is a conditional GET used by the router's
+    ReadCache. Backends that can report an ETag override it; the default
+    never validates, so those objects are simply not cached.
     """
 
     # ------------------------------------------------------------------
@@ -78,6 +104,157 @@ class StorageBackend(ABC):
     async def list_files_async(self, prefix: str = "") -> list[str]:
         """Async version of list_files()."""
 
+    # ------------------------------------------------------------------
+    # Streaming API
+    # ------------------------------------------------------------------
+
+    def read_stream(self, path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+        """Yield the object at *path* in chunks of at most *chunk_size* bytes."""
+        yield from iter_chunks(self.read(path), chunk_size)
+
+    def write_stream(self, path: str, source: ByteSource, **kwargs) -> bool:
+        """Write a byte source (buffer, file-like object or chunk iterable) to *path*."""
+        return self.write(path, b"".join(iter_chunks(source)), **kwargs)
+
+    async def read_stream_async(self, path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncIterator[bytes]:
+        """Async version of read_stream()."""
+        for chunk in iter_chunks(await self.read_async(path), chunk_size):
+            yield chunk
+
+    async def write_stream_async(self, path: str, source: AsyncByteSource, **kwargs) -> bool:
+        """Async version of write_stream(); also accepts async iterables."""
+        chunks = [chunk async for chunk in aiter_chunks(source)]
+        return await self.write_async(path, b"".join(chunks), **kwargs)
+
+    # ------------------------------------------------------------------
+    # Ranged reads
+    # ------------------------------------------------------------------
+
+    def read_range(self, path: str, start: int, end: int | None = None) -> bytes:
+        """Return bytes ``[start, end)`` of the object at *path* (``end=None`` = to the end).
+
+        A range past the end of the object is truncated, like a slice.
+        """
+        check_range(start, end)
+        if start == end:
+            return b""
+        return self._read_range(path, start, end)[0]
+
+    async def read_range_async(self, path: str, start: int, end: int | None = None) -> bytes:
+        """Async version of read_range()."""
+        check_range(start, end)
+        if start == end:
+            return b""
+        return (await self._read_range_async(path, start, end))[0]
+
+    def _read_range(self, path: str, start: int, end: int | None) -> tuple[bytes, int | None]:
+        """Return ``(data, total_size)``; the default reads the whole object and slices it."""
+        data = self.read(path)
+        return data[start:end], len(data)
+
+    async def _read_range_async(self, path: str, start: int, end: int | None) -> tuple[bytes, int | None]:
+        """Async version of _read_range()."""
+        data = await self.read_async(path)
+        return data[start:end], len(data)
+
+    # ------------------------------------------------------------------
+    # Listing
+    # ------------------------------------------------------------------
+
+    def iter_files(
+        self,
+        prefix: str = "",
+        recursive: bool = True,
+        with_metadata: bool = False,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> Iterator[FileEntry]:
+        """Yield a FileEntry for every object under *prefix*, fetching one page at a time.
+
+        ``recursive=False`` lists one level and yields sub-folders as
+        ``is_dir`` entries. ``with_metadata=True`` fills size / ETag /
+        modified time from the listing itself. The default wraps
+        list_files(); the built-in backends override it to page lazily.
+        """
+        for path in self.list_files(prefix):
+            yield FileEntry(path)
+
+    async def iter_files_async(
+        self,
+        prefix: str = "",
+        recursive: bool = True,
+        with_metadata: bool = False,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> AsyncIterator[FileEntry]:
+        """Async version of iter_files()."""
+        for path in await self.list_files_async(prefix):
+            yield FileEntry(path)
+
+    # ------------------------------------------------------------------
+    # Bulk operations
+    # ------------------------------------------------------------------
+
+    def delete_many(self, paths: list[str]) -> dict[str, Exception | None]:
+        """Delete *paths*, returning ``{path: error or None}``.
+
+        The default deletes one path at a time. Backends with a bulk delete
+        endpoint override it; BackendRouter.delete_many uses the override and
+        otherwise issues concurrent single deletes.
+        """
+        results: dict[str, Exception | None] = {}
+        for path in paths:
+            try:
+                self.delete(path)
+                results[path] = None
+            except Exception as exc:
+                results[path] = exc
+        return results
+
+    async def delete_many_async(self, paths: list[str]) -> dict[str, Exception | None]:
+        """Async version of delete_many()."""
+        results: dict[str, Exception | None] = {}
+        for path in paths:
+            try:
+                await self.delete_async(path)
+                results[path] = None
+            except Exception as exc:
+                results[path] = exc
+        return results
+
+    @classmethod
+    def has_bulk_delete(cls) -> bool:
+        """True if this backend overrides delete_many() with a native bulk call."""
+        return cls.delete_many is not StorageBackend.delete_many
+
+    def get_urls(self, paths: list[str], expires_in: int = 3600) -> dict[str, str]:
+        """Return ``{path: signed URL}`` for *paths*.
+
+        The default calls get_url() once per path. Backends that can sign
+        many paths in one request (or locally, without a request) override
+        it, and BackendRouter.get_urls uses the override.
+        """
+        return {path: self.get_url(path, expires_in=expires_in) for path in paths}
+
+    async def get_urls_async(self, paths: list[str], expires_in: int = 3600) -> dict[str, str]:
+        """Async version of get_urls()."""
+        return {path: await self.get_url_async(path, expires_in=expires_in) for path in paths}
+
+    @classmethod
+    def has_bulk_urls(cls) -> bool:
+        """True if this backend overrides get_urls() with a bulk or local signer."""
+        return cls.get_urls is not StorageBackend.get_urls
+
+    # ------------------------------------------------------------------
+    # Conditional reads
+    # ------------------------------------------------------------------
+
+    def _read_if_changed(self, path: str, etag: str | None) -> tuple[bytes | None, str | None]:
+        """Return ``(data, etag)``, or ``(None, etag)`` if the object still matches *etag*."""
+        return self.read(path), None
+
+    async def _read_if_changed_async(self, path: str, etag: str | None) -> tuple[bytes | None, str | None]:
+        """Async version of _read_if_changed()."""
+        return await self.read_async(path), None
+
     # ------------------------------------------------------------------
     # Shared helpers
     # ------------------------------------------------------------------
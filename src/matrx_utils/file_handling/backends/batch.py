@@ -0,0 +1,99 @@
+"""Helpers for BackendRouter's batch operations (read_many, write_many, …).
+
+Each batch call returns one BatchResult per input item, in input order.
+A failed item carries its exception instead of aborting the whole batch.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_BATCH_CONCURRENCY: int = 8
+
+
+def group_by_bucket(
+    paths: Iterable[str], parse: Callable[[str], tuple[str, str]]
+) -> tuple[dict[str, list[tuple[str, str]]], dict[str, Exception | None]]:
+    """Split backend paths into ``{bucket: [(path, key), …]}`` for bulk calls.
+
+    Paths that *parse* rejects are returned in the second dict with their
+    error, ready to merge into a ``{path: error}`` result.
+    """
+    groups: dict[str, list[tuple[str, str]]] = {}
+    rejected: dict[str, Exception | None] = {}
+    for path in paths:
+        try:
+            bucket, key = parse(path)
+        except ValueError as exc:
+            rejected[path] = exc
+            continue
+        groups.setdefault(bucket, []).append((path, key))
+    return groups, rejected
+
+
+def chunked(items: list[T], size: int) -> Iterable[list[T]]:
+    for offset in range(0, len(items), size):
+        yield items[offset : offset + size]
+
+
+@dataclass
+class BatchResult(Generic[T]):
+    """Outcome of one item in a batch call.
+
+    ``item`` is the input (a URI, or a ``(src, dst)`` pair for copies);
+    ``value`` is what the single-item call returned (bytes for reads,
+    True for writes / deletes / copies) and ``error`` is set instead when
+    the item failed.
+    """
+
+    item: Any
+    value: T | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def unwrap(self) -> T:
+        """Return ``value``, or raise the item's error."""
+        if self.error is not None:
+            raise self.error
+        return self.value  # type: ignore[return-value]
+
+
+def run_bounded(fn: Callable[[Any], T], items: Iterable[Any], max_concurrency: int) -> list[BatchResult[T]]:
+    """Call ``fn(item)`` for every item on at most *max_concurrency* threads."""
+    items = list(items)
+
+    def _one(item: Any) -> BatchResult[T]:
+        try:
+            return BatchResult(item, fn(item))
+        except Exception as exc:
+            return BatchResult(item, error=exc)
+
+    if max_concurrency <= 1 or len(items) <= 1:
+        return [_one(item) for item in items]
+    with ThreadPoolExecutor(min(max_concurrency, len(items)), thread_name_prefix="storage-batch") as pool:
+        return list(pool.map(_one, items))
+
+
+async def arun_bounded(
+    fn: Callable[[Any], Awaitable[T]], items: Iterable[Any], max_concurrency: int
+) -> list[BatchResult[T]]:
+    """Async version of run_bounded(): at most *max_concurrency* calls in flight."""
+    semaphore = asyncio.Semaphore(max(max_concurrency, 1))
+
+    async def _one(item: Any) -> BatchResult[T]:
+        async with semaphore:
+            try:
+                return BatchResult(item, await fn(item))
+            except Exception as exc:
+                return BatchResult(item, error=exc)
+
+    return list(await asyncio.gather(*(_one(item) for item in items)))
@@ -0,0 +1,379 @@
+"""Content-addressed, deduplicated writes on top of BackendRouter.
+
+Generated images and documents are often written again and again under
+new paths. ContentStore hashes each payload (SHA-256, streamed into a
+spool file for non-buffer sources) and keeps the bytes once, as a blob
+under ``<root>/blobs/``. When a blob with that hash already exists, the
+upload is skipped entirely.
+
+    store = router.content_store("s3://media/.cas")
+    store.write("s3://media/users/7/avatar.png", png)     # uploads once
+    store.write("s3://media/users/8/avatar.png", png)     # no upload
+
+The logical path is recorded in one of two modes:
+
+    "copy"     (default) — a server-side copy of the blob is made at the
+               logical path. Plain reads, get_url() and public URLs keep
+               working. Upload bandwidth is saved. Storage is saved only
+               once gc() reclaims blobs whose paths are all gone.
+    "pointer"  — the logical path holds a small JSON pointer to the blob,
+               and the bytes are stored once. Read it through
+               store.read() / store.get_url(), which dereference the
+               pointer. A plain read returns the pointer itself.
+
+A copy that cannot stay server-side (the root is on another backend,
+or in another Supabase bucket) uploads the payload to the logical path
+directly. Keep the root next to the data to get the savings.
+
+Each logical path holds a reference to its blob: a tiny object at
+``<root>/refs/<hash>/<path id>``, plus an index entry at
+``<root>/paths/<path id>``. The index lets an overwrite or delete() drop
+the old reference. The reference is written before the blob is checked
+or uploaded, and a write that reuses a blob refreshes its modified time
+with a server-side self-copy. gc() deletes only blobs that have no
+references and are older than *grace* seconds, and checks both again
+just before deleting each blob, so a write in flight keeps its blob.
+Blobs whose age the backend's listing does not report are never
+collected.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from collections.abc import AsyncIterable, AsyncIterator, Iterator
+from datetime import datetime, timedelta, timezone
+from typing import IO, TYPE_CHECKING, Any, Union
+
+from .executors import io_executor
+from .retry import is_not_found
+from .streaming import DEFAULT_CHUNK_SIZE, AsyncByteSource, ByteSource, iter_chunks
+
+if TYPE_CHECKING:
+    from .router import BackendRouter
+
+logger = logging.getLogger(__name__)
+
+MODES: tuple[str, ...] = ("copy", "pointer")
+DEFAULT_GC_GRACE: float = 24 * 3600
+
+_SPOOL_MEMORY: int = 8 * 1024 * 1024
+_POINTER_MAX: int = 1024
+_POINTER_KEY: str = "matrx_cas"
+
+Payload = Union[bytes, IO[bytes], os.PathLike]
+
+
+def _path_id(uri: str) -> str:
+    return hashlib.sha256(uri.encode()).hexdigest()[:32]
+
+
+def _pointer(digest: str, size: int, uri: str) -> bytes:
+    return json.dumps({_POINTER_KEY: 1, "sha256": digest, "size": size, "uri": uri}).encode()
+
+
+def _parse_pointer(data: bytes) -> dict[str, Any] | None:
+    if len(data) > _POINTER_MAX or not data.startswith(b'{"' + _POINTER_KEY.encode()):
+        return None
+    try:
+        pointer = json.loads(data)
+    except ValueError:
+        return None
+    return pointer if isinstance(pointer, dict) and isinstance(pointer.get("sha256"), str) else None
+
+
+def _hash(content: ByteSource) -> tuple[str, int, Payload]:
+    """SHA-256 and size of *content*, plus a replayable payload to upload it from.
+
+    Buffers are hashed in place and local paths are hashed from disk.
+    Streams and iterables are spooled (memory up to 8 MB, then a temp file).
+    """
+    digest = hashlib.sha256()
+    if isinstance(content, (bytes, bytearray, memoryview, str)):
+        raw = content.encode() if isinstance(content, str) else bytes(content)
+        digest.update(raw)
+        return digest.hexdigest(), len(raw), raw
+    if isinstance(content, os.PathLike):
+        size = 0
+        for chunk in iter_chunks(content, DEFAULT_CHUNK_SIZE):
+            digest.update(chunk)
+            size += len(chunk)
+        return digest.hexdigest(), size, content
+    spool = tempfile.SpooledTemporaryFile(_SPOOL_MEMORY)
+    size = 0
+    for chunk in iter_chunks(content, DEFAULT_CHUNK_SIZE):
+        digest.update(chunk)
+        spool.write(chunk)
+        size += len(chunk)
+    spool.seek(0)
+    return digest.hexdigest(), size, spool  # type: ignore[return-value]
+
+
+@contextlib.contextmanager
+def _hashed(content: ByteSource) -> Iterator[tuple[str, int, Payload]]:
+    digest, size, payload = _hash(content)
+    try:
+        yield digest, size, payload
+    finally:
+        if payload is not content and hasattr(payload, "close"):
+            payload.close()  # type: ignore[union-attr]
+
+
+@contextlib.asynccontextmanager
+async def _ahashed(content: AsyncByteSource) -> AsyncIterator[tuple[str, int, Payload]]:
+    if isinstance(content, AsyncIterable):
+        digest = hashlib.sha256()
+        spool = tempfile.SpooledTemporaryFile(_SPOOL_MEMORY)
+        size = 0
+        async for chunk in content:
+            digest.update(chunk)
+            await io_executor().run(spool.write, chunk)
+            size += len(chunk)
+        spool.seek(0)
+        hashed: tuple[str, int, Payload] = (digest.hexdigest(), size, spool)  # type: ignore[assignment]
+    else:
+        hashed = await io_executor().run(_hash, content)
+    try:
+        yield hashed
+    finally:
+        if hashed[2] is not content and hasattr(hashed[2], "close"):
+            hashed[2].close()  # type: ignore[union-attr]
+
+
+class ContentStore:
+    """Deduplicated writes under a content-addressed *root* URI (see module docstring).
+
+    ``hits`` counts writes that skipped the upload, ``misses`` writes that
+    uploaded a new blob and ``bytes_skipped`` the upload bandwidth saved.
+    """
+
+    def __init__(self, router: BackendRouter, root: str, mode: str = "copy") -> None:
+        if mode not in MODES:
+            raise ValueError(f"ContentStore mode must be one of {MODES}, got {mode!r}.")
+        self.router = router
+        self.root = root.rstrip("/")
+        self.mode = mode
+        self.hits = 0
+        self.misses = 0
+        self.bytes_skipped = 0
+
+    # ------------------------------------------------------------------
+    # Layout
+    # ------------------------------------------------------------------
+
+    def blob_uri(self, digest: str) -> str:
+        return f"{self.root}/blobs/{digest[:2]}/{digest}"
+
+    def _ref_uri(self, digest: str, uri: str) -> str:
+        return f"{self.root}/refs/{digest}/{_path_id(uri)}"
+
+    def _index_uri(self, uri: str) -> str:
+        return f"{self.root}/paths/{_path_id(uri)}"
+
+    # ------------------------------------------------------------------
+    # Sync API
+    # ------------------------------------------------------------------
+
+    def write(self, uri: str, content: ByteSource) -> str:
+        """Store *content* at *uri*, uploading its bytes only if no blob has them yet.
+
+        Returns the payload's SHA-256 hex digest.
+        """
+        with _hashed(content) as (digest, size, payload):
+            previous = self.lookup(uri)
+            self.router.write(self._ref_uri(digest, uri), uri)
+            blob = self.blob_uri(digest)
+            if self._exists(blob) and self._touch(blob):
+                self.hits += 1
+                self.bytes_skipped += size
+            else:
+                self.misses += 1
+                self.router.write(blob, payload)
+                if hasattr(payload, "seek"):
+                    payload.seek(0)  # type: ignore[union-attr]
+
+            record = _pointer(digest, size, uri)
+            if self.mode == "pointer":
+                self.router.write(uri, record)
+            elif self.router._native_copy(blob, uri) is not None:
+                self.router.copy(blob, uri)
+            else:
+                self.router.write(uri, payload)
+            self.router.write(self._index_uri(uri), record)
+            if previous is not None and previous != digest:
+                self.router.delete(self._ref_uri(previous, uri))
+        return digest
+
+    def read(self, uri: str) -> bytes:
+        """Read *uri*, following a pointer to its blob."""
+        data = self.router.read(uri)
+        pointer = _parse_pointer(data)
+        return data if pointer is None else self.router.read(self.blob_uri(pointer["sha256"]))
+
+    def get_url(self, uri: str, expires_in: int = 3600) -> str:
+        """Signed URL for *uri*; in pointer mode, for the blob it points to."""
+        if self.mode == "pointer":
+            digest = self.lookup(uri)
+            if digest is not None:
+                return self.router.get_url(self.blob_uri(digest), expires_in)
+        return self.router.get_url(uri, expires_in)
+
+    def lookup(self, uri: str) -> str | None:
+        """The digest last written to *uri* through this store, or None."""
+        try:
+            pointer = _parse_pointer(self.router.read(self._index_uri(uri)))
+        except Exception as exc:
+            if is_not_found(exc):
+                return None
+            raise
+        return None if pointer is None else pointer["sha256"]
+
+    def delete(self, uri: str) -> bool:
+        """Delete *uri* and drop its reference; the blob goes at the next gc()."""
+        digest = self.lookup(uri)
+        self.router.delete(uri)
+        if digest is not None:
+            self.router.delete_many([self._ref_uri(digest, uri), self._index_uri(uri)])
+        return True
+
+    def gc(self, grace: float = DEFAULT_GC_GRACE) -> int:
+        """Delete blobs that no path references and that are older than *grace* seconds.
+
+        References and age are checked again right before each delete, so a
+        blob reused by a write since the listing started is kept. Returns
+        the number of blobs deleted.
+        """
+        deleted = 0
+        for entry in self.router.iter_files(f"{self.root}/blobs/", with_metadata=True):
+            if entry.is_dir or not self._expired(entry.last_modified, grace):
+                continue
+            digest = entry.path.rsplit("/", 1)[-1]
+            if self._referenced(digest) or not self._expired(self._last_modified(digest), grace):
+                continue
+            try:
+                deleted += bool(self.router.delete(entry.path))
+            except Exception as exc:
+                logger.warning("Could not delete unreferenced blob %s: %s", entry.path, exc)
+        return deleted
+
+    @staticmethod
+    def _expired(last_modified: datetime | None, grace: float) -> bool:
+        return last_modified is not None and last_modified <= datetime.now(timezone.utc) - timedelta(seconds=grace)
+
+    def _referenced(self, digest: str) -> bool:
+        return next(iter(self.router.iter_files(f"{self.root}/refs/{digest}/")), None) is not None
+
+    def _last_modified(self, digest: str) -> datetime | None:
+        """The blob's current modified time, listed afresh; None if it is gone."""
+        for entry in self.router.iter_files(f"{self.root}/blobs/{digest[:2]}/", with_metadata=True):
+            if entry.path.rsplit("/", 1)[-1] == digest:
+                return entry.last_modified
+        return None
+
+    def _touch(self, blob: str) -> bool:
+        """Refresh *blob*'s modified time with a server-side self-copy, so gc() sees it as new.
+
+        Returns False if the blob has vanished (upload it again). A backend
+        that cannot copy an object onto itself leaves the time unchanged.
+        """
+        if self.router._native_copy(blob, blob) is None:
+            return True
+        try:
+            self.router.copy(blob, blob)
+        except Exception as exc:
+            if is_not_found(exc):
+                return False
+            logger.debug("Could not refresh the modified time of %s: %s", blob, exc)
+        return True
+
+    def _exists(self, uri: str) -> bool:
+        try:
+            self.router.read_range(uri, 0, 1)
+        except Exception as exc:
+            if is_not_found(exc):
+                return False
+            raise
+        return True
+
+    # ------------------------------------------------------------------
+    # Async API
+    # ------------------------------------------------------------------
+
+    async def write_async(self, uri: str, content: AsyncByteSource) -> str:
+        """Non-blocking write(); async iterables are spooled while they are hashed."""
+        async with _ahashed(content) as (digest, size, payload):
+            previous = await self.lookup_async(uri)
+            await self.router.write_async(self._ref_uri(digest, uri), uri)
+            blob = self.blob_uri(digest)
+            if await self._exists_async(blob) and await self._touch_async(blob):
+                self.hits += 1
+                self.bytes_skipped += size
+            else:
+                self.misses += 1
+                await self.router.write_async(blob, payload)
+                if hasattr(payload, "seek"):
+                    payload.seek(0)  # type: ignore[union-attr]
+
+            record = _pointer(digest, size, uri)
+            if self.mode == "pointer":
+                await self.router.write_async(uri, record)
+            elif self.router._native_copy(blob, uri) is not None:
+                await self.router.copy_async(blob, uri)
+            else:
+                await self.router.write_async(uri, payload)
+            await self.router.write_async(self._index_uri(uri), record)
+            if previous is not None and previous != digest:
+                await self.router.delete_async(self._ref_uri(previous, uri))
+        return digest
+
+    async def read_async(self, uri: str) -> bytes:
+        data = await self.router.read_async(uri)
+        pointer = _parse_pointer(data)
+        return data if pointer is None else await self.router.read_async(self.blob_uri(pointer["sha256"]))
+
+    async def get_url_async(self, uri: str, expires_in: int = 3600) -> str:
+        if self.mode == "pointer":
+            digest = await self.lookup_async(uri)
+            if digest is not None:
+                return await self.router.get_url_async(self.blob_uri(digest), expires_in)
+        return await self.router.get_url_async(uri, expires_in)
+
+    async def lookup_async(self, uri: str) -> str | None:
+        try:
+            pointer = _parse_pointer(await self.router.read_async(self._index_uri(uri)))
+        except Exception as exc:
+            if is_not_found(exc):
+                return None
+            raise
+        return None if pointer is None else pointer["sha256"]
+
+    async def delete_async(self, uri: str) -> bool:
+        digest = await self.lookup_async(uri)
+        await self.router.delete_async(uri)
+        if digest is not None:
+            await self.router.delete_many_async([self._ref_uri(digest, uri), self._index_uri(uri)])
+        return True
+
+    async def _touch_async(self, blob: str) -> bool:
+        if self.router._native_copy(blob, blob) is None:
+            return True
+        try:
+            await self.router.copy_async(blob, blob)
+        except Exception as exc:
+            if is_not_found(exc):
+                return False
+            logger.debug("Could not refresh the modified time of %s: %s", blob, exc)
+        return True
+
+    async def _exists_async(self, uri: str) -> bool:
+        try:
+            await self.router.read_range_async(uri, 0, 1)
+        except Exception as exc:
+            if is_not_found(exc):
+                return False
+            raise
+        return True
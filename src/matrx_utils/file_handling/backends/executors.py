@@ -0,0 +1,231 @@
+"""Dedicated thread pools for blocking work called from async code.
+
+``loop.run_in_executor(None, ...)`` and ``asyncio.to_thread()`` share the
+loop's default executor. That puts blocking boto3 calls and CPU-bound
+Pillow / OpenCV work in one queue of unbounded length. Under load each
+side starves the other, and the backlog grows until requests time out.
+
+Two pools keep them apart:
+
+    io_executor()   — blocking storage I/O (S3Backend, local file reads in
+                      the streaming helpers and the read cache)
+    cpu_executor()  — media processing (image variants, video frames)
+
+BoundedExecutor.run() applies backpressure. It accepts at most
+``max_pending`` calls (queued plus running) per event loop, and further
+callers wait asynchronously for a slot instead of growing the queue. The
+caller's contextvars (request IDs, tracing spans) are copied into the
+worker thread, as asyncio.to_thread() does. ``stats`` reports queue depth
+and latency:
+
+    from matrx_utils.file_handling.backends import configure_executors, io_executor
+
+    configure_executors(io_workers=64, io_max_pending=512)
+    stats = io_executor().stats
+    stats.queued, stats.peak_queued, stats.avg_queue_seconds, stats.avg_run_seconds
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import os
+import threading
+import time
+import weakref
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_IO_WORKERS: int = 32
+DEFAULT_CPU_WORKERS: int = os.cpu_count() or 4
+
+
+@dataclass
+class ExecutorStats:
+    """Gauges (running, queued, waiting) and counters since creation or reset()."""
+
+    running: int = 0  # calls executing on a worker thread
+    queued: int = 0  # calls accepted and waiting for a free worker
+    waiting: int = 0  # callers held back by backpressure
+    peak_queued: int = 0
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    queue_seconds: float = 0.0  # total time accepted calls waited for a worker
+    max_queue_seconds: float = 0.0
+    run_seconds: float = 0.0
+
+    @property
+    def avg_queue_seconds(self) -> float:
+        started = self.completed + self.running
+        return self.queue_seconds / started if started else 0.0
+
+    @property
+    def avg_run_seconds(self) -> float:
+        return self.run_seconds / self.completed if self.completed else 0.0
+
+    def reset(self) -> None:
+        """Zero the counters; the gauges keep tracking live calls."""
+        self.peak_queued = self.queued
+        self.submitted = self.completed = self.failed = 0
+        self.queue_seconds = self.max_queue_seconds = self.run_seconds = 0.0
+
+
+class BoundedExecutor:
+    """A named ThreadPoolExecutor with async backpressure, contextvars and stats."""
+
+    def __init__(self, name: str, max_workers: int, max_pending: int | None = None) -> None:
+        if max_workers < 1:
+            raise ValueError(f"{name} executor needs at least 1 worker, got {max_workers}.")
+        self.name = name
+        self.max_workers = max_workers
+        self.max_pending = max(max_pending or max_workers * 4, max_workers)
+        self.stats = ExecutorStats()
+        self._lock = threading.Lock()
+        self._pool: ThreadPoolExecutor | None = None
+        self._gates: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    async def run(self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+        """Run ``fn(*args, **kwargs)`` on a worker thread and await the result.
+
+        The slot is held until the call finishes, even if the awaiting
+        task is cancelled, so max_pending bounds the threads' real backlog.
+        """
+        loop = asyncio.get_running_loop()
+        gate = self._gate(loop)
+        if gate.locked():
+            with self._lock:
+                self.stats.waiting += 1
+            try:
+                await gate.acquire()
+            finally:
+                with self._lock:
+                    self.stats.waiting -= 1
+        else:
+            await gate.acquire()
+
+        call = functools.partial(fn, *args, **kwargs)
+        try:
+            future = self._submit(contextvars.copy_context(), call)
+        except BaseException:
+            gate.release()
+            raise
+        future.add_done_callback(lambda _: self._release(loop, gate))
+        return await asyncio.wrap_future(future)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker threads; the next run() starts a fresh pool."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _gate(self, loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+        gate = self._gates.get(loop)
+        if gate is None:
+            gate = self._gates[loop] = asyncio.Semaphore(self.max_pending)
+        return gate
+
+    def _submit(self, ctx: contextvars.Context, call: Callable[[], T]) -> Future[T]:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(self.max_workers, thread_name_prefix=f"matrx-{self.name}")
+            stats = self.stats
+            stats.submitted += 1
+            stats.queued += 1
+            stats.peak_queued = max(stats.peak_queued, stats.queued)
+            future = self._pool.submit(self._call, ctx, call, time.perf_counter())
+        future.add_done_callback(self._unqueue_cancelled)
+        return future
+
+    def _call(self, ctx: contextvars.Context, call: Callable[[], T], queued_at: float) -> T:
+        started = time.perf_counter()
+        with self._lock:
+            stats = self.stats
+            stats.queued -= 1
+            stats.running += 1
+            stats.queue_seconds += started - queued_at
+            stats.max_queue_seconds = max(stats.max_queue_seconds, started - queued_at)
+        failed = False
+        try:
+            return ctx.run(call)
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            with self._lock:
+                stats.running -= 1
+                stats.completed += 1
+                stats.failed += failed
+                stats.run_seconds += time.perf_counter() - started
+
+    def _unqueue_cancelled(self, future: Future[Any]) -> None:
+        if future.cancelled():  # never reached a worker, so _call() did not dequeue it
+            with self._lock:
+                self.stats.queued -= 1
+
+    @staticmethod
+    def _release(loop: asyncio.AbstractEventLoop, gate: asyncio.Semaphore) -> None:
+        try:
+            loop.call_soon_threadsafe(gate.release)
+        except RuntimeError:  # loop already closed; its semaphore goes with it
+            pass
+
+
+_io: BoundedExecutor | None = None
+_cpu: BoundedExecutor | None = None
+_lock = threading.Lock()
+
+
+def io_executor() -> BoundedExecutor:
+    """The shared pool for blocking storage I/O."""
+    global _io
+    with _lock:
+        if _io is None:
+            _io = BoundedExecutor("io", DEFAULT_IO_WORKERS)
+        return _io
+
+
+def cpu_executor() -> BoundedExecutor:
+    """The shared pool for CPU-bound media work."""
+    global _cpu
+    with _lock:
+        if _cpu is None:
+            _cpu = BoundedExecutor("cpu", DEFAULT_CPU_WORKERS)
+        return _cpu
+
+
+def configure_executors(
+    io_workers: int | None = None,
+    io_max_pending: int | None = None,
+    cpu_workers: int | None = None,
+    cpu_max_pending: int | None = None,
+) -> None:
+    """Resize the shared pools; call once at start-up, before serving requests.
+
+    A pool that is replaced is shut down without waiting. Calls already
+    running on it still finish.
+    """
+    global _io, _cpu
+    with _lock:
+        old: list[BoundedExecutor | None] = []
+        if io_workers is not None or io_max_pending is not None:
+            old.append(_io)
+            _io = BoundedExecutor("io", io_workers or DEFAULT_IO_WORKERS, io_max_pending)
+        if cpu_workers is not None or cpu_max_pending is not None:
+            old.append(_cpu)
+            _cpu = BoundedExecutor("cpu", cpu_workers or DEFAULT_CPU_WORKERS, cpu_max_pending)
+    for executor in old:
+        if executor is not None:
+            executor.shutdown(wait=False)
@@ -0,0 +1,78 @@
+"""Long-lived, per-event-loop httpx.AsyncClient pools for the HTTP backends.
+
+An httpx.AsyncClient owns sockets bound to the event loop that opened them.
+Sharing one across loops fails with "Event loop is closed" (or hangs), and
+that happens with asyncio.run() per request, pytest-asyncio, or a
+worker thread running its own loop. Creating a client per call is safe,
+but it pays a TCP + TLS handshake every time and never reuses a connection.
+
+AsyncClientPool keeps one pooled client per running loop, created on first
+use. A loop's client is dropped when the loop is garbage collected or
+found closed. Call aclose() from the loop before shutting it down (e.g. in
+a FastAPI lifespan handler) to close its connections cleanly.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import weakref
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONNECTIONS: int = 20
+DEFAULT_KEEPALIVE_EXPIRY: float = 30.0
+
+
+def http2_available() -> bool:
+    """True if the optional ``h2`` package (httpx[http2]) is installed."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def build_limits(max_connections: int, keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY) -> httpx.Limits:
+    import httpx
+
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
+
+
+class AsyncClientPool:
+    """One httpx.AsyncClient per running event loop, built by *factory*."""
+
+    def __init__(self, factory: Callable[[], httpx.AsyncClient]) -> None:
+        self._factory = factory
+        self._clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def get(self) -> httpx.AsyncClient:
+        """Return the current loop's client, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None or client.is_closed:
+            for stale in [other for other in self._clients if other.is_closed()]:
+                del self._clients[stale]
+            client = self._clients[loop] = self._factory()
+        return client
+
+    async def aclose(self) -> None:
+        """Close the current loop's client (a no-op if it never made one)."""
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    def reset(self) -> None:
+        """Forget every client (after a config change); open ones close when collected."""
+        self._clients.clear()
@@ -0,0 +1,54 @@
+"""Typed entries and shared helpers for the backends' iter_files() listings.
+
+iter_files() is a lazy generator. Each backend fetches one page at a time
+from its list API, so memory stays constant however many objects match.
+With ``with_metadata=True`` an entry carries whatever the list response
+already includes (size, ETag, modified time, content type), and no extra
+HEAD requests are made. Fields a backend does not report stay None.
+
+    for entry in router.iter_files("s3://logs/2024/", with_metadata=True):
+        if entry.size and entry.size > 100 * 1024 * 1024:
+            print(entry.path, entry.size, entry.last_modified)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+DEFAULT_PAGE_SIZE: int = 1000
+
+
+@dataclass(frozen=True)
+class FileEntry:
+    """One listed object, or a folder (``is_dir``) in a non-recursive listing.
+
+    ``path`` is a backend path ("bucket/key") from a backend and a full URI
+    ("s3://bucket/key") from BackendRouter. Folder paths end with "/".
+    """
+
+    path: str
+    size: int | None = None
+    etag: str | None = None
+    last_modified: datetime | None = None
+    content_type: str | None = None
+    is_dir: bool = False
+
+
+def parse_timestamp(value: Any) -> datetime | None:
+    """datetime from a datetime, an ISO-8601 string or epoch seconds; None if unparseable."""
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value, tz=timezone.utc)
+    if isinstance(value, str) and value:
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    return None
+
+
+def clean_etag(value: Any) -> str | None:
+    return value.strip('"') if isinstance(value, str) and value else None
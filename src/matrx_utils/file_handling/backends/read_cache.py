@@ -0,0 +1,339 @@
+"""Read-through cache for BackendRouter.
+
+Two tiers, both LRU and both keyed by canonical native URI
+(``s3://bucket/key``, ``supabase://bucket/path``, ``server://path``):
+
+    memory — small objects, capped at ``memory_bytes`` in total
+    disk   — every cacheable object, capped at ``max_bytes`` in total
+
+Only objects whose backend reports an ETag are cached. A cached object is
+revalidated with a conditional GET (``If-None-Match``). An unchanged
+object answers 304 with no body, so a hit costs one round trip and no
+download. Set ``revalidate_after`` to skip even that for objects validated
+within the last N seconds.
+
+Writes, appends and deletes through the same router invalidate the entry.
+Changes made by other writers are caught by revalidation.
+
+    from matrx_utils.file_handling.backends import BackendRouter, ReadCache
+
+    router = BackendRouter(cache=ReadCache("/var/cache/matrx", max_bytes=2 * 1024**3))
+    router.read("s3://assets/templates/invoice.html")   # miss: downloaded
+    router.read("s3://assets/templates/invoice.html")   # hit: 304, served locally
+    router.cache.stats.hits, router.cache.stats.misses
+
+Each disk entry is two files named by the SHA-256 of the URI: ``.bin``
+holds the bytes and ``.json`` holds the URI and ETag. Both are written
+atomically. The index is rebuilt from the sidecars on start-up, with
+the least recently used entries (by mtime) evicted first.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from .executors import io_executor
+
+# fetch(etag) -> (data, etag), or (None, etag) when the object still matches
+Fetch = Callable[[str | None], tuple[bytes | None, str | None]]
+AsyncFetch = Callable[[str | None], Awaitable[tuple[bytes | None, str | None]]]
+
+_DEFAULT_MAX_BYTES: int = 1024 * 1024 * 1024  # 1 GB on disk
+_DEFAULT_MEMORY_BYTES: int = 64 * 1024 * 1024  # 64 MB in memory
+_DEFAULT_MEMORY_ITEM_BYTES: int = 4 * 1024 * 1024  # larger objects stay on disk only
+
+
+@dataclass
+class CacheStats:
+    """Counters since the cache was created (or since reset())."""
+
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    revalidations: int = 0  # conditional GETs answered "not modified"
+    evictions: int = 0
+    invalidations: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def reset(self) -> None:
+        self.memory_hits = self.disk_hits = self.misses = 0
+        self.revalidations = self.evictions = self.invalidations = 0
+
+
+@dataclass
+class _Entry:
+    etag: str
+    size: int
+    validated_at: float = 0.0  # monotonic; 0 = must revalidate before serving
+
+
+class ReadCache:
+    """Size-capped LRU on local disk with an in-memory hot tier (see module docstring)."""
+
+    def __init__(
+        self,
+        directory: str | os.PathLike,
+        max_bytes: int = _DEFAULT_MAX_BYTES,
+        memory_bytes: int = _DEFAULT_MEMORY_BYTES,
+        memory_item_bytes: int = _DEFAULT_MEMORY_ITEM_BYTES,
+        revalidate_after: float = 0.0,
+    ) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.memory_bytes = memory_bytes
+        self.memory_item_bytes = min(memory_item_bytes, memory_bytes)
+        self.revalidate_after = revalidate_after
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._disk_total = 0
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._memory_total = 0
+        self._epoch = 0  # bumped by invalidate(); see _store()
+        self._load_index()
+
+    # ------------------------------------------------------------------
+    # Read-through API (called by BackendRouter)
+    # ------------------------------------------------------------------
+
+    def read(self, uri: str, fetch: Fetch) -> bytes:
+        """Return the bytes for *uri*, calling *fetch* only to revalidate or download."""
+        data = self._fresh(uri)
+        if data is not None:
+            return data
+        epoch, etag = self._epoch, self._etag(uri)
+        result, new_etag = fetch(etag)
+        if result is None:
+            data = self._not_modified(uri)
+            if data is not None:
+                return data
+            result, new_etag = fetch(None)
+        return self._store(uri, result, new_etag, epoch)  # type: ignore[arg-type]
+
+    async def read_async(self, uri: str, fetch: AsyncFetch) -> bytes:
+        """Async version of read(); disk I/O runs on the storage I/O executor."""
+        data = await io_executor().run(self._fresh, uri)
+        if data is not None:
+            return data
+        epoch, etag = self._epoch, self._etag(uri)
+        result, new_etag = await fetch(etag)
+        if result is None:
+            data = await io_executor().run(self._not_modified, uri)
+            if data is not None:
+                return data
+            result, new_etag = await fetch(None)
+        return await io_executor().run(self._store, uri, result, new_etag, epoch)  # type: ignore[arg-type]
+
+    def invalidate(self, uri: str) -> None:
+        """Drop *uri* from both tiers (no-op if it is not cached)."""
+        with self._lock:
+            self._epoch += 1
+        if self._forget(uri):
+            with self._lock:
+                self.stats.invalidations += 1
+
+    def clear(self) -> None:
+        """Remove every cached object."""
+        with self._lock:
+            uris = list(self._entries)
+            self._entries.clear()
+            self._memory.clear()
+            self._disk_total = self._memory_total = 0
+        for uri in uris:
+            self._unlink(uri)
+
+    def __contains__(self, uri: str) -> bool:
+        return uri in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def disk_bytes(self) -> int:
+        return self._disk_total
+
+    @property
+    def memory_bytes_used(self) -> int:
+        return self._memory_total
+
+    # ------------------------------------------------------------------
+    # Tier logic
+    # ------------------------------------------------------------------
+
+    def _fresh(self, uri: str) -> bytes | None:
+        """Cached bytes if validated within revalidate_after seconds, else None."""
+        with self._lock:
+            entry = self._entries.get(uri)
+            if entry is None or not entry.validated_at:
+                return None
+            if time.monotonic() - entry.validated_at > self.revalidate_after:
+                return None
+        return self._serve(uri)
+
+    def _etag(self, uri: str) -> str | None:
+        with self._lock:
+            entry = self._entries.get(uri)
+            return entry.etag if entry else None
+
+    def _not_modified(self, uri: str) -> bytes | None:
+        """Mark *uri* validated and serve it; None if the entry vanished meanwhile."""
+        with self._lock:
+            entry = self._entries.get(uri)
+            if entry is None:
+                return None
+            entry.validated_at = time.monotonic()
+            self.stats.revalidations += 1
+        return self._serve(uri)
+
+    def _serve(self, uri: str) -> bytes | None:
+        with self._lock:
+            data = self._memory.get(uri)
+            if data is not None:
+                self._memory.move_to_end(uri)
+                self._entries.move_to_end(uri)
+                self.stats.memory_hits += 1
+                return data
+        try:
+            data = self._bin_path(uri).read_bytes()
+            os.utime(self._bin_path(uri))  # LRU order survives a restart
+        except OSError:
+            self._forget(uri)
+            return None
+        with self._lock:
+            if uri not in self._entries:
+                return data
+            self._entries.move_to_end(uri)
+            self.stats.disk_hits += 1
+            self._remember(uri, data)
+        return data
+
+    def _store(self, uri: str, data: bytes, etag: str | None, epoch: int) -> bytes:
+        """Record a fresh download; objects without an ETag or over max_bytes are not cached.
+
+        If anything was invalidated since the download started (*epoch* is
+        stale), it may predate a write through this router, so the entry must
+        revalidate before it is served.
+        """
+        with self._lock:
+            self.stats.misses += 1
+        if not etag or len(data) > self.max_bytes:
+            self._forget(uri)
+            return data
+        self._write_atomic(self._bin_path(uri), data)
+        self._write_atomic(self._meta_path(uri), json.dumps({"uri": uri, "etag": etag}).encode())
+        with self._lock:
+            old = self._entries.pop(uri, None)
+            if old is not None:
+                self._disk_total -= old.size
+            self._drop_memory(uri)
+            validated_at = time.monotonic() if epoch == self._epoch else 0.0
+            self._entries[uri] = _Entry(etag, len(data), validated_at)
+            self._disk_total += len(data)
+            self._remember(uri, data)
+            evicted = self._evict_over_budget()
+        for victim in evicted:
+            self._unlink(victim)
+        return data
+
+    def _forget(self, uri: str) -> bool:
+        """Remove *uri* from both tiers and disk; True if it was cached."""
+        with self._lock:
+            entry = self._entries.pop(uri, None)
+            self._drop_memory(uri)
+            if entry is None:
+                return False
+            self._disk_total -= entry.size
+        self._unlink(uri)
+        return True
+
+    def _evict_over_budget(self) -> list[str]:
+        """Pop least recently used entries until under max_bytes (caller holds the lock)."""
+        evicted: list[str] = []
+        while self._disk_total > self.max_bytes and len(self._entries) > 1:
+            victim, entry = self._entries.popitem(last=False)
+            self._disk_total -= entry.size
+            self._drop_memory(victim)
+            self.stats.evictions += 1
+            evicted.append(victim)
+        return evicted
+
+    def _remember(self, uri: str, data: bytes) -> None:
+        """Put *data* in the memory tier (caller holds the lock)."""
+        if len(data) > self.memory_item_bytes or uri in self._memory:
+            return
+        self._memory[uri] = data
+        self._memory_total += len(data)
+        while self._memory_total > self.memory_bytes:
+            _, dropped = self._memory.popitem(last=False)
+            self._memory_total -= len(dropped)
+
+    def _drop_memory(self, uri: str) -> None:
+        data = self._memory.pop(uri, None)
+        if data is not None:
+            self._memory_total -= len(data)
+
+    # ------------------------------------------------------------------
+    # Disk layout
+    # ------------------------------------------------------------------
+
+    def _stem(self, uri: str) -> Path:
+        return self.directory / hashlib.sha256(uri.encode()).hexdigest()
+
+    def _bin_path(self, uri: str) -> Path:
+        return self._stem(uri).with_suffix(".bin")
+
+    def _meta_path(self, uri: str) -> Path:
+        return self._stem(uri).with_suffix(".json")
+
+    def _write_atomic(self, path: Path, data: bytes) -> None:
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def _unlink(self, uri: str) -> None:
+        self._meta_path(uri).unlink(missing_ok=True)
+        self._bin_path(uri).unlink(missing_ok=True)
+
+    def _load_index(self) -> None:
+        """Rebuild the LRU index from the sidecar files left by a previous process."""
+        found: list[tuple[float, str, _Entry]] = []
+        for meta in self.directory.glob("*.json"):
+            blob = meta.with_suffix(".bin")
+            try:
+                info = json.loads(meta.read_text(encoding="utf-8"))
+                stat = blob.stat()
+            except (OSError, ValueError):
+                meta.unlink(missing_ok=True)
+                blob.unlink(missing_ok=True)
+                continue
+            found.append((stat.st_mtime, info["uri"], _Entry(info["etag"], stat.st_size)))
+        for _, uri, entry in sorted(found, key=lambda item: item[0]):
+            self._entries[uri] = entry
+            self._disk_total += entry.size
+        for victim in self._evict_over_budget():
+            self._unlink(victim)
+        for tmp in self.directory.glob("*.tmp"):
+            tmp.unlink(missing_ok=True)
@@ -0,0 +1,434 @@
+"""Retry policy, retry budgets and circuit breakers for BackendRouter.
+
+Every call the router makes to a backend goes through that backend's
+Retrier. Three mechanisms stop a storage brownout from turning into a
+retry storm:
+
+    Backoff with decorrelated jitter — each delay is drawn between
+        ``base_delay`` and three times the previous delay, capped at
+        ``max_delay``. Threads that failed together do not retry together.
+        ``deadline`` bounds the total time one call spends retrying.
+    Retry budget — a token bucket per backend. Each retry spends one
+        token, and each successful call returns ``budget_refill`` tokens,
+        up to ``budget_capacity``. Once the initial allowance is spent,
+        retries are capped at about 10% of successful traffic.
+    Circuit breaker — after ``breaker_threshold`` consecutive transient
+        failures the backend's circuit opens. Calls then fail at once with
+        CircuitOpenError for ``breaker_reset`` seconds. After that one
+        probe call goes through, and its success closes the circuit.
+
+Errors are classified by type and HTTP status, not by message text
+(see is_retryable()):
+
+    router = BackendRouter(retry_policy=RetryPolicy(max_attempts=5, deadline=10.0))
+    router.retrier("supabase").breaker.state      # "closed", "open" or "half_open"
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import random
+import threading
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+K = TypeVar("K", bound=Hashable)
+
+CLOSED: str = "closed"
+OPEN: str = "open"
+HALF_OPEN: str = "half_open"
+
+_RETRYABLE_STATUS: frozenset[int] = frozenset({408, 425, 429})
+
+# S3 error codes that mean "try again", whatever HTTP status they come with.
+_RETRYABLE_CODES: frozenset[str] = frozenset(
+    {
+        "SlowDown",
+        "Throttling",
+        "ThrottlingException",
+        "RequestThrottled",
+        "RequestLimitExceeded",
+        "RequestTimeout",
+        "InternalError",
+        "ServiceUnavailable",
+    }
+)
+
+_PERMANENT_OS_ERRORS: tuple[type[OSError], ...] = (
+    FileNotFoundError,
+    FileExistsError,
+    IsADirectoryError,
+    NotADirectoryError,
+    PermissionError,
+)
+
+
+class StorageHTTPError(RuntimeError):
+    """A backend request answered with an HTTP error status."""
+
+    def __init__(self, message: str, status_code: int) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class CircuitOpenError(ConnectionError):
+    """Raised without calling the backend while its circuit breaker is open."""
+
+
+# ----------------------------------------------------------------------
+# Classification
+# ----------------------------------------------------------------------
+
+
+def status_code(exc: BaseException) -> int | None:
+    """The HTTP status carried by *exc* (botocore, httpx, requests, storage3…), if any."""
+    response: Any = getattr(exc, "response", None)
+    if isinstance(response, dict):  # botocore ClientError
+        value: Any = response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+    else:
+        value = next(
+            (
+                found
+                for source in (exc, response)
+                for attr in ("status_code", "status")
+                if (found := getattr(source, attr, None)) is not None
+            ),
+            None,
+        )
+    try:
+        status = int(value)
+    except (TypeError, ValueError):
+        return None
+    return status if 100 <= status < 600 else None
+
+
+@functools.cache
+def _transport_errors() -> tuple[type[BaseException], ...]:
+    """Network-level exception types of the HTTP clients that are installed."""
+    types: list[type[BaseException]] = [ConnectionError, TimeoutError]
+    try:
+        from botocore.exceptions import ConnectionError as BotoConnectionError
+        from botocore.exceptions import HTTPClientError
+
+        types += [BotoConnectionError, HTTPClientError]
+    except ImportError:
+        pass
+    try:
+        import httpx
+
+        types.append(httpx.TransportError)
+    except ImportError:
+        pass
+    return tuple(types)
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """Return True if *exc* is a transient failure worth retrying.
+
+    Retried: HTTP 408 / 425 / 429 / 5xx, S3 throttling and internal-error
+    codes, and network errors (timeouts, refused or reset connections).
+    Never retried: other 4xx, missing files, ValueError / RuntimeError
+    without a status (bad paths, missing configuration) and CircuitOpenError.
+    """
+    if isinstance(exc, CircuitOpenError):
+        return False
+    response: Any = getattr(exc, "response", None)
+    if isinstance(response, dict) and response.get("Error", {}).get("Code") in _RETRYABLE_CODES:
+        return True
+    status = status_code(exc)
+    if status is not None:
+        return status in _RETRYABLE_STATUS or status >= 500
+    if isinstance(exc, (ValueError, RuntimeError, *_PERMANENT_OS_ERRORS)):
+        return False
+    return isinstance(exc, (OSError, *_transport_errors()))
+
+
+def is_not_found(exc: BaseException) -> bool:
+    """Return True if *exc* means the object does not exist."""
+    if isinstance(exc, FileNotFoundError):
+        return True
+    response: Any = getattr(exc, "response", None)
+    if isinstance(response, dict) and response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+        return True
+    status = status_code(exc)
+    # Supabase Storage answers a missing object with HTTP 400 and statusCode "404" in the body.
+    return status == 404 or (status == 400 and '"statusCode":"404"' in str(exc).replace(" ", ""))
+
+
+# ----------------------------------------------------------------------
+# Policy, budget, breaker
+# ----------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How BackendRouter retries transient failures (see module docstring).
+
+    ``deadline=None`` removes the per-call time limit, and
+    ``breaker_threshold=0`` disables the circuit breaker.
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 10.0
+    deadline: float | None = 30.0
+    budget_capacity: float = 10.0
+    budget_refill: float = 0.1
+    breaker_threshold: int = 5
+    breaker_reset: float = 30.0
+
+    def backoff(self, previous: float | None) -> float:
+        """The next delay: uniform in [base_delay, 3 × previous], capped at max_delay."""
+        upper = 3 * (previous or self.base_delay)
+        return min(self.max_delay, random.uniform(self.base_delay, max(upper, self.base_delay)))
+
+
+class RetryBudget:
+    """Token bucket limiting how many retries a backend may spend."""
+
+    def __init__(self, capacity: float, refill: float) -> None:
+        self.capacity = capacity
+        self.refill = refill
+        self.tokens = capacity
+        self._lock = threading.Lock()
+
+    def try_spend(self) -> bool:
+        """Take a token for one retry; False when the budget is exhausted."""
+        with self._lock:
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            return True
+
+    def deposit(self) -> None:
+        """Credit a successful call."""
+        with self._lock:
+            self.tokens = min(self.capacity, self.tokens + self.refill)
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with a single half-open probe.
+
+    A probe that never reports back (its thread hangs, or its task is
+    cancelled without the caller noticing) gives up the slot after
+    *probe_timeout* seconds, ``reset_timeout`` by default.
+    """
+
+    def __init__(self, name: str, threshold: int, reset_timeout: float, probe_timeout: float | None = None) -> None:
+        self.name = name
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.probe_timeout = reset_timeout if probe_timeout is None else probe_timeout
+        self.failures = 0
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probing = False
+        self._probe_started = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    def before_call(self) -> bool:
+        """Raise CircuitOpenError unless a call may go to the backend now.
+
+        Returns True when the call is the half-open probe. The caller must
+        then report its outcome with record_success(), record_failure()
+        or record_neutral().
+        """
+        if self.threshold <= 0:
+            return False
+        with self._lock:
+            if self._state == OPEN:
+                wait = self.reset_timeout - (time.monotonic() - self._opened_at)
+                if wait > 0:
+                    raise CircuitOpenError(
+                        f"{self.name} circuit is open after {self.failures} consecutive "
+                        f"transient failures; next probe in {wait:.1f}s."
+                    )
+                self._state = HALF_OPEN
+                self._probing = False
+            if self._state == HALF_OPEN:
+                now = time.monotonic()
+                if self._probing and now - self._probe_started < self.probe_timeout:
+                    raise CircuitOpenError(f"{self.name} circuit is half-open; a probe call is in flight.")
+                self._probing = True
+                self._probe_started = now
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """The backend answered (even with a permanent error): close the circuit."""
+        with self._lock:
+            self.failures = 0
+            self._state = CLOSED
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            self._probing = False
+            if self.threshold > 0 and (self._state == HALF_OPEN or self.failures >= self.threshold):
+                if self._state != OPEN:
+                    logger.warning("%s circuit opened after %d consecutive transient failures.", self.name, self.failures)
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+
+    def record_neutral(self, probe: bool = True) -> None:
+        """The call ended without a verdict on the backend (a local error, or
+        cancellation): free the probe slot if *probe* held it, change nothing else."""
+        if not probe:
+            return
+        with self._lock:
+            self._probing = False
+
+
+# ----------------------------------------------------------------------
+# Retrier
+# ----------------------------------------------------------------------
+
+
+class Retrier:
+    """Applies a RetryPolicy to one backend, with that backend's budget and breaker."""
+
+    def __init__(self, name: str, policy: RetryPolicy) -> None:
+        self.name = name
+        self.policy = policy
+        self.budget = RetryBudget(policy.budget_capacity, policy.budget_refill)
+        self.breaker = CircuitBreaker(name, policy.breaker_threshold, policy.breaker_reset)
+
+    def call(self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+        """Call *fn*, retrying transient failures under the policy."""
+        started = time.monotonic()
+        delay: float | None = None
+        attempt = 0
+        while True:
+            attempt += 1
+            probe = self.breaker.before_call()
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as exc:
+                delay = self._after_failure(exc, attempt, started, delay, probe)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+            except BaseException:  # KeyboardInterrupt, SystemExit: no verdict on the backend
+                self.breaker.record_neutral(probe)
+                raise
+            else:
+                self._succeeded()
+                return result
+
+    async def call_async(self, fn: Callable[..., Awaitable[T]], /, *args: Any, **kwargs: Any) -> T:
+        """Async version of call(); *fn* returns an awaitable."""
+        started = time.monotonic()
+        delay: float | None = None
+        attempt = 0
+        while True:
+            attempt += 1
+            probe = self.breaker.before_call()
+            try:
+                result = await fn(*args, **kwargs)
+            except Exception as exc:
+                delay = self._after_failure(exc, attempt, started, delay, probe)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+            except BaseException:  # CancelledError and friends: no verdict on the backend
+                self.breaker.record_neutral(probe)
+                raise
+            else:
+                self._succeeded()
+                return result
+
+    def call_bulk(
+        self, run: Callable[[list[K]], dict[K, Exception | None]], items: list[K]
+    ) -> dict[K, Exception | None]:
+        """Call the bulk operation *run*, then re-run it on just the items that failed transiently."""
+        started = time.monotonic()
+        results = self.call(run, items)
+        delay: float | None = None
+        for attempt in range(1, self.policy.max_attempts):
+            failed = [key for key, exc in results.items() if exc is not None and is_retryable(exc)]
+            if not failed:
+                break
+            delay = self._retry_delay(results[failed[0]], attempt, started, delay, items=len(failed))  # type: ignore[arg-type]
+            if delay is None:
+                break
+            time.sleep(delay)
+            results.update(self.call(run, failed))
+        return results
+
+    async def call_bulk_async(
+        self, run: Callable[[list[K]], Awaitable[dict[K, Exception | None]]], items: list[K]
+    ) -> dict[K, Exception | None]:
+        """Async version of call_bulk()."""
+        started = time.monotonic()
+        results = await self.call_async(run, items)
+        delay: float | None = None
+        for attempt in range(1, self.policy.max_attempts):
+            failed = [key for key, exc in results.items() if exc is not None and is_retryable(exc)]
+            if not failed:
+                break
+            delay = self._retry_delay(results[failed[0]], attempt, started, delay, items=len(failed))  # type: ignore[arg-type]
+            if delay is None:
+                break
+            await asyncio.sleep(delay)
+            results.update(await self.call_async(run, failed))
+        return results
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _succeeded(self) -> None:
+        self.breaker.record_success()
+        self.budget.deposit()
+
+    def _after_failure(
+        self, exc: Exception, attempt: int, started: float, previous: float | None, probe: bool
+    ) -> float | None:
+        """Record *exc* with the breaker; return the delay before the next attempt, or None to give up."""
+        if not is_retryable(exc):
+            if status_code(exc) is not None:
+                self.breaker.record_success()
+            else:
+                self.breaker.record_neutral(probe)
+            return None
+        self.breaker.record_failure()
+        if self.breaker.state == OPEN:
+            return None
+        return self._retry_delay(exc, attempt, started, previous)
+
+    def _retry_delay(
+        self, exc: Exception, attempt: int, started: float, previous: float | None, items: int | None = None
+    ) -> float | None:
+        policy = self.policy
+        if attempt >= policy.max_attempts:
+            return None
+        delay = policy.backoff(previous)
+        if policy.deadline is not None and time.monotonic() - started + delay > policy.deadline:
+            logger.warning("%s: retry deadline of %.1fs reached; giving up (%s).", self.name, policy.deadline, exc)
+            return None
+        if not self.budget.try_spend():
+            logger.warning("%s: retry budget exhausted; not retrying (%s).", self.name, exc)
+            return None
+        what = "Transient error" if items is None else f"Transient errors on {items} item(s)"
+        logger.warning(
+            "%s from %s on attempt %d/%d (%s). Retrying in %.1fs…",
+            what,
+            self.name,
+            attempt,
+            policy.max_attempts,
+            exc,
+            delay,
+        )
+        return delay
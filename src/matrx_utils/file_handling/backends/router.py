@@ -13,14 +13,82 @@ Supported HTTPS URLs (auto-converted to native, then read via credentials)
     S3 virtual-host:  https://bucket.s3.region.amazonaws.com/key[?X-Amz-Signature=...]
     S3 path-style:    https://s3.region.amazonaws.com/bucket/key
 
+Streaming
+---------
+    read_stream() / write_stream() (and their async versions) move data in
+    chunks, so memory stays at O(chunk size). write() and write_async() hand
+    any non-bytes content (a file object or a chunk iterable) to them
+    automatically. open_read() wraps read_stream() in a read-only file object.
+
+Ranged reads
+------------
+    read_range(uri, start, end) fetches bytes [start, end) only: a PDF
+    header, an MP4 moov atom, one page of a large JSONL file. open_seekable()
+    returns a seekable read-only file object that fetches blocks lazily
+    through read_range and keeps the most recent ones in a small cache.
+
+Read cache
+----------
+    Pass ``cache=ReadCache(directory, ...)`` to cache read() / read_url()
+    (and their async versions) on local disk with an in-memory hot tier.
+    Entries are keyed by canonical native URI, so an HTTPS URL and the
+    native URI for the same object share one entry. They are revalidated
+    by ETag and invalidated by write / write_stream / append / delete
+    through this router. Streams and ranged reads bypass the cache. See
+    read_cache.py.
+
 Retry policy
 ------------
-    read() and write() automatically retry on transient failures:
-        - Up to MAX_RETRIES attempts total (default 3)
-        - Exponential backoff: 0.5 s, 1 s, 2 s
-        - Retried: network errors, HTTP 429, HTTP 5xx
-        - NOT retried: HTTP 403, HTTP 404, ValueError, RuntimeError
-          (these are logic / config errors, not transient)
+    Calls to a backend retry transient failures under a RetryPolicy
+    (pass ``retry_policy=`` to change it; see retry.py):
+        - Up to 3 attempts, within a 30 s deadline per call
+        - Backoff with decorrelated jitter, starting around 0.5 s
+        - Retried: network errors, HTTP 408 / 429 / 5xx, S3 throttling
+        - NOT retried: other 4xx, ValueError, RuntimeError without an
+          HTTP status (these are logic / config errors, not transient)
+    Each backend has its own retry budget (a token bucket) and circuit
+    breaker. While the breaker is open, calls to that backend raise
+    CircuitOpenError at once instead of piling on.
+    Streams are retried only where that is safe. A read stream is retried
+    until its first chunk arrives. A write stream is retried when its source
+    can be replayed: an in-memory buffer, a local file path or a seekable file.
+
+Signed URLs
+-----------
+    get_url() and ensure_url() keep the URLs they sign in an in-process
+    SignedUrlCache and return a cached one while it has at least half of
+    the requested lifetime left (see url_cache.py). Pass
+    ``url_cache=False`` to sign every time. get_urls() / ensure_urls()
+    sign many at once, using Supabase's multi-path create_signed_urls.
+
+Batch operations
+----------------
+    read_many() / write_many() / delete_many() / copy_many() (and their
+    async versions) run up to ``max_concurrency`` items at once and return
+    one BatchResult per item, in input order, holding either the value or
+    the error. delete_many() uses S3 DeleteObjects and Supabase's
+    multi-path remove. In a bulk call, only the items that failed with a
+    transient error are retried, under the same policy as above.
+
+Deduplicated writes
+-------------------
+    content_store(root) returns a ContentStore that hashes each payload,
+    uploads each distinct payload once under ``<root>/blobs/`` and records
+    the written path as a server-side copy or a pointer. Reference-counted
+    gc() removes blobs that no path uses any more.
+
+Appends
+-------
+    append() takes the cheapest route the backend offers. On S3, objects of
+    5 MB and up are extended server-side (UploadPartCopy). The file server
+    appends with ``PATCH ?append=1``. segmented(uri) turns a URI into a
+    SegmentedObject, so each append is one small PUT and the segments are
+    compacted in the background. This is the cheap route on Supabase,
+    which cannot append server-side. Once a URI has segments, append() and
+    delete() on Supabase find them on any router, and every read, write,
+    delete and URL call for that URI goes through them. A Supabase URI
+    that was never opened with segmented() is still appended to by
+    read-modify-write, O(object size) per append. See segmented.py.
 
 BackendRouter is lazily initialised — backend instances are created on
 first use so that import-time costs and misconfigured-but-unused backends
@@ -29,11 +97,31 @@ do not cause errors.
 
 from __future__ import annotations
 
-import time
+import io
+import os
 import logging
+from collections.abc import AsyncIterator, Iterable, Iterator, Mapping
+from dataclasses import replace
+from typing import Any
 from urllib.parse import urlparse
 
 from .base_backend import StorageBackend
+from .batch import DEFAULT_BATCH_CONCURRENCY, BatchResult, arun_bounded, run_bounded
+from .content_store import ContentStore
+from .listing import DEFAULT_PAGE_SIZE, FileEntry
+from .read_cache import ReadCache
+from .retry import Retrier, RetryPolicy
+from .segmented import DEFAULT_COMPACT_AFTER, DEFAULT_MIN_AGE, DEFAULT_TARGET_SIZE, SegmentedObject, segments_prefix
+from .url_cache import SignedUrlCache, expiry_bucket
+from .streaming import (
+    DEFAULT_BLOCK_SIZE,
+    DEFAULT_CHUNK_SIZE,
+    AsyncByteSource,
+    ByteSource,
+    ChunkReader,
+    RangeReader,
+    check_range,
+)
 from .s3_backend import S3Backend
 from .supabase_backend import SupabaseBackend
 from .server_backend import ServerBackend
@@ -43,54 +131,6 @@ logger = logging.getLogger(__name__)
 
 CLOUD_SCHEMES: frozenset[str] = frozenset({"s3", "supabase", "server"})
 
-_MAX_RETRIES: int = 3
-_RETRY_BACKOFF: tuple[float, ...] = (0.5, 1.0, 2.0)
-
-# Error message fragments that indicate a transient failure worth retrying.
-# Permanent errors (403, 404, bad path, not-configured) are never retried.
-_TRANSIENT_FRAGMENTS: tuple[str, ...] = (
-    "timeout",
-    "timed out",
-    "connection",
-    "network",
-    "throttl",
-    "rate limit",
-    "503",
-    "502",
-    "500",
-    "429",
-    "temporarily unavailable",
-    "service unavailable",
-    "internal server error",
-)
-
-_PERMANENT_FRAGMENTS: tuple[str, ...] = (
-    "403",
-    "404",
-    "forbidden",
-    "not found",
-    "nosuchkey",
-    "nosuchbucket",
-    "access denied",
-    "not configured",
-    "invalid",
-    "no such",
-)
-
-
-def _is_transient(exc: Exception) -> bool:
-    """Return True if *exc* looks like a transient failure worth retrying."""
-    msg = str(exc).lower()
-    # Permanent errors take priority — never retry these.
-    for fragment in _PERMANENT_FRAGMENTS:
-        if fragment in msg:
-            return False
-    for fragment in _TRANSIENT_FRAGMENTS:
-        if fragment in msg:
-            return True
-    # ConnectionError and TimeoutError subclasses are always transient.
-    return isinstance(exc, (ConnectionError, TimeoutError, OSError))
-
 
 def _url_seconds_remaining(url: str) -> float | None:
     """Return seconds until *url* expires, or None if it has no expiry.
@@ -142,60 +182,44 @@ def _url_seconds_remaining(url: str) -> float | None:
     return None  # no expiry information found
 
 
-def _with_retry(fn, *args, **kwargs):
-    """Call *fn* with retry/backoff on transient errors.
+def _signed_lifetime(url: str, expires_in: int) -> float:
+    """Seconds *url* stays valid: read from the URL itself when it says, else *expires_in*."""
+    remaining = _url_seconds_remaining(url)
+    return expires_in if remaining is None else remaining
 
-    On a permanent error (403, 404, not-configured, etc.) the exception
-    is re-raised immediately without any retry.
-    """
-    last_exc: Exception | None = None
-    for attempt in range(_MAX_RETRIES):
-        try:
-            return fn(*args, **kwargs)
-        except (ValueError, RuntimeError) as exc:
-            # Config / logic errors — never retry.
-            raise
-        except Exception as exc:
-            if not _is_transient(exc):
-                raise
-            last_exc = exc
-            if attempt < _MAX_RETRIES - 1:
-                delay = _RETRY_BACKOFF[min(attempt, len(_RETRY_BACKOFF) - 1)]
-                logger.warning(
-                    "Transient error on attempt %d/%d (%s). Retrying in %.1fs…",
-                    attempt + 1,
-                    _MAX_RETRIES,
-                    exc,
-                    delay,
-                )
-                time.sleep(delay)
-    raise last_exc  # type: ignore[misc]
 
+def _write_items(items: Mapping[str, Any] | Iterable[tuple[str, Any]]) -> list[tuple[str, Any]]:
+    return list(items.items()) if isinstance(items, Mapping) else list(items)
 
-async def _with_retry_async(fn, *args, **kwargs):
-    """Async version of _with_retry — same policy, awaits the coroutine."""
-    last_exc: Exception | None = None
-    for attempt in range(_MAX_RETRIES):
-        try:
-            return await fn(*args, **kwargs)
-        except (ValueError, RuntimeError):
-            raise
-        except Exception as exc:
-            if not _is_transient(exc):
-                raise
-            last_exc = exc
-            if attempt < _MAX_RETRIES - 1:
-                import asyncio
-                delay = _RETRY_BACKOFF[min(attempt, len(_RETRY_BACKOFF) - 1)]
-                logger.warning(
-                    "Transient error on attempt %d/%d (%s). Retrying in %.1fs…",
-                    attempt + 1,
-                    _MAX_RETRIES,
-                    exc,
-                    delay,
-                )
-                await asyncio.sleep(delay)
-    raise last_exc  # type: ignore[misc]
+
+def _by_uri(results: list[BatchResult[Any]]) -> list[BatchResult[Any]]:
+    """Re-key results run over ``(uri, content)`` pairs by the URI alone."""
+    return [BatchResult(result.item[0], result.value, result.error) for result in results]
+
+
+def _ensured(url: str, target: BatchResult[str] | str, signed: Mapping[str, BatchResult[str]]) -> BatchResult[str]:
+    """ensure_urls() result for *url*: as-is / failed (*target* is a result) or freshly signed."""
+    if isinstance(target, BatchResult):
+        return target
+    result = signed[target]
+    return BatchResult(url, result.value, result.error)
+
+
+def _is_buffer(content: object) -> bool:
+    return isinstance(content, (bytes, bytearray, memoryview, str))
+
+
+def _split(data: bytes, chunk_size: int) -> Iterator[bytes]:
+    for offset in range(0, len(data), chunk_size):
+        yield data[offset : offset + chunk_size]
+
+
+def _rewind_point(source: object) -> int | None:
+    """Offset to seek back to before retrying a write of *source*, or None if it can't be replayed."""
+    seekable = getattr(source, "seekable", None)
+    if callable(seekable) and seekable():
+        return source.tell()  # type: ignore[attr-defined]
+    return None
 
 
 # ---------------------------------------------------------------------------
@@ -248,10 +272,23 @@ class BackendRouter:
     correct one, with automatic retry on transient failures.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        cache: ReadCache | None = None,
+        url_cache: SignedUrlCache | bool = True,
+        retry_policy: RetryPolicy | None = None,
+    ) -> None:
         self._s3: S3Backend | None = None
         self._supabase: SupabaseBackend | None = None
         self._server: ServerBackend | None = None
+        self.cache: ReadCache | None = cache
+        if isinstance(url_cache, bool):
+            url_cache = SignedUrlCache() if url_cache else None
+        self.url_cache: SignedUrlCache | None = url_cache
+        self._segmented: dict[str, SegmentedObject] = {}
+        self._content_stores: dict[tuple[str, str], ContentStore] = {}
+        self.retry_policy: RetryPolicy = retry_policy or RetryPolicy()
+        self._retriers: dict[StorageBackend, Retrier] = {}
 
     # ------------------------------------------------------------------
     # Lazy backend accessors
@@ -275,12 +312,39 @@ class BackendRouter:
             self._server = ServerBackend()
         return self._server
 
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def close(self) -> None:
+        """Release the pooled sync connections of every backend created so far."""
+        for backend in (self._s3, self._supabase, self._server):
+            close = getattr(backend, "close", None)
+            if callable(close):
+                close()
+
+    async def aclose(self) -> None:
+        """Release the running event loop's pooled async connections.
+
+        Call it from the loop that made the requests, e.g. at the end of a
+        FastAPI lifespan handler.
+        """
+        for backend in (self._s3, self._supabase, self._server):
+            aclose = getattr(backend, "aclose", None)
+            if callable(aclose):
+                await aclose()
+
     # ------------------------------------------------------------------
     # Internal dispatch
     # ------------------------------------------------------------------
 
     def _resolve(self, uri: str) -> tuple[StorageBackend, str]:
         """Return (backend, storage_path) for any URI or HTTPS URL."""
+        backend, path, _ = self._locate(uri)
+        return backend, path
+
+    def _locate(self, uri: str) -> tuple[StorageBackend, str, str]:
+        """Return (backend, storage_path, canonical native URI) for any URI or HTTPS URL."""
         parsed_scheme = uri.split("://", 1)[0].lower() if "://" in uri else ""
 
         if parsed_scheme in ("http", "https"):
@@ -295,7 +359,37 @@ class BackendRouter:
             "supabase": self.supabase,
             "server": self.server,
         }
-        return backends[scheme], path
+        canonical = path.lstrip("/")
+        if scheme == "s3":
+            canonical = "/".join(self.s3._parse_path(canonical))
+        return backends[scheme], path, f"{scheme}://{canonical}"
+
+    def _retrier(self, backend: StorageBackend) -> Retrier:
+        retrier = self._retriers.get(backend)
+        if retrier is None:
+            retrier = self._retriers.setdefault(backend, Retrier(type(backend).__name__, self.retry_policy))
+        return retrier
+
+    def retrier(self, scheme: str) -> Retrier:
+        """The Retrier (retry budget and circuit breaker) guarding the *scheme* backend."""
+        backends: dict[str, StorageBackend] = {"s3": self.s3, "supabase": self.supabase, "server": self.server}
+        return self._retrier(backends[scheme.lower()])
+
+    def _cached_read(self, cache: ReadCache, uri: str) -> bytes:
+        backend, path, key = self._locate(uri)
+        return cache.read(key, lambda etag: self._retrier(backend).call(backend._read_if_changed, path, etag))
+
+    async def _cached_read_async(self, cache: ReadCache, uri: str) -> bytes:
+        backend, path, key = self._locate(uri)
+
+        async def _fetch(etag: str | None) -> tuple[bytes | None, str | None]:
+            return await self._retrier(backend).call_async(backend._read_if_changed_async, path, etag)
+
+        return await cache.read_async(key, _fetch)
+
+    def _invalidate(self, uri: str) -> None:
+        if self.cache is not None:
+            self.cache.invalidate(self._locate(uri)[2])
 
     # ------------------------------------------------------------------
     # Public routing API — mirrors StorageBackend interface
@@ -303,25 +397,235 @@ class BackendRouter:
 
     def read(self, uri: str) -> bytes:
         """Read bytes from *uri* with automatic retry on transient errors."""
+        segmented = self._segmented.get(uri)
+        if segmented is not None:
+            return segmented.read()
+        if self.cache is not None:
+            return self._cached_read(self.cache, uri)
         backend, path = self._resolve(uri)
-        return _with_retry(backend.read, path)
+        return self._retrier(backend).call(backend.read, path)
+
+    def write(self, uri: str, content: ByteSource, **kwargs) -> bool:
+        """Write *content* to *uri* with automatic retry on transient errors.
 
-    def write(self, uri: str, content: bytes | str, **kwargs) -> bool:
-        """Write *content* to *uri* with automatic retry on transient errors."""
+        File objects and chunk iterables are streamed (see write_stream()).
+        """
+        if not _is_buffer(content):
+            return self.write_stream(uri, content, **kwargs)
+        backend, path = self._resolve(uri)
+        try:
+            written = self._retrier(backend).call(backend.write, path, content, **kwargs)
+        finally:
+            self._invalidate(uri)
+        self._replace_segments(uri)
+        return written
+
+    def segmented(
+        self,
+        uri: str,
+        compact_after: int = DEFAULT_COMPACT_AFTER,
+        target_size: int = DEFAULT_TARGET_SIZE,
+        min_age: float = DEFAULT_MIN_AGE,
+    ) -> SegmentedObject:
+        """Open *uri* as an append-optimised segmented object (see segmented.py).
+
+        From then on, reads, writes, appends, deletes and get_url() for
+        *uri* on this router go to the segments under ``<uri>.segments/``.
+        Bytes already stored at *uri* become the first segment. Use it for
+        logs and other objects that grow by small appends on backends
+        without a server-side append, such as Supabase.
+        """
+        segmented = self._segmented.get(uri)
+        if segmented is None:
+            parse_uri(uri)
+            segmented = self._segmented[uri] = SegmentedObject(self, uri, compact_after, target_size, min_age)
+        return segmented
+
+    def content_store(self, root: str, mode: str = "copy") -> ContentStore:
+        """Return the deduplicating ContentStore rooted at *root* (see content_store.py).
+
+        ``store.write(uri, content)`` uploads each distinct payload once,
+        under ``<root>/blobs/``. It records *uri* as a server-side copy
+        (``mode="copy"``) or as a small pointer (``mode="pointer"``).
+        """
+        parse_uri(root)
+        key = (root.rstrip("/"), mode)
+        store = self._content_stores.get(key)
+        if store is None:
+            store = self._content_stores[key] = ContentStore(self, root, mode)
+        return store
+
+    def _segmented_for(self, uri: str, backend: StorageBackend) -> SegmentedObject | None:
+        """The open SegmentedObject for *uri*, opening one on Supabase if *uri* already has segments."""
+        segmented = self._segmented.get(uri)
+        if segmented is None and isinstance(backend, SupabaseBackend):
+            if next(iter(self.iter_files(segments_prefix(uri), page_size=1)), None) is not None:
+                segmented = self.segmented(uri)
+        return segmented
+
+    async def _segmented_for_async(self, uri: str, backend: StorageBackend) -> SegmentedObject | None:
+        segmented = self._segmented.get(uri)
+        if segmented is None and isinstance(backend, SupabaseBackend):
+            async for _ in self.iter_files_async(segments_prefix(uri), page_size=1):
+                return self.segmented(uri)
+        return segmented
+
+    def _replace_segments(self, uri: str) -> None:
+        """After a whole-object write to a segmented *uri*, drop its segments so reads see the write."""
+        segmented = self._segmented.get(uri)
+        if segmented is not None:
+            segmented.clear()
+
+    async def _replace_segments_async(self, uri: str) -> None:
+        segmented = self._segmented.get(uri)
+        if segmented is not None:
+            await segmented.clear_async()
+
+    def _materialize(self, uri: str, data: bytes) -> None:
+        """Write a segmented object's content to *uri* itself, leaving the segments in place."""
         backend, path = self._resolve(uri)
-        return _with_retry(backend.write, path, content, **kwargs)
+        try:
+            self._retrier(backend).call(backend.write, path, data)
+        finally:
+            self._invalidate(uri)
+
+    async def _materialize_async(self, uri: str, data: bytes) -> None:
+        backend, path = self._resolve(uri)
+        try:
+            await self._retrier(backend).call_async(backend.write_async, path, data)
+        finally:
+            self._invalidate(uri)
+
+    # ------------------------------------------------------------------
+    # Streaming
+    # ------------------------------------------------------------------
+
+    def read_stream(self, uri: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+        """Yield the object at *uri* in chunks of at most *chunk_size* bytes."""
+        segmented = self._segmented.get(uri)
+        if segmented is not None:
+            for piece in segmented.iter_range():
+                yield from _split(piece, chunk_size)
+            return
+        backend, path = self._resolve(uri)
+
+        def _open() -> tuple[Iterator[bytes], bytes | None]:
+            chunks = backend.read_stream(path, chunk_size)
+            return chunks, next(chunks, None)
+
+        chunks, first = self._retrier(backend).call(_open)
+        try:
+            if first is not None:
+                yield first
+                yield from chunks
+        finally:
+            chunks.close()  # type: ignore[attr-defined]
+
+    def write_stream(self, uri: str, source: ByteSource, **kwargs) -> bool:
+        """Stream *source* (buffer, file object or chunk iterable) to *uri*."""
+        backend, path = self._resolve(uri)
+        try:
+            if _is_buffer(source) or isinstance(source, os.PathLike):
+                written = self._retrier(backend).call(backend.write_stream, path, source, **kwargs)
+            elif (start := _rewind_point(source)) is None:
+                written = backend.write_stream(path, source, **kwargs)
+            else:
+
+                def _attempt() -> bool:
+                    source.seek(start)  # type: ignore[union-attr]
+                    return backend.write_stream(path, source, **kwargs)
+
+                written = self._retrier(backend).call(_attempt)
+        finally:
+            self._invalidate(uri)
+        self._replace_segments(uri)
+        return written
+
+    def open_read(self, uri: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> io.BufferedReader:
+        """Return a read-only binary file object that streams *uri* on demand."""
+        return io.BufferedReader(ChunkReader(self.read_stream(uri, chunk_size)), buffer_size=chunk_size)
+
+    # ------------------------------------------------------------------
+    # Ranged reads
+    # ------------------------------------------------------------------
+
+    def read_range(self, uri: str, start: int, end: int | None = None) -> bytes:
+        """Read bytes ``[start, end)`` of *uri* (``end=None`` = to the end), with retry."""
+        segmented = self._segmented.get(uri)
+        if segmented is not None:
+            check_range(start, end)
+            return segmented.read_range(start, end)
+        backend, path = self._resolve(uri)
+        return self._retrier(backend).call(backend.read_range, path, start, end)
+
+    def open_seekable(
+        self, uri: str, block_size: int = DEFAULT_BLOCK_SIZE, cache_blocks: int = 8
+    ) -> io.BufferedReader:
+        """Return a seekable read-only file object over *uri*.
+
+        Data is fetched in *block_size* ranges only when read, and the last
+        *cache_blocks* blocks are cached. Nothing is fetched until the first
+        read or end-relative seek.
+        """
+        backend, path = self._resolve(uri)
+        segmented = self._segmented.get(uri)
+
+        def _fetch(start: int, end: int | None) -> tuple[bytes, int | None]:
+            check_range(start, end)
+            if segmented is not None:
+                return segmented.fetch_range(start, end)
+            return self._retrier(backend).call(backend._read_range, path, start, end)
+
+        reader = RangeReader(_fetch, block_size=block_size, cache_blocks=cache_blocks)
+        return io.BufferedReader(reader, buffer_size=block_size)
 
     def append(self, uri: str, content: bytes | str) -> bool:
+        """Append *content* to *uri* by the cheapest route available.
+
+        A segmented URI gets a new segment (one small PUT): one opened with
+        segmented(), or on Supabase one that already has segments. S3
+        extends objects of 5 MB and up server-side, and the file server
+        appends in place when it supports ``PATCH ?append=1``. Everything
+        else is read, extended and rewritten.
+        """
         backend, path = self._resolve(uri)
-        return _with_retry(backend.append, path, content)
+        segmented = self._segmented_for(uri, backend)
+        if segmented is not None:
+            return segmented.append(content)
+        try:
+            return self._retrier(backend).call(backend.append, path, content)
+        finally:
+            self._invalidate(uri)
 
     def delete(self, uri: str) -> bool:
         backend, path = self._resolve(uri)
-        return backend.delete(path)
+        segmented = self._segmented_for(uri, backend)
+        if segmented is not None:
+            segmented.clear()
+        try:
+            return backend.delete(path)
+        finally:
+            self._invalidate(uri)
 
     def get_url(self, uri: str, expires_in: int = 3600) -> str:
-        backend, path = self._resolve(uri)
-        return backend.get_url(path, expires_in=expires_in)
+        """Return a signed URL for *uri*, from the signed-URL cache when one is still fresh.
+
+        For a segmented URI, the segments are first concatenated into the
+        object at *uri*, so the URL serves the current content.
+        """
+        segmented = self._segmented.get(uri)
+        if segmented is not None:
+            self._materialize(uri, segmented.read())
+        url_cache = self.url_cache
+        backend, path, key = self._locate(uri)
+        if url_cache is None:
+            return backend.get_url(path, expires_in=expires_in)
+        url = url_cache.get(key, expires_in)
+        if url is None:
+            ttl = expiry_bucket(expires_in)
+            url = backend.get_url(path, expires_in=ttl)
+            url_cache.put(key, expires_in, url, _signed_lifetime(url, ttl))
+        return url
 
     def get_public_url(self, uri: str) -> str:
         """Return the permanent public URL for a cloud object (bucket must be public)."""
@@ -339,6 +643,28 @@ class BackendRouter:
         scheme = uri_prefix.split("://", 1)[0].lower()
         return [f"{scheme}://{item}" for item in raw]
 
+    def iter_files(
+        self,
+        uri_prefix: str,
+        recursive: bool = True,
+        with_metadata: bool = False,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> Iterator[FileEntry]:
+        """Lazily list everything under *uri_prefix*, one page at a time.
+
+        Yields FileEntry objects whose ``path`` is a full URI. See
+        StorageBackend.iter_files() for *recursive* and *with_metadata*.
+        """
+        if not uri_prefix:
+            raise ValueError(
+                "iter_files() requires a URI prefix with a scheme, "
+                "e.g. 's3://bucket/folder/' or 'supabase://bucket/'."
+            )
+        backend, path = self._resolve(uri_prefix)
+        scheme = uri_prefix.split("://", 1)[0].lower()
+        entries = backend.iter_files(path, recursive, with_metadata, page_size)
+        return (replace(entry, path=f"{scheme}://{entry.path}") for entry in entries)
+
     # ------------------------------------------------------------------
     # read_url — the "React sent me a URL" entry point
     # ------------------------------------------------------------------
@@ -368,11 +694,10 @@ class BackendRouter:
         RuntimeError
             If the relevant backend is not configured (missing credentials).
         """
-        return _with_retry(self._read_url_once, url)
-
-    def _read_url_once(self, url: str) -> bytes:
+        if self.cache is not None:
+            return self._cached_read(self.cache, url)
         backend, path = self._resolve(url)
-        return backend.read(path)
+        return self._retrier(backend).call(backend.read, path)
 
     # ------------------------------------------------------------------
     # Status helpers
@@ -406,21 +731,97 @@ class BackendRouter:
 
     async def read_async(self, uri: str) -> bytes:
         """Non-blocking read. Use in FastAPI routes and all async contexts."""
+        segmented = self._segmented.get(uri)
+        if segmented is not None:
+            return await segmented.read_async()
+        if self.cache is not None:
+            return await self._cached_read_async(self.cache, uri)
         backend, path = self._resolve(uri)
-        return await _with_retry_async(backend.read_async, path)
+        return await self._retrier(backend).call_async(backend.read_async, path)
 
-    async def write_async(self, uri: str, content: bytes | str, **kwargs) -> bool:
-        """Non-blocking write."""
+    async def write_async(self, uri: str, content: AsyncByteSource, **kwargs) -> bool:
+        """Non-blocking write. File objects and (async) chunk iterables are streamed."""
+        if not _is_buffer(content):
+            return await self.write_stream_async(uri, content, **kwargs)
+        backend, path = self._resolve(uri)
+        try:
+            written = await self._retrier(backend).call_async(backend.write_async, path, content, **kwargs)
+        finally:
+            self._invalidate(uri)
+        await self._replace_segments_async(uri)
+        return written
+
+    async def read_stream_async(self, uri: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncIterator[bytes]:
+        """Non-blocking read_stream()."""
+        segmented = self._segmented.get(uri)
+        if segmented is not None:
+            async for piece in segmented.iter_range_async():
+                for chunk in _split(piece, chunk_size):
+                    yield chunk
+            return
         backend, path = self._resolve(uri)
-        return await _with_retry_async(backend.write_async, path, content, **kwargs)
+
+        async def _open() -> tuple[AsyncIterator[bytes], bytes | None]:
+            chunks = backend.read_stream_async(path, chunk_size)
+            return chunks, await anext(chunks, None)
+
+        chunks, first = await self._retrier(backend).call_async(_open)
+        try:
+            if first is not None:
+                yield first
+                async for chunk in chunks:
+                    yield chunk
+        finally:
+            await chunks.aclose()  # type: ignore[attr-defined]
+
+    async def write_stream_async(self, uri: str, source: AsyncByteSource, **kwargs) -> bool:
+        """Non-blocking write_stream(); also accepts async iterables."""
+        backend, path = self._resolve(uri)
+        try:
+            if _is_buffer(source) or isinstance(source, os.PathLike):
+                written = await self._retrier(backend).call_async(backend.write_stream_async, path, source, **kwargs)
+            elif (start := _rewind_point(source)) is None:
+                written = await backend.write_stream_async(path, source, **kwargs)
+            else:
+
+                async def _attempt() -> bool:
+                    source.seek(start)  # type: ignore[union-attr]
+                    return await backend.write_stream_async(path, source, **kwargs)
+
+                written = await self._retrier(backend).call_async(_attempt)
+        finally:
+            self._invalidate(uri)
+        await self._replace_segments_async(uri)
+        return written
+
+    async def read_range_async(self, uri: str, start: int, end: int | None = None) -> bytes:
+        """Non-blocking read_range()."""
+        segmented = self._segmented.get(uri)
+        if segmented is not None:
+            check_range(start, end)
+            return await segmented.read_range_async(start, end)
+        backend, path = self._resolve(uri)
+        return await self._retrier(backend).call_async(backend.read_range_async, path, start, end)
 
     async def append_async(self, uri: str, content: bytes | str) -> bool:
         backend, path = self._resolve(uri)
-        return await _with_retry_async(backend.append_async, path, content)
+        segmented = await self._segmented_for_async(uri, backend)
+        if segmented is not None:
+            return await segmented.append_async(content)
+        try:
+            return await self._retrier(backend).call_async(backend.append_async, path, content)
+        finally:
+            self._invalidate(uri)
 
     async def delete_async(self, uri: str) -> bool:
         backend, path = self._resolve(uri)
-        return await backend.delete_async(path)
+        segmented = await self._segmented_for_async(uri, backend)
+        if segmented is not None:
+            await segmented.clear_async()
+        try:
+            return await backend.delete_async(path)
+        finally:
+            self._invalidate(uri)
 
     def get_public_url(self, uri: str) -> str:
         """Return the permanent public URL for a cloud object (bucket must be public)."""
@@ -433,8 +834,20 @@ class BackendRouter:
         return await backend.get_public_url_async(path)
 
     async def get_url_async(self, uri: str, expires_in: int = 3600) -> str:
-        backend, path = self._resolve(uri)
-        return await backend.get_url_async(path, expires_in=expires_in)
+        """Non-blocking get_url()."""
+        segmented = self._segmented.get(uri)
+        if segmented is not None:
+            await self._materialize_async(uri, await segmented.read_async())
+        url_cache = self.url_cache
+        backend, path, key = self._locate(uri)
+        if url_cache is None:
+            return await backend.get_url_async(path, expires_in=expires_in)
+        url = url_cache.get(key, expires_in)
+        if url is None:
+            ttl = expiry_bucket(expires_in)
+            url = await backend.get_url_async(path, expires_in=ttl)
+            url_cache.put(key, expires_in, url, _signed_lifetime(url, ttl))
+        return url
 
     async def list_files_async(self, uri_prefix: str = "") -> list[str]:
         if not uri_prefix:
@@ -446,13 +859,194 @@ class BackendRouter:
         scheme = uri_prefix.split("://", 1)[0].lower()
         return [f"{scheme}://{item}" for item in raw]
 
+    def iter_files_async(
+        self,
+        uri_prefix: str,
+        recursive: bool = True,
+        with_metadata: bool = False,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> AsyncIterator[FileEntry]:
+        """Non-blocking iter_files(): ``async for entry in router.iter_files_async(prefix)``."""
+        if not uri_prefix:
+            raise ValueError(
+                "iter_files_async() requires a URI prefix with a scheme."
+            )
+        backend, path = self._resolve(uri_prefix)
+        scheme = uri_prefix.split("://", 1)[0].lower()
+        entries = backend.iter_files_async(path, recursive, with_metadata, page_size)
+        return (replace(entry, path=f"{scheme}://{entry.path}") async for entry in entries)
+
     async def read_url_async(self, url: str) -> bytes:
         """Non-blocking read from any URL format a client might send."""
-        return await _with_retry_async(self._read_url_once_async, url)
-
-    async def _read_url_once_async(self, url: str) -> bytes:
+        if self.cache is not None:
+            return await self._cached_read_async(self.cache, url)
         backend, path = self._resolve(url)
-        return await backend.read_async(path)
+        return await self._retrier(backend).call_async(backend.read_async, path)
+
+    # ------------------------------------------------------------------
+    # Copies and batch operations
+    # ------------------------------------------------------------------
+
+    def _group_by_backend(
+        self, uris: list[str], errors: dict[str, Exception | None]
+    ) -> dict[StorageBackend, list[tuple[str, str]]]:
+        """Group *uris* as ``{backend: [(uri, path), …]}``; unparseable URIs go into *errors*."""
+        groups: dict[StorageBackend, list[tuple[str, str]]] = {}
+        for uri in uris:
+            try:
+                backend, path = self._resolve(uri)
+            except Exception as exc:
+                errors[uri] = exc
+                continue
+            groups.setdefault(backend, []).append((uri, path))
+        return groups
+
+    def _native_copy(self, src_uri: str, dst_uri: str) -> tuple[StorageBackend, str, str] | None:
+        """Return (backend, src_path, dst_path) if the copy can stay server-side, else None."""
+        src_backend, src_path = self._resolve(src_uri)
+        dst_backend, dst_path = self._resolve(dst_uri)
+        if src_backend is not dst_backend or not hasattr(src_backend, "copy"):
+            return None
+        if isinstance(src_backend, SupabaseBackend):
+            # Supabase only copies within one bucket.
+            if src_backend._parse_path(src_path)[0] != src_backend._parse_path(dst_path)[0]:
+                return None
+        return src_backend, src_path, dst_path
+
+    def copy(self, src_uri: str, dst_uri: str) -> bool:
+        """Copy *src_uri* to *dst_uri*, server-side when both live on the same backend.
+
+        Anything else (e.g. S3 → Supabase) is streamed through this process.
+        """
+        native = self._native_copy(src_uri, dst_uri)
+        if native is None:
+            return self.write_stream(dst_uri, self.read_stream(src_uri))
+        backend, src_path, dst_path = native
+        try:
+            return self._retrier(backend).call(backend.copy, src_path, dst_path)  # type: ignore[attr-defined]
+        finally:
+            self._invalidate(dst_uri)
+
+    def read_many(
+        self, uris: Iterable[str], max_concurrency: int = DEFAULT_BATCH_CONCURRENCY
+    ) -> list[BatchResult[bytes]]:
+        """Read every URI, at most *max_concurrency* at a time.
+
+        Returns one BatchResult per URI, in input order. A failed read sets
+        ``error`` on its result instead of raising. Each read is retried on
+        its own, so one flaky object does not restart the batch.
+        """
+        return run_bounded(self.read, uris, max_concurrency)
+
+    def write_many(
+        self,
+        items: Mapping[str, ByteSource] | Iterable[tuple[str, ByteSource]],
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        **kwargs,
+    ) -> list[BatchResult[bool]]:
+        """Write ``{uri: content}`` (or ``(uri, content)`` pairs) concurrently; see read_many()."""
+        results = run_bounded(lambda item: self.write(item[0], item[1], **kwargs), _write_items(items), max_concurrency)
+        return _by_uri(results)
+
+    def delete_many(
+        self, uris: Iterable[str], max_concurrency: int = DEFAULT_BATCH_CONCURRENCY
+    ) -> list[BatchResult[bool]]:
+        """Delete every URI, using the backend's bulk endpoint where it has one.
+
+        S3 deletes up to 1000 keys per DeleteObjects request and Supabase
+        removes a list of paths per request. Only the keys that failed
+        transiently are sent again. Backends without a bulk endpoint get
+        up to *max_concurrency* single deletes in parallel.
+        """
+        uris = list(uris)
+        errors: dict[str, Exception | None] = {}
+        groups = self._group_by_backend(uris, errors)
+
+        for backend, entries in groups.items():
+            try:
+                if backend.has_bulk_delete():
+                    outcome = self._retrier(backend).call_bulk(backend.delete_many, [path for _, path in entries])
+                    errors.update((uri, outcome[path]) for uri, path in entries)
+                else:
+                    results = run_bounded(lambda entry: self._retrier(backend).call(backend.delete, entry[1]), entries, max_concurrency)
+                    errors.update((result.item[0], result.error) for result in results)
+            finally:
+                for uri, _ in entries:
+                    self._invalidate(uri)
+        return [BatchResult(uri, True, None) if errors[uri] is None else BatchResult(uri, error=errors[uri]) for uri in uris]
+
+    def copy_many(
+        self, pairs: Mapping[str, str] | Iterable[tuple[str, str]], max_concurrency: int = DEFAULT_BATCH_CONCURRENCY
+    ) -> list[BatchResult[bool]]:
+        """Copy ``{src: dst}`` (or ``(src, dst)`` pairs) concurrently; results carry the pair."""
+        return run_bounded(lambda pair: self.copy(*pair), _write_items(pairs), max_concurrency)
+
+    async def copy_async(self, src_uri: str, dst_uri: str) -> bool:
+        """Non-blocking copy()."""
+        native = self._native_copy(src_uri, dst_uri)
+        if native is None:
+            return await self.write_stream_async(dst_uri, self.read_stream_async(src_uri))
+        backend, src_path, dst_path = native
+        try:
+            return await self._retrier(backend).call_async(backend.copy_async, src_path, dst_path)  # type: ignore[attr-defined]
+        finally:
+            self._invalidate(dst_uri)
+
+    async def read_many_async(
+        self, uris: Iterable[str], max_concurrency: int = DEFAULT_BATCH_CONCURRENCY
+    ) -> list[BatchResult[bytes]]:
+        """Non-blocking read_many()."""
+        return await arun_bounded(self.read_async, uris, max_concurrency)
+
+    async def write_many_async(
+        self,
+        items: Mapping[str, AsyncByteSource] | Iterable[tuple[str, AsyncByteSource]],
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        **kwargs,
+    ) -> list[BatchResult[bool]]:
+        """Non-blocking write_many()."""
+
+        async def _write(item: tuple[str, AsyncByteSource]) -> bool:
+            return await self.write_async(item[0], item[1], **kwargs)
+
+        return _by_uri(await arun_bounded(_write, _write_items(items), max_concurrency))
+
+    async def delete_many_async(
+        self, uris: Iterable[str], max_concurrency: int = DEFAULT_BATCH_CONCURRENCY
+    ) -> list[BatchResult[bool]]:
+        """Non-blocking delete_many()."""
+        uris = list(uris)
+        errors: dict[str, Exception | None] = {}
+        groups = self._group_by_backend(uris, errors)
+
+        for backend, entries in groups.items():
+            try:
+                if backend.has_bulk_delete():
+                    outcome = await self._retrier(backend).call_bulk_async(
+                        backend.delete_many_async, [path for _, path in entries]
+                    )
+                    errors.update((uri, outcome[path]) for uri, path in entries)
+                else:
+
+                    async def _delete(entry: tuple[str, str], backend: StorageBackend = backend) -> bool:
+                        return await self._retrier(backend).call_async(backend.delete_async, entry[1])
+
+                    results = await arun_bounded(_delete, entries, max_concurrency)
+                    errors.update((result.item[0], result.error) for result in results)
+            finally:
+                for uri, _ in entries:
+                    self._invalidate(uri)
+        return [BatchResult(uri, True, None) if errors[uri] is None else BatchResult(uri, error=errors[uri]) for uri in uris]
+
+    async def copy_many_async(
+        self, pairs: Mapping[str, str] | Iterable[tuple[str, str]], max_concurrency: int = DEFAULT_BATCH_CONCURRENCY
+    ) -> list[BatchResult[bool]]:
+        """Non-blocking copy_many()."""
+
+        async def _copy(pair: tuple[str, str]) -> bool:
+            return await self.copy_async(*pair)
+
+        return await arun_bounded(_copy, _write_items(pairs), max_concurrency)
 
     # ------------------------------------------------------------------
     # ensure_url — smart URL refresh without unnecessary network calls
@@ -462,8 +1056,8 @@ class BackendRouter:
         """Return a guaranteed-valid URL for a cloud file.
 
         Logic (zero network calls when URL is still fresh):
-        1. If *url* is a native cloud URI (s3://, supabase://) — generate
-           a fresh signed URL directly. No expiry check needed.
+        1. If *url* is a native cloud URI (s3://, supabase://) — return a
+           signed URL via get_url(), reusing a cached one while it is fresh.
         2. If *url* is a Supabase signed URL — decode the JWT payload and
            read the 'exp' claim without any network call or secret key.
            Return the original URL if it has ≥ *buffer_seconds* remaining.
@@ -471,7 +1065,7 @@ class BackendRouter:
            from the query string. Return the original if still valid.
         4. If *url* is a public (non-expiring) HTTPS URL — return it as-is.
         5. If expired (or unrecognised format) — parse to storage path,
-           generate a fresh signed URL via backend credentials, return it.
+           sign it again via get_url() and return that.
 
         Parameters
         ----------
@@ -480,45 +1074,142 @@ class BackendRouter:
         expires_in:
             Expiry for the *new* URL when one needs to be generated (seconds).
         """
-        from .url_parser import parse_storage_url
-        import time
-
-        # Native URIs have no expiry — generate a fresh signed URL
-        parsed_scheme = url.split("://", 1)[0].lower() if "://" in url else ""
-        if parsed_scheme in CLOUD_SCHEMES:
-            result = parse_storage_url(url)
-            backend, path = self._resolve(url)
-            return backend.get_url(path, expires_in=expires_in)
-
-        # HTTPS URL — check if it carries expiry information
-        remaining = _url_seconds_remaining(url)
-        if remaining is None:
-            # Public / non-expiring URL — return as-is
-            return url
-        if remaining > 60:
-            # More than 60 s left — safe to use as-is
-            return url
-
-        # Expired or about to expire — regenerate via credentials
-        result = parse_storage_url(url)
-        backend, path = self._resolve(result.to_native_uri())
-        return backend.get_url(path, expires_in=expires_in)
+        target = self._refresh_target(url)
+        return url if target is None else self.get_url(target, expires_in=expires_in)
 
     async def ensure_url_async(self, url: str, expires_in: int = 3600) -> str:
         """Async version of ensure_url()."""
-        from .url_parser import parse_storage_url
+        target = self._refresh_target(url)
+        return url if target is None else await self.get_url_async(target, expires_in=expires_in)
 
+    def _refresh_target(self, url: str) -> str | None:
+        """Native URI to sign for *url*, or None if *url* can be returned as-is."""
         parsed_scheme = url.split("://", 1)[0].lower() if "://" in url else ""
         if parsed_scheme in CLOUD_SCHEMES:
-            backend, path = self._resolve(url)
-            return await backend.get_url_async(path, expires_in=expires_in)
+            return url
 
+        # HTTPS URL — public / non-expiring, or more than 60 s left: use as-is
         remaining = _url_seconds_remaining(url)
-        if remaining is None:
-            return url
-        if remaining > 60:
-            return url
+        if remaining is None or remaining > 60:
+            return None
 
-        result = parse_storage_url(url)
-        backend, path = self._resolve(result.to_native_uri())
-        return await backend.get_url_async(path, expires_in=expires_in)
+        # Expired or about to expire — regenerate via credentials
+        return parse_storage_url(url).to_native_uri()
+
+    # ------------------------------------------------------------------
+    # Batch presigning
+    # ------------------------------------------------------------------
+
+    def _split_url_batch(
+        self, uris: list[str], expires_in: int, found: dict[str, BatchResult[str]]
+    ) -> dict[StorageBackend, list[tuple[str, str, str]]]:
+        """Fill *found* with cache hits and bad URIs; group the rest as ``{backend: [(uri, path, key)]}``."""
+        pending: dict[StorageBackend, list[tuple[str, str, str]]] = {}
+        for uri in dict.fromkeys(uris):
+            try:
+                backend, path, key = self._locate(uri)
+            except Exception as exc:
+                found[uri] = BatchResult(uri, error=exc)
+                continue
+            url = self.url_cache.get(key, expires_in) if self.url_cache is not None else None
+            if url is not None:
+                found[uri] = BatchResult(uri, url)
+            else:
+                pending.setdefault(backend, []).append((uri, path, key))
+        return pending
+
+    def _remember_urls(
+        self,
+        entries: list[tuple[str, str, str]],
+        urls: list[BatchResult[str]],
+        expires_in: int,
+        ttl: int,
+        found: dict[str, BatchResult[str]],
+    ) -> None:
+        """Record freshly signed *urls* in *found* (by URI) and in the signed-URL cache."""
+        for (uri, _, key), result in zip(entries, urls):
+            found[uri] = BatchResult(uri, result.value, result.error)
+            if self.url_cache is not None and result.ok:
+                self.url_cache.put(key, expires_in, result.value, _signed_lifetime(result.value, ttl))  # type: ignore[arg-type]
+
+    def get_urls(
+        self, uris: Iterable[str], expires_in: int = 3600, max_concurrency: int = DEFAULT_BATCH_CONCURRENCY
+    ) -> list[BatchResult[str]]:
+        """Signed URLs for many URIs; one BatchResult per URI, in input order.
+
+        Fresh URLs come from the signed-URL cache. The rest are signed per
+        backend: Supabase signs a whole bucket's paths in one
+        create_signed_urls request, S3 presigns locally, and other
+        backends sign up to *max_concurrency* URIs at once.
+        """
+        uris = list(uris)
+        found: dict[str, BatchResult[str]] = {}
+        ttl = expiry_bucket(expires_in) if self.url_cache is not None else expires_in
+        for backend, entries in self._split_url_batch(uris, expires_in, found).items():
+            paths = [path for _, path, _ in entries]
+            urls: list[BatchResult[str]] | None = None
+            if backend.has_bulk_urls():
+                try:
+                    signed = self._retrier(backend).call(backend.get_urls, paths, ttl)
+                    urls = [BatchResult(path, signed[path]) for path in paths]
+                except Exception as exc:
+                    logger.warning("Bulk signing failed (%s); signing %d URL(s) one by one.", exc, len(paths))
+            if urls is None:
+                urls = run_bounded(lambda path: backend.get_url(path, expires_in=ttl), paths, max_concurrency)
+            self._remember_urls(entries, urls, expires_in, ttl, found)
+        return [found[uri] for uri in uris]
+
+    def ensure_urls(
+        self, urls: Iterable[str], expires_in: int = 3600, max_concurrency: int = DEFAULT_BATCH_CONCURRENCY
+    ) -> list[BatchResult[str]]:
+        """Batch ensure_url(): URLs that are still fresh come back unchanged, the rest are signed via get_urls()."""
+        urls = list(urls)
+        targets: dict[str, BatchResult[str] | str] = {}
+        for url in dict.fromkeys(urls):
+            try:
+                targets[url] = self._refresh_target(url) or BatchResult(url, url)
+            except Exception as exc:
+                targets[url] = BatchResult(url, error=exc)
+        native = [target for target in targets.values() if isinstance(target, str)]
+        signed = {result.item: result for result in self.get_urls(native, expires_in, max_concurrency)}
+        return [_ensured(url, targets[url], signed) for url in urls]
+
+    async def get_urls_async(
+        self, uris: Iterable[str], expires_in: int = 3600, max_concurrency: int = DEFAULT_BATCH_CONCURRENCY
+    ) -> list[BatchResult[str]]:
+        """Non-blocking get_urls()."""
+        uris = list(uris)
+        found: dict[str, BatchResult[str]] = {}
+        ttl = expiry_bucket(expires_in) if self.url_cache is not None else expires_in
+        for backend, entries in self._split_url_batch(uris, expires_in, found).items():
+            paths = [path for _, path, _ in entries]
+            urls: list[BatchResult[str]] | None = None
+            if backend.has_bulk_urls():
+                try:
+                    signed = await self._retrier(backend).call_async(backend.get_urls_async, paths, ttl)
+                    urls = [BatchResult(path, signed[path]) for path in paths]
+                except Exception as exc:
+                    logger.warning("Bulk signing failed (%s); signing %d URL(s) one by one.", exc, len(paths))
+            if urls is None:
+
+                async def _sign(path: str, backend: StorageBackend = backend) -> str:
+                    return await backend.get_url_async(path, expires_in=ttl)
+
+                urls = await arun_bounded(_sign, paths, max_concurrency)
+            self._remember_urls(entries, urls, expires_in, ttl, found)
+        return [found[uri] for uri in uris]
+
+    async def ensure_urls_async(
+        self, urls: Iterable[str], expires_in: int = 3600, max_concurrency: int = DEFAULT_BATCH_CONCURRENCY
+    ) -> list[BatchResult[str]]:
+        """Non-blocking ensure_urls()."""
+        urls = list(urls)
+        targets: dict[str, BatchResult[str] | str] = {}
+        for url in dict.fromkeys(urls):
+            try:
+                targets[url] = self._refresh_target(url) or BatchResult(url, url)
+            except Exception as exc:
+                targets[url] = BatchResult(url, error=exc)
+        native = [target for target in targets.values() if isinstance(target, str)]
+        signed = {result.item: result for result in await self.get_urls_async(native, expires_in, max_concurrency)}
+        return [_ensured(url, targets[url], signed) for url in urls]
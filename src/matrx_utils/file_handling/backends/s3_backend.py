@@ -13,25 +13,80 @@ Path convention expected by this backend:
 
 If AWS_S3_DEFAULT_BUCKET is set you may omit the bucket segment:
     "path/to/object.ext"  →  "{default_bucket}/path/to/object.ext"
+
+Large transfers are split into parts of ``part_size`` bytes, with up to
+``max_concurrency`` parts in flight at once. Both are constructor
+arguments and plain attributes, so they can be tuned on a live backend:
+
+    router.s3.part_size = 32 * 1024 * 1024
+    router.s3.max_concurrency = 16
+
+Multipart uploads (write, write_stream, upload_file, upload_fileobj) keep
+roughly ``part_size * max_concurrency`` bytes in memory. Objects of at
+least two parts are fetched as concurrent ranged GETs (read,
+download_file). Every range is pinned to the first response's ETag, so a
+concurrent overwrite fails the read instead of mixing two versions.
+append() extends objects of 5 MB and up server-side (UploadPartCopy), so
+it uploads only the new bytes.
+
+The async methods run boto3 on the shared storage I/O pool
+(executors.io_executor()), or on the BoundedExecutor passed as
+``executor``.
 """
 
 from __future__ import annotations
 
 import io
+import itertools
+import os
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from typing import TYPE_CHECKING, Any
 
 from .base_backend import StorageBackend
+from .batch import chunked, group_by_bucket
+from .executors import BoundedExecutor, io_executor
+from .listing import DEFAULT_PAGE_SIZE, FileEntry, clean_etag
+from .streaming import (
+    DEFAULT_CHUNK_SIZE,
+    AsyncByteSource,
+    ByteSource,
+    aiter_chunks,
+    arechunk,
+    content_range_total,
+    iter_chunks,
+    range_header,
+    rechunk,
+)
 
 if TYPE_CHECKING:
+    from boto3.s3.transfer import TransferConfig
     from mypy_boto3_s3 import S3Client
     from mypy_boto3_s3.type_defs import CompletedPartTypeDef
 
 
 _MULTIPART_THRESHOLD: int = 8 * 1024 * 1024  # 8 MB
+_MIN_PART_SIZE: int = 5 * 1024 * 1024  # S3 minimum for every part but the last
+_MAX_PARTS: int = 10_000  # S3 limit per multipart upload
+_MAX_COPY_PART: int = 5 * 1024 * 1024 * 1024  # S3 limit per UploadPartCopy range
+_DEFAULT_CONCURRENCY: int = 8
+_MAX_DELETE_KEYS: int = 1000  # S3 limit per DeleteObjects request
 
 
 class S3Backend(StorageBackend):
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        part_size: int = _MULTIPART_THRESHOLD,
+        max_concurrency: int = _DEFAULT_CONCURRENCY,
+        executor: BoundedExecutor | None = None,
+    ) -> None:
+        if part_size < _MIN_PART_SIZE:
+            raise ValueError(f"S3 part_size must be at least {_MIN_PART_SIZE} bytes, got {part_size}.")
+        if max_concurrency < 1:
+            raise ValueError(f"S3 max_concurrency must be at least 1, got {max_concurrency}.")
+        self.part_size: int = part_size
+        self.max_concurrency: int = max_concurrency
+        self._executor: BoundedExecutor | None = executor  # None = the shared io_executor()
         self._client: S3Client | None = None
         self._default_bucket: str = ""
         self._region: str = "us-east-1"
@@ -82,6 +137,26 @@ class S3Backend(StorageBackend):
     def is_configured(self) -> bool:
         return self._configured
 
+    def _part_size_for(self, total: int | None) -> int:
+        """Return the part size for an upload of *total* bytes (None = unknown).
+
+        Grows past ``part_size`` only when the object would otherwise need
+        more than S3's 10,000 parts.
+        """
+        if total is None:
+            return self.part_size
+        return max(self.part_size, -(-total // _MAX_PARTS))
+
+    def _transfer_config(self) -> TransferConfig:
+        """boto3 managed-transfer settings matching this backend's part size and concurrency."""
+        from boto3.s3.transfer import TransferConfig
+
+        return TransferConfig(
+            multipart_threshold=self.part_size,
+            multipart_chunksize=self.part_size,
+            max_concurrency=self.max_concurrency,
+        )
+
     # ------------------------------------------------------------------
     # Path helpers
     # ------------------------------------------------------------------
@@ -109,11 +184,32 @@ class S3Backend(StorageBackend):
     # ------------------------------------------------------------------
 
     def read(self, path: str) -> bytes:
+        """Read an object. Objects of two parts or more are fetched as concurrent
+        ranged GETs, reusing the first response for part one (no extra HEAD)."""
         self._require_configured()
         bucket, key = self._parse_path(path)
-        response: Any = self._get_client().get_object(Bucket=bucket, Key=key)
-        body: bytes = response["Body"].read()
-        return body
+        client: S3Client = self._get_client()
+        response: Any = client.get_object(Bucket=bucket, Key=key)
+        size: int = response.get("ContentLength", 0)
+        if self.max_concurrency < 2 or size < 2 * self.part_size:
+            body: bytes = response["Body"].read()
+            return body
+
+        try:
+            first: bytes = response["Body"].read(self.part_size)
+        finally:
+            response["Body"].close()
+        etag: str = response.get("ETag", "")
+
+        def fetch(start: int) -> bytes:
+            end: int = min(start + self.part_size, size) - 1
+            extra: dict[str, str] = {"IfMatch": etag} if etag else {}
+            part: Any = client.get_object(Bucket=bucket, Key=key, Range=f"bytes={start}-{end}", **extra)
+            return part["Body"].read()
+
+        with ThreadPoolExecutor(self.max_concurrency, thread_name_prefix="s3-range") as pool:
+            rest: list[bytes] = list(pool.map(fetch, range(len(first), size, self.part_size)))
+        return b"".join([first, *rest])
 
     def write(self, path: str, content: bytes | str, acl: str = "private") -> bool:
         self._require_configured()
@@ -121,9 +217,10 @@ class S3Backend(StorageBackend):
         client: S3Client = self._get_client()
 
         raw: bytes = content.encode() if isinstance(content, str) else content
+        part_size: int = self._part_size_for(len(raw))
 
-        if len(raw) >= _MULTIPART_THRESHOLD:
-            self._multipart_upload(client, bucket, key, raw, acl)
+        if len(raw) >= part_size:
+            self._multipart_upload(client, bucket, key, iter_chunks(raw, part_size), acl)
         else:
             client.put_object(Bucket=bucket, Key=key, Body=raw, ACL=acl)  # type: ignore[arg-type]
         return True
@@ -133,43 +230,205 @@ class S3Backend(StorageBackend):
         client: S3Client,
         bucket: str,
         key: str,
-        content: bytes,
+        parts: Iterable[bytes],
         acl: str,
     ) -> None:
+        """Upload *parts* (each at least 5 MB except the last) as one multipart object.
+
+        Up to ``max_concurrency`` parts upload at once. *parts* is only pulled
+        when a slot frees up, so a lazy source keeps memory bounded.
+        """
         mpu: Any = client.create_multipart_upload(Bucket=bucket, Key=key, ACL=acl)  # type: ignore[arg-type]
         upload_id: str = mpu["UploadId"]
-        parts: list[CompletedPartTypeDef] = []
-        chunk_size: int = _MULTIPART_THRESHOLD
+        completed: list[CompletedPartTypeDef] = []
         try:
-            for i, offset in enumerate(range(0, len(content), chunk_size), start=1):
-                chunk: bytes = content[offset : offset + chunk_size]
-                part: Any = client.upload_part(
-                    Bucket=bucket,
-                    Key=key,
-                    PartNumber=i,
-                    UploadId=upload_id,
-                    Body=chunk,
-                )
-                parts.append({"PartNumber": i, "ETag": part["ETag"]})
+            with ThreadPoolExecutor(self.max_concurrency, thread_name_prefix="s3-part") as pool:
+                in_flight: set[Future[CompletedPartTypeDef]] = set()
+                pending: Iterator[tuple[int, bytes]] = enumerate(parts, start=1)
+                try:
+                    while True:
+                        if len(in_flight) >= self.max_concurrency:
+                            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                            completed.extend(f.result() for f in done)
+                        item: tuple[int, bytes] | None = next(pending, None)
+                        if item is None:
+                            break
+                        in_flight.add(pool.submit(self._upload_part, client, bucket, key, upload_id, *item))
+                    completed.extend(f.result() for f in wait(in_flight).done)
+                except BaseException:
+                    for f in in_flight:
+                        f.cancel()
+                    raise
+            completed.sort(key=lambda p: p["PartNumber"])
             client.complete_multipart_upload(
                 Bucket=bucket,
                 Key=key,
                 UploadId=upload_id,
-                MultipartUpload={"Parts": parts},
+                MultipartUpload={"Parts": completed},
             )
-        except Exception:
+        except BaseException:
             client.abort_multipart_upload(Bucket=bucket, Key=key, UploadId=upload_id)
             raise
 
-    def append(self, path: str, content: bytes | str) -> bool:
+    @staticmethod
+    def _upload_part(
+        client: S3Client, bucket: str, key: str, upload_id: str, number: int, body: bytes
+    ) -> CompletedPartTypeDef:
+        part: Any = client.upload_part(
+            Bucket=bucket,
+            Key=key,
+            PartNumber=number,
+            UploadId=upload_id,
+            Body=body,
+        )
+        return {"PartNumber": number, "ETag": part["ETag"]}
+
+    # ------------------------------------------------------------------
+    # Ranged reads
+    # ------------------------------------------------------------------
+
+    def _read_range(self, path: str, start: int, end: int | None) -> tuple[bytes, int | None]:
+        """Ranged GET. A start past the end of the object (InvalidRange) reads as empty."""
+        from botocore.exceptions import ClientError
+
         self._require_configured()
+        bucket, key = self._parse_path(path)
         try:
-            existing: bytes = self.read(path)
-        except Exception:
-            existing = b""
+            response: Any = self._get_client().get_object(Bucket=bucket, Key=key, Range=range_header(start, end))
+        except ClientError as exc:
+            error: dict[str, Any] = exc.response.get("Error", {})
+            if error.get("Code") != "InvalidRange":
+                raise
+            size: str = str(error.get("ActualObjectSize", ""))
+            return b"", int(size) if size.isdigit() else None
+        try:
+            data: bytes = response["Body"].read()
+        finally:
+            response["Body"].close()
+        return data, content_range_total(response.get("ContentRange"))
 
+    # ------------------------------------------------------------------
+    # Conditional reads
+    # ------------------------------------------------------------------
+
+    def _read_if_changed(self, path: str, etag: str | None) -> tuple[bytes | None, str | None]:
+        """GET with If-None-Match; S3 answers 304 (raised as ClientError) when unchanged."""
+        from botocore.exceptions import ClientError
+
+        self._require_configured()
+        bucket, key = self._parse_path(path)
+        extra: dict[str, str] = {"IfNoneMatch": etag} if etag else {}
+        try:
+            response: Any = self._get_client().get_object(Bucket=bucket, Key=key, **extra)
+        except ClientError as exc:
+            if etag and exc.response.get("ResponseMetadata", {}).get("HTTPStatusCode") == 304:
+                return None, etag
+            raise
+        data: bytes = response["Body"].read()
+        return data, response.get("ETag") or None
+
+    # ------------------------------------------------------------------
+    # Streaming
+    # ------------------------------------------------------------------
+
+    def read_stream(self, path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+        self._require_configured()
+        bucket, key = self._parse_path(path)
+        body: Any = self._get_client().get_object(Bucket=bucket, Key=key)["Body"]
+        try:
+            yield from body.iter_chunks(chunk_size)
+        finally:
+            body.close()
+
+    def write_stream(self, path: str, source: ByteSource, acl: str = "private") -> bool:
+        """Stream *source* to S3. Objects under one part go up in a single PUT;
+        larger ones as concurrent multipart parts, about ``max_concurrency``
+        parts held in memory. A local file path source is read part by part."""
+        self._require_configured()
+        bucket, key = self._parse_path(path)
+        client: S3Client = self._get_client()
+
+        part_size: int = self._part_size_for(os.path.getsize(source) if isinstance(source, os.PathLike) else None)
+        parts: Iterator[bytes] = rechunk(iter_chunks(source, part_size), part_size)
+        first: bytes = next(parts, b"")
+        if len(first) < part_size:
+            client.put_object(Bucket=bucket, Key=key, Body=first, ACL=acl)  # type: ignore[arg-type]
+        else:
+            self._multipart_upload(client, bucket, key, itertools.chain([first], parts), acl)
+        return True
+
+    def append(self, path: str, content: bytes | str) -> bool:
+        """Append *content* to the object at *path*, creating it if missing.
+
+        An object of at least 5 MB is extended server-side. A multipart
+        upload copies the current object into its leading parts
+        (UploadPartCopy, pinned to the object's ETag) and sends *content*
+        as the last part, so only *content* crosses the wire. A smaller
+        object is read, extended and rewritten, which is cheap at that size.
+        """
+        from botocore.exceptions import ClientError
+
+        self._require_configured()
+        bucket, key = self._parse_path(path)
+        client: S3Client = self._get_client()
         raw: bytes = content.encode() if isinstance(content, str) else content
-        return self.write(path, existing + raw)
+        try:
+            head: Any = client.head_object(Bucket=bucket, Key=key)
+        except ClientError as exc:
+            if exc.response.get("Error", {}).get("Code") not in ("404", "NoSuchKey", "NotFound"):
+                raise
+            return self.write(path, raw)
+
+        size: int = head["ContentLength"]
+        if size < _MIN_PART_SIZE:
+            return self.write(path, self.read(path) + raw)
+        if raw:
+            self._append_by_copy(client, bucket, key, size, head["ETag"], head.get("ContentType"), raw)
+        return True
+
+    @staticmethod
+    def _copy_ranges(size: int) -> list[tuple[int, int]]:
+        """Split ``[0, size)`` into as few near-equal ranges as UploadPartCopy allows."""
+        count: int = -(-size // _MAX_COPY_PART)
+        step: int = -(-size // count)
+        return [(start, min(start + step, size)) for start in range(0, size, step)]
+
+    def _append_by_copy(
+        self,
+        client: S3Client,
+        bucket: str,
+        key: str,
+        size: int,
+        etag: str,
+        content_type: str | None,
+        raw: bytes,
+    ) -> None:
+        extra: dict[str, str] = {"ContentType": content_type} if content_type else {}
+        mpu: Any = client.create_multipart_upload(Bucket=bucket, Key=key, ACL="private", **extra)  # type: ignore[arg-type]
+        upload_id: str = mpu["UploadId"]
+        try:
+            completed: list[CompletedPartTypeDef] = []
+            for number, (start, end) in enumerate(self._copy_ranges(size), start=1):
+                part: Any = client.upload_part_copy(
+                    Bucket=bucket,
+                    Key=key,
+                    PartNumber=number,
+                    UploadId=upload_id,
+                    CopySource={"Bucket": bucket, "Key": key},
+                    CopySourceRange=f"bytes={start}-{end - 1}",
+                    CopySourceIfMatch=etag,
+                )
+                completed.append({"PartNumber": number, "ETag": part["CopyPartResult"]["ETag"]})
+            completed.append(self._upload_part(client, bucket, key, upload_id, len(completed) + 1, raw))
+            client.complete_multipart_upload(
+                Bucket=bucket,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": completed},
+            )
+        except BaseException:
+            client.abort_multipart_upload(Bucket=bucket, Key=key, UploadId=upload_id)
+            raise
 
     def delete(self, path: str) -> bool:
         self._require_configured()
@@ -177,6 +436,36 @@ class S3Backend(StorageBackend):
         self._get_client().delete_object(Bucket=bucket, Key=key)
         return True
 
+    def delete_many(self, paths: list[str]) -> dict[str, Exception | None]:
+        """Bulk delete with DeleteObjects, up to 1000 keys per request per bucket.
+
+        Per-key failures come back as ClientError instances built from the
+        response's Errors list, so the router can retry just those keys.
+        """
+        from botocore.exceptions import ClientError
+
+        self._require_configured()
+        client: S3Client = self._get_client()
+        groups, results = group_by_bucket(paths, self._parse_path)
+        for bucket, entries in groups.items():
+            for batch in chunked(entries, _MAX_DELETE_KEYS):
+                try:
+                    response: Any = client.delete_objects(
+                        Bucket=bucket,
+                        Delete={"Objects": [{"Key": key} for _, key in batch], "Quiet": True},
+                    )
+                except Exception as exc:
+                    results.update((path, exc) for path, _ in batch)
+                    continue
+                errors: dict[str, Any] = {err["Key"]: err for err in response.get("Errors", [])}
+                for path, key in batch:
+                    err = errors.get(key)
+                    results[path] = None if err is None else ClientError(
+                        {"Error": {"Code": err.get("Code", ""), "Message": err.get("Message", "")}},
+                        "DeleteObjects",
+                    )
+        return results
+
     # ------------------------------------------------------------------
     # URL generation
     # ------------------------------------------------------------------
@@ -191,6 +480,10 @@ class S3Backend(StorageBackend):
         )
         return url
 
+    def get_urls(self, paths: list[str], expires_in: int = 3600) -> dict[str, str]:
+        """Presign every path locally — presigning needs no request to S3."""
+        return {path: self.get_url(path, expires_in) for path in paths}
+
     def make_public_url(self, path: str) -> str:
         """Return the permanent public URL (only works for public-read objects)."""
         bucket, key = self._parse_path(path)
@@ -201,6 +494,22 @@ class S3Backend(StorageBackend):
     # ------------------------------------------------------------------
 
     def list_files(self, prefix: str = "") -> list[str]:
+        return [entry.path for entry in self.iter_files(prefix)]
+
+    def iter_files(
+        self,
+        prefix: str = "",
+        recursive: bool = True,
+        with_metadata: bool = False,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> Iterator[FileEntry]:
+        """Lazily list *prefix* with ListObjectsV2, *page_size* keys per request."""
+        for page in self._list_pages(prefix, recursive, with_metadata, page_size):
+            yield from page
+
+    def _list_pages(
+        self, prefix: str, recursive: bool, with_metadata: bool, page_size: int
+    ) -> Iterator[list[FileEntry]]:
         self._require_configured()
         client: S3Client = self._get_client()
         bucket: str
@@ -217,26 +526,54 @@ class S3Backend(StorageBackend):
                 "no bucket specified and AWS_S3_DEFAULT_BUCKET is not set."
             )
 
+        params: dict[str, Any] = {"Bucket": bucket, "Prefix": key_prefix, "PaginationConfig": {"PageSize": page_size}}
+        if not recursive:
+            params["Delimiter"] = "/"
         paginator: Any = client.get_paginator("list_objects_v2")
-        results: list[str] = []
-        for page in paginator.paginate(Bucket=bucket, Prefix=key_prefix):
+        for page in paginator.paginate(**params):
+            entries: list[FileEntry] = [
+                FileEntry(f"{bucket}/{common['Prefix']}", is_dir=True) for common in page.get("CommonPrefixes", [])
+            ]
             for obj in page.get("Contents", []):
-                results.append(f"{bucket}/{obj['Key']}")
-        return results
+                if with_metadata:
+                    entries.append(
+                        FileEntry(
+                            f"{bucket}/{obj['Key']}",
+                            size=obj.get("Size"),
+                            etag=clean_etag(obj.get("ETag")),
+                            last_modified=obj.get("LastModified"),
+                        )
+                    )
+                else:
+                    entries.append(FileEntry(f"{bucket}/{obj['Key']}"))
+            yield entries
 
     # ------------------------------------------------------------------
     # Copy / move helpers (convenience, not in ABC)
     # ------------------------------------------------------------------
 
     def copy(self, src_path: str, dst_path: str) -> bool:
-        """Server-side copy within S3 — no data transfer to/from client."""
+        """Server-side copy within S3 — no data transfer to/from client.
+
+        Copying an object onto itself rewrites it in place with the same
+        content type and metadata, which refreshes its LastModified time.
+        """
         self._require_configured()
         src_bucket, src_key = self._parse_path(src_path)
         dst_bucket, dst_key = self._parse_path(dst_path)
-        self._get_client().copy_object(
+        client = self._get_client()
+        extra: dict[str, Any] = {}
+        if (src_bucket, src_key) == (dst_bucket, dst_key):
+            # S3 rejects a self-copy that does not replace the metadata.
+            head: Any = client.head_object(Bucket=src_bucket, Key=src_key)
+            extra = {"MetadataDirective": "REPLACE", "Metadata": head.get("Metadata", {})}
+            if head.get("ContentType"):
+                extra["ContentType"] = head["ContentType"]
+        client.copy_object(
             CopySource={"Bucket": src_bucket, "Key": src_key},
             Bucket=dst_bucket,
             Key=dst_key,
+            **extra,
         )
         return True
 
@@ -254,24 +591,28 @@ class S3Backend(StorageBackend):
         }
 
     def upload_file(self, local_path: str, s3_path: str, acl: str = "private") -> bool:
-        """Upload a local file to S3 using streaming (memory-efficient)."""
+        """Upload a local file to S3 in concurrent parts (memory-efficient)."""
         self._require_configured()
         bucket, key = self._parse_path(s3_path)
-        self._get_client().upload_file(local_path, bucket, key, ExtraArgs={"ACL": acl})
+        self._get_client().upload_file(
+            local_path, bucket, key, ExtraArgs={"ACL": acl}, Config=self._transfer_config()
+        )
         return True
 
     def download_file(self, s3_path: str, local_path: str) -> bool:
-        """Download an S3 object to a local file path."""
+        """Download an S3 object to a local file path as concurrent ranged GETs."""
         self._require_configured()
         bucket, key = self._parse_path(s3_path)
-        self._get_client().download_file(bucket, key, local_path)
+        self._get_client().download_file(bucket, key, local_path, Config=self._transfer_config())
         return True
 
     def upload_fileobj(self, file_obj: io.IOBase, s3_path: str, acl: str = "private") -> bool:
-        """Upload a file-like object to S3."""
+        """Upload a file-like object to S3 in concurrent parts."""
         self._require_configured()
         bucket, key = self._parse_path(s3_path)
-        self._get_client().upload_fileobj(file_obj, bucket, key, ExtraArgs={"ACL": acl})
+        self._get_client().upload_fileobj(
+            file_obj, bucket, key, ExtraArgs={"ACL": acl}, Config=self._transfer_config()
+        )
         return True
 
     # ------------------------------------------------------------------
@@ -281,37 +622,113 @@ class S3Backend(StorageBackend):
     # boto3 version. The correct non-blocking pattern for boto3 in async
     # applications is to run sync calls in a thread-pool executor — the
     # event loop is never blocked; I/O waits happen in worker threads.
+    # That pool is the storage I/O executor (executors.py), not the loop's
+    # default one, so media processing cannot starve S3 calls or vice versa.
+
+    async def _run(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Any:
+        return await (self._executor or io_executor()).run(fn, *args, **kwargs)
 
     async def read_async(self, path: str) -> bytes:
-        import asyncio
-        return await asyncio.get_event_loop().run_in_executor(None, self.read, path)
+        return await self._run(self.read, path)
 
     async def write_async(self, path: str, content: bytes | str, acl: str = "private") -> bool:
-        import asyncio
-        return await asyncio.get_event_loop().run_in_executor(None, self.write, path, content, acl)
+        return await self._run(self.write, path, content, acl)
 
     async def append_async(self, path: str, content: bytes | str) -> bool:
-        import asyncio
-        return await asyncio.get_event_loop().run_in_executor(None, self.append, path, content)
+        return await self._run(self.append, path, content)
 
     async def delete_async(self, path: str) -> bool:
-        import asyncio
-        return await asyncio.get_event_loop().run_in_executor(None, self.delete, path)
+        return await self._run(self.delete, path)
+
+    async def delete_many_async(self, paths: list[str]) -> dict[str, Exception | None]:
+        return await self._run(self.delete_many, paths)
 
     async def get_url_async(self, path: str, expires_in: int = 3600) -> str:
-        import asyncio
-        return await asyncio.get_event_loop().run_in_executor(
-            None, self.get_url, path, expires_in
-        )
+        return await self._run(self.get_url, path, expires_in)
+
+    async def get_urls_async(self, paths: list[str], expires_in: int = 3600) -> dict[str, str]:
+        return self.get_urls(paths, expires_in)
 
     async def list_files_async(self, prefix: str = "") -> list[str]:
+        return await self._run(self.list_files, prefix)
+
+    async def iter_files_async(
+        self,
+        prefix: str = "",
+        recursive: bool = True,
+        with_metadata: bool = False,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> AsyncIterator[FileEntry]:
+        pages: Iterator[list[FileEntry]] = self._list_pages(prefix, recursive, with_metadata, page_size)
+        try:
+            while (page := await self._run(next, pages, None)) is not None:
+                for entry in page:
+                    yield entry
+        finally:
+            pages.close()  # type: ignore[attr-defined]
+
+    async def _read_range_async(self, path: str, start: int, end: int | None) -> tuple[bytes, int | None]:
+        return await self._run(self._read_range, path, start, end)
+
+    async def _read_if_changed_async(self, path: str, etag: str | None) -> tuple[bytes | None, str | None]:
+        return await self._run(self._read_if_changed, path, etag)
+
+    async def read_stream_async(self, path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncIterator[bytes]:
+        chunks: Iterator[bytes] = self.read_stream(path, chunk_size)
+        try:
+            while (chunk := await self._run(next, chunks, None)) is not None:
+                yield chunk
+        finally:
+            chunks.close()  # type: ignore[attr-defined]
+
+    async def write_stream_async(self, path: str, source: AsyncByteSource, acl: str = "private") -> bool:
         import asyncio
-        return await asyncio.get_event_loop().run_in_executor(None, self.list_files, prefix)
+        self._require_configured()
+        bucket, key = self._parse_path(path)
+        client: S3Client = self._get_client()
+
+        def call(fn, *args, **kwargs) -> asyncio.Future[Any]:
+            return asyncio.ensure_future(self._run(fn, *args, **kwargs))
+
+        part_size: int = self._part_size_for(os.path.getsize(source) if isinstance(source, os.PathLike) else None)
+        parts: AsyncIterator[bytes] = arechunk(aiter_chunks(source, part_size), part_size)
+        first: bytes = await anext(parts, b"")
+        if len(first) < part_size:
+            await call(client.put_object, Bucket=bucket, Key=key, Body=first, ACL=acl)
+            return True
+
+        mpu: Any = await call(client.create_multipart_upload, Bucket=bucket, Key=key, ACL=acl)
+        upload_id: str = mpu["UploadId"]
+        completed: list[CompletedPartTypeDef] = []
+        in_flight: set[asyncio.Future[CompletedPartTypeDef]] = set()
+        try:
+            number: int = 1
+            chunk: bytes | None = first
+            while chunk is not None:
+                in_flight.add(call(self._upload_part, client, bucket, key, upload_id, number, chunk))
+                if len(in_flight) >= self.max_concurrency:
+                    done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                    completed.extend(f.result() for f in done)
+                number, chunk = number + 1, await anext(parts, None)
+            completed.extend(await asyncio.gather(*in_flight))
+            in_flight.clear()
+            completed.sort(key=lambda p: p["PartNumber"])
+            await call(
+                client.complete_multipart_upload,
+                Bucket=bucket,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": completed},
+            )
+        except BaseException:
+            if in_flight:
+                await asyncio.wait(in_flight)
+            await call(client.abort_multipart_upload, Bucket=bucket, Key=key, UploadId=upload_id)
+            raise
+        return True
 
     async def copy_async(self, src_path: str, dst_path: str) -> bool:
-        import asyncio
-        return await asyncio.get_event_loop().run_in_executor(None, self.copy, src_path, dst_path)
+        return await self._run(self.copy, src_path, dst_path)
 
     async def get_metadata_async(self, path: str) -> dict[str, Any]:
-        import asyncio
-        return await asyncio.get_event_loop().run_in_executor(None, self.get_metadata, path)
+        return await self._run(self.get_metadata, path)
@@ -0,0 +1,402 @@
+"""Append-optimised objects stored as a series of small segment objects.
+
+Supabase Storage cannot extend an object server-side, so a plain append
+downloads the whole object and uploads it again. For a log that grows
+by a few KB at a time, that makes every append O(object size).
+SegmentedObject stores each append as its own object under
+``<uri>.segments/``, so an append is one small PUT. A read lists the
+segments and concatenates them in order.
+
+    log = router.segmented("supabase://logs/jobs/42.jsonl")
+    log.append(b'{"step": 1}\\n')        # one PUT of 12 bytes
+    data = log.read()
+
+Segment names encode the range of append IDs they hold, as
+``<first>-<last>``. An ID is a nanosecond timestamp plus a random suffix,
+so names sort in append order. Compaction merges a run of small segments
+into one segment named after the whole range, and only then deletes the
+originals. A reader that lists in between sees both, keeps the widest
+range and skips the segments it covers, so it never reads data twice.
+Compaction runs on a background thread every ``compact_after`` appends
+and merges segments into pieces of up to ``target_size`` bytes. Larger
+segments, and segments whose size the listing does not report, are
+left alone, so no append ever rewrites the whole object.
+
+Only segments older than ``min_age`` seconds are compacted, which leaves
+time for a slow writer's in-flight PUT to land before its range is merged.
+
+The segments prefix is the marker: a URI with objects under
+``<uri>.segments/`` is segmented, whichever router or process looks. The
+first append or read through a SegmentedObject whose prefix is still
+empty copies the bytes already stored at *uri* into a seed segment that
+sorts before every append, so existing content is kept. On a router that
+has the URI open (router.segmented(), or an append on Supabase, which
+finds the prefix by itself), read, read_stream, read_range,
+open_seekable, write, delete and get_url all go through the segments.
+get_url() first writes the concatenated segments to *uri*, so the signed
+URL serves the current content. A router that never opened the URI
+still reads the object at *uri* as it was.
+"""
+
+from __future__ import annotations
+
+import logging
+import secrets
+import threading
+import time
+from collections.abc import AsyncIterator, Iterator
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from .listing import FileEntry
+from .retry import is_not_found
+
+if TYPE_CHECKING:
+    from .router import BackendRouter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_COMPACT_AFTER: int = 64
+DEFAULT_TARGET_SIZE: int = 64 * 1024 * 1024
+DEFAULT_MIN_AGE: float = 60.0
+
+_SUFFIX: str = ".segments/"
+_TIMESTAMP_DIGITS: int = 20
+_SEED_ID: str = "0" * (_TIMESTAMP_DIGITS + 8)
+
+
+@dataclass(frozen=True)
+class _Segment:
+    name: str
+    first: str
+    last: str
+    size: int | None
+
+
+def segments_prefix(uri: str) -> str:
+    """Where the segments of *uri* live: ``<uri>.segments/``."""
+    return uri.rstrip("/") + _SUFFIX
+
+
+def _new_id() -> str:
+    return f"{time.time_ns():0{_TIMESTAMP_DIGITS}d}{secrets.token_hex(4)}"
+
+
+def _id_time_ns(segment_id: str) -> int:
+    return int(segment_id[:_TIMESTAMP_DIGITS])
+
+
+def _parse(name: str, size: int | None) -> _Segment | None:
+    first, sep, last = name.partition("-")
+    if not sep or len(first) != len(last) or not first[:_TIMESTAMP_DIGITS].isdigit():
+        return None
+    return _Segment(name, first, last, size)
+
+
+def _cover(segments: list[_Segment]) -> list[_Segment]:
+    """The segments to read, in order: the widest range wins over the ranges inside it."""
+    ordered = sorted(sorted(segments, key=lambda s: s.last, reverse=True), key=lambda s: s.first)
+    chosen: list[_Segment] = []
+    for segment in ordered:
+        if chosen and segment.first <= chosen[-1].last:
+            continue
+        chosen.append(segment)
+    return chosen
+
+
+def _runs(segments: list[_Segment], target_size: int) -> list[list[_Segment]]:
+    """Group consecutive small segments into runs of at most *target_size* bytes.
+
+    A segment whose size the listing did not report is treated as large:
+    it is never merged, and it ends the run before it.
+    """
+    runs: list[list[_Segment]] = [[]]
+    total = 0
+    for segment in segments:
+        size = target_size if segment.size is None else segment.size
+        if size >= target_size or total + size > target_size:
+            runs.append([])
+            total = 0
+            if size >= target_size:
+                continue
+        runs[-1].append(segment)
+        total += size
+    return [run for run in runs if len(run) > 1]
+
+
+def _total_size(segments: list[_Segment]) -> int | None:
+    if any(segment.size is None for segment in segments):
+        return None
+    return sum(segment.size for segment in segments)  # type: ignore[misc]
+
+
+class SegmentedObject:
+    """An append-only object kept as segments under ``<uri>.segments/`` (see module docstring)."""
+
+    def __init__(
+        self,
+        router: BackendRouter,
+        uri: str,
+        compact_after: int = DEFAULT_COMPACT_AFTER,
+        target_size: int = DEFAULT_TARGET_SIZE,
+        min_age: float = DEFAULT_MIN_AGE,
+    ) -> None:
+        self.router = router
+        self.uri = uri
+        self.prefix = segments_prefix(uri)
+        self.compact_after = compact_after
+        self.target_size = target_size
+        self.min_age = min_age
+        self._lock = threading.Lock()
+        self._compacting = threading.Lock()
+        self._appends = 0
+        self._seeded = False
+
+    # ------------------------------------------------------------------
+    # Append / read
+    # ------------------------------------------------------------------
+
+    def append(self, content: bytes | str) -> bool:
+        """Store *content* as a new segment; one PUT, whatever the object's size."""
+        self._seed()
+        segment_id = _new_id()
+        self.router.write(f"{self.prefix}{segment_id}-{segment_id}", content)
+        self._appended()
+        return True
+
+    async def append_async(self, content: bytes | str) -> bool:
+        await self._seed_async()
+        segment_id = _new_id()
+        await self.router.write_async(f"{self.prefix}{segment_id}-{segment_id}", content)
+        self._appended()
+        return True
+
+    def segments(self) -> list[str]:
+        """URIs of the segments that make up the object, in append order."""
+        self._seed()
+        return [self.prefix + segment.name for segment in self._list()]
+
+    async def segments_async(self) -> list[str]:
+        await self._seed_async()
+        return [self.prefix + segment.name for segment in await self._list_async()]
+
+    def read(self) -> bytes:
+        """The whole object: every segment, concatenated. Empty if nothing was appended.
+
+        If a segment vanishes between listing and reading (a compaction
+        merged it), the segments are listed and read once more.
+        """
+        results = self.router.read_many(self.segments())
+        if not all(result.ok for result in results):
+            results = self.router.read_many(self.segments())
+        return b"".join(result.unwrap() for result in results)
+
+    async def read_async(self) -> bytes:
+        results = await self.router.read_many_async(await self.segments_async())
+        if not all(result.ok for result in results):
+            results = await self.router.read_many_async(await self.segments_async())
+        return b"".join(result.unwrap() for result in results)
+
+    def read_range(self, start: int, end: int | None = None) -> bytes:
+        """Bytes ``[start, end)`` of the object, fetching only the segments they span."""
+        return b"".join(self.iter_range(start, end))
+
+    async def read_range_async(self, start: int, end: int | None = None) -> bytes:
+        return b"".join([piece async for piece in self.iter_range_async(start, end)])
+
+    def fetch_range(self, start: int, end: int | None) -> tuple[bytes, int | None]:
+        """read_range() plus the object's total size, for RangeReader."""
+        self._seed()
+        return self.read_range(start, end), _total_size(self._list())
+
+    def iter_range(self, start: int = 0, end: int | None = None) -> Iterator[bytes]:
+        """Yield bytes ``[start, end)`` one segment (or part of one) at a time.
+
+        Offsets come from the listed segment sizes. If a segment vanishes
+        mid-read (a compaction merged it), the segments are listed again
+        and reading resumes at the same offset in the merged segment.
+        """
+        self._seed()
+        position = start
+        failed_at: int | None = None
+        while True:
+            segments = self._list()
+            try:
+                offset = 0
+                for segment in segments:
+                    if end is not None and offset >= end:
+                        return
+                    uri = self.prefix + segment.name
+                    size = segment.size
+                    data = None
+                    if size is None:
+                        data = self.router.read(uri)
+                        size = len(data)
+                    if offset + size > position:
+                        lo = position - offset
+                        hi = None if end is None or end >= offset + size else end - offset
+                        piece = data[lo:hi] if data is not None else self.router.read_range(uri, lo, hi)
+                        position += len(piece)
+                        yield piece
+                    offset += size
+                return
+            except Exception as exc:
+                if not is_not_found(exc) or failed_at == position:
+                    raise
+                failed_at = position
+
+    async def iter_range_async(self, start: int = 0, end: int | None = None) -> AsyncIterator[bytes]:
+        await self._seed_async()
+        position = start
+        failed_at: int | None = None
+        while True:
+            segments = await self._list_async()
+            try:
+                offset = 0
+                for segment in segments:
+                    if end is not None and offset >= end:
+                        return
+                    uri = self.prefix + segment.name
+                    size = segment.size
+                    data = None
+                    if size is None:
+                        data = await self.router.read_async(uri)
+                        size = len(data)
+                    if offset + size > position:
+                        lo = position - offset
+                        hi = None if end is None or end >= offset + size else end - offset
+                        piece = data[lo:hi] if data is not None else await self.router.read_range_async(uri, lo, hi)
+                        position += len(piece)
+                        yield piece
+                    offset += size
+                return
+            except Exception as exc:
+                if not is_not_found(exc) or failed_at == position:
+                    raise
+                failed_at = position
+
+    # ------------------------------------------------------------------
+    # Seed / reset
+    # ------------------------------------------------------------------
+
+    def clear(self) -> None:
+        """Delete every segment. The next append or read seeds again from the object at *uri*."""
+        stale = [self.prefix + segment.name for segment in self._list_all()]
+        if stale:
+            self.router.delete_many(stale)
+        self._seeded = False
+
+    async def clear_async(self) -> None:
+        stale = [self.prefix + segment.name for segment in await self._list_all_async()]
+        if stale:
+            await self.router.delete_many_async(stale)
+        self._seeded = False
+
+    def _seed(self) -> None:
+        """Copy the object already at *uri* into the first segment, if no segments exist yet.
+
+        The seed segment has a fixed name that sorts before every append ID,
+        so two routers seeding at once write the same object.
+        """
+        if self._seeded:
+            return
+        if not self._list_all():
+            backend, path = self.router._resolve(self.uri)
+            try:
+                existing = self.router._retrier(backend).call(backend.read, path)
+            except Exception as exc:
+                if not is_not_found(exc):
+                    raise
+                existing = b""
+            if existing:
+                self.router.write(f"{self.prefix}{_SEED_ID}-{_SEED_ID}", existing)
+        self._seeded = True
+
+    async def _seed_async(self) -> None:
+        if self._seeded:
+            return
+        if not await self._list_all_async():
+            backend, path = self.router._resolve(self.uri)
+            try:
+                existing = await self.router._retrier(backend).call_async(backend.read_async, path)
+            except Exception as exc:
+                if not is_not_found(exc):
+                    raise
+                existing = b""
+            if existing:
+                await self.router.write_async(f"{self.prefix}{_SEED_ID}-{_SEED_ID}", existing)
+        self._seeded = True
+
+    # ------------------------------------------------------------------
+    # Compaction
+    # ------------------------------------------------------------------
+
+    def compact(self, min_age: float | None = None) -> int:
+        """Merge runs of small segments older than *min_age* seconds.
+
+        Returns the number of segments merged away. The originals are
+        deleted after the merged segment is written, together with any
+        segments left hidden by an earlier compaction whose delete failed.
+        """
+        min_age = self.min_age if min_age is None else min_age
+        cutoff = time.time_ns() - int(min_age * 1e9)
+        with self._compacting:
+            listed = self._list_all()
+            visible = _cover(listed)
+            hidden = set(listed).difference(visible)
+            eligible: list[_Segment] = []
+            for segment in visible:
+                if _id_time_ns(segment.last) >= cutoff:
+                    break
+                eligible.append(segment)
+
+            merged: list[_Segment] = []
+            for run in _runs(eligible, self.target_size):
+                parts = self.router.read_many([self.prefix + segment.name for segment in run])
+                data = b"".join(part.unwrap() for part in parts)
+                self.router.write(f"{self.prefix}{run[0].first}-{run[-1].last}", data)
+                merged.extend(run)
+
+            stale = [self.prefix + segment.name for segment in (*merged, *hidden)]
+            if stale:
+                self.router.delete_many(stale)
+            return len(merged)
+
+    def _appended(self) -> None:
+        if not self.compact_after:
+            return
+        with self._lock:
+            self._appends += 1
+            if self._appends < self.compact_after or self._compacting.locked():
+                return
+            self._appends = 0
+        threading.Thread(target=self._compact_in_background, name="matrx-segment-compact", daemon=True).start()
+
+    def _compact_in_background(self) -> None:
+        try:
+            self.compact()
+        except Exception as exc:
+            logger.warning("Background compaction of %s failed: %s", self.uri, exc)
+
+    # ------------------------------------------------------------------
+    # Listing
+    # ------------------------------------------------------------------
+
+    def _parse_entry(self, entry: FileEntry) -> _Segment | None:
+        if entry.is_dir or not entry.path.startswith(self.prefix):
+            return None
+        return _parse(entry.path[len(self.prefix) :], entry.size)
+
+    def _list_all(self) -> list[_Segment]:
+        entries = self.router.iter_files(self.prefix, with_metadata=True)
+        return [segment for segment in map(self._parse_entry, entries) if segment is not None]
+
+    def _list(self) -> list[_Segment]:
+        return _cover(self._list_all())
+
+    async def _list_all_async(self) -> list[_Segment]:
+        segments = [self._parse_entry(entry) async for entry in self.router.iter_files_async(self.prefix, with_metadata=True)]
+        return [segment for segment in segments if segment is not None]
+
+    async def _list_async(self) -> list[_Segment]:
+        return _cover(await self._list_all_async())
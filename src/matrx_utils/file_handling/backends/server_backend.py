@@ -5,13 +5,30 @@ Auto-configures from environment variables (or a matrx_utils settings object):
     FILE_SERVER_BASE_URL — required (e.g. https://files.myapp.com)
     FILE_SERVER_API_KEY  — required (sent as "Authorization: Bearer <key>")
     FILE_SERVER_TIMEOUT  — optional, seconds (default: 30)
+    FILE_SERVER_MAX_CONNECTIONS — optional, connection pool size (default: 20)
+    FILE_SERVER_HTTP2    — optional, "true" to negotiate HTTP/2 on async calls
+                           (needs the h2 package: pip install httpx[http2])
+
+Connections are pooled and kept alive. The sync API shares one
+requests.Session whose pool holds FILE_SERVER_MAX_CONNECTIONS connections.
+The async API shares one httpx.AsyncClient per event loop with the same
+limit (see http_pool.py). Call close() / await aclose() on shutdown to
+release them.
 
 Expected REST conventions on the server side:
 
-    GET    /files/{path}         → 200 + raw bytes body
-    PUT    /files/{path}         → 200/201 on success
+    GET    /files/{path}         → 200 + raw bytes body (streamed by read_stream);
+                                   an ETag header makes the object cacheable, and
+                                   If-None-Match → 304 revalidates it cheaply
+    GET    /files/{path} + Range → 206 + the range (read_range; a server that
+                                   ignores Range works too, just less efficiently)
+    PUT    /files/{path}         → 200/201 on success (chunked body from write_stream)
     DELETE /files/{path}         → 200/204 on success
-    GET    /files?prefix={p}     → 200 + JSON array of path strings
+    GET    /files?prefix={p}     → 200 + JSON array of path strings, or one page:
+                                   {"files": [...], "next_cursor": "..."}; iter_files
+                                   sends limit, cursor, recursive=0 and metadata=1,
+                                   and entries may be objects with path, size, etag,
+                                   last_modified, content_type and is_dir
     GET    /files/{path}?url=1   → 200 + JSON {"url": "..."} (signed/direct URL)
     PATCH  /files/{path}?append=1 → 200/201 (server-side append, optional)
 
@@ -21,23 +38,94 @@ All paths are relative — the base URL prefix is prepended automatically.
 from __future__ import annotations
 
 import json
-from typing import Any
+import logging
+from collections.abc import AsyncIterator, Iterator
+from typing import TYPE_CHECKING, Any
 
 import requests
 
 from .base_backend import StorageBackend
-
+from .http_pool import DEFAULT_MAX_CONNECTIONS, AsyncClientPool, build_limits, http2_available
+from .listing import DEFAULT_PAGE_SIZE, FileEntry, clean_etag, parse_timestamp
+from .retry import StorageHTTPError
+from .streaming import (
+    DEFAULT_CHUNK_SIZE,
+    AsyncByteSource,
+    ByteSource,
+    ahttp_range_result,
+    aiter_chunks,
+    http_range_result,
+    iter_chunks,
+    range_header,
+)
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = logging.getLogger(__name__)
 
 _DEFAULT_TIMEOUT = 30
 
 
+def _list_params(
+    prefix: str, recursive: bool, with_metadata: bool, page_size: int, cursor: str | None
+) -> dict[str, str]:
+    params: dict[str, str] = {"limit": str(page_size)}
+    if prefix:
+        params["prefix"] = prefix
+    if not recursive:
+        params["recursive"] = "0"
+    if with_metadata:
+        params["metadata"] = "1"
+    if cursor:
+        params["cursor"] = cursor
+    return params
+
+
+def _parse_listing(data: Any, with_metadata: bool) -> tuple[list[FileEntry], str | None]:
+    """Entries and next cursor from a GET /files response (see the module docstring)."""
+    if isinstance(data, list):
+        items, cursor = data, None
+    elif isinstance(data, dict):
+        items = data.get("files", data.get("items", []))
+        cursor = data.get("next_cursor") or data.get("cursor")
+    else:
+        return [], None
+    entries: list[FileEntry] = []
+    for item in items:
+        if not isinstance(item, dict):
+            entries.append(FileEntry(str(item)))
+            continue
+        path = str(item.get("path") or item.get("name") or "")
+        is_dir = bool(item.get("is_dir")) or item.get("type") == "directory"
+        if is_dir:
+            entries.append(FileEntry(path.rstrip("/") + "/", is_dir=True))
+            continue
+        if not with_metadata:
+            entries.append(FileEntry(path))
+            continue
+        entries.append(
+            FileEntry(
+                path,
+                size=item.get("size"),
+                etag=clean_etag(item.get("etag")),
+                last_modified=parse_timestamp(item.get("last_modified") or item.get("modified")),
+                content_type=item.get("content_type"),
+            )
+        )
+    return entries, cursor
+
+
 class ServerBackend(StorageBackend):
     def __init__(self) -> None:
         self._base_url: str = ""
         self._api_key: str = ""
         self._timeout: int = _DEFAULT_TIMEOUT
+        self._max_connections: int = DEFAULT_MAX_CONNECTIONS
+        self._http2: bool = False
         self._configured: bool = False
         self._session: requests.Session | None = None
+        self._async_pool = AsyncClientPool(self._new_async_client)
         self._init_from_settings()
 
     # ------------------------------------------------------------------
@@ -63,6 +151,11 @@ class ServerBackend(StorageBackend):
                 except ValueError:
                     self._timeout = _DEFAULT_TIMEOUT
 
+            max_conn_raw = self._safe_get(settings, "FILE_SERVER_MAX_CONNECTIONS")
+            if max_conn_raw.isdigit() and int(max_conn_raw) > 0:
+                self._max_connections = int(max_conn_raw)
+            self._http2 = self._safe_get(settings, "FILE_SERVER_HTTP2").lower() in ("1", "true", "yes")
+
             self._configured = True
         except Exception:
             return
@@ -77,14 +170,46 @@ class ServerBackend(StorageBackend):
 
     def _get_session(self) -> requests.Session:
         if self._session is None:
+            from requests.adapters import HTTPAdapter
+
             session = requests.Session()
             session.headers.update({
                 "Authorization": f"Bearer {self._api_key}",
                 "Accept": "application/octet-stream",
             })
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self._max_connections)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
             self._session = session
         return self._session
 
+    def _new_async_client(self) -> httpx.AsyncClient:
+        import httpx
+
+        http2 = self._http2 and http2_available()
+        if self._http2 and not http2:
+            logger.warning("FILE_SERVER_HTTP2 is set but the h2 package is missing; using HTTP/1.1.")
+        return httpx.AsyncClient(
+            headers=self._async_headers(),
+            timeout=self._timeout,
+            limits=build_limits(self._max_connections),
+            http2=http2,
+        )
+
+    def _async_client(self) -> httpx.AsyncClient:
+        """The pooled client for the running event loop."""
+        return self._async_pool.get()
+
+    def close(self) -> None:
+        """Close the sync session's pooled connections."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    async def aclose(self) -> None:
+        """Close the running event loop's pooled async client."""
+        await self._async_pool.aclose()
+
     def is_configured(self) -> bool:
         return self._configured
 
@@ -118,6 +243,45 @@ class ServerBackend(StorageBackend):
         self._raise_for_status(response, f"write '{path}'")
         return True
 
+    def read_stream(self, path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+        self._require_configured()
+        url = self._file_url(path)
+        with self._get_session().get(url, stream=True, timeout=self._timeout) as response:
+            self._raise_for_status(response, f"read_stream '{path}'")
+            yield from response.iter_content(chunk_size)
+
+    def write_stream(self, path: str, source: ByteSource) -> bool:
+        """PUT *source* as a chunked request body — never buffered whole."""
+        self._require_configured()
+        url = self._file_url(path)
+        headers = {"Content-Type": "application/octet-stream"}
+        response = self._get_session().put(
+            url, data=iter_chunks(source), headers=headers, timeout=self._timeout
+        )
+        self._raise_for_status(response, f"write_stream '{path}'")
+        return True
+
+    def _read_range(self, path: str, start: int, end: int | None) -> tuple[bytes, int | None]:
+        self._require_configured()
+        headers = {"Range": range_header(start, end)}
+        with self._get_session().get(
+            self._file_url(path), headers=headers, stream=True, timeout=self._timeout
+        ) as response:
+            if response.status_code != 416:
+                self._raise_for_status(response, f"read_range '{path}'")
+            return http_range_result(
+                response.status_code, response.headers, response.iter_content(DEFAULT_CHUNK_SIZE), start, end
+            )
+
+    def _read_if_changed(self, path: str, etag: str | None) -> tuple[bytes | None, str | None]:
+        self._require_configured()
+        headers = {"If-None-Match": etag} if etag else {}
+        response = self._get_session().get(self._file_url(path), headers=headers, timeout=self._timeout)
+        if etag and response.status_code == 304:
+            return None, etag
+        self._raise_for_status(response, f"read '{path}'")
+        return response.content, response.headers.get("ETag")
+
     def append(self, path: str, content: bytes | str) -> bool:
         """Append to a file on the server.
 
@@ -191,37 +355,46 @@ class ServerBackend(StorageBackend):
     # ------------------------------------------------------------------
 
     def list_files(self, prefix: str = "") -> list[str]:
+        return [entry.path for entry in self.iter_files(prefix)]
+
+    def iter_files(
+        self,
+        prefix: str = "",
+        recursive: bool = True,
+        with_metadata: bool = False,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> Iterator[FileEntry]:
+        """Lazily list *prefix*, following the server's ``next_cursor`` from page to page."""
         self._require_configured()
         base = f"{self._base_url}/files"
-        params: dict[str, str] = {}
-        if prefix:
-            params["prefix"] = prefix
-
-        response = self._get_session().get(
-            base,
-            params=params,
-            headers={"Accept": "application/json"},
-            timeout=self._timeout,
-        )
-        self._raise_for_status(response, f"list_files prefix='{prefix}'")
-
-        data = response.json()
-        if isinstance(data, list):
-            return [str(item) for item in data]
-        if isinstance(data, dict):
-            return [str(item) for item in data.get("files", data.get("items", []))]
-        return []
+        cursor: str | None = None
+        while True:
+            response = self._get_session().get(
+                base,
+                params=_list_params(prefix, recursive, with_metadata, page_size, cursor),
+                headers={"Accept": "application/json"},
+                timeout=self._timeout,
+            )
+            self._raise_for_status(response, f"list_files prefix='{prefix}'")
+            entries, next_cursor = _parse_listing(response.json(), with_metadata)
+            yield from entries
+            if not next_cursor or next_cursor == cursor:
+                return
+            cursor = next_cursor
 
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _raise_for_status(response: requests.Response, context: str) -> None:
-        if not response.ok:
-            raise RuntimeError(
+    def _raise_for_status(response: Any, context: str) -> None:
+        """Raise on a failed requests or httpx response (httpx has is_success, not ok)."""
+        ok = response.ok if isinstance(response, requests.Response) else response.is_success
+        if not ok:
+            raise StorageHTTPError(
                 f"ServerBackend {context} failed with HTTP {response.status_code}: "
-                f"{response.text[:200]}"
+                f"{response.text[:200]}",
+                response.status_code,
             )
 
     def health_check(self) -> bool:
@@ -237,7 +410,7 @@ class ServerBackend(StorageBackend):
             return False
 
     # ------------------------------------------------------------------
-    # Asynchronous API — httpx.AsyncClient
+    # Asynchronous API — pooled httpx.AsyncClient, one per event loop
     # ------------------------------------------------------------------
 
     def _async_headers(self) -> dict[str, str]:
@@ -248,39 +421,69 @@ class ServerBackend(StorageBackend):
 
     async def read_async(self, path: str) -> bytes:
         self._require_configured()
-        import httpx
-        async with httpx.AsyncClient(headers=self._async_headers(), timeout=self._timeout) as client:
-            response = await client.get(self._file_url(path))
-            self._raise_for_status(response, f"read_async '{path}'")  # type: ignore[arg-type]
-            return response.content
+        response = await self._async_client().get(self._file_url(path))
+        self._raise_for_status(response, f"read_async '{path}'")
+        return response.content
+
+    async def read_stream_async(self, path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncIterator[bytes]:
+        self._require_configured()
+        async with self._async_client().stream("GET", self._file_url(path)) as response:
+            if not response.is_success:
+                await response.aread()
+            self._raise_for_status(response, f"read_stream_async '{path}'")
+            async for chunk in response.aiter_bytes(chunk_size):
+                yield chunk
+
+    async def _read_if_changed_async(self, path: str, etag: str | None) -> tuple[bytes | None, str | None]:
+        self._require_configured()
+        headers = {"If-None-Match": etag} if etag else {}
+        response = await self._async_client().get(self._file_url(path), headers=headers)
+        if etag and response.status_code == 304:
+            return None, etag
+        self._raise_for_status(response, f"read_async '{path}'")
+        return response.content, response.headers.get("ETag")
+
+    async def _read_range_async(self, path: str, start: int, end: int | None) -> tuple[bytes, int | None]:
+        self._require_configured()
+        headers = {"Range": range_header(start, end)}
+        async with self._async_client().stream("GET", self._file_url(path), headers=headers) as response:
+            if response.status_code != 416 and not response.is_success:
+                await response.aread()
+                self._raise_for_status(response, f"read_range_async '{path}'")
+            return await ahttp_range_result(
+                response.status_code, response.headers, response.aiter_bytes(DEFAULT_CHUNK_SIZE), start, end
+            )
+
+    async def write_stream_async(self, path: str, source: AsyncByteSource) -> bool:
+        self._require_configured()
+        headers = {"Content-Type": "application/octet-stream"}
+        response = await self._async_client().put(self._file_url(path), content=aiter_chunks(source), headers=headers)
+        self._raise_for_status(response, f"write_stream_async '{path}'")
+        return True
 
     async def write_async(self, path: str, content: bytes | str) -> bool:
         self._require_configured()
         if isinstance(content, str):
             content = content.encode()
-        import httpx
-        headers = {**self._async_headers(), "Content-Type": "application/octet-stream"}
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            response = await client.put(self._file_url(path), content=content, headers=headers)
-            self._raise_for_status(response, f"write_async '{path}'")  # type: ignore[arg-type]
-            return True
+        headers = {"Content-Type": "application/octet-stream"}
+        response = await self._async_client().put(self._file_url(path), content=content, headers=headers)
+        self._raise_for_status(response, f"write_async '{path}'")
+        return True
 
     async def append_async(self, path: str, content: bytes | str) -> bool:
         self._require_configured()
         if isinstance(content, str):
             content = content.encode()
-        import httpx
-        headers = {**self._async_headers(), "Content-Type": "application/octet-stream"}
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            # Try server-side append first
-            response = await client.patch(
-                self._file_url(path),
-                params={"append": "1"},
-                content=content,
-                headers=headers,
-            )
-            if response.status_code in (200, 201, 204):
-                return True
+        headers = {"Content-Type": "application/octet-stream"}
+        # Try server-side append first
+        response = await self._async_client().patch(
+            self._file_url(path),
+            params={"append": "1"},
+            content=content,
+            headers=headers,
+        )
+        if response.status_code in (200, 201, 204):
+            return True
         # Fall back: read → concat → write
         try:
             existing = await self.read_async(path)
@@ -290,50 +493,58 @@ class ServerBackend(StorageBackend):
 
     async def delete_async(self, path: str) -> bool:
         self._require_configured()
-        import httpx
-        async with httpx.AsyncClient(headers=self._async_headers(), timeout=self._timeout) as client:
-            response = await client.delete(self._file_url(path))
-            self._raise_for_status(response, f"delete_async '{path}'")  # type: ignore[arg-type]
-            return True
+        response = await self._async_client().delete(self._file_url(path))
+        self._raise_for_status(response, f"delete_async '{path}'")
+        return True
 
     async def get_url_async(self, path: str, expires_in: int = 3600) -> str:
         self._require_configured()
-        import httpx, json as _json
         url = self._file_url(path)
-        headers = {**self._async_headers(), "Accept": "application/json"}
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            response = await client.get(url, params={"url": "1", "expires": str(expires_in)}, headers=headers)
-            if response.status_code == 200:
-                try:
-                    data = response.json()
-                    if isinstance(data, dict):
-                        return data.get("url") or data.get("signedUrl") or url
-                except (_json.JSONDecodeError, ValueError):
-                    pass
+        response = await self._async_client().get(
+            url,
+            params={"url": "1", "expires": str(expires_in)},
+            headers={"Accept": "application/json"},
+        )
+        if response.status_code == 200:
+            try:
+                data = response.json()
+                if isinstance(data, dict):
+                    return data.get("url") or data.get("signedUrl") or url
+            except (json.JSONDecodeError, ValueError):
+                pass
         return url
 
     async def list_files_async(self, prefix: str = "") -> list[str]:
+        return [entry.path async for entry in self.iter_files_async(prefix)]
+
+    async def iter_files_async(
+        self,
+        prefix: str = "",
+        recursive: bool = True,
+        with_metadata: bool = False,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> AsyncIterator[FileEntry]:
         self._require_configured()
-        import httpx
         base = f"{self._base_url}/files"
-        params: dict[str, str] = {"prefix": prefix} if prefix else {}
-        headers = {**self._async_headers(), "Accept": "application/json"}
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            response = await client.get(base, params=params, headers=headers)
-            self._raise_for_status(response, f"list_files_async prefix='{prefix}'")  # type: ignore[arg-type]
-            data = response.json()
-            if isinstance(data, list):
-                return [str(item) for item in data]
-            if isinstance(data, dict):
-                return [str(item) for item in data.get("files", data.get("items", []))]
-            return []
+        cursor: str | None = None
+        while True:
+            response = await self._async_client().get(
+                base,
+                params=_list_params(prefix, recursive, with_metadata, page_size, cursor),
+                headers={"Accept": "application/json"},
+            )
+            self._raise_for_status(response, f"list_files_async prefix='{prefix}'")
+            entries, next_cursor = _parse_listing(response.json(), with_metadata)
+            for entry in entries:
+                yield entry
+            if not next_cursor or next_cursor == cursor:
+                return
+            cursor = next_cursor
 
     async def health_check_async(self) -> bool:
         try:
             self._require_configured()
-            import httpx
-            async with httpx.AsyncClient(headers=self._async_headers(), timeout=self._timeout) as client:
-                response = await client.get(f"{self._base_url}/health")
-                return response.is_success
+            response = await self._async_client().get(f"{self._base_url}/health")
+            return response.is_success
         except Exception:
             return False
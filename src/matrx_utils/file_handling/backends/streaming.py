@@ -0,0 +1,370 @@
+"""Chunked byte-stream helpers shared by the storage backends.
+
+A *byte source* is anything a streaming write accepts:
+
+    bytes / bytearray / memoryview / str   — sliced into chunks
+    an os.PathLike local file path         — opened and read chunk by chunk
+    a binary file-like object (has .read) — read chunk by chunk
+    an iterable of bytes chunks            — passed through
+    an async iterable of bytes chunks      — async writes only
+
+Backends never join a source into one ``bytes`` object on their streaming
+paths. Memory therefore stays at O(chunk size), or O(part size) for S3
+multipart uploads.
+
+Byte ranges are half-open, like slices: ``[start, end)``, with ``end=None``
+meaning "to the end of the object". The helpers below convert them to and
+from HTTP ``Range`` / ``Content-Range`` headers. RangeReader turns a range
+fetcher into a seekable file object.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import re
+from collections import OrderedDict
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable, Iterator, Mapping
+from typing import BinaryIO, Union
+
+from .executors import io_executor
+
+DEFAULT_CHUNK_SIZE: int = 1024 * 1024  # 1 MB
+DEFAULT_BLOCK_SIZE: int = 256 * 1024  # 256 KB — RangeReader fetch granularity
+
+ByteSource = Union[bytes, bytearray, memoryview, str, os.PathLike, BinaryIO, Iterable[bytes]]
+AsyncByteSource = Union[ByteSource, AsyncIterable[bytes]]
+
+
+def _as_bytes(chunk: bytes | bytearray | memoryview | str) -> bytes:
+    if isinstance(chunk, str):
+        return chunk.encode()
+    return chunk if isinstance(chunk, bytes) else bytes(chunk)
+
+
+def iter_chunks(source: ByteSource, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """Yield *source* as non-empty ``bytes`` chunks.
+
+    In-memory buffers, file paths and file-like objects are cut into
+    *chunk_size* pieces. Iterables keep their own chunk boundaries. A plain
+    ``str`` is content, never a path.
+    """
+    if isinstance(source, os.PathLike):
+        with open(source, "rb") as f:
+            yield from iter_chunks(f, chunk_size)
+        return
+    if isinstance(source, str):
+        source = source.encode()
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        view = memoryview(source)
+        for offset in range(0, len(view), chunk_size):
+            yield bytes(view[offset : offset + chunk_size])
+        return
+    read = getattr(source, "read", None)
+    if callable(read):
+        while chunk := read(chunk_size):
+            yield _as_bytes(chunk)
+        return
+    for chunk in source:
+        if chunk:
+            yield _as_bytes(chunk)
+
+
+async def aiter_chunks(source: AsyncByteSource, chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """Async version of iter_chunks() that also accepts async iterables.
+
+    Files are read on the storage I/O executor so a slow disk never
+    blocks the event loop.
+    """
+    if isinstance(source, os.PathLike):
+        f = await io_executor().run(open, source, "rb")
+        try:
+            async for chunk in aiter_chunks(f, chunk_size):
+                yield chunk
+        finally:
+            f.close()
+        return
+    if hasattr(source, "__aiter__"):
+        async for chunk in source:  # type: ignore[union-attr]
+            if chunk:
+                yield _as_bytes(chunk)
+        return
+    read = getattr(source, "read", None)
+    if callable(read):
+        while chunk := await io_executor().run(read, chunk_size):
+            yield _as_bytes(chunk)
+        return
+    for chunk in iter_chunks(source, chunk_size):  # type: ignore[arg-type]
+        yield chunk
+
+
+def rechunk(chunks: Iterable[bytes], size: int) -> Iterator[bytes]:
+    """Regroup *chunks* into pieces of exactly *size* bytes (the last may be shorter).
+
+    Chunks that already have the right size pass through without a copy.
+    """
+    buffer = bytearray()
+    for chunk in chunks:
+        if not buffer and len(chunk) == size:
+            yield chunk
+            continue
+        buffer += chunk
+        while len(buffer) >= size:
+            with memoryview(buffer) as view:
+                part = bytes(view[:size])
+            del buffer[:size]
+            yield part
+    if buffer:
+        yield bytes(buffer)
+
+
+async def arechunk(chunks: AsyncIterable[bytes], size: int) -> AsyncIterator[bytes]:
+    """Async version of rechunk()."""
+    buffer = bytearray()
+    async for chunk in chunks:
+        if not buffer and len(chunk) == size:
+            yield chunk
+            continue
+        buffer += chunk
+        while len(buffer) >= size:
+            with memoryview(buffer) as view:
+                part = bytes(view[:size])
+            del buffer[:size]
+            yield part
+    if buffer:
+        yield bytes(buffer)
+
+
+class ChunkReader(io.RawIOBase):
+    """Read-only, non-seekable file object over an iterator of bytes chunks.
+
+    Wrap it in ``io.BufferedReader`` for line iteration, or hand it straight
+    to anything that calls ``.read()`` (json.load, csv, zipfile streams, …).
+    Closing the reader closes the underlying generator, which releases the
+    HTTP response behind it.
+    """
+
+    def __init__(self, chunks: Iterator[bytes]) -> None:
+        self._chunks = chunks
+        self._pending = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:  # type: ignore[override]
+        while not self._pending:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._pending = memoryview(chunk)
+        n = min(len(buffer), len(self._pending))
+        buffer[:n] = self._pending[:n]
+        self._pending = self._pending[n:]
+        return n
+
+    def close(self) -> None:
+        if not self.closed:
+            close = getattr(self._chunks, "close", None)
+            if callable(close):
+                close()
+        super().close()
+
+
+# ---------------------------------------------------------------------------
+# Byte ranges
+# ---------------------------------------------------------------------------
+
+# fetch(start, end) -> (data, total object size or None if not reported)
+RangeFetcher = Callable[[int, Union[int, None]], tuple[bytes, Union[int, None]]]
+
+_CONTENT_RANGE = re.compile(r"bytes\s+(?:\d+-\d+|\*)/(\d+|\*)")
+
+
+def check_range(start: int, end: int | None) -> None:
+    """Raise ValueError unless ``[start, end)`` is a valid half-open byte range."""
+    if start < 0:
+        raise ValueError(f"Range start must be >= 0, got {start}.")
+    if end is not None and end < start:
+        raise ValueError(f"Range end ({end}) must be >= start ({start}).")
+
+
+def range_header(start: int, end: int | None) -> str:
+    """HTTP ``Range`` value for ``[start, end)`` (HTTP ranges are inclusive)."""
+    return f"bytes={start}-" if end is None else f"bytes={start}-{end - 1}"
+
+
+def content_range_total(value: str | None) -> int | None:
+    """Total size from a ``Content-Range`` value such as ``bytes 0-99/1234``."""
+    match = _CONTENT_RANGE.match(value or "")
+    if match is None or match.group(1) == "*":
+        return None
+    return int(match.group(1))
+
+
+def _header_int(headers: Mapping[str, str], name: str) -> int | None:
+    value = headers.get(name)
+    return int(value) if value and value.isdigit() else None
+
+
+def slice_chunks(chunks: Iterable[bytes], start: int, end: int | None) -> bytes:
+    """Bytes ``[start, end)`` of a chunk stream; stops reading once *end* is reached."""
+    out = bytearray()
+    offset = 0
+    for chunk in chunks:
+        lo, hi = max(start - offset, 0), len(chunk) if end is None else min(end - offset, len(chunk))
+        if lo < hi:
+            out += chunk[lo:hi]
+        offset += len(chunk)
+        if end is not None and offset >= end:
+            break
+    return bytes(out)
+
+
+async def aslice_chunks(chunks: AsyncIterable[bytes], start: int, end: int | None) -> bytes:
+    """Async version of slice_chunks()."""
+    out = bytearray()
+    offset = 0
+    async for chunk in chunks:
+        lo, hi = max(start - offset, 0), len(chunk) if end is None else min(end - offset, len(chunk))
+        if lo < hi:
+            out += chunk[lo:hi]
+        offset += len(chunk)
+        if end is not None and offset >= end:
+            break
+    return bytes(out)
+
+
+def http_range_result(
+    status: int, headers: Mapping[str, str], chunks: Iterable[bytes], start: int, end: int | None
+) -> tuple[bytes, int | None]:
+    """Interpret a successful (or 416) response to a ranged GET.
+
+    206 carries just the range. 416 means *start* is past the end. A plain
+    200 means the server ignored ``Range``; the body is then sliced locally
+    and only read as far as *end*.
+    """
+    if status == 416:
+        return b"", content_range_total(headers.get("content-range"))
+    if status == 206:
+        return b"".join(chunks), content_range_total(headers.get("content-range"))
+    return slice_chunks(chunks, start, end), _header_int(headers, "content-length")
+
+
+async def ahttp_range_result(
+    status: int, headers: Mapping[str, str], chunks: AsyncIterable[bytes], start: int, end: int | None
+) -> tuple[bytes, int | None]:
+    """Async version of http_range_result()."""
+    if status == 416:
+        return b"", content_range_total(headers.get("content-range"))
+    if status == 206:
+        return b"".join([chunk async for chunk in chunks]), content_range_total(headers.get("content-range"))
+    return await aslice_chunks(chunks, start, end), _header_int(headers, "content-length")
+
+
+class RangeReader(io.RawIOBase):
+    """Seekable, read-only file object that fetches byte ranges on demand.
+
+    Small reads are served from *block_size*-aligned blocks, with the last
+    *cache_blocks* blocks kept in an LRU cache. Header sniffing, seeking
+    back and forth in a container format, or paging through lines then
+    costs one request per block, not per read. Reads spanning whole blocks
+    bypass the cache and fetch the span in one request.
+
+    *size* is learned from the first response when not given.
+    """
+
+    def __init__(
+        self,
+        fetch: RangeFetcher,
+        size: int | None = None,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        cache_blocks: int = 8,
+    ) -> None:
+        if block_size < 1 or cache_blocks < 1:
+            raise ValueError("block_size and cache_blocks must be at least 1.")
+        self._fetch = fetch
+        self._size = size
+        self._block_size = block_size
+        self._cache_blocks = cache_blocks
+        self._cache: OrderedDict[int, bytes] = OrderedDict()
+        self._pos = 0
+        self.requests = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    @property
+    def size(self) -> int:
+        """Total object size in bytes (fetches the first block if still unknown)."""
+        index = 0
+        while self._size is None:
+            self._block(index)
+            index += 1
+        return self._size
+
+    def _get(self, start: int, end: int | None) -> bytes:
+        self.requests += 1
+        data, total = self._fetch(start, end)
+        if total is not None:
+            self._size = total
+        elif end is None or len(data) < end - start:
+            self._size = start + len(data)
+        return data
+
+    def _block(self, index: int) -> bytes:
+        block = self._cache.get(index)
+        if block is not None:
+            self._cache.move_to_end(index)
+            return block
+        start = index * self._block_size
+        block = self._get(start, start + self._block_size)
+        self._cache[index] = block
+        if len(self._cache) > self._cache_blocks:
+            self._cache.popitem(last=False)
+        return block
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == io.SEEK_END:
+            pos = self.size + offset
+        else:
+            raise ValueError(f"Invalid whence ({whence}).")
+        if pos < 0:
+            raise ValueError(f"Negative seek position {pos}.")
+        self._pos = pos
+        return pos
+
+    def readinto(self, buffer) -> int:  # type: ignore[override]
+        with memoryview(buffer) as raw:
+            view = raw.cast("B")
+            n = 0
+            while n < len(view) and (self._size is None or self._pos < self._size):
+                index, offset = divmod(self._pos, self._block_size)
+                wanted = len(view) - n
+                if offset == 0 and wanted >= self._block_size and index not in self._cache:
+                    span = wanted - wanted % self._block_size
+                    data = self._get(self._pos, self._pos + span)
+                else:
+                    data = self._block(index)[offset : offset + wanted]
+                if not data:
+                    break
+                view[n : n + len(data)] = data
+                n += len(data)
+                self._pos += len(data)
+            return n
+
+    def readall(self) -> bytes:
+        if self._size is not None and self._pos >= self._size:
+            return b""
+        data = self._get(self._pos, None)
+        self._pos += len(data)
+        return data
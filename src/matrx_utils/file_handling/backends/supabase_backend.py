@@ -26,25 +26,78 @@ storage3 API notes (as of storage3 >=0.7):
     get_public_url()    → str directly
     remove()            → list[dict[str, Any]]
     copy() / move()     → dict[str, str]
+
+storage3 only moves whole ``bytes``. The streaming methods therefore call the
+Storage REST endpoint (``/storage/v1/object/{bucket}/{path}``) directly with
+httpx: downloads are read chunk by chunk, and uploads send a raw chunked
+request body.
 """
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Iterator
 from typing import TYPE_CHECKING, Any
+from urllib.parse import quote
 
 from .base_backend import StorageBackend
+from .batch import chunked, group_by_bucket
+from .http_pool import DEFAULT_MAX_CONNECTIONS, AsyncClientPool, build_limits
+from .listing import DEFAULT_PAGE_SIZE, FileEntry, clean_etag, parse_timestamp
+from .retry import StorageHTTPError
+from .streaming import (
+    DEFAULT_CHUNK_SIZE,
+    AsyncByteSource,
+    ByteSource,
+    ahttp_range_result,
+    aiter_chunks,
+    http_range_result,
+    iter_chunks,
+    range_header,
+)
 
 if TYPE_CHECKING:
+    import httpx
     from supabase import Client, AsyncClient
     from storage3._sync.file_api import SyncBucket
     from storage3._sync.file_api import SyncBucketActionsMixin
     from storage3._async.file_api import AsyncBucketActionsMixin
 
+_MAX_REMOVE_PATHS: int = 1000  # Storage API limit per remove() request
+_MAX_SIGN_PATHS: int = 1000  # paths per create_signed_urls() request
+
+
+def _list_options(page_size: int, offset: int) -> dict[str, Any]:
+    return {"limit": page_size, "offset": offset, "sortBy": {"column": "name", "order": "asc"}}
+
+
+def _entries(bucket: str, folder: str, items: list[dict[str, Any]], with_metadata: bool) -> Iterator[FileEntry]:
+    """FileEntries for one page of list(); folders are the items without an ``id``."""
+    for item in items:
+        name: str = item.get("name", "")
+        if not name:
+            continue
+        path = f"{bucket}/{folder}/{name}" if folder else f"{bucket}/{name}"
+        if item.get("id") is None:
+            yield FileEntry(f"{path}/", is_dir=True)
+        elif with_metadata:
+            meta: dict[str, Any] = item.get("metadata") or {}
+            yield FileEntry(
+                path,
+                size=meta.get("size", meta.get("contentLength")),
+                etag=clean_etag(meta.get("eTag")),
+                last_modified=parse_timestamp(meta.get("lastModified") or item.get("updated_at")),
+                content_type=meta.get("mimetype"),
+            )
+        else:
+            yield FileEntry(path)
+
 
 class SupabaseBackend(StorageBackend):
     def __init__(self) -> None:
         self._client: Client | None = None
         self._async_client: AsyncClient | None = None
+        self._http: httpx.Client | None = None
+        self._async_http = AsyncClientPool(self._new_async_http)
         self._url: str = ""
         self._key: str = ""
         self._configured: bool = False
@@ -136,6 +189,65 @@ class SupabaseBackend(StorageBackend):
     def is_configured(self) -> bool:
         return self._configured
 
+    # ------------------------------------------------------------------
+    # Raw Storage REST access (streaming)
+    # ------------------------------------------------------------------
+
+    def _object_url(self, bucket: str, file_path: str) -> str:
+        return f"{self._url.rstrip('/')}/storage/v1/object/{bucket}/{quote(file_path, safe='/')}"
+
+    def _rest_headers(self) -> dict[str, str]:
+        return {"apikey": self._key, "Authorization": f"Bearer {self._key}"}
+
+    @staticmethod
+    def _upload_headers(upsert: bool, content_type: str | None) -> dict[str, str]:
+        return {
+            "x-upsert": "true" if upsert else "false",
+            "content-type": content_type or "application/octet-stream",
+            "cache-control": "max-age=3600",
+        }
+
+    def _get_http(self) -> httpx.Client:
+        if self._http is None:
+            import httpx
+            self._http = httpx.Client(
+                headers=self._rest_headers(),
+                timeout=self.upload_timeout_seconds,
+                limits=build_limits(DEFAULT_MAX_CONNECTIONS),
+            )
+        return self._http
+
+    def _new_async_http(self) -> httpx.AsyncClient:
+        import httpx
+        return httpx.AsyncClient(
+            headers=self._rest_headers(),
+            timeout=self.upload_timeout_seconds,
+            limits=build_limits(DEFAULT_MAX_CONNECTIONS),
+        )
+
+    def _get_async_http(self) -> httpx.AsyncClient:
+        """The pooled REST client for the running event loop (see http_pool.py)."""
+        return self._async_http.get()
+
+    def close(self) -> None:
+        """Close the sync REST client's pooled connections."""
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+
+    async def aclose(self) -> None:
+        """Close the running event loop's pooled REST client."""
+        await self._async_http.aclose()
+
+    @staticmethod
+    def _raise_for_status(response: httpx.Response, context: str) -> None:
+        if not response.is_success:
+            raise StorageHTTPError(
+                f"SupabaseBackend {context} failed with HTTP {response.status_code}: "
+                f"{response.text[:200]}",
+                response.status_code,
+            )
+
     # ------------------------------------------------------------------
     # Path helpers
     # ------------------------------------------------------------------
@@ -184,7 +296,59 @@ class SupabaseBackend(StorageBackend):
         self._bucket(bucket).upload(file_path, raw, file_options=file_options)
         return True
 
+    def read_stream(self, path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+        self._require_configured()
+        bucket, file_path = self._parse_path(path)
+        with self._get_http().stream("GET", self._object_url(bucket, file_path)) as response:
+            if not response.is_success:
+                response.read()
+            self._raise_for_status(response, f"read_stream '{path}'")
+            yield from response.iter_bytes(chunk_size)
+
+    def _read_range(self, path: str, start: int, end: int | None) -> tuple[bytes, int | None]:
+        self._require_configured()
+        bucket, file_path = self._parse_path(path)
+        headers = {"Range": range_header(start, end)}
+        with self._get_http().stream("GET", self._object_url(bucket, file_path), headers=headers) as response:
+            if response.status_code != 416 and not response.is_success:
+                response.read()
+                self._raise_for_status(response, f"read_range '{path}'")
+            return http_range_result(
+                response.status_code, response.headers, response.iter_bytes(DEFAULT_CHUNK_SIZE), start, end
+            )
+
+    def _read_if_changed(self, path: str, etag: str | None) -> tuple[bytes | None, str | None]:
+        self._require_configured()
+        bucket, file_path = self._parse_path(path)
+        headers = {"If-None-Match": etag} if etag else {}
+        response = self._get_http().get(self._object_url(bucket, file_path), headers=headers)
+        if etag and response.status_code == 304:
+            return None, etag
+        self._raise_for_status(response, f"read '{path}'")
+        return response.content, response.headers.get("etag")
+
+    def write_stream(
+        self,
+        path: str,
+        source: ByteSource,
+        upsert: bool = True,
+        content_type: str | None = None,
+    ) -> bool:
+        self._require_configured()
+        bucket, file_path = self._parse_path(path)
+        response = self._get_http().post(
+            self._object_url(bucket, file_path),
+            content=iter_chunks(source),
+            headers=self._upload_headers(upsert, content_type),
+        )
+        self._raise_for_status(response, f"write_stream '{path}'")
+        return True
+
     def append(self, path: str, content: bytes | str) -> bool:
+        """Read-modify-write: O(object size) per call, as Storage cannot append.
+
+        BackendRouter.segmented() gives appends that cost one small PUT.
+        """
         self._require_configured()
         try:
             existing: bytes = self.read(path)
@@ -199,6 +363,20 @@ class SupabaseBackend(StorageBackend):
         self._bucket(bucket).remove([file_path])
         return True
 
+    def delete_many(self, paths: list[str]) -> dict[str, Exception | None]:
+        """Bulk delete with one multi-path remove() per bucket (up to 1000 paths each)."""
+        self._require_configured()
+        groups, results = group_by_bucket(paths, self._parse_path)
+        for bucket, entries in groups.items():
+            for batch in chunked(entries, _MAX_REMOVE_PATHS):
+                try:
+                    self._bucket(bucket).remove([file_path for _, file_path in batch])
+                    error: Exception | None = None
+                except Exception as exc:
+                    error = exc
+                results.update((path, error) for path, _ in batch)
+        return results
+
     # ------------------------------------------------------------------
     # URL generation
     # ------------------------------------------------------------------
@@ -218,6 +396,35 @@ class SupabaseBackend(StorageBackend):
             pass
         return self.get_public_url(path)
 
+    def get_urls(self, paths: list[str], expires_in: int = 3600) -> dict[str, str]:
+        """Sign many paths with one create_signed_urls() request per bucket.
+
+        Like get_url(), a path that cannot be signed gets its public URL.
+        """
+        self._require_configured()
+        groups, rejected = group_by_bucket(paths, self._parse_path)
+        if rejected:
+            raise next(iter(rejected.values()))  # type: ignore[misc]
+        urls: dict[str, str] = {}
+        for bucket, entries in groups.items():
+            for batch in chunked(entries, _MAX_SIGN_PATHS):
+                try:
+                    signed = self._bucket(bucket).create_signed_urls([file_path for _, file_path in batch], expires_in)
+                except Exception:
+                    signed = []
+                urls.update(self._match_signed(batch, signed))
+        return {path: urls.get(path) or self.get_public_url(path) for path in paths}
+
+    @staticmethod
+    def _match_signed(batch: list[tuple[str, str]], signed: list[Any]) -> dict[str, str]:
+        """Map a create_signed_urls() response back to ``{path: url}``, skipping per-item errors."""
+        by_file: dict[str, str] = {
+            item["path"]: item["signedURL"]
+            for item in signed
+            if item.get("path") and item.get("signedURL") and not item.get("error")
+        }
+        return {path: by_file[file_path] for path, file_path in batch if file_path in by_file}
+
     def get_public_url(self, path: str) -> str:
         """Return the permanent public URL (bucket must be set to Public)."""
         self._require_configured()
@@ -232,27 +439,55 @@ class SupabaseBackend(StorageBackend):
     def list_files(self, prefix: str = "") -> list[str]:
         """List files under *prefix*, which must include the bucket.
 
-        prefix format: "bucket-name/optional/sub/path"
+        prefix format: "bucket-name/optional/sub/path" ("bucket-name" lists the bucket root)
+
+        One level only, like Storage's list(); sub-folders are included by
+        name. Every page is fetched, so large folders are not truncated.
         """
-        self._require_configured()
+        return [entry.path.rstrip("/") for entry in self.iter_files(prefix, recursive=False)]
 
-        if "/" not in prefix:
+    def iter_files(
+        self,
+        prefix: str = "",
+        recursive: bool = True,
+        with_metadata: bool = False,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> Iterator[FileEntry]:
+        """Lazily list the folder *prefix* ("bucket/folder"), *page_size* items per list() call.
+
+        Storage lists one folder at a time, so a recursive listing walks
+        sub-folders depth-first. Pages are fetched by offset, so objects
+        added or removed during the walk may be missed or repeated.
+        """
+        bucket, folder = self._list_target(prefix, "iter_files")
+        bucket_api = self._bucket(bucket)
+        pending: list[str] = [folder]
+        while pending:
+            folder = pending.pop()
+            subfolders: list[str] = []
+            offset = 0
+            while True:
+                items: list[dict[str, Any]] = bucket_api.list(folder, _list_options(page_size, offset))
+                for entry in _entries(bucket, folder, items, with_metadata):
+                    if entry.is_dir and recursive:
+                        subfolders.append(entry.path.partition("/")[2].rstrip("/"))
+                    else:
+                        yield entry
+                if len(items) < page_size:
+                    break
+                offset += len(items)
+            pending.extend(reversed(subfolders))
+
+    def _list_target(self, prefix: str, method: str) -> tuple[str, str]:
+        self._require_configured()
+        bucket, _, folder = prefix.strip("/").partition("/")
+        if not bucket:
             raise ValueError(
-                f"Supabase list_files() prefix '{prefix}' must include the bucket: "
+                f"Supabase {method}() prefix '{prefix}' must include the bucket: "
                 "'bucket-name/optional/path'. "
                 "Use the URI form supabase://bucket-name/optional/path"
             )
-        bucket, _, path_prefix = prefix.partition("/")
-
-        # list() returns list[dict[str, Any]] — plain dicts
-        items: list[dict[str, Any]] = self._bucket(bucket).list(path_prefix)
-        results: list[str] = []
-        for item in items:
-            name: str = item.get("name", "")
-            if name:
-                full_path: str = f"{path_prefix}/{name}".lstrip("/")
-                results.append(f"{bucket}/{full_path}")
-        return results
+        return bucket, folder.strip("/")
 
     # ------------------------------------------------------------------
     # Bucket management helpers (convenience, not in ABC)
@@ -336,6 +571,57 @@ class SupabaseBackend(StorageBackend):
         await bucket_api.upload(file_path, raw, file_options=file_options)
         return True
 
+    async def read_stream_async(self, path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncIterator[bytes]:
+        self._require_configured()
+        bucket, file_path = self._parse_path(path)
+        async with self._get_async_http().stream("GET", self._object_url(bucket, file_path)) as response:
+            if not response.is_success:
+                await response.aread()
+            self._raise_for_status(response, f"read_stream_async '{path}'")
+            async for chunk in response.aiter_bytes(chunk_size):
+                yield chunk
+
+    async def _read_range_async(self, path: str, start: int, end: int | None) -> tuple[bytes, int | None]:
+        self._require_configured()
+        bucket, file_path = self._parse_path(path)
+        headers = {"Range": range_header(start, end)}
+        async with self._get_async_http().stream(
+            "GET", self._object_url(bucket, file_path), headers=headers
+        ) as response:
+            if response.status_code != 416 and not response.is_success:
+                await response.aread()
+                self._raise_for_status(response, f"read_range_async '{path}'")
+            return await ahttp_range_result(
+                response.status_code, response.headers, response.aiter_bytes(DEFAULT_CHUNK_SIZE), start, end
+            )
+
+    async def _read_if_changed_async(self, path: str, etag: str | None) -> tuple[bytes | None, str | None]:
+        self._require_configured()
+        bucket, file_path = self._parse_path(path)
+        headers = {"If-None-Match": etag} if etag else {}
+        response = await self._get_async_http().get(self._object_url(bucket, file_path), headers=headers)
+        if etag and response.status_code == 304:
+            return None, etag
+        self._raise_for_status(response, f"read_async '{path}'")
+        return response.content, response.headers.get("etag")
+
+    async def write_stream_async(
+        self,
+        path: str,
+        source: AsyncByteSource,
+        upsert: bool = True,
+        content_type: str | None = None,
+    ) -> bool:
+        self._require_configured()
+        bucket, file_path = self._parse_path(path)
+        response = await self._get_async_http().post(
+            self._object_url(bucket, file_path),
+            content=aiter_chunks(source),
+            headers=self._upload_headers(upsert, content_type),
+        )
+        self._raise_for_status(response, f"write_stream_async '{path}'")
+        return True
+
     async def append_async(self, path: str, content: bytes | str) -> bool:
         self._require_configured()
         try:
@@ -352,6 +638,20 @@ class SupabaseBackend(StorageBackend):
         await bucket_api.remove([file_path])
         return True
 
+    async def delete_many_async(self, paths: list[str]) -> dict[str, Exception | None]:
+        self._require_configured()
+        groups, results = group_by_bucket(paths, self._parse_path)
+        for bucket, entries in groups.items():
+            bucket_api = await self._async_bucket(bucket)
+            for batch in chunked(entries, _MAX_REMOVE_PATHS):
+                try:
+                    await bucket_api.remove([file_path for _, file_path in batch])
+                    error: Exception | None = None
+                except Exception as exc:
+                    error = exc
+                results.update((path, error) for path, _ in batch)
+        return results
+
     async def get_url_async(self, path: str, expires_in: int = 3600) -> str:
         self._require_configured()
         bucket, file_path = self._parse_path(path)
@@ -365,6 +665,22 @@ class SupabaseBackend(StorageBackend):
             pass
         return await self.get_public_url_async(path)
 
+    async def get_urls_async(self, paths: list[str], expires_in: int = 3600) -> dict[str, str]:
+        self._require_configured()
+        groups, rejected = group_by_bucket(paths, self._parse_path)
+        if rejected:
+            raise next(iter(rejected.values()))  # type: ignore[misc]
+        urls: dict[str, str] = {}
+        for bucket, entries in groups.items():
+            bucket_api = await self._async_bucket(bucket)
+            for batch in chunked(entries, _MAX_SIGN_PATHS):
+                try:
+                    signed = await bucket_api.create_signed_urls([file_path for _, file_path in batch], expires_in)
+                except Exception:
+                    signed = []
+                urls.update(self._match_signed(batch, signed))
+        return {path: urls.get(path) or await self.get_public_url_async(path) for path in paths}
+
     async def get_public_url_async(self, path: str) -> str:
         self._require_configured()
         bucket, file_path = self._parse_path(path)
@@ -373,21 +689,33 @@ class SupabaseBackend(StorageBackend):
         return url
 
     async def list_files_async(self, prefix: str = "") -> list[str]:
-        self._require_configured()
-        if "/" not in prefix:
-            raise ValueError(
-                f"Supabase list_files_async() prefix '{prefix}' must include the bucket."
-            )
-        bucket, _, path_prefix = prefix.partition("/")
+        return [entry.path.rstrip("/") async for entry in self.iter_files_async(prefix, recursive=False)]
+
+    async def iter_files_async(
+        self,
+        prefix: str = "",
+        recursive: bool = True,
+        with_metadata: bool = False,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> AsyncIterator[FileEntry]:
+        bucket, folder = self._list_target(prefix, "iter_files_async")
         bucket_api = await self._async_bucket(bucket)
-        items: list[dict[str, Any]] = await bucket_api.list(path_prefix)
-        results: list[str] = []
-        for item in items:
-            name: str = item.get("name", "")
-            if name:
-                full_path: str = f"{path_prefix}/{name}".lstrip("/")
-                results.append(f"{bucket}/{full_path}")
-        return results
+        pending: list[str] = [folder]
+        while pending:
+            folder = pending.pop()
+            subfolders: list[str] = []
+            offset = 0
+            while True:
+                items: list[dict[str, Any]] = await bucket_api.list(folder, _list_options(page_size, offset))
+                for entry in _entries(bucket, folder, items, with_metadata):
+                    if entry.is_dir and recursive:
+                        subfolders.append(entry.path.partition("/")[2].rstrip("/"))
+                    else:
+                        yield entry
+                if len(items) < page_size:
+                    break
+                offset += len(items)
+            pending.extend(reversed(subfolders))
 
     async def copy_async(self, src_path: str, dst_path: str) -> bool:
         self._require_configured()
@@ -0,0 +1,96 @@
+"""In-memory StorageBackend shared by the backend tests."""
+
+from datetime import datetime, timezone
+
+from matrx_utils.file_handling.backends import FileEntry, StorageBackend, StorageHTTPError
+from matrx_utils.file_handling.backends.streaming import iter_chunks
+
+
+class MemoryBackend(StorageBackend):
+    """Objects in a dict, with server-side copies and listed modified times."""
+
+    def __init__(self) -> None:
+        self.objects: dict[str, bytes] = {}
+        self.modified: dict[str, datetime] = {}
+        self.uploaded = 0
+        self.copies: list[tuple[str, str]] = []
+
+    def _put(self, path: str, data: bytes) -> bool:
+        self.objects[path] = data
+        self.modified[path] = datetime.now(timezone.utc)
+        return True
+
+    def _get(self, path: str) -> bytes:
+        if path not in self.objects:
+            raise StorageHTTPError(f"{path} not found, HTTP 404", 404)
+        return self.objects[path]
+
+    def is_configured(self) -> bool:
+        return True
+
+    def read(self, path):
+        return self._get(path)
+
+    def write(self, path, content, **kwargs):
+        data = content.encode() if isinstance(content, str) else bytes(content)
+        self.uploaded += len(data)
+        return self._put(path, data)
+
+    def write_stream(self, path, source, **kwargs):
+        return self.write(path, b"".join(iter_chunks(source)))
+
+    def _read_range(self, path, start, end):
+        data = self._get(path)
+        return data[start:end], len(data)
+
+    def copy(self, src, dst):
+        self.copies.append((src, dst))
+        return self._put(dst, self._get(src))
+
+    def append(self, path, content):
+        data = content.encode() if isinstance(content, str) else bytes(content)
+        return self.write(path, self.objects.get(path, b"") + data)
+
+    def delete(self, path):
+        self.objects.pop(path, None)
+        self.modified.pop(path, None)
+        return True
+
+    def get_url(self, path, expires_in=3600):
+        return f"https://signed.example/{path}"
+
+    def list_files(self, prefix=""):
+        return sorted(path for path in self.objects if path.startswith(prefix))
+
+    def iter_files(self, prefix="", recursive=True, with_metadata=False, page_size=1000):
+        for path in self.list_files(prefix):
+            yield FileEntry(path, len(self.objects[path]), last_modified=self.modified[path])
+
+    async def read_async(self, path):
+        return self.read(path)
+
+    async def write_async(self, path, content, **kwargs):
+        return self.write(path, content)
+
+    async def write_stream_async(self, path, source, **kwargs):
+        if hasattr(source, "__aiter__"):
+            return self.write(path, b"".join([chunk async for chunk in source]))
+        return self.write_stream(path, source)
+
+    async def _read_range_async(self, path, start, end):
+        return self._read_range(path, start, end)
+
+    async def copy_async(self, src, dst):
+        return self.copy(src, dst)
+
+    async def append_async(self, path, content):
+        return self.append(path, content)
+
+    async def delete_async(self, path):
+        return self.delete(path)
+
+    async def get_url_async(self, path, expires_in=3600):
+        return self.get_url(path, expires_in)
+
+    async def list_files_async(self, prefix=""):
+        return self.list_files(prefix)
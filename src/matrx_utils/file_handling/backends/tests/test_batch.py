@@ -0,0 +1,253 @@
+"""
+Tests for BackendRouter's batch operations (read_many, write_many, delete_many,
+copy_many) and backends/batch.py, against a backend that fails some items.
+
+Covers:
+- One BatchResult per input, in input order, failures carried not raised
+- Only the failed items are retried; permanent failures are not
+- Bulk deletes re-send only the keys that failed transiently
+- Backends without a bulk delete get single deletes
+- run_bounded / arun_bounded, chunked, group_by_bucket
+"""
+
+import asyncio
+import sys
+import threading
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent.parent))
+
+from matrx_utils.file_handling.backends import BackendRouter, StorageHTTPError
+from matrx_utils.file_handling.backends.batch import arun_bounded, chunked, group_by_bucket, run_bounded
+from matrx_utils.file_handling.backends.retry import RetryPolicy
+from matrx_utils.file_handling.backends.tests.memory_backend import MemoryBackend
+
+URIS = [f"supabase://docs/{name}.txt" for name in ("a", "b", "c", "d", "e")]
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+def _unavailable(path: str) -> StorageHTTPError:
+    return StorageHTTPError(f"{path}: HTTP 503", 503)
+
+
+def _forbidden(path: str) -> StorageHTTPError:
+    return StorageHTTPError(f"{path}: HTTP 403", 403)
+
+
+class FlakyBackend(MemoryBackend):
+    """MemoryBackend whose listed paths fail a set number of times, per operation."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.failures: dict[str, list[Exception]] = {}
+        self.calls: Counter[tuple[str, str]] = Counter()
+        self._lock = threading.Lock()
+
+    def _maybe_fail(self, op: str, path: str) -> None:
+        with self._lock:
+            self.calls[op, path] += 1
+            pending = self.failures.get(path)
+            if pending:
+                raise pending.pop(0)
+
+    def read(self, path):
+        self._maybe_fail("read", path)
+        return super().read(path)
+
+    def write(self, path, content, **kwargs):
+        self._maybe_fail("write", path)
+        return super().write(path, content, **kwargs)
+
+    def copy(self, src, dst):
+        self._maybe_fail("copy", src)
+        return super().copy(src, dst)
+
+    def delete(self, path):
+        self._maybe_fail("delete", path)
+        return super().delete(path)
+
+
+class BulkBackend(FlakyBackend):
+    """FlakyBackend with a native bulk delete; records each batch it is sent."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: list[list[str]] = []
+
+    def delete_many(self, paths):
+        self.batches.append(list(paths))
+        results = {}
+        for path in paths:
+            try:
+                self.delete(path)
+                results[path] = None
+            except Exception as exc:
+                results[path] = exc
+        return results
+
+    async def delete_many_async(self, paths):
+        return self.delete_many(paths)
+
+
+def _router(backend: MemoryBackend) -> BackendRouter:
+    policy = RetryPolicy(base_delay=0.0, max_delay=0.0, breaker_threshold=0)
+    router = BackendRouter(url_cache=False, retry_policy=policy)
+    router._supabase = backend
+    return router
+
+
+@pytest.fixture()
+def backend() -> FlakyBackend:
+    backend = FlakyBackend()
+    for uri in URIS:
+        path = uri.removeprefix("supabase://")
+        backend._put(path, path.encode())
+    # b fails once (retried), d is forbidden (not retried).
+    backend.failures = {"docs/b.txt": [_unavailable("docs/b.txt")], "docs/d.txt": [_forbidden("docs/d.txt")]}
+    return backend
+
+
+def _assert_aligned(results, items) -> None:
+    assert [r.item for r in results] == items
+    assert [r.ok for r in results] == [True, True, True, False, True]
+    assert results[3].error.status_code == 403
+    with pytest.raises(StorageHTTPError):
+        results[3].unwrap()
+
+
+def _calls(backend: FlakyBackend, op: str) -> dict[str, int]:
+    return {path: n for (name, path), n in backend.calls.items() if name == op}
+
+
+# ---------------------------------------------------------------------------
+# Router batch calls
+# ---------------------------------------------------------------------------
+
+class TestReadWriteCopyMany:
+    def test_read_many(self, backend):
+        results = _router(backend).read_many(URIS, max_concurrency=3)
+        _assert_aligned(results, URIS)
+        assert [r.value for r in results if r.ok] == [b"docs/a.txt", b"docs/b.txt", b"docs/c.txt", b"docs/e.txt"]
+        assert _calls(backend, "read") == {
+            "docs/a.txt": 1, "docs/b.txt": 2, "docs/c.txt": 1, "docs/d.txt": 1, "docs/e.txt": 1,
+        }
+
+    def test_write_many(self, backend):
+        results = _router(backend).write_many({uri: b"new" for uri in URIS}, max_concurrency=3)
+        _assert_aligned(results, URIS)
+        assert _calls(backend, "write")["docs/b.txt"] == 2
+        assert _calls(backend, "write")["docs/d.txt"] == 1
+        assert backend.objects["docs/b.txt"] == b"new"
+        assert backend.objects["docs/d.txt"] == b"docs/d.txt"
+
+    def test_copy_many(self, backend):
+        pairs = [(uri, uri.replace("docs/", "copies/")) for uri in URIS]
+        results = _router(backend).copy_many(pairs, max_concurrency=3)
+        _assert_aligned(results, pairs)
+        assert _calls(backend, "copy")["docs/b.txt"] == 2
+        assert "copies/d.txt" not in backend.objects
+        assert backend.objects["copies/b.txt"] == b"docs/b.txt"
+
+    def test_unparseable_uri_is_its_own_failure(self, backend):
+        results = _router(backend).read_many(["supabase://docs/a.txt", "ftp://nope/x"])
+        assert [r.ok for r in results] == [True, False]
+        assert results[1].item == "ftp://nope/x"
+
+    def test_async(self, backend):
+        router = _router(backend)
+
+        async def run():
+            return await router.read_many_async(URIS, max_concurrency=2)
+
+        _assert_aligned(asyncio.run(run()), URIS)
+        assert _calls(backend, "read")["docs/b.txt"] == 2
+
+
+class TestDeleteMany:
+    def test_bulk_resends_only_transient_failures(self, backend):
+        bulk = BulkBackend()
+        bulk.objects, bulk.modified, bulk.failures = backend.objects, backend.modified, backend.failures
+        results = _router(bulk).delete_many(URIS)
+        _assert_aligned(results, URIS)
+        assert bulk.batches == [[uri.removeprefix("supabase://") for uri in URIS], ["docs/b.txt"]]
+        assert sorted(bulk.objects) == ["docs/d.txt"]
+
+    def test_bulk_async(self, backend):
+        bulk = BulkBackend()
+        bulk.objects, bulk.modified, bulk.failures = backend.objects, backend.modified, backend.failures
+        results = asyncio.run(_router(bulk).delete_many_async(URIS))
+        _assert_aligned(results, URIS)
+        assert bulk.batches[1:] == [["docs/b.txt"]]
+
+    def test_single_deletes_without_bulk_endpoint(self, backend):
+        assert not backend.has_bulk_delete()
+        results = _router(backend).delete_many(URIS, max_concurrency=2)
+        _assert_aligned(results, URIS)
+        assert _calls(backend, "delete") == {
+            "docs/a.txt": 1, "docs/b.txt": 2, "docs/c.txt": 1, "docs/d.txt": 1, "docs/e.txt": 1,
+        }
+
+
+# ---------------------------------------------------------------------------
+# batch.py helpers
+# ---------------------------------------------------------------------------
+
+class TestHelpers:
+    def test_run_bounded_keeps_order_and_limit(self):
+        active = peak = 0
+        lock = threading.Lock()
+
+        def work(n: int) -> int:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            try:
+                if n % 3 == 0:
+                    raise ValueError(n)
+                return n * 10
+            finally:
+                with lock:
+                    active -= 1
+
+        results = run_bounded(work, range(10), max_concurrency=3)
+        assert [r.item for r in results] == list(range(10))
+        assert [r.value for r in results if r.ok] == [10, 20, 40, 50, 70, 80]
+        assert all(isinstance(r.error, ValueError) for r in results if not r.ok)
+        assert peak <= 3
+
+    def test_arun_bounded_limit(self):
+        active = peak = 0
+
+        async def work(n: int) -> int:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0)
+            active -= 1
+            return n
+
+        results = asyncio.run(arun_bounded(work, range(8), max_concurrency=2))
+        assert [r.value for r in results] == list(range(8))
+        assert peak == 2
+
+    def test_chunked(self):
+        assert [len(c) for c in chunked(list(range(2500)), 1000)] == [1000, 1000, 500]
+        assert list(chunked([], 1000)) == []
+
+    def test_group_by_bucket(self):
+        def parse(path: str) -> tuple[str, str]:
+            bucket, _, key = path.partition("/")
+            if not key:
+                raise ValueError(path)
+            return bucket, key
+
+        groups, rejected = group_by_bucket(["a/1", "b/2", "a/3", "bare"], parse)
+        assert groups == {"a": [("a/1", "1"), ("a/3", "3")], "b": [("b/2", "2")]}
+        assert list(rejected) == ["bare"]
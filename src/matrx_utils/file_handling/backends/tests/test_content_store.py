@@ -0,0 +1,235 @@
+"""
+Tests for ContentStore (backends/content_store.py) against an in-memory backend.
+
+Covers:
+- Dedup hits skip the blob upload and refresh the blob's modified time
+- A hit on a blob that vanished uploads it again
+- Overwrites move the path's reference to the new blob
+- delete() drops the path, its reference and its index entry
+- gc() honours references and the grace period
+- gc() re-checks references and age right before each delete
+- Pointer mode and the async API
+"""
+
+import asyncio
+import hashlib
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent.parent))
+
+from matrx_utils.file_handling.backends import BackendRouter, FileEntry
+from matrx_utils.file_handling.backends.tests.memory_backend import MemoryBackend
+
+ROOT = "supabase://media/.cas"
+PAYLOAD = b"png-bytes" * 1000
+DIGEST = hashlib.sha256(PAYLOAD).hexdigest()
+BLOB = f"media/.cas/blobs/{DIGEST[:2]}/{DIGEST}"
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+@pytest.fixture()
+def backend() -> MemoryBackend:
+    return MemoryBackend()
+
+
+@pytest.fixture()
+def router(backend) -> BackendRouter:
+    router = BackendRouter(url_cache=False)
+    router._supabase = backend
+    return router
+
+
+@pytest.fixture()
+def store(router):
+    return router.content_store(ROOT)
+
+
+def _age(backend: MemoryBackend, path: str, seconds: float = 3600) -> None:
+    backend.modified[path] -= timedelta(seconds=seconds)
+
+
+def _refs(backend: MemoryBackend, digest: str = DIGEST) -> list[str]:
+    return backend.list_files(f"media/.cas/refs/{digest}/")
+
+
+# ---------------------------------------------------------------------------
+# Writes
+# ---------------------------------------------------------------------------
+
+class TestDedupWrites:
+    def test_first_write_uploads_blob(self, store, backend):
+        assert store.write("supabase://media/u/1.png", PAYLOAD) == DIGEST
+        assert store.misses == 1 and store.hits == 0
+        assert backend.objects[BLOB] == PAYLOAD
+        assert backend.objects["media/u/1.png"] == PAYLOAD
+        assert (BLOB, "media/u/1.png") in backend.copies
+
+    def test_hit_skips_upload(self, store, backend):
+        store.write("supabase://media/u/1.png", PAYLOAD)
+        uploaded = backend.uploaded
+        store.write("supabase://media/u/2.png", PAYLOAD)
+        assert store.hits == 1 and store.bytes_skipped == len(PAYLOAD)
+        assert backend.uploaded - uploaded < 1000  # only the reference and index entry
+        assert backend.objects["media/u/2.png"] == PAYLOAD
+        assert len(_refs(backend)) == 2
+
+    def test_hit_refreshes_blob_time(self, store, backend):
+        store.write("supabase://media/u/1.png", PAYLOAD)
+        _age(backend, BLOB, 7 * 24 * 3600)
+        store.write("supabase://media/u/2.png", PAYLOAD)
+        assert (BLOB, BLOB) in backend.copies
+        assert backend.modified[BLOB] > datetime.now(timezone.utc) - timedelta(minutes=1)
+
+    def test_hit_on_vanished_blob_uploads_again(self, store, backend, monkeypatch):
+        store.write("supabase://media/u/1.png", PAYLOAD)
+        real_copy = backend.copy
+
+        def copy(src, dst):
+            if src == dst:
+                backend.delete(src)  # collected between the existence check and the refresh
+            return real_copy(src, dst)
+
+        monkeypatch.setattr(backend, "copy", copy)
+        store.write("supabase://media/u/2.png", PAYLOAD)
+        assert store.misses == 2
+        assert backend.objects[BLOB] == PAYLOAD
+
+    def test_overwrite_moves_reference(self, store, backend):
+        store.write("supabase://media/u/1.png", PAYLOAD)
+        other = store.write("supabase://media/u/1.png", b"other")
+        assert _refs(backend) == []
+        assert len(_refs(backend, other)) == 1
+        assert store.lookup("supabase://media/u/1.png") == other
+
+    def test_rewrite_same_content_keeps_reference(self, store, backend):
+        store.write("supabase://media/u/1.png", PAYLOAD)
+        store.write("supabase://media/u/1.png", PAYLOAD)
+        assert len(_refs(backend)) == 1
+
+    def test_delete_drops_path_reference_and_index(self, store, backend):
+        store.write("supabase://media/u/1.png", PAYLOAD)
+        store.delete("supabase://media/u/1.png")
+        assert "media/u/1.png" not in backend.objects
+        assert _refs(backend) == []
+        assert store.lookup("supabase://media/u/1.png") is None
+        assert BLOB in backend.objects  # reclaimed by gc(), not delete()
+
+    def test_pointer_mode(self, router, backend):
+        store = router.content_store(ROOT, mode="pointer")
+        store.write("supabase://media/p/1.bin", PAYLOAD)
+        store.write("supabase://media/p/2.bin", PAYLOAD)
+        assert len(backend.objects["media/p/1.bin"]) < 300
+        assert store.read("supabase://media/p/2.bin") == PAYLOAD
+        assert store.get_url("supabase://media/p/1.bin") == f"https://signed.example/{BLOB}"
+
+    def test_invalid_mode(self, router):
+        with pytest.raises(ValueError):
+            router.content_store(ROOT, mode="hardlink")
+
+
+# ---------------------------------------------------------------------------
+# Garbage collection
+# ---------------------------------------------------------------------------
+
+class TestGc:
+    def test_keeps_referenced_and_recent_blobs(self, store, backend):
+        store.write("supabase://media/u/1.png", PAYLOAD)
+        _age(backend, BLOB)
+        assert store.gc(grace=60) == 0
+        store.delete("supabase://media/u/1.png")
+        assert store.gc() == 0  # inside the default grace period
+        assert BLOB in backend.objects
+
+    def test_collects_unreferenced_old_blobs(self, store, backend):
+        store.write("supabase://media/u/1.png", PAYLOAD)
+        store.write("supabase://media/u/2.png", b"kept")
+        store.delete("supabase://media/u/1.png")
+        for path in backend.list_files("media/.cas/blobs/"):
+            _age(backend, path)
+        assert store.gc(grace=60) == 1
+        assert BLOB not in backend.objects
+        assert store.read("supabase://media/u/2.png") == b"kept"
+
+    def test_blob_reused_during_gc_survives(self, store, router, backend, monkeypatch):
+        other = b"second blob"
+        store.write("supabase://media/u/1.png", PAYLOAD)
+        store.write("supabase://media/u/2.png", other)
+        store.delete("supabase://media/u/1.png")
+        store.delete("supabase://media/u/2.png")
+        for path in backend.list_files("media/.cas/blobs/"):
+            _age(backend, path)
+        real_iter = router.iter_files
+
+        def iter_files(prefix, *args, **kwargs):
+            for entry in real_iter(prefix, *args, **kwargs):
+                yield entry
+                if prefix == f"{ROOT}/blobs/":
+                    # A writer reuses every blob right after gc() has seen it.
+                    digest = entry.path.rsplit("/", 1)[-1]
+                    content = PAYLOAD if digest == DIGEST else other
+                    store.write(f"supabase://media/new/{digest}", content)
+
+        monkeypatch.setattr(router, "iter_files", iter_files)
+        store.gc(grace=60)
+        assert store.read(f"supabase://media/new/{DIGEST}") == PAYLOAD
+        assert store.read(f"supabase://media/new/{hashlib.sha256(other).hexdigest()}") == other
+        assert BLOB in backend.objects
+
+    def test_blob_refreshed_since_listing_survives(self, store, router, backend, monkeypatch):
+        store.write("supabase://media/u/1.png", PAYLOAD)
+        store.delete("supabase://media/u/1.png")
+        real_iter = router.iter_files
+        stale = datetime.now(timezone.utc) - timedelta(days=30)
+
+        def iter_files(prefix, *args, **kwargs):
+            for entry in real_iter(prefix, *args, **kwargs):
+                if prefix == f"{ROOT}/blobs/":
+                    entry = FileEntry(entry.path, entry.size, last_modified=stale)
+                yield entry
+
+        monkeypatch.setattr(router, "iter_files", iter_files)
+        assert store.gc(grace=60) == 0
+        assert BLOB in backend.objects
+
+    def test_unknown_age_is_never_collected(self, store, router, backend, monkeypatch):
+        store.write("supabase://media/u/1.png", PAYLOAD)
+        store.delete("supabase://media/u/1.png")
+        real_iter = router.iter_files
+
+        def iter_files(prefix, *args, **kwargs):
+            for entry in real_iter(prefix, *args, **kwargs):
+                yield FileEntry(entry.path, entry.size)
+
+        monkeypatch.setattr(router, "iter_files", iter_files)
+        assert store.gc(grace=0) == 0
+
+
+# ---------------------------------------------------------------------------
+# Async API
+# ---------------------------------------------------------------------------
+
+class TestAsync:
+    def test_async_write_read_delete(self, store, backend):
+        async def run():
+            async def chunks():
+                for i in range(0, len(PAYLOAD), 4096):
+                    yield PAYLOAD[i : i + 4096]
+
+            assert await store.write_async("supabase://media/a/1", chunks()) == DIGEST
+            _age(backend, BLOB)
+            assert await store.write_async("supabase://media/a/2", PAYLOAD) == DIGEST
+            assert await store.read_async("supabase://media/a/2") == PAYLOAD
+            await store.delete_async("supabase://media/a/1")
+            assert await store.lookup_async("supabase://media/a/1") is None
+            assert await store.lookup_async("supabase://media/a/2") == DIGEST
+
+        asyncio.run(run())
+        assert store.misses == 1 and store.hits == 1
+        assert backend.modified[BLOB] > datetime.now(timezone.utc) - timedelta(minutes=1)
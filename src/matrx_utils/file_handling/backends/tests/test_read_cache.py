@@ -0,0 +1,243 @@
+"""
+Tests for ReadCache (backends/read_cache.py) with a fake origin.
+
+Covers:
+- Misses download, hits revalidate with a 304 and no body
+- revalidate_after serves without a round trip
+- A router write invalidates the entry
+- An invalidate during a download leaves the stored entry unvalidated
+- Objects without an ETag are not cached
+- Memory and disk caps, LRU eviction
+- The index is rebuilt from the sidecar files on start-up
+"""
+
+import asyncio
+import hashlib
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent.parent))
+
+from matrx_utils.file_handling.backends import BackendRouter, ReadCache
+from matrx_utils.file_handling.backends.tests.memory_backend import MemoryBackend
+
+URI = "s3://assets/page.html"
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+class FakeOrigin:
+    """fetch(etag) over a dict of objects; records the ETag sent with each call."""
+
+    def __init__(self, etags: bool = True) -> None:
+        self.objects: dict[str, bytes] = {}
+        self.etags = etags
+        self.calls: list[tuple[str, str | None]] = []
+
+    def etag(self, uri: str) -> str | None:
+        return hashlib.md5(self.objects[uri]).hexdigest() if self.etags else None
+
+    def fetch(self, uri: str):
+        def _fetch(etag: str | None) -> tuple[bytes | None, str | None]:
+            self.calls.append((uri, etag))
+            current = self.etag(uri)
+            if etag is not None and etag == current:
+                return None, current
+            return self.objects[uri], current
+
+        return _fetch
+
+
+class EtagBackend(MemoryBackend):
+    """MemoryBackend answering conditional GETs with a content ETag."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.downloads = 0
+
+    def _read_if_changed(self, path, etag):
+        current = hashlib.md5(self._get(path)).hexdigest()
+        if etag == current:
+            return None, current
+        self.downloads += 1
+        return self._get(path), current
+
+    async def _read_if_changed_async(self, path, etag):
+        return self._read_if_changed(path, etag)
+
+
+@pytest.fixture()
+def origin() -> FakeOrigin:
+    origin = FakeOrigin()
+    origin.objects[URI] = b"<html>v1</html>"
+    return origin
+
+
+@pytest.fixture()
+def cache(tmp_path) -> ReadCache:
+    return ReadCache(tmp_path / "cache")
+
+
+# ---------------------------------------------------------------------------
+# Read-through
+# ---------------------------------------------------------------------------
+
+class TestRevalidation:
+    def test_miss_then_304_hit(self, cache, origin):
+        assert cache.read(URI, origin.fetch(URI)) == b"<html>v1</html>"
+        assert cache.read(URI, origin.fetch(URI)) == b"<html>v1</html>"
+        assert origin.calls == [(URI, None), (URI, origin.etag(URI))]
+        assert cache.stats.misses == 1
+        assert cache.stats.revalidations == 1
+        assert cache.stats.memory_hits == 1
+
+    def test_changed_object_is_downloaded(self, cache, origin):
+        cache.read(URI, origin.fetch(URI))
+        origin.objects[URI] = b"<html>v2</html>"
+        assert cache.read(URI, origin.fetch(URI)) == b"<html>v2</html>"
+        assert cache.stats.misses == 2
+        assert cache.read(URI, origin.fetch(URI)) == b"<html>v2</html>"
+        assert cache.stats.revalidations == 1
+
+    def test_revalidate_after_skips_round_trip(self, tmp_path, origin):
+        cache = ReadCache(tmp_path / "cache", revalidate_after=60)
+        cache.read(URI, origin.fetch(URI))
+        cache.read(URI, origin.fetch(URI))
+        assert len(origin.calls) == 1
+
+    def test_async_read(self, cache, origin):
+        async def fetch(etag):
+            return origin.fetch(URI)(etag)
+
+        async def run():
+            assert await cache.read_async(URI, fetch) == b"<html>v1</html>"
+            assert await cache.read_async(URI, fetch) == b"<html>v1</html>"
+
+        asyncio.run(run())
+        assert cache.stats.revalidations == 1
+
+    def test_no_etag_is_not_cached(self, cache):
+        origin = FakeOrigin(etags=False)
+        origin.objects[URI] = b"dynamic"
+        cache.read(URI, origin.fetch(URI))
+        cache.read(URI, origin.fetch(URI))
+        assert URI not in cache
+        assert origin.calls == [(URI, None), (URI, None)]
+        assert list(cache.directory.iterdir()) == []
+
+
+class TestInvalidation:
+    def test_router_write_invalidates(self, tmp_path):
+        backend = EtagBackend()
+        backend._put("site/page.html", b"v1")
+        router = BackendRouter(cache=ReadCache(tmp_path / "cache"), url_cache=False)
+        router._supabase = backend
+        uri = "supabase://site/page.html"
+        assert router.read(uri) == b"v1"
+        assert router.read(uri) == b"v1"
+        assert backend.downloads == 1
+        router.write(uri, b"v2")
+        assert uri not in router.cache
+        assert router.read(uri) == b"v2"
+        assert router.cache.stats.invalidations == 1
+
+    def test_invalidate_during_download_leaves_entry_unvalidated(self, tmp_path, origin):
+        cache = ReadCache(tmp_path / "cache", revalidate_after=3600)
+        inner = origin.fetch(URI)
+
+        def racing_fetch(etag):
+            result = inner(etag)
+            cache.invalidate(URI)  # a write through the router lands mid-download
+            return result
+
+        assert cache.read(URI, racing_fetch) == b"<html>v1</html>"
+        assert URI in cache
+        # Stored, but revalidate_after does not apply: the next read asks the origin.
+        cache.read(URI, origin.fetch(URI))
+        assert origin.calls[-1] == (URI, origin.etag(URI))
+        assert cache.stats.revalidations == 1
+
+    def test_invalidate_removes_files(self, cache, origin):
+        cache.read(URI, origin.fetch(URI))
+        cache.invalidate(URI)
+        assert URI not in cache
+        assert list(cache.directory.iterdir()) == []
+        assert cache.disk_bytes == 0 and cache.memory_bytes_used == 0
+
+
+# ---------------------------------------------------------------------------
+# Caps and eviction
+# ---------------------------------------------------------------------------
+
+class TestCaps:
+    def _fill(self, cache: ReadCache, origin: FakeOrigin, sizes: dict[str, int]) -> None:
+        for uri, size in sizes.items():
+            origin.objects[uri] = bytes([len(uri) % 256]) * size
+            cache.read(uri, origin.fetch(uri))
+
+    def test_disk_cap_evicts_least_recently_used(self, tmp_path):
+        cache = ReadCache(tmp_path / "cache", max_bytes=250)
+        origin = FakeOrigin()
+        self._fill(cache, origin, {"s3://b/a": 100, "s3://b/b": 100})
+        cache.read("s3://b/a", origin.fetch("s3://b/a"))  # a is now most recent
+        self._fill(cache, origin, {"s3://b/c": 100})
+        assert "s3://b/a" in cache and "s3://b/c" in cache
+        assert "s3://b/b" not in cache
+        assert cache.disk_bytes == 200
+        assert cache.stats.evictions == 1
+        assert len(list(cache.directory.glob("*.bin"))) == 2
+
+    def test_object_over_disk_cap_is_not_cached(self, tmp_path):
+        cache = ReadCache(tmp_path / "cache", max_bytes=50)
+        origin = FakeOrigin()
+        self._fill(cache, origin, {"s3://b/big": 100})
+        assert len(cache) == 0
+
+    def test_memory_cap(self, tmp_path):
+        cache = ReadCache(tmp_path / "cache", memory_bytes=150, memory_item_bytes=80)
+        origin = FakeOrigin()
+        self._fill(cache, origin, {"s3://b/a": 60, "s3://b/b": 60, "s3://b/c": 60, "s3://b/big": 100})
+        assert cache.memory_bytes_used == 120  # b and c; a dropped, big never held
+        assert cache.disk_bytes == 280
+        cache.read("s3://b/big", origin.fetch("s3://b/big"))
+        cache.read("s3://b/c", origin.fetch("s3://b/c"))
+        assert cache.stats.disk_hits == 1
+        assert cache.stats.memory_hits == 1
+
+
+# ---------------------------------------------------------------------------
+# Restart
+# ---------------------------------------------------------------------------
+
+class TestIndexRebuild:
+    def test_rebuilt_from_sidecars(self, tmp_path):
+        origin = FakeOrigin()
+        first = ReadCache(tmp_path / "cache")
+        for n, uri in enumerate(("s3://b/old", "s3://b/new")):
+            origin.objects[uri] = b"x" * 10
+            first.read(uri, origin.fetch(uri))
+            os.utime(first._bin_path(uri), (1_000 + n, 1_000 + n))
+
+        second = ReadCache(tmp_path / "cache", max_bytes=15)
+        assert "s3://b/new" in second and "s3://b/old" not in second
+        assert second.disk_bytes == 10
+        origin.calls.clear()
+        assert second.read("s3://b/new", origin.fetch("s3://b/new")) == b"x" * 10
+        assert origin.calls == [("s3://b/new", origin.etag("s3://b/new"))]
+        assert second.stats.disk_hits == 1
+
+    def test_broken_sidecars_and_temp_files_are_removed(self, tmp_path):
+        directory = tmp_path / "cache"
+        directory.mkdir()
+        (directory / "orphan.json").write_text('{"uri": "s3://b/x", "etag": "e"}', encoding="utf-8")
+        (directory / "garbled.json").write_text("{", encoding="utf-8")
+        (directory / "garbled.bin").write_bytes(b"x")
+        (directory / "partial.tmp").write_bytes(b"x")
+        cache = ReadCache(directory)
+        assert len(cache) == 0
+        assert list(directory.iterdir()) == []
@@ -0,0 +1,321 @@
+"""
+Tests for the router's retry policy (backends/retry.py).
+
+Covers:
+- is_retryable() classification by type, status code and S3 error code
+- Retrier retries transient errors only, up to max_attempts
+- Retry budget exhaustion and refill
+- Deadline stops retrying
+- Circuit breaker: open -> fail fast -> half-open probe success / failure
+- A cancelled or interrupted probe frees the probe slot; a stuck probe expires
+"""
+
+import asyncio
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent.parent))
+
+from matrx_utils.file_handling.backends import retry
+from matrx_utils.file_handling.backends.retry import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitOpenError,
+    Retrier,
+    RetryPolicy,
+    StorageHTTPError,
+    is_retryable,
+)
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture()
+def clock(monkeypatch) -> FakeClock:
+    fake = FakeClock()
+    monkeypatch.setattr(retry, "time", types.SimpleNamespace(monotonic=fake.monotonic, sleep=fake.sleep))
+
+    async def _sleep(seconds: float) -> None:
+        fake.sleep(seconds)
+
+    monkeypatch.setattr(retry, "asyncio", types.SimpleNamespace(sleep=_sleep))
+    return fake
+
+
+class Flaky:
+    """Raises *exc* for the first *failures* calls, then returns "ok"."""
+
+    def __init__(self, failures: int, exc: BaseException | None = None) -> None:
+        self.failures = failures
+        self.exc = exc or ConnectionResetError("reset")
+        self.calls = 0
+
+    def __call__(self) -> str:
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise self.exc
+        return "ok"
+
+
+def _client_error(code: str, status: int) -> Exception:
+    from botocore.exceptions import ClientError
+
+    return ClientError({"Error": {"Code": code}, "ResponseMetadata": {"HTTPStatusCode": status}}, "GetObject")
+
+
+def _fail(retrier: Retrier, fn) -> None:
+    with pytest.raises(Exception):
+        retrier.call(fn)
+
+
+# ---------------------------------------------------------------------------
+# Classification
+# ---------------------------------------------------------------------------
+
+class TestIsRetryable:
+    @pytest.mark.parametrize(
+        "exc",
+        [
+            StorageHTTPError("HTTP 503", 503),
+            StorageHTTPError("HTTP 429", 429),
+            StorageHTTPError("HTTP 408", 408),
+            ConnectionResetError(),
+            TimeoutError(),
+            OSError("socket closed"),
+        ],
+    )
+    def test_transient(self, exc):
+        assert is_retryable(exc)
+
+    @pytest.mark.parametrize(
+        "exc",
+        [
+            StorageHTTPError("HTTP 404", 404),
+            StorageHTTPError("HTTP 403", 403),
+            RuntimeError("not configured"),
+            ValueError("bad uri, HTTP 500 in the text"),
+            FileNotFoundError("x"),
+            PermissionError("x"),
+            KeyError("timeout"),
+            Exception("connection reset 503"),
+            CircuitOpenError("open"),
+        ],
+    )
+    def test_permanent(self, exc):
+        assert not is_retryable(exc)
+
+    def test_s3_codes(self):
+        pytest.importorskip("botocore")
+        assert is_retryable(_client_error("SlowDown", 503))
+        assert is_retryable(_client_error("Throttling", 400))
+        assert is_retryable(_client_error("InternalError", 500))
+        assert not is_retryable(_client_error("NoSuchKey", 404))
+        assert not is_retryable(_client_error("AccessDenied", 403))
+
+    def test_httpx_errors(self):
+        httpx = pytest.importorskip("httpx")
+        request = httpx.Request("GET", "http://example.invalid")
+        assert is_retryable(httpx.ConnectTimeout("slow", request=request))
+        bad_gateway = httpx.Response(502, request=request)
+        assert is_retryable(httpx.HTTPStatusError("502", request=request, response=bad_gateway))
+        unauthorized = httpx.Response(401, request=request)
+        assert not is_retryable(httpx.HTTPStatusError("401", request=request, response=unauthorized))
+
+
+# ---------------------------------------------------------------------------
+# Retries, budget, deadline
+# ---------------------------------------------------------------------------
+
+class TestRetrier:
+    def test_retries_transient_until_success(self, clock):
+        fn = Flaky(2)
+        assert Retrier("t", RetryPolicy()).call(fn) == "ok"
+        assert fn.calls == 3
+        assert len(clock.sleeps) == 2
+
+    def test_gives_up_after_max_attempts(self, clock):
+        fn = Flaky(10)
+        with pytest.raises(ConnectionResetError):
+            Retrier("t", RetryPolicy(max_attempts=3)).call(fn)
+        assert fn.calls == 3
+
+    def test_permanent_error_not_retried(self, clock):
+        fn = Flaky(10, StorageHTTPError("HTTP 404", 404))
+        with pytest.raises(StorageHTTPError):
+            Retrier("t", RetryPolicy()).call(fn)
+        assert fn.calls == 1 and clock.sleeps == []
+
+    def test_backoff_is_jittered_and_capped(self):
+        policy = RetryPolicy(base_delay=0.5, max_delay=4.0)
+        first = {policy.backoff(None) for _ in range(200)}
+        assert all(0.5 <= d <= 1.5 for d in first) and len(first) > 50
+        assert all(policy.backoff(10.0) <= 4.0 for _ in range(50))
+
+    def test_budget_exhaustion(self, clock):
+        retrier = Retrier("t", RetryPolicy(budget_capacity=2, budget_refill=0, breaker_threshold=0))
+        fn = Flaky(100)
+        for _ in range(3):
+            _fail(retrier, fn)
+        # Two retries on the first call, then the bucket is empty.
+        assert fn.calls == 5
+        assert retrier.budget.tokens == 0
+
+    def test_budget_refills_on_success(self, clock):
+        retrier = Retrier("t", RetryPolicy(budget_capacity=1, budget_refill=0.5))
+        retrier.budget.tokens = 0
+        retrier.call(lambda: 1)
+        retrier.call(lambda: 1)
+        assert retrier.budget.try_spend()
+        assert not retrier.budget.try_spend()
+
+    def test_deadline_stops_retrying(self, clock):
+        fn = Flaky(10)
+        with pytest.raises(ConnectionResetError):
+            Retrier("t", RetryPolicy(base_delay=5, deadline=1)).call(fn)
+        assert fn.calls == 1
+
+    def test_bulk_reruns_only_transient_items(self, clock):
+        calls = []
+
+        def run(items):
+            calls.append(list(items))
+            first = len(calls) == 1
+            return {
+                key: StorageHTTPError("HTTP 500", 500) if key == "b" and first
+                else StorageHTTPError("HTTP 404", 404) if key == "c"
+                else None
+                for key in items
+            }
+
+        results = Retrier("t", RetryPolicy()).call_bulk(run, ["a", "b", "c"])
+        assert calls == [["a", "b", "c"], ["b"]]
+        assert results["b"] is None and isinstance(results["c"], StorageHTTPError)
+
+    def test_async_retries(self, clock):
+        attempts = {"n": 0}
+
+        async def fn():
+            attempts["n"] += 1
+            if attempts["n"] < 3:
+                raise TimeoutError()
+            return 7
+
+        assert asyncio.run(Retrier("t", RetryPolicy()).call_async(fn)) == 7
+        assert attempts["n"] == 3
+
+
+# ---------------------------------------------------------------------------
+# Circuit breaker
+# ---------------------------------------------------------------------------
+
+def _open_breaker(clock: FakeClock) -> tuple[Retrier, Flaky]:
+    retrier = Retrier("t", RetryPolicy(max_attempts=1, breaker_threshold=3, breaker_reset=30))
+    bad = Flaky(1000)
+    for _ in range(3):
+        _fail(retrier, bad)
+    assert retrier.breaker.state == OPEN
+    return retrier, bad
+
+
+class TestCircuitBreaker:
+    def test_open_fails_fast(self, clock):
+        retrier, bad = _open_breaker(clock)
+        with pytest.raises(CircuitOpenError):
+            retrier.call(bad)
+        assert bad.calls == 3
+
+    def test_probe_success_closes(self, clock):
+        retrier, _ = _open_breaker(clock)
+        clock.now += 31
+        assert retrier.call(lambda: "up") == "up"
+        assert retrier.breaker.state == CLOSED and retrier.breaker.failures == 0
+
+    def test_probe_failure_reopens(self, clock):
+        retrier, bad = _open_breaker(clock)
+        clock.now += 31
+        with pytest.raises(ConnectionResetError):
+            retrier.call(bad)
+        assert retrier.breaker.state == OPEN
+        with pytest.raises(CircuitOpenError):
+            retrier.call(lambda: "up")
+
+    def test_only_one_probe_at_a_time(self, clock):
+        retrier, _ = _open_breaker(clock)
+        clock.now += 31
+        assert retrier.breaker.before_call() is True
+        assert retrier.breaker.state == HALF_OPEN
+        with pytest.raises(CircuitOpenError):
+            retrier.call(lambda: "second")
+
+    def test_cancelled_async_probe_frees_slot(self, clock):
+        retrier, _ = _open_breaker(clock)
+        clock.now += 31
+
+        async def hang():
+            await asyncio.Event().wait()
+
+        async def cancel_probe():
+            task = asyncio.ensure_future(retrier.call_async(hang))
+            await asyncio.sleep(0)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(cancel_probe())
+        assert retrier.breaker.state == HALF_OPEN
+        assert retrier.call(lambda: "up") == "up"
+        assert retrier.breaker.state == CLOSED
+
+    def test_interrupted_sync_probe_frees_slot(self, clock):
+        retrier, _ = _open_breaker(clock)
+        clock.now += 31
+        with pytest.raises(KeyboardInterrupt):
+            retrier.call(Flaky(1, KeyboardInterrupt()))
+        assert retrier.call(lambda: "up") == "up"
+
+    def test_stuck_probe_expires(self, clock):
+        retrier, _ = _open_breaker(clock)
+        clock.now += 31
+        assert retrier.breaker.before_call() is True  # a probe that never reports back
+        with pytest.raises(CircuitOpenError):
+            retrier.call(lambda: "up")
+        clock.now += 31
+        assert retrier.call(lambda: "up") == "up"
+
+    def test_permanent_error_counts_as_healthy(self, clock):
+        retrier = Retrier("t", RetryPolicy(max_attempts=1, breaker_threshold=2))
+        _fail(retrier, Flaky(1))
+        _fail(retrier, Flaky(1, StorageHTTPError("HTTP 404", 404)))
+        _fail(retrier, Flaky(1))
+        assert retrier.breaker.state == CLOSED
+
+    def test_local_error_does_not_close_probe(self, clock):
+        retrier, _ = _open_breaker(clock)
+        clock.now += 31
+        _fail(retrier, Flaky(1, ValueError("bad path")))
+        assert retrier.breaker.state == HALF_OPEN
+
+    def test_disabled_breaker(self, clock):
+        retrier = Retrier("t", RetryPolicy(max_attempts=1, breaker_threshold=0))
+        for _ in range(10):
+            _fail(retrier, Flaky(1))
+        assert retrier.call(lambda: "up") == "up"
@@ -0,0 +1,223 @@
+"""
+Tests for S3Backend (backends/s3_backend.py) against a stubbed boto3 client.
+
+Covers:
+- Multipart upload: parts completing out of order are completed sorted
+- A failing part aborts the multipart upload
+- A lazy source is never pulled more than max_concurrency parts ahead
+- Concurrent ranged-GET read(): ranges pinned to the first ETag, reassembled in order
+- delete_many(): DeleteObjects chunked at 1000 keys per bucket, per-key errors
+"""
+
+import re
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent.parent))
+
+from matrx_utils.file_handling.backends.s3_backend import _MIN_PART_SIZE, S3Backend
+
+PART = _MIN_PART_SIZE
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+class StubBody:
+    def __init__(self, data: bytes) -> None:
+        self._data = data
+        self._pos = 0
+
+    def read(self, n: int | None = None) -> bytes:
+        end = len(self._data) if n is None else self._pos + n
+        chunk = self._data[self._pos:end]
+        self._pos += len(chunk)
+        return chunk
+
+    def close(self) -> None:
+        pass
+
+
+class StubClient:
+    """The boto3 S3 calls S3Backend makes, recorded; objects live in a dict."""
+
+    def __init__(self) -> None:
+        self.objects: dict[tuple[str, str], bytes] = {}
+        self.calls: list[tuple[str, dict]] = []
+        self.parts: dict[int, bytes] = {}
+        self.lock = threading.Lock()
+        self.upload_part_hook = None
+
+    def _record(self, name: str, **kwargs) -> None:
+        with self.lock:
+            self.calls.append((name, kwargs))
+
+    def names(self) -> list[str]:
+        return [name for name, _ in self.calls]
+
+    def create_multipart_upload(self, **kwargs):
+        self._record("create_multipart_upload", **kwargs)
+        return {"UploadId": "upload-1"}
+
+    def upload_part(self, **kwargs):
+        if self.upload_part_hook is not None:
+            self.upload_part_hook(kwargs["PartNumber"])
+        self._record("upload_part", PartNumber=kwargs["PartNumber"])
+        with self.lock:
+            self.parts[kwargs["PartNumber"]] = kwargs["Body"]
+        return {"ETag": f'"part-{kwargs["PartNumber"]}"'}
+
+    def complete_multipart_upload(self, **kwargs):
+        self._record("complete_multipart_upload", **kwargs)
+        numbers = [p["PartNumber"] for p in kwargs["MultipartUpload"]["Parts"]]
+        self.objects[kwargs["Bucket"], kwargs["Key"]] = b"".join(self.parts[n] for n in numbers)
+
+    def abort_multipart_upload(self, **kwargs):
+        self._record("abort_multipart_upload", **kwargs)
+
+    def put_object(self, **kwargs):
+        self._record("put_object", Key=kwargs["Key"])
+        self.objects[kwargs["Bucket"], kwargs["Key"]] = kwargs["Body"]
+
+    def delete_objects(self, Bucket, Delete):
+        keys = [obj["Key"] for obj in Delete["Objects"]]
+        self._record("delete_objects", Bucket=Bucket, Keys=keys)
+        return {"Errors": [{"Key": key, "Code": "AccessDenied", "Message": "denied"} for key in keys if "locked" in key]}
+
+    def get_object(self, Bucket, Key, Range=None, IfMatch=None):
+        self._record("get_object", Range=Range, IfMatch=IfMatch)
+        data = self.objects[Bucket, Key]
+        if Range is not None:
+            start, end = map(int, re.fullmatch(r"bytes=(\d+)-(\d+)", Range).groups())
+            data = data[start:end + 1]
+        return {"Body": StubBody(data), "ContentLength": len(self.objects[Bucket, Key]), "ETag": '"v1"'}
+
+
+@pytest.fixture()
+def client() -> StubClient:
+    return StubClient()
+
+
+@pytest.fixture()
+def s3(client) -> S3Backend:
+    backend = S3Backend(part_size=PART, max_concurrency=3)
+    backend._configured = True
+    backend._client = client
+    return backend
+
+
+def _parts(count: int) -> list[bytes]:
+    return [bytes([n]) * PART for n in range(1, count + 1)]
+
+
+# ---------------------------------------------------------------------------
+# Multipart upload
+# ---------------------------------------------------------------------------
+
+class TestMultipartUpload:
+    def test_out_of_order_parts_complete_sorted(self, s3, client):
+        last_done = threading.Event()
+
+        def hook(number: int) -> None:
+            if number == 3:
+                last_done.set()
+            else:
+                assert last_done.wait(5)  # parts 1 and 2 finish after part 3
+
+        client.upload_part_hook = hook
+        parts = _parts(3)
+        s3.write("bucket/big.bin", b"".join(parts))
+
+        uploaded = [kw["PartNumber"] for name, kw in client.calls if name == "upload_part"]
+        assert uploaded[0] == 3
+        complete = next(kw for name, kw in client.calls if name == "complete_multipart_upload")
+        assert [p["PartNumber"] for p in complete["MultipartUpload"]["Parts"]] == [1, 2, 3]
+        assert [p["ETag"] for p in complete["MultipartUpload"]["Parts"]] == ['"part-1"', '"part-2"', '"part-3"']
+        assert client.objects["bucket", "big.bin"] == b"".join(parts)
+
+    def test_failing_part_aborts(self, s3, client):
+        def hook(number: int) -> None:
+            if number == 2:
+                raise ConnectionError("reset by peer")
+
+        client.upload_part_hook = hook
+        with pytest.raises(ConnectionError):
+            s3.write_stream("bucket/big.bin", iter(_parts(4)))
+        assert "abort_multipart_upload" in client.names()
+        assert "complete_multipart_upload" not in client.names()
+        abort = next(kw for name, kw in client.calls if name == "abort_multipart_upload")
+        assert abort == {"Bucket": "bucket", "Key": "big.bin", "UploadId": "upload-1"}
+
+    def test_lazy_source_bounded_by_max_concurrency(self, s3, client):
+        finished = 0
+        ahead: list[int] = []
+
+        def hook(number: int) -> None:
+            nonlocal finished
+            time.sleep(0.01)
+            with client.lock:
+                finished += 1
+
+        def source():
+            chunk = b"x" * PART
+            for pulled in range(1, 13):
+                with client.lock:
+                    ahead.append(pulled - finished)
+                yield chunk
+
+        client.upload_part_hook = hook
+        s3.write_stream("bucket/big.bin", source())
+        assert len(client.parts) == 12
+        assert max(ahead) <= s3.max_concurrency
+
+    def test_small_object_is_single_put(self, s3, client):
+        s3.write("bucket/small.txt", b"hello")
+        assert client.names() == ["put_object"]
+
+
+# ---------------------------------------------------------------------------
+# Ranged reads
+# ---------------------------------------------------------------------------
+
+class TestConcurrentRead:
+    def test_ranges_pinned_and_reassembled(self, s3, client):
+        data = b"".join(_parts(3)) + b"tail"
+        client.objects["bucket", "big.bin"] = data
+        assert s3.read("bucket/big.bin") == data
+        ranged = [kw for name, kw in client.calls if name == "get_object" and kw["Range"]]
+        assert {kw["Range"] for kw in ranged} == {
+            f"bytes={PART}-{2 * PART - 1}",
+            f"bytes={2 * PART}-{3 * PART - 1}",
+            f"bytes={3 * PART}-{3 * PART + 3}",
+        }
+        assert all(kw["IfMatch"] == '"v1"' for kw in ranged)
+
+    def test_small_object_single_get(self, s3, client):
+        client.objects["bucket", "small.bin"] = b"abc"
+        assert s3.read("bucket/small.bin") == b"abc"
+        assert client.names() == ["get_object"]
+
+
+# ---------------------------------------------------------------------------
+# Bulk delete
+# ---------------------------------------------------------------------------
+
+class TestDeleteMany:
+    def test_chunked_at_1000_keys_per_bucket(self, s3, client):
+        paths = [f"logs/{n:04d}.txt" for n in range(2500)] + ["media/a.png", "media/locked.png"]
+        results = s3.delete_many(paths)
+        batches = [(kw["Bucket"], len(kw["Keys"])) for name, kw in client.calls if name == "delete_objects"]
+        assert batches == [("logs", 1000), ("logs", 1000), ("logs", 500), ("media", 2)]
+        assert list(results) == paths
+        assert [path for path, error in results.items() if error is not None] == ["media/locked.png"]
+        assert results["media/locked.png"].response["Error"]["Code"] == "AccessDenied"
+
+    def test_unparseable_path_is_reported(self, s3, client):
+        results = s3.delete_many(["no-bucket", "logs/a.txt"])
+        assert isinstance(results["no-bucket"], ValueError)
+        assert results["logs/a.txt"] is None
@@ -0,0 +1,283 @@
+"""
+Tests for SegmentedObject (backends/segmented.py) against an in-memory backend.
+
+Covers:
+- _cover(): interleaved and nested ranges, leftovers of a half-finished compaction
+- _runs(): size limits, large and unknown-size segments
+- Appends and reads in order, seeded from bytes already at the URI
+- compact(): merge then delete, young segments left alone, a late-landing segment
+- Reads that race a compaction resume at the right offset
+- Router paths for a segmented URI: read_stream, read_range, open_seekable,
+  write, delete, get_url; Supabase appends find existing segments by themselves
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent.parent))
+
+from matrx_utils.file_handling.backends import BackendRouter, router as router_module
+from matrx_utils.file_handling.backends.segmented import _cover, _parse, _runs
+from matrx_utils.file_handling.backends.tests.memory_backend import MemoryBackend
+
+URI = "supabase://logs/job.log"
+PREFIX = "logs/job.log.segments/"
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+def _id(ts: int, suffix: str = "00000000") -> str:
+    return f"{ts:020d}{suffix}"
+
+
+def _seg(first: int, last: int | None = None, size: int | None = 1):
+    last = first if last is None else last
+    return _parse(f"{_id(first)}-{_id(last)}", size)
+
+
+def _names(segments) -> list[tuple[int, int]]:
+    return [(int(s.first[:20]), int(s.last[:20])) for s in segments]
+
+
+@pytest.fixture()
+def backend() -> MemoryBackend:
+    return MemoryBackend()
+
+
+@pytest.fixture()
+def router(backend, monkeypatch) -> BackendRouter:
+    # Treat the in-memory backend as Supabase: no server-side append.
+    monkeypatch.setattr(router_module, "SupabaseBackend", MemoryBackend)
+    router = BackendRouter(url_cache=False)
+    router._supabase = backend
+    return router
+
+
+def _put(backend: MemoryBackend, first: int, last: int | None = None, data: bytes = b"") -> None:
+    last = first if last is None else last
+    backend._put(f"{PREFIX}{_id(first)}-{_id(last)}", data)
+
+
+def _old(n: int) -> int:
+    """A timestamp far older than any min_age."""
+    return 1_000 + n
+
+
+# ---------------------------------------------------------------------------
+# Pure helpers
+# ---------------------------------------------------------------------------
+
+class TestCover:
+    def test_interleaved_merge_wins(self):
+        listed = [_seg(2), _seg(4), _seg(1, 3), _seg(1), _seg(3), _seg(5)]
+        assert _names(_cover(listed)) == [(1, 3), (4, 4), (5, 5)]
+
+    def test_nested_ranges(self):
+        listed = [_seg(2, 3), _seg(1, 2), _seg(1, 4), _seg(5)]
+        assert _names(_cover(listed)) == [(1, 4), (5, 5)]
+
+    def test_disjoint_ranges_keep_order(self):
+        listed = [_seg(3), _seg(1, 2), _seg(4, 6)]
+        assert _names(_cover(listed)) == [(1, 2), (3, 3), (4, 6)]
+
+    def test_parse_rejects_foreign_names(self):
+        assert _parse("notes.txt", 1) is None
+        assert _parse(f"{_id(1)}-{_id(2)[:-1]}", 1) is None
+        assert _parse("abc-def", 1) is None
+
+
+class TestRuns:
+    def test_groups_up_to_target(self):
+        segments = [_seg(i, size=10) for i in range(5)]
+        assert [_names(run) for run in _runs(segments, 25)] == [[(0, 0), (1, 1)], [(2, 2), (3, 3)]]
+
+    def test_large_segment_splits_and_is_skipped(self):
+        segments = [_seg(0, size=5), _seg(1, size=5), _seg(2, size=100), _seg(3, size=5), _seg(4, size=5)]
+        assert [_names(run) for run in _runs(segments, 50)] == [[(0, 0), (1, 1)], [(3, 3), (4, 4)]]
+
+    def test_unknown_size_is_never_merged(self):
+        segments = [_seg(0, size=5), _seg(1, size=None), _seg(2, size=5), _seg(3, size=None)]
+        assert _runs(segments, 50) == []
+
+    def test_single_segments_are_not_runs(self):
+        assert _runs([_seg(0, size=5)], 50) == []
+
+
+# ---------------------------------------------------------------------------
+# SegmentedObject
+# ---------------------------------------------------------------------------
+
+class TestAppendRead:
+    def test_appends_read_in_order(self, router, backend):
+        log = router.segmented(URI, compact_after=0)
+        for line in (b"a\n", b"b\n", b"c\n"):
+            router.append(URI, line)
+        assert router.read(URI) == b"a\nb\nc\n"
+        assert len(log.segments()) == 3
+        assert "logs/job.log" not in backend.objects
+
+    def test_existing_object_is_seeded(self, router, backend):
+        backend._put("logs/job.log", b"before\n")
+        router.segmented(URI, compact_after=0)
+        router.append(URI, b"after\n")
+        assert router.read(URI) == b"before\nafter\n"
+
+    def test_seed_is_written_once(self, router, backend):
+        backend._put("logs/job.log", b"before\n")
+        router.segmented(URI, compact_after=0).append(b"1")
+        other = BackendRouter(url_cache=False)
+        other._supabase = backend
+        other.segmented(URI, compact_after=0).append(b"2")
+        assert other.read(URI) == b"before\n12"
+
+    def test_other_router_append_finds_segments(self, router, backend):
+        router.segmented(URI, compact_after=0).append(b"1")
+        other = BackendRouter(url_cache=False)
+        other._supabase = backend
+        other.append(URI, b"2")  # no segmented() call: the prefix is the marker
+        assert other.read(URI) == b"12"
+        assert "logs/job.log" not in backend.objects
+
+    def test_plain_append_without_segments_rewrites(self, router, backend):
+        backend._put("logs/plain.log", b"x")
+        router.append("supabase://logs/plain.log", b"y")
+        assert backend.objects["logs/plain.log"] == b"xy"
+
+
+class TestCompact:
+    def test_merges_then_deletes(self, router, backend):
+        for n in range(4):
+            _put(backend, _old(n), data=bytes([65 + n]))
+        log = router.segmented(URI, compact_after=0)
+        assert log.compact() == 4
+        assert backend.list_files(PREFIX) == [f"{PREFIX}{_id(_old(0))}-{_id(_old(3))}"]
+        assert log.read() == b"ABCD"
+
+    def test_young_segments_are_left_alone(self, router, backend):
+        _put(backend, _old(0), data=b"A")
+        _put(backend, _old(1), data=b"B")
+        _put(backend, _old(2), data=b"C")
+        _put(backend, time.time_ns(), data=b"D")
+        log = router.segmented(URI, compact_after=0)
+        assert log.compact(min_age=3600) == 3
+        assert log.read() == b"ABCD"
+        listed = backend.list_files(PREFIX)
+        assert len(listed) == 2
+        assert listed[0] == f"{PREFIX}{_id(_old(0))}-{_id(_old(2))}"
+
+    def test_run_stops_at_first_young_segment(self, router, backend):
+        young = time.time_ns()
+        _put(backend, _old(0), data=b"A")
+        _put(backend, young, data=b"B")
+        _put(backend, young + 1, data=b"C")
+        log = router.segmented(URI, compact_after=0)
+        assert log.compact(min_age=3600) == 0
+        assert len(backend.list_files(PREFIX)) == 3
+
+    def test_late_segment_after_compaction(self, router, backend):
+        young = time.time_ns()
+        _put(backend, _old(0), data=b"A")
+        _put(backend, _old(1), data=b"B")
+        _put(backend, young, data=b"D")
+        log = router.segmented(URI, compact_after=0)
+        assert log.compact(min_age=3600) == 2
+        # A slow writer's PUT lands after the compaction, with an ID older than "D".
+        _put(backend, young - 1, data=b"C")
+        assert log.read() == b"ABCD"
+        assert log.compact(min_age=0) == 3
+        assert log.read() == b"ABCD"
+        assert len(backend.list_files(PREFIX)) == 1
+
+    def test_leftovers_of_failed_delete_are_hidden_then_removed(self, router, backend):
+        _put(backend, _old(0), data=b"A")
+        _put(backend, _old(1), data=b"B")
+        _put(backend, _old(0), _old(1), data=b"AB")
+        _put(backend, _old(2), data=b"C")
+        log = router.segmented(URI, compact_after=0)
+        assert log.read() == b"ABC"
+        log.compact(min_age=3600)
+        assert log.read() == b"ABC"
+        assert backend.list_files(PREFIX) == [f"{PREFIX}{_id(_old(0))}-{_id(_old(2))}"]
+
+    def test_read_racing_compaction_resumes_at_offset(self, router, backend):
+        for n in range(4):
+            _put(backend, _old(n), data=bytes([65 + n]) * 3)
+        log = router.segmented(URI, compact_after=0)
+        pieces = log.iter_range(1)
+        first = next(pieces)
+        log.compact()  # the rest of the listed segments are gone now
+        assert first + b"".join(pieces) == b"AABBBCCCDDD"
+
+
+# ---------------------------------------------------------------------------
+# Router paths for a segmented URI
+# ---------------------------------------------------------------------------
+
+class TestRouterPaths:
+    @pytest.fixture()
+    def log(self, router, backend):
+        backend._put("logs/job.log", b"0123")
+        log = router.segmented(URI, compact_after=0)
+        for chunk in (b"4567", b"89", b"abcdef"):
+            router.append(URI, chunk)
+        return log
+
+    def test_read_stream(self, router, log):
+        assert list(router.read_stream(URI, chunk_size=3))[:2] == [b"012", b"3"]
+        assert b"".join(router.read_stream(URI, chunk_size=3)) == b"0123456789abcdef"
+
+    def test_read_range(self, router, log):
+        assert router.read_range(URI, 2, 11) == b"23456789a"
+        assert router.read_range(URI, 10) == b"abcdef"
+        assert router.read_range(URI, 4, 8) == b"4567"
+
+    def test_open_seekable(self, router, log):
+        with router.open_seekable(URI, block_size=5) as f:
+            f.seek(-3, 2)
+            assert f.read() == b"def"
+            f.seek(6)
+            assert f.read(4) == b"6789"
+
+    def test_write_replaces_segments(self, router, backend, log):
+        router.write(URI, b"fresh")
+        assert backend.list_files(PREFIX) == []
+        assert router.read(URI) == b"fresh"
+        router.append(URI, b"!")
+        assert router.read(URI) == b"fresh!"
+
+    def test_delete_removes_segments_and_object(self, router, backend, log):
+        router.delete(URI)
+        assert backend.list_files("logs/") == []
+        assert router.read(URI) == b""
+
+    def test_delete_from_other_router(self, backend, log):
+        other = BackendRouter(url_cache=False)
+        other._supabase = backend
+        other.delete(URI)
+        assert backend.list_files("logs/") == []
+
+    def test_get_url_materializes(self, router, backend, log):
+        assert router.get_url(URI).endswith("logs/job.log")
+        assert backend.objects["logs/job.log"] == b"0123456789abcdef"
+        assert router.read(URI) == b"0123456789abcdef"
+
+    def test_async_paths(self, router, backend):
+        backend._put("logs/job.log", b"ab")
+
+        async def run():
+            router.segmented(URI, compact_after=0)
+            await router.append_async(URI, b"cd")
+            await router.append_async(URI, b"ef")
+            assert await router.read_async(URI) == b"abcdef"
+            assert await router.read_range_async(URI, 1, 5) == b"bcde"
+            assert b"".join([c async for c in router.read_stream_async(URI, chunk_size=4)]) == b"abcdef"
+            await router.delete_async(URI)
+            assert await router.read_async(URI) == b""
+
+        asyncio.run(run())
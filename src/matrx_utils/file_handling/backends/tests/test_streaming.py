@@ -0,0 +1,250 @@
+"""
+Tests for the byte-stream helpers (backends/streaming.py) and the router's
+rule for retrying streamed writes. No network.
+
+Covers:
+- iter_chunks(): buffers, file objects, paths and iterables
+- rechunk() / arechunk(): boundary sizes, pass-through of exact chunks
+- ChunkReader: read(n), readinto(), line iteration, close() closes the source
+- Range helpers: check_range, range_header, content_range_total, slice_chunks
+- write_stream(): a non-seekable source is not retried; a seekable one is
+  rewound to where it started before the retry
+"""
+
+import asyncio
+import io
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent.parent))
+
+from matrx_utils.file_handling.backends import BackendRouter, StorageHTTPError
+from matrx_utils.file_handling.backends.retry import RetryPolicy
+from matrx_utils.file_handling.backends.streaming import (
+    ChunkReader,
+    arechunk,
+    check_range,
+    content_range_total,
+    iter_chunks,
+    range_header,
+    rechunk,
+    slice_chunks,
+)
+from matrx_utils.file_handling.backends.tests.memory_backend import MemoryBackend
+
+
+# ---------------------------------------------------------------------------
+# Chunking
+# ---------------------------------------------------------------------------
+
+class TestIterChunks:
+    def test_buffer_and_str(self):
+        assert list(iter_chunks(b"abcdefg", 3)) == [b"abc", b"def", b"g"]
+        assert list(iter_chunks("abcd", 2)) == [b"ab", b"cd"]
+        assert list(iter_chunks(b"", 3)) == []
+
+    def test_file_object_and_path(self, tmp_path):
+        path = tmp_path / "data.bin"
+        path.write_bytes(b"0123456789")
+        assert list(iter_chunks(io.BytesIO(b"0123456789"), 4)) == [b"0123", b"4567", b"89"]
+        assert list(iter_chunks(path, 4)) == [b"0123", b"4567", b"89"]
+
+    def test_iterable_keeps_boundaries_and_drops_empties(self):
+        assert list(iter_chunks([b"a", b"", bytearray(b"bcd"), memoryview(b"e")], 2)) == [b"a", b"bcd", b"e"]
+
+
+class TestRechunk:
+    @pytest.mark.parametrize(
+        ("chunks", "expected"),
+        [
+            ([], []),
+            ([b"abcd"], [b"abcd"]),  # exactly one piece
+            ([b"abcde"], [b"abcd", b"e"]),  # one byte over
+            ([b"abc"], [b"abc"]),  # one byte under: a short last piece
+            ([b"ab", b"cd", b"ef", b"gh"], [b"abcd", b"efgh"]),  # joins small chunks
+            ([b"abcdefghij"], [b"abcd", b"efgh", b"ij"]),  # splits a large chunk
+            ([b"a", b"bcdefgh", b"i"], [b"abcd", b"efgh", b"i"]),  # straddles boundaries
+        ],
+    )
+    def test_boundaries(self, chunks, expected):
+        assert list(rechunk(iter(chunks), 4)) == expected
+
+    def test_exact_chunks_pass_through(self):
+        chunk = b"abcd"
+        assert next(rechunk([chunk], 4)) is chunk
+
+    def test_async_matches_sync(self):
+        chunks = [b"a", b"bcdefgh", b"i", b"jklm", b"n"]
+
+        async def source():
+            for chunk in chunks:
+                yield chunk
+
+        async def run():
+            return [piece async for piece in arechunk(source(), 4)]
+
+        assert asyncio.run(run()) == list(rechunk(chunks, 4))
+
+
+class TestChunkReader:
+    def test_read_n_across_chunks(self):
+        reader = ChunkReader(iter([b"abc", b"", b"defg", b"h"]))
+        assert reader.read(2) == b"ab"
+        assert reader.read(3) == b"c"  # a raw read returns at most one chunk's remainder
+        assert reader.read(3) == b"def"
+        assert reader.read() == b"gh"
+        assert reader.read(1) == b""
+
+    def test_readinto(self):
+        reader = ChunkReader(iter([b"hello", b"world"]))
+        buffer = bytearray(3)
+        assert reader.readinto(buffer) == 3 and buffer == b"hel"
+        assert reader.readinto(buffer) == 2 and buffer[:2] == b"lo"
+        assert reader.readinto(buffer) == 3 and buffer == b"wor"
+        big = bytearray(10)
+        assert reader.readinto(big) == 2 and big[:2] == b"ld"
+        assert reader.readinto(big) == 0
+
+    def test_buffered_lines(self):
+        reader = io.BufferedReader(ChunkReader(iter([b"one\ntw", b"o\nthree"])), buffer_size=4)
+        assert list(reader) == [b"one\n", b"two\n", b"three"]
+
+    def test_close_closes_generator(self):
+        closed = []
+
+        def chunks():
+            try:
+                yield b"a"
+                yield b"b"
+            finally:
+                closed.append(True)
+
+        reader = ChunkReader(chunks())
+        reader.read(1)
+        reader.close()
+        assert closed == [True]
+
+
+# ---------------------------------------------------------------------------
+# Byte ranges
+# ---------------------------------------------------------------------------
+
+class TestRanges:
+    def test_check_range(self):
+        check_range(0, None)
+        check_range(5, 5)
+        with pytest.raises(ValueError):
+            check_range(-1, None)
+        with pytest.raises(ValueError):
+            check_range(5, 4)
+
+    def test_headers(self):
+        assert range_header(0, 10) == "bytes=0-9"
+        assert range_header(7, None) == "bytes=7-"
+        assert content_range_total("bytes 0-99/1234") == 1234
+        assert content_range_total("bytes */50") == 50
+        assert content_range_total("bytes 0-99/*") is None
+        assert content_range_total(None) is None
+
+    def test_slice_chunks_stops_at_end(self):
+        pulled = []
+
+        def chunks():
+            for chunk in (b"abc", b"def", b"ghi"):
+                pulled.append(chunk)
+                yield chunk
+
+        assert slice_chunks(chunks(), 2, 5) == b"cde"
+        assert pulled == [b"abc", b"def"]
+        assert slice_chunks([b"abc", b"def"], 4, None) == b"ef"
+
+
+# ---------------------------------------------------------------------------
+# Retrying streamed writes
+# ---------------------------------------------------------------------------
+
+class FailingOnceBackend(MemoryBackend):
+    """Consumes part of the source, then fails the first write_stream with a 503."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.attempts = 0
+
+    def write_stream(self, path, source, **kwargs):
+        self.attempts += 1
+        if self.attempts == 1:
+            next(iter_chunks(source, 2), None)
+            raise StorageHTTPError(f"{path}: HTTP 503", 503)
+        return super().write_stream(path, source, **kwargs)
+
+    async def write_stream_async(self, path, source, **kwargs):
+        if not hasattr(source, "__aiter__"):
+            return self.write_stream(path, source, **kwargs)
+        self.attempts += 1
+        await anext(aiter(source), None)
+        raise StorageHTTPError(f"{path}: HTTP 503", 503)
+
+
+class NonSeekable(io.RawIOBase):
+    def __init__(self, data: bytes) -> None:
+        self._data = io.BytesIO(data)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        return self._data.readinto(buffer)
+
+
+@pytest.fixture()
+def backend() -> FailingOnceBackend:
+    return FailingOnceBackend()
+
+
+@pytest.fixture()
+def router(backend) -> BackendRouter:
+    policy = RetryPolicy(base_delay=0.0, max_delay=0.0, breaker_threshold=0)
+    router = BackendRouter(url_cache=False, retry_policy=policy)
+    router._supabase = backend
+    return router
+
+
+URI = "supabase://uploads/report.csv"
+
+
+class TestWriteRetry:
+    @pytest.mark.parametrize("source", [lambda: iter([b"ab", b"cd"]), lambda: NonSeekable(b"abcd")])
+    def test_non_seekable_source_not_retried(self, router, backend, source):
+        with pytest.raises(StorageHTTPError):
+            router.write_stream(URI, source())
+        assert backend.attempts == 1
+        assert "uploads/report.csv" not in backend.objects
+
+    def test_seekable_source_rewound_before_retry(self, router, backend):
+        source = io.BytesIO(b"HEADERabcdef")
+        source.seek(6)  # the write starts mid-file
+        assert router.write_stream(URI, source)
+        assert backend.attempts == 2
+        assert backend.objects["uploads/report.csv"] == b"abcdef"
+
+    def test_buffer_retried(self, router, backend):
+        assert router.write_stream(URI, b"abcdef")
+        assert backend.attempts == 2
+        assert backend.objects["uploads/report.csv"] == b"abcdef"
+
+    def test_async_seekable_rewound(self, router, backend):
+        source = io.BytesIO(b"abcdef")
+        assert asyncio.run(router.write_stream_async(URI, source))
+        assert backend.attempts == 2
+        assert backend.objects["uploads/report.csv"] == b"abcdef"
+
+    def test_async_iterable_not_retried(self, router, backend):
+        async def chunks():
+            yield b"ab"
+            yield b"cd"
+
+        with pytest.raises(StorageHTTPError):
+            asyncio.run(router.write_stream_async(URI, chunks()))
+        assert backend.attempts == 1
@@ -0,0 +1,89 @@
+"""In-process cache of signed URLs for BackendRouter.get_url() / ensure_url().
+
+Signing an S3 URL is a local computation, but a Supabase or file-server URL
+costs a network round trip. A feed response that signs dozens of objects
+pays that round trip every time. SignedUrlCache keeps each URL it has issued
+and serves it again while it keeps enough of its lifetime:
+
+    remaining >= max(min_remaining, refresh_fraction * expires_in)
+
+With the defaults, get_url(uri, expires_in=3600) returns a cached URL that
+is valid for at least another 30 minutes. Otherwise it signs a new one.
+
+Entries are keyed by (canonical native URI, expiry bucket). The bucket is
+*expires_in* rounded up to 5 minutes (see expiry_bucket()), and new URLs are
+signed for the whole bucket. Requests for 3500 s and 3600 s therefore share
+an entry, and both get at least what they asked for. The cache is a bounded
+LRU guarded by a lock, so one instance can be shared across threads.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+
+_DEFAULT_MAX_ENTRIES: int = 10_000
+_BUCKET_SECONDS: int = 300
+
+
+def expiry_bucket(expires_in: int) -> int:
+    """Round *expires_in* up to the next multiple of 5 minutes (short expiries are kept exact)."""
+    if expires_in <= _BUCKET_SECONDS:
+        return expires_in
+    return -(-expires_in // _BUCKET_SECONDS) * _BUCKET_SECONDS
+
+
+class SignedUrlCache:
+    """Bounded LRU of signed URLs with their absolute expiry (see module docstring)."""
+
+    def __init__(
+        self,
+        max_entries: int = _DEFAULT_MAX_ENTRIES,
+        refresh_fraction: float = 0.5,
+        min_remaining: float = 60.0,
+    ) -> None:
+        self.max_entries = max_entries
+        self.refresh_fraction = refresh_fraction
+        self.min_remaining = min_remaining
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[str, int], tuple[str, float]] = OrderedDict()
+
+    def get(self, uri: str, expires_in: int) -> str | None:
+        """Return a cached URL for *uri* that is still good for *expires_in*, or None."""
+        key = (uri, expiry_bucket(expires_in))
+        needed = max(self.min_remaining, self.refresh_fraction * expires_in)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] - time.time() >= needed:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, uri: str, expires_in: int, url: str, lifetime: float) -> None:
+        """Remember *url*, signed for a *expires_in* request, as valid for *lifetime* more seconds."""
+        with self._lock:
+            key = (uri, expiry_bucket(expires_in))
+            self._entries[key] = (url, time.time() + lifetime)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, uri: str) -> None:
+        """Drop every cached URL for *uri*."""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == uri]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -24,10 +24,12 @@ Usage inside a handler method:
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Iterator
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from matrx_utils.file_handling.backends.router import BackendRouter
+    from matrx_utils.file_handling.backends.streaming import AsyncByteSource, ByteSource
     from matrx_utils.file_handling.backends.llm_helpers import LLMInputMode, LLMOutputFormat
 
 
@@ -65,10 +67,18 @@ class CloudMixin:
         """Read raw bytes from a cloud URI (s3://, supabase://, server://)."""
         return self._require_cloud().read(uri)
 
-    def cloud_write(self, uri: str, content: bytes | str, **kwargs) -> bool:
-        """Write content to a cloud URI."""
+    def cloud_write(self, uri: str, content: "ByteSource", **kwargs) -> bool:
+        """Write content to a cloud URI. File objects and chunk iterables are streamed."""
         return self._require_cloud().write(uri, content, **kwargs)
 
+    def cloud_read_stream(self, uri: str, chunk_size: int = 1024 * 1024) -> Iterator[bytes]:
+        """Stream a cloud object in chunks instead of loading it whole."""
+        return self._require_cloud().read_stream(uri, chunk_size)
+
+    def cloud_read_range(self, uri: str, start: int, end: int | None = None) -> bytes:
+        """Read bytes ``[start, end)`` of a cloud object (``end=None`` = to the end)."""
+        return self._require_cloud().read_range(uri, start, end)
+
     def cloud_append(self, uri: str, content: bytes | str) -> bool:
         """Append content to a cloud object."""
         return self._require_cloud().append(uri, content)
@@ -109,10 +119,18 @@ class CloudMixin:
         """Non-blocking read from a cloud URI."""
         return await self._require_cloud().read_async(uri)
 
-    async def cloud_write_async(self, uri: str, content: bytes | str, **kwargs) -> bool:
-        """Non-blocking write to a cloud URI."""
+    async def cloud_write_async(self, uri: str, content: "AsyncByteSource", **kwargs) -> bool:
+        """Non-blocking write to a cloud URI. File objects and (async) chunk iterables are streamed."""
         return await self._require_cloud().write_async(uri, content, **kwargs)
 
+    def cloud_read_stream_async(self, uri: str, chunk_size: int = 1024 * 1024) -> AsyncIterator[bytes]:
+        """Non-blocking chunked read: ``async for chunk in self.cloud_read_stream_async(uri)``."""
+        return self._require_cloud().read_stream_async(uri, chunk_size)
+
+    async def cloud_read_range_async(self, uri: str, start: int, end: int | None = None) -> bytes:
+        """Non-blocking ranged read from a cloud object."""
+        return await self._require_cloud().read_range_async(uri, start, end)
+
     async def cloud_append_async(self, uri: str, content: bytes | str) -> bool:
         """Non-blocking append to a cloud object."""
         return await self._require_cloud().append_async(uri, content)
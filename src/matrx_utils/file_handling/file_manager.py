@@ -36,6 +36,7 @@ from .backends import (
 )
 
 if TYPE_CHECKING:
+    from .backends import ReadCache
     from .cloud_sync.config import CloudSyncConfig
     from .cloud_sync.sync_engine import SyncEngine
     from .cloud_sync.models import SyncResult
@@ -55,6 +56,7 @@ class FileManager:
         print_errors=True,
         batch_handler=None,
         cloud_sync: CloudSyncConfig | None = None,
+        read_cache: ReadCache | None = None,
     ):
         self.app_name = app_name
         self.batch_print = batch_print
@@ -68,7 +70,7 @@ class FileManager:
         self.image_handler = ImageHandler(app_name, batch_print=batch_print)
         self.markdown_handler = MarkdownHandler(app_name, batch_print=batch_print)
         self.video_handler = VideoHandler(app_name, batch_print=batch_print)
-        self.cloud = BackendRouter()
+        self.cloud = BackendRouter(cache=read_cache)
 
         # Inject the shared router into every handler so they can call
         # cloud methods (self.cloud_read, self.cloud_write_async, etc.)
@@ -104,6 +106,7 @@ class FileManager:
         print_errors=True,
         batch_handler=None,
         cloud_sync: CloudSyncConfig | None = None,
+        read_cache: ReadCache | None = None,
     ):
         key = (app_name, batch_print, print_errors, id(batch_handler))
         if not new_instance and key in cls._instances:
@@ -112,9 +115,12 @@ class FileManager:
             if cloud_sync is not None and existing._sync_engine is None:
                 from .cloud_sync.sync_engine import SyncEngine as _SE
                 existing._sync_engine = _SE(cloud_sync, existing.cloud)
+            # Likewise a read cache
+            if read_cache is not None and existing.cloud.cache is None:
+                existing.cloud.cache = read_cache
             return existing
 
-        instance = cls(app_name, new_instance, batch_print, print_errors, batch_handler, cloud_sync)
+        instance = cls(app_name, new_instance, batch_print, print_errors, batch_handler, cloud_sync, read_cache)
         if not new_instance:
             cls._instances[key] = instance
         return instance
@@ -168,6 +174,11 @@ class FileManager:
             fm.write("supabase://bucket/avatar.png", content=image_bytes)
             fm.write("server://uploads/data.csv", content=csv_text)
 
+        For cloud URIs, *content* may also be an open binary file or an
+        iterable of bytes chunks. It is then streamed, never loaded whole:
+            with open("talk.mp4", "rb") as f:
+                fm.write("s3://bucket/talk.mp4", content=f)
+
         When cloud_sync is configured, local writes automatically sync
         to cloud storage and record metadata in the database (background).
         Pass ``cloud_sync=False`` to skip sync for this call.
@@ -182,6 +193,50 @@ class FileManager:
             self._background_sync_write(path, content)
         return result
 
+    def read_stream(self, uri: str, chunk_size: int = 1024 * 1024):
+        """Iterate over a cloud object in chunks, holding at most one chunk in memory.
+
+            with open("local.mp4", "wb") as out:
+                for chunk in fm.read_stream("s3://bucket/talk.mp4"):
+                    out.write(chunk)
+        """
+        return self.cloud.read_stream(uri, chunk_size)
+
+    def open_read(self, uri: str, chunk_size: int = 1024 * 1024):
+        """Open a cloud object as a read-only binary file that streams on demand."""
+        return self.cloud.open_read(uri, chunk_size)
+
+    def read_range(self, uri: str, start: int, end: int | None = None) -> bytes:
+        """Read bytes ``[start, end)`` of a cloud object without downloading the rest.
+
+            header = fm.read_range("s3://bucket/report.pdf", 0, 1024)
+        """
+        return self.cloud.read_range(uri, start, end)
+
+    def open_seekable(self, uri: str, block_size: int = 256 * 1024, cache_blocks: int = 8):
+        """Open a cloud object as a seekable read-only binary file that fetches ranges lazily."""
+        return self.cloud.open_seekable(uri, block_size, cache_blocks)
+
+    def read_many(self, uris, max_concurrency: int = 8):
+        """Read several cloud objects concurrently; one BatchResult per URI, in order.
+
+            for result in fm.read_many(["s3://bucket/a.json", "s3://bucket/b.json"]):
+                data = result.unwrap()
+        """
+        return self.cloud.read_many(uris, max_concurrency)
+
+    def write_many(self, items, max_concurrency: int = 8, **kwargs):
+        """Write ``{uri: content}`` concurrently; see read_many()."""
+        return self.cloud.write_many(items, max_concurrency, **kwargs)
+
+    def delete_many(self, uris, max_concurrency: int = 8):
+        """Delete several cloud objects, using bulk delete endpoints where available."""
+        return self.cloud.delete_many(uris, max_concurrency)
+
+    def copy_many(self, pairs, max_concurrency: int = 8):
+        """Copy ``{src_uri: dst_uri}`` concurrently, server-side where possible."""
+        return self.cloud.copy_many(pairs, max_concurrency)
+
     def append(self, root, path=None, content=None, file_type='text', **kwargs):
         """Append to a file in local storage or a cloud URI.
 
@@ -237,6 +292,30 @@ class FileManager:
         handler = getattr(self, f"{file_type}_handler")
         return handler.list_files(root, path)
 
+    def segmented(self, uri: str, **kwargs):
+        """Open a cloud URI as an append-optimised segmented object.
+
+            log = fm.segmented("supabase://logs/job-42.jsonl")
+            fm.append("supabase://logs/job-42.jsonl", content=line)  # one small PUT
+        """
+        return self.cloud.segmented(uri, **kwargs)
+
+    def content_store(self, root: str, mode: str = "copy"):
+        """Deduplicating writes: each distinct payload is uploaded once under *root*.
+
+            store = fm.content_store("s3://media/.cas")
+            store.write("s3://media/users/7/avatar.png", png_bytes)
+        """
+        return self.cloud.content_store(root, mode)
+
+    def iter_files(self, uri_prefix: str, recursive: bool = True, with_metadata: bool = False):
+        """Lazily list a cloud prefix, one page at a time, as FileEntry objects.
+
+            big = [e.path for e in fm.iter_files("s3://bucket/logs/", with_metadata=True)
+                   if e.size and e.size > 10 * 1024 * 1024]
+        """
+        return self.cloud.iter_files(uri_prefix, recursive, with_metadata)
+
     def get_url(self, uri: str, expires_in: int = 3600) -> str:
         """Return a time-limited URL for a cloud-stored file.
 
@@ -309,10 +388,34 @@ class FileManager:
         """Non-blocking read. Always use this inside FastAPI routes."""
         return await self.cloud.read_async(uri)
 
-    async def write_async(self, uri: str, content: bytes | str, **kwargs) -> bool:
-        """Non-blocking write."""
+    async def write_async(self, uri: str, content, **kwargs) -> bool:
+        """Non-blocking write. File objects and (async) chunk iterables are streamed."""
         return await self.cloud.write_async(uri, content, **kwargs)
 
+    def read_stream_async(self, uri: str, chunk_size: int = 1024 * 1024):
+        """Non-blocking chunked read: ``async for chunk in fm.read_stream_async(uri)``."""
+        return self.cloud.read_stream_async(uri, chunk_size)
+
+    async def read_range_async(self, uri: str, start: int, end: int | None = None) -> bytes:
+        """Non-blocking read_range()."""
+        return await self.cloud.read_range_async(uri, start, end)
+
+    async def read_many_async(self, uris, max_concurrency: int = 8):
+        """Non-blocking read_many()."""
+        return await self.cloud.read_many_async(uris, max_concurrency)
+
+    async def write_many_async(self, items, max_concurrency: int = 8, **kwargs):
+        """Non-blocking write_many()."""
+        return await self.cloud.write_many_async(items, max_concurrency, **kwargs)
+
+    async def delete_many_async(self, uris, max_concurrency: int = 8):
+        """Non-blocking delete_many()."""
+        return await self.cloud.delete_many_async(uris, max_concurrency)
+
+    async def copy_many_async(self, pairs, max_concurrency: int = 8):
+        """Non-blocking copy_many()."""
+        return await self.cloud.copy_many_async(pairs, max_concurrency)
+
     async def append_async(self, uri: str, content: bytes | str) -> bool:
         """Non-blocking append."""
         return await self.cloud.append_async(uri, content)
@@ -329,6 +432,10 @@ class FileManager:
         """Non-blocking file listing."""
         return await self.cloud.list_files_async(uri_prefix)
 
+    def iter_files_async(self, uri_prefix: str, recursive: bool = True, with_metadata: bool = False):
+        """Non-blocking iter_files(): ``async for entry in fm.iter_files_async(prefix)``."""
+        return self.cloud.iter_files_async(uri_prefix, recursive, with_metadata)
+
     async def read_url_async(self, url: str) -> bytes:
         """Non-blocking read from any URL format a client might send."""
         return await self.cloud.read_url_async(url)
@@ -344,7 +451,7 @@ class FileManager:
         regenerates the URL if it has expired or has < 60 s remaining.
 
         Works with:
-        - Native URIs (s3://, supabase://)          → always generates fresh URL
+        - Native URIs (s3://, supabase://)          → signed (cached while fresh)
         - Supabase signed URLs (JWT token in ?token) → checks 'exp' claim
         - S3 presigned URLs (X-Amz-Date/Expires)    → checks query params
         - Public HTTPS URLs (no expiry info)         → returned as-is
@@ -359,6 +466,25 @@ class FileManager:
         """Async version of ensure_url(). Use this in FastAPI routes."""
         return await self.cloud.ensure_url_async(url, expires_in=expires_in)
 
+    def get_urls(self, uris, expires_in: int = 3600, max_concurrency: int = 8):
+        """Signed URLs for many cloud files at once; one BatchResult per URI, in order.
+
+            urls = [r.value for r in fm.get_urls(item_uris)]
+        """
+        return self.cloud.get_urls(uris, expires_in, max_concurrency)
+
+    def ensure_urls(self, urls, expires_in: int = 3600, max_concurrency: int = 8):
+        """Batch ensure_url(): only expired or native entries are (re)signed."""
+        return self.cloud.ensure_urls(urls, expires_in, max_concurrency)
+
+    async def get_urls_async(self, uris, expires_in: int = 3600, max_concurrency: int = 8):
+        """Non-blocking get_urls()."""
+        return await self.cloud.get_urls_async(uris, expires_in, max_concurrency)
+
+    async def ensure_urls_async(self, urls, expires_in: int = 3600, max_concurrency: int = 8):
+        """Non-blocking ensure_urls()."""
+        return await self.cloud.ensure_urls_async(urls, expires_in, max_concurrency)
+
     # ------------------------------------------------------------------
     # LLM helpers — get_for_llm / push_from_llm (sync + async)
     # ------------------------------------------------------------------
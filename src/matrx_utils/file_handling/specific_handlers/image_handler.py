@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import asyncio
 import base64
 from io import BytesIO
 from pathlib import Path
@@ -8,6 +7,7 @@ from typing import TypedDict
 
 from PIL import Image, ImageEnhance
 
+from matrx_utils.file_handling.backends.executors import cpu_executor
 from matrx_utils.file_handling.file_handler import FileHandler
 
 
@@ -515,7 +515,7 @@ class ImageHandler(FileHandler):
     ) -> dict[str, str]:
         """Async version of process_variants(). Use this in FastAPI routes.
 
-        CPU work (Pillow resizing) runs in a thread executor so the event loop
+        CPU work (Pillow resizing) runs on the shared CPU executor so the event loop
         is never blocked. Supabase uploads are fully async via AsyncClient.
 
         Parameters
@@ -533,10 +533,7 @@ class ImageHandler(FileHandler):
         dict[str, str]
             Mapping of variant key to permanent public URL.
         """
-        loop = asyncio.get_event_loop()
-        rendered = await loop.run_in_executor(
-            None, self._render_variants, image_bytes, variants
-        )
+        rendered = await cpu_executor().run(self._render_variants, image_bytes, variants)
         urls: dict[str, str] = {}
         for key, suffix, fmt, data in rendered:
             ext = "jpg" if fmt.upper() == "JPEG" else fmt.lower()
@@ -26,11 +26,13 @@ Typical usage in a FastAPI route
 
 from __future__ import annotations
 
-import asyncio
 import os
 import tempfile
+from collections.abc import AsyncIterable, Iterable
 from io import BytesIO
+from typing import BinaryIO
 
+from matrx_utils.file_handling.backends.executors import cpu_executor
 from matrx_utils.file_handling.file_handler import FileHandler
 
 
@@ -136,7 +138,7 @@ class VideoHandler(FileHandler):
     async def extract_frame_at_async(
         self, video_bytes: bytes, position: float = 0.10
     ) -> bytes:
-        """Async wrapper around extract_frame_at() — offloads to a thread executor.
+        """Async wrapper around extract_frame_at() — offloads to the shared CPU executor.
 
         Use this in FastAPI routes. The event loop is never blocked.
 
@@ -152,10 +154,7 @@ class VideoHandler(FileHandler):
         bytes
             JPEG-encoded bytes of the extracted frame.
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None, self.extract_frame_at, video_bytes, position
-        )
+        return await cpu_executor().run(self.extract_frame_at, video_bytes, position)
 
     # ------------------------------------------------------------------
     # Cloud upload
@@ -163,19 +162,22 @@ class VideoHandler(FileHandler):
 
     async def upload_video_async(
         self,
-        video_bytes: bytes,
+        video_bytes: bytes | str | os.PathLike | BinaryIO | Iterable[bytes] | AsyncIterable[bytes],
         dest_uri: str,
         content_type: str = "video/mp4",
     ) -> str:
-        """Upload video bytes to cloud storage and return the permanent public URL.
+        """Upload a video to cloud storage and return the permanent public URL.
 
         The upload uses the BackendRouter's retry policy and the SupabaseBackend's
         600-second timeout, so large files (up to 500MB) are handled safely.
+        Anything other than raw bytes is streamed in chunks, so a local file
+        path or open file never has to be loaded into memory.
 
         Parameters
         ----------
         video_bytes:
-            Raw bytes of the video file.
+            The video: raw bytes, a local file path, an open binary file, or a
+            (sync or async) iterable of bytes chunks.
         dest_uri:
             Full cloud storage URI including filename.
             e.g. ``"supabase://podcast-assets/{user_id}/{uuid}/video.mp4"``
@@ -187,15 +189,23 @@ class VideoHandler(FileHandler):
         str
             Permanent public URL of the uploaded video.
         """
-        await self.cloud_write_async(dest_uri, video_bytes, content_type=content_type)
+        if isinstance(video_bytes, (str, os.PathLike)):
+            with open(video_bytes, "rb") as f:
+                await self.cloud_write_async(dest_uri, f, content_type=content_type)
+        else:
+            await self.cloud_write_async(dest_uri, video_bytes, content_type=content_type)
         return await self.cloud_get_public_url_async(dest_uri)
 
     def upload_video(
         self,
-        video_bytes: bytes,
+        video_bytes: bytes | str | os.PathLike | BinaryIO | Iterable[bytes],
         dest_uri: str,
         content_type: str = "video/mp4",
     ) -> str:
         """Synchronous version of upload_video_async(). Use in scripts/tests."""
-        self.cloud_write(dest_uri, video_bytes, content_type=content_type)
+        if isinstance(video_bytes, (str, os.PathLike)):
+            with open(video_bytes, "rb") as f:
+                self.cloud_write(dest_uri, f, content_type=content_type)
+        else:
+            self.cloud_write(dest_uri, video_bytes, content_type=content_type)
         return self.cloud_get_public_url(dest_uri)